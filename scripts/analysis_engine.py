@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Single-pass execution engine for the analyze_* modules
+
+Every analyzer used to scan the whole season on its own and re-derive the
+same per-play values (offense == team, lowercased play_type, uppercased
+play_text, ...). The engine walks the play stream once, builds a PlayContext
+with those shared values for each play and hands it to every registered
+analyzer:
+- Analyzer.visit(ctx) is called for every play (analyzers keep the plays
+  they are interested in)
+- Analyzer.end_game(game_id) is called whenever the stream moves on to
+  another game
+- Analyzer.game_partials(engine) reduces the visited plays to one partial
+  aggregate per game (counts, sums, attempt/conversion pairs, table rows)
+- Analyzer.merge(partials, engine) builds the same result dict the analyze_*
+  function returns from any list of those partials
+
+finalize() merges the partials of every game. AnalysisEngine.results_for_games
+merges those of a subset, so a game-level filter (conference games, the last
+3 games, some opponents) never visits the plays again.
+
+Each analyze_* function is a one-analyzer run of this engine, so running
+them separately or together gives identical results.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from drive_index import DriveIndex
+from game_index import GameIndex
+
+
+# Marker for "no game seen yet" (game_id itself may be None)
+_NO_GAME = object()
+
+
+class PlayContext:
+    """Derived fields shared by all analyzers, computed once per play"""
+
+    __slots__ = (
+        'play',
+        'game_id',
+        'offense',
+        'defense',
+        'is_offense',
+        'is_defense',
+        'play_type',
+        'play_type_lower',
+        'play_type_upper',
+        'play_text',
+        'play_text_lower',
+        'play_text_upper',
+    )
+
+    def __init__(self, play: Dict[str, Any], team_lower: str):
+        self.play = play
+        self.game_id = play.get('game_id')
+
+        # Side of the ball (lowercased team names)
+        self.offense = (play.get('offense') or '').lower()
+        self.defense = (play.get('defense') or '').lower()
+        self.is_offense = self.offense == team_lower
+        self.is_defense = self.defense == team_lower
+
+        self.play_type = play.get('play_type') or ''
+        self.play_type_lower = self.play_type.lower()
+        self.play_type_upper = self.play_type.upper()
+
+        self.play_text = play.get('play_text') or ''
+        self.play_text_lower = self.play_text.lower()
+        self.play_text_upper = self.play_text.upper()
+
+
+class Analyzer:
+    """
+    Base class for analyzers run by AnalysisEngine
+
+    Args:
+        team_name: Team the analysis is for
+    """
+
+    # Key of this analyzer's result in AnalysisEngine.run()
+    name = ''
+
+    def __init__(self, team_name: str):
+        self.team_name = team_name
+        # game_id -> partial aggregates of the last finalize()
+        self.partials: Dict[Any, Dict[str, Any]] = {}
+
+    def visit(self, ctx: PlayContext) -> None:
+        """Called once for every play of the season, in play order"""
+
+    def end_game(self, game_id: Any) -> None:
+        """Called after the last consecutive play of a game"""
+
+    def game_partials(self, engine: 'AnalysisEngine') -> Dict[Any, Dict[str, Any]]:
+        """
+        Partial aggregates of each game, keyed by game_id in play order,
+        once all plays have been visited
+        """
+        raise NotImplementedError
+
+    def merge(self, partials: Sequence[Dict[str, Any]], engine: 'AnalysisEngine') -> Dict[str, Any]:
+        """Build the analysis result from the partials of some games"""
+        raise NotImplementedError
+
+    def finalize(self, engine: 'AnalysisEngine') -> Dict[str, Any]:
+        """Build the analysis result once all plays have been visited"""
+        self.partials = self.game_partials(engine)
+        return self.merge(list(self.partials.values()), engine)
+
+
+class AnalysisEngine:
+    """
+    Runs several analyzers over one pass of the play stream
+
+    Args:
+        team_name: Team the analysis is for
+        game_index: GameIndex of the season (team_data['game_index']); built
+            from the plays if not given
+        drive_index: DriveIndex of the season (team_data['drive_index']);
+            built from the plays on first use if not given
+    """
+
+    def __init__(self, team_name: str, game_index: Optional[GameIndex] = None,
+                 drive_index: Optional[DriveIndex] = None):
+        self.team_name = team_name
+        self.team_lower = team_name.lower()
+        self.game_index = game_index
+        self._drive_index = drive_index
+        self.analyzers: List[Analyzer] = []
+        self.plays: Sequence[Dict[str, Any]] = []
+
+    @property
+    def drive_index(self) -> DriveIndex:
+        """DriveIndex of the plays being analyzed (only some analyzers need it)"""
+        if self._drive_index is None:
+            self._drive_index = DriveIndex(self.plays)
+        return self._drive_index
+
+    def register(self, analyzer: Analyzer) -> Analyzer:
+        """Add an analyzer to the next run()"""
+        self.analyzers.append(analyzer)
+        return analyzer
+
+    def run(self, plays: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Walk the plays once and finalize every registered analyzer
+
+        Args:
+            plays: List of play dicts or a PlayTable
+
+        Returns:
+            Dictionary of analyzer name -> analysis result
+        """
+        self.plays = plays
+        if self.game_index is None:
+            self.game_index = GameIndex(plays)
+
+        analyzers = self.analyzers
+        team_lower = self.team_lower
+        current_game = _NO_GAME
+        for play in plays:
+            ctx = PlayContext(play, team_lower)
+            if ctx.game_id != current_game:
+                if current_game is not _NO_GAME:
+                    self._end_game(current_game)
+                current_game = ctx.game_id
+            for analyzer in analyzers:
+                analyzer.visit(ctx)
+        if current_game is not _NO_GAME:
+            self._end_game(current_game)
+
+        return {analyzer.name: analyzer.finalize(self) for analyzer in analyzers}
+
+    def results_for_games(self, game_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Results over a subset of the games of the last run(), merged from the
+        analyzers' per-game partials (the plays are not visited again)
+
+        Args:
+            game_ids: Games to include, e.g. game_index.last_n(3) or the
+                games against some opponents
+
+        Returns:
+            Dictionary of analyzer name -> analysis result
+        """
+        selected = set(game_ids)
+        return {
+            analyzer.name: analyzer.merge(
+                [partial for game_id, partial in analyzer.partials.items() if game_id in selected], self)
+            for analyzer in self.analyzers
+        }
+
+    def _end_game(self, game_id: Any) -> None:
+        for analyzer in self.analyzers:
+            analyzer.end_game(game_id)
+
+
+def group_by_game(items: Iterable[Any],
+                  game_id: Callable[[Any], Any] = lambda ctx: ctx.game_id) -> Dict[Any, List[Any]]:
+    """Items (PlayContexts by default) grouped by game, games in first-seen order"""
+    games: Dict[Any, List[Any]] = {}
+    for item in items:
+        games.setdefault(game_id(item), []).append(item)
+    return games
+
+
+def merge_counts(partials: Sequence[Dict[str, Any]], field: str) -> Dict[Any, int]:
+    """Sum of the per-game {key: count} dicts in partials[i][field], keys in first-seen order"""
+    counts: Dict[Any, int] = {}
+    for partial in partials:
+        for key, count in partial[field].items():
+            counts[key] = counts.get(key, 0) + count
+    return counts
+
+
+def run_analyzer(analyzer: Analyzer, plays: Sequence[Dict[str, Any]],
+                 game_index: Optional[GameIndex] = None,
+                 drive_index: Optional[DriveIndex] = None) -> Dict[str, Any]:
+    """Run a single analyzer over the plays and return its result"""
+    engine = AnalysisEngine(analyzer.team_name, game_index, drive_index)
+    engine.register(analyzer)
+    return engine.run(plays)[analyzer.name]
+
+
+def standard_analyzers(team_name: str) -> List[Analyzer]:
+    """The analyzers generate_html_app runs for each team"""
+    from analyze_middle_eight import MiddleEightAnalyzer
+    from analyze_explosive_plays import ExplosivePlaysAnalyzer
+    from analyze_penalties import PenaltiesAnalyzer
+    from analyze_4th_downs import FourthDownsAnalyzer
+    from analyze_post_turnover import PostTurnoverAnalyzer
+    from analyze_special_teams import SpecialTeamsAnalyzer
+    from analyze_red_zone import RedZoneAnalyzer
+
+    return [
+        MiddleEightAnalyzer(team_name),
+        ExplosivePlaysAnalyzer(team_name),
+        PenaltiesAnalyzer(team_name),
+        FourthDownsAnalyzer(team_name),
+        PostTurnoverAnalyzer(team_name),
+        SpecialTeamsAnalyzer(team_name),
+        RedZoneAnalyzer(team_name),
+    ]
+
+
+def run_standard_analyzers(plays: Sequence[Dict[str, Any]], team_name: str,
+                           game_index: Optional[GameIndex] = None,
+                           drive_index: Optional[DriveIndex] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run all standard analyzers over a single pass of the plays
+
+    Returns:
+        Dictionary keyed by analyzer name ('middle_eight', 'explosive',
+        'penalties', 'fourth_downs', 'post_turnover', 'special_teams',
+        'red_zone') with the same results as the analyze_* functions
+    """
+    engine = AnalysisEngine(team_name, game_index, drive_index)
+    for analyzer in standard_analyzers(team_name):
+        engine.register(analyzer)
+    return engine.run(plays)
@@ -3,229 +3,259 @@
 Analyze Tight Red Zone (10 yards), Red Zone (20 yards), and Green Zone (30 yards) performance
 """
 
-from typing import Dict, List, Any
-from collections import defaultdict, Counter
+from typing import Dict, List, Any, Sequence
 
+from analysis_engine import Analyzer, AnalysisEngine, PlayContext, group_by_game, run_analyzer
+from play_text_features import text_feature
 
-def analyze_red_zone(plays: List[Dict], team_name: str) -> Dict[str, Any]:
-    """
-    Analyze Tight Red Zone (10 yards), Red Zone (20 yards), and Green Zone (30 yards) performance
-    
-    Args:
-        plays: List of play dictionaries
-        team_name: Name of the team
-        
-    Returns:
-        Dictionary with analysis results
-    """
-    # Filter to ONLY the primary team's offensive plays (but include field goals even though they're special teams)
-    # This ensures we only analyze the primary team's performance, not opponent plays
-    offensive_plays = [
-        p for p in plays
-        if (p.get('offense') or '').lower() == team_name.lower()
-        and (p.get('play_classification') != 'special_teams' 
-             or 'field goal' in p.get('play_type', '').lower())
-    ]
-    
-    # Double-check: ensure no opponent plays slip through
-    offensive_plays = [p for p in offensive_plays if (p.get('offense') or '').lower() == team_name.lower()]
-    
-    # Tight Red Zone: 10 yards to goal and in
-    tight_red_zone_plays = [
-        p for p in offensive_plays
-        if (p.get('yards_to_goal') is not None and p.get('yards_to_goal') <= 10)
-    ]
-    
-    # Red Zone: 20 yards to goal and in
-    red_zone_plays = [
-        p for p in offensive_plays
-        if (p.get('yards_to_goal') is not None and p.get('yards_to_goal') <= 20)
-    ]
-    
-    # Outer Red Zone: 11-20 yards to goal (red zone but not tight red zone)
-    outer_red_zone_plays = [
-        p for p in offensive_plays
-        if (p.get('yards_to_goal') is not None and 11 <= p.get('yards_to_goal') <= 20)
-    ]
-    
-    # Green Zone: 30 yards to goal and in
-    green_zone_plays = [
-        p for p in offensive_plays
-        if (p.get('yards_to_goal') is not None and p.get('yards_to_goal') <= 30)
-    ]
+
+class RedZoneAnalyzer(Analyzer):
+    """Tight red zone / red zone / green zone offense (see analyze_red_zone)"""
+
+    name = 'red_zone'
+
+    def __init__(self, team_name: str):
+        super().__init__(team_name)
+        self.offensive_plays: List[Dict] = []
+        self.tight_red_zone_plays: List[Dict] = []
+        self.red_zone_plays: List[Dict] = []
+        self.outer_red_zone_plays: List[Dict] = []
+        self.green_zone_plays: List[Dict] = []
+
+    def visit(self, ctx: PlayContext) -> None:
+        # Filter to ONLY the primary team's offensive plays (but include field goals even though they're special teams)
+        # This ensures we only analyze the primary team's performance, not opponent plays
+        play = ctx.play
+        if not ctx.is_offense:
+            return
+        if play.get('play_classification') == 'special_teams' and 'field goal' not in ctx.play_type_lower:
+            return
+        self.offensive_plays.append(play)
+
+        yards_to_goal = play.get('yards_to_goal')
+        if yards_to_goal is None:
+            return
+        # Tight Red Zone: 10 yards to goal and in
+        if yards_to_goal <= 10:
+            self.tight_red_zone_plays.append(play)
+        # Red Zone: 20 yards to goal and in
+        if yards_to_goal <= 20:
+            self.red_zone_plays.append(play)
+        # Outer Red Zone: 11-20 yards to goal (red zone but not tight red zone)
+        if 11 <= yards_to_goal <= 20:
+            self.outer_red_zone_plays.append(play)
+        # Green Zone: 30 yards to goal and in
+        if yards_to_goal <= 30:
+            self.green_zone_plays.append(play)
+
+    def game_partials(self, engine: AnalysisEngine) -> Dict[Any, Dict[str, Any]]:
+        zones = {
+            'tight_red_zone': group_by_game(self.tight_red_zone_plays, game_id_of),
+            'red_zone': group_by_game(self.red_zone_plays, game_id_of),
+            'outer_red_zone': group_by_game(self.outer_red_zone_plays, game_id_of),
+            'green_zone': group_by_game(self.green_zone_plays, game_id_of),
+        }
+        return {
+            game_id: dict(
+                {zone: zone_partial(zone_games.get(game_id, [])) for zone, zone_games in zones.items()},
+                game_id=game_id
+            )
+            for game_id in group_by_game(self.offensive_plays, game_id_of)
+        }
+
+    def merge(self, partials: Sequence[Dict[str, Any]], engine: AnalysisEngine) -> Dict[str, Any]:
+        result = {
+            zone: merge_zone([partial[zone] for partial in partials])
+            for zone in ('tight_red_zone', 'red_zone', 'outer_red_zone', 'green_zone')
+        }
     
-    def analyze_zone(zone_plays, zone_name):
-        """Analyze a specific zone"""
-        if not zone_plays:
-            return {
-                'total_plays': 0,
-                'red_zone_attempts': 0,
-                'touchdowns': 0,
-                'td_scoring_rate': 0,
-                'turnovers': 0,
-                'turnovers_on_downs': 0,
-                'avg_ppa': 0,
-                'explosive_plays': 0,
-                'explosive_rate': 0,
-                'conversions_3rd': {'attempts': 0, 'conversions': 0, 'rate': 0},
-                'conversions_4th': {'attempts': 0, 'conversions': 0, 'rate': 0},
-                'plays': []
+        # Group by game for trend analysis
+        for zone in ('tight_red_zone', 'red_zone', 'green_zone'):
+            result[f'{zone}_by_game'] = {
+                partial['game_id']: {
+                    'plays': partial[zone]['total_plays'],
+                    'scores': partial[zone]['scores'],
+                    'touchdowns': partial[zone]['scored_touchdowns']
+                }
+                for partial in partials
+                if partial[zone]['total_plays']
             }
-        
-        touchdowns = sum(1 for p in zone_plays 
-                         if p.get('scoring') == True
-                         and ('touchdown' in p.get('play_type', '').lower() 
-                              or 'touchdown' in p.get('play_text', '').lower()))
-        
-        # Count red zone attempts (unique drives that entered the zone)
-        # A red zone attempt is a drive that had at least one play in the zone
-        red_zone_drives = set()
-        for p in zone_plays:
+    
+        result['total_games'] = len(partials)
+        return result
+
+
+def game_id_of(play: Dict) -> Any:
+    """Game a play belongs to (the offensive plays are plain play dicts)"""
+    return play.get('game_id')
+
+
+def is_touchdown(play: Dict) -> bool:
+    """Touchdown by play_type or play_text"""
+    return 'touchdown' in play.get('play_type', '').lower() or bool(text_feature(play, 'text_is_td'))
+
+
+def zone_partial(zone_plays: List[Dict]) -> Dict[str, Any]:
+    """Counts, sums and table rows of one game's plays in a zone"""
+    touchdowns = sum(1 for p in zone_plays 
+                     if p.get('scoring') == True
+                     and is_touchdown(p))
+
+    # Count red zone attempts (unique drives that entered the zone)
+    # A red zone attempt is a drive that had at least one play in the zone
+    red_zone_drives = set()
+    for p in zone_plays:
+        game_id = p.get('game_id')
+        drive_number = p.get('drive_number')
+        if game_id and drive_number is not None:
+            red_zone_drives.add((game_id, drive_number))
+
+    # Count how many of those drives resulted in a touchdown
+    drives_with_td = set()
+    for p in zone_plays:
+        if p.get('scoring') == True and is_touchdown(p):
             game_id = p.get('game_id')
             drive_number = p.get('drive_number')
             if game_id and drive_number is not None:
-                red_zone_drives.add((game_id, drive_number))
-        
-        red_zone_attempts = len(red_zone_drives)
-        
-        # Count how many of those drives resulted in a touchdown
-        drives_with_td = set()
-        for p in zone_plays:
-            if p.get('scoring') == True and ('touchdown' in p.get('play_type', '').lower() 
-                                             or 'touchdown' in p.get('play_text', '').lower()):
-                game_id = p.get('game_id')
-                drive_number = p.get('drive_number')
-                if game_id and drive_number is not None:
-                    drives_with_td.add((game_id, drive_number))
-        
-        td_scoring_rate = (len(drives_with_td) / red_zone_attempts * 100) if red_zone_attempts > 0 else 0
-        
-        # Count turnovers in the zone
+                drives_with_td.add((game_id, drive_number))
+
+    # PPA
+    ppas = [float(p.get('ppa')) for p in zone_plays if p.get('ppa') is not None]
+
+    # 3rd down conversions
+    third_downs = [p for p in zone_plays if p.get('down') == 3]
+    third_conversions = sum(1 for p in third_downs 
+                           if text_feature(p, 'text_is_first_down')
+                           or p.get('yards_gained', 0) >= p.get('distance', 0))
+
+    # 4th down conversions (go for it only)
+    fourth_downs = [
+        p for p in zone_plays 
+        if p.get('down') == 4 
+        and 'punt' not in p.get('play_type', '').lower()
+        and 'field goal' not in p.get('play_type', '').lower()
+    ]
+    fourth_conversions = sum(1 for p in fourth_downs
+                            if text_feature(p, 'text_is_first_down')
+                            or p.get('yards_gained', 0) >= p.get('distance', 0))
+
+    # Prepare plays for table
+    zone_plays_list = []
+    for play in zone_plays:
+        zone_plays_list.append({
+            'game_id': play.get('game_id'),
+            'game_week': play.get('game_week'),
+            'opponent': play.get('opponent'),
+            'period': play.get('period'),
+            'clock': play.get('clock', ''),
+            'down': play.get('down'),
+            'distance': play.get('distance'),
+            'yards_to_goal': play.get('yards_to_goal'),
+            'play_type': play.get('play_type', ''),
+            'yards_gained': play.get('yards_gained', 0),
+            'ppa': play.get('ppa'),
+            'scoring': play.get('scoring', False),
+            'explosive': play.get('explosive_play', False),
+            'play_text': play.get('play_text', '')[:200]
+        })
+
+    return {
+        'total_plays': len(zone_plays),
+        'red_zone_attempts': len(red_zone_drives),
+        'drives_with_td': len(drives_with_td),
+        'touchdowns': touchdowns,
         # Separate turnovers on downs from fumbles/interceptions
-        turnovers = sum(1 for p in zone_plays 
-                       if p.get('turnover') == True
-                       and (p.get('turnover_type') or '').lower() != 'downs')
-        
-        # Count turnovers on downs separately
-        turnovers_on_downs = sum(1 for p in zone_plays 
-                                if p.get('turnover') == True
-                                and (p.get('turnover_type') or '').lower() == 'downs')
-        
-        # PPA
-        ppas = [float(p.get('ppa')) for p in zone_plays if p.get('ppa') is not None]
-        avg_ppa = sum(ppas) / len(ppas) if ppas else 0
-        
-        # Explosive plays
-        explosive = sum(1 for p in zone_plays if p.get('explosive_play'))
-        explosive_rate = (explosive / len(zone_plays) * 100) if zone_plays else 0
-        
-        # 3rd down conversions
-        third_downs = [p for p in zone_plays if p.get('down') == 3]
-        third_conversions = sum(1 for p in third_downs 
-                               if '1st down' in p.get('play_text', '').lower() 
-                               or 'first down' in p.get('play_text', '').lower()
-                               or p.get('yards_gained', 0) >= p.get('distance', 0))
-        
-        # 4th down conversions (go for it only)
-        fourth_downs = [
-            p for p in zone_plays 
-            if p.get('down') == 4 
-            and 'punt' not in p.get('play_type', '').lower()
-            and 'field goal' not in p.get('play_type', '').lower()
-        ]
-        fourth_conversions = sum(1 for p in fourth_downs
-                                if '1st down' in p.get('play_text', '').lower()
-                                or 'first down' in p.get('play_text', '').lower()
-                                or p.get('yards_gained', 0) >= p.get('distance', 0))
-        
-        # Prepare plays for table
-        zone_plays_list = []
-        for play in zone_plays:
-            zone_plays_list.append({
-                'game_id': play.get('game_id'),
-                'game_week': play.get('game_week'),
-                'opponent': play.get('opponent'),
-                'period': play.get('period'),
-                'clock': play.get('clock', ''),
-                'down': play.get('down'),
-                'distance': play.get('distance'),
-                'yards_to_goal': play.get('yards_to_goal'),
-                'play_type': play.get('play_type', ''),
-                'yards_gained': play.get('yards_gained', 0),
-                'ppa': play.get('ppa'),
-                'scoring': play.get('scoring', False),
-                'explosive': play.get('explosive_play', False),
-                'play_text': play.get('play_text', '')[:200]
-            })
-        
+        'turnovers': sum(1 for p in zone_plays 
+                         if p.get('turnover') == True
+                         and (p.get('turnover_type') or '').lower() != 'downs'),
+        'turnovers_on_downs': sum(1 for p in zone_plays 
+                                  if p.get('turnover') == True
+                                  and (p.get('turnover_type') or '').lower() == 'downs'),
+        'ppa_sum': sum(ppas),
+        'ppa_count': len(ppas),
+        'explosive_plays': sum(1 for p in zone_plays if p.get('explosive_play')),
+        'scores': sum(1 for p in zone_plays if p.get('scoring')),
+        'scored_touchdowns': sum(1 for p in zone_plays if p.get('scoring') and is_touchdown(p)),
+        'third_attempts': len(third_downs),
+        'third_conversions': third_conversions,
+        'fourth_attempts': len(fourth_downs),
+        'fourth_conversions': fourth_conversions,
+        'plays': zone_plays_list
+    }
+
+
+def merge_zone(zone_partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Analyze a zone over the games of zone_partials"""
+    def total(field):
+        return sum(partial[field] for partial in zone_partials)
+
+    total_plays = total('total_plays')
+    if not total_plays:
         return {
-            'total_plays': len(zone_plays),
-            'red_zone_attempts': red_zone_attempts,
-            'touchdowns': touchdowns,
-            'td_scoring_rate': td_scoring_rate,
-            'turnovers': turnovers,
-            'turnovers_on_downs': turnovers_on_downs,
-            'avg_ppa': avg_ppa,
-            'explosive_plays': explosive,
-            'explosive_rate': explosive_rate,
-            'conversions_3rd': {
-                'attempts': len(third_downs),
-                'conversions': third_conversions,
-                'rate': (third_conversions / len(third_downs) * 100) if third_downs else 0
-            },
-            'conversions_4th': {
-                'attempts': len(fourth_downs),
-                'conversions': fourth_conversions,
-                'rate': (fourth_conversions / len(fourth_downs) * 100) if fourth_downs else 0
-            },
-            'plays': zone_plays_list
+            'total_plays': 0,
+            'red_zone_attempts': 0,
+            'touchdowns': 0,
+            'td_scoring_rate': 0,
+            'turnovers': 0,
+            'turnovers_on_downs': 0,
+            'avg_ppa': 0,
+            'explosive_plays': 0,
+            'explosive_rate': 0,
+            'conversions_3rd': {'attempts': 0, 'conversions': 0, 'rate': 0},
+            'conversions_4th': {'attempts': 0, 'conversions': 0, 'rate': 0},
+            'plays': []
         }
-    
-    tight_red_zone_stats = analyze_zone(tight_red_zone_plays, 'Tight Red Zone')
-    red_zone_stats = analyze_zone(red_zone_plays, 'Red Zone')
-    outer_red_zone_stats = analyze_zone(outer_red_zone_plays, 'Outer Red Zone')
-    green_zone_stats = analyze_zone(green_zone_plays, 'Green Zone')
-    
-    # Group by game for trend analysis
-    tight_red_zone_by_game = defaultdict(lambda: {'plays': 0, 'scores': 0, 'touchdowns': 0})
-    red_zone_by_game = defaultdict(lambda: {'plays': 0, 'scores': 0, 'touchdowns': 0})
-    green_zone_by_game = defaultdict(lambda: {'plays': 0, 'scores': 0, 'touchdowns': 0})
-    
-    for play in tight_red_zone_plays:
-        game_id = play.get('game_id')
-        tight_red_zone_by_game[game_id]['plays'] += 1
-        if play.get('scoring'):
-            tight_red_zone_by_game[game_id]['scores'] += 1
-            if ('touchdown' in play.get('play_type', '').lower() 
-                or 'touchdown' in play.get('play_text', '').lower()):
-                tight_red_zone_by_game[game_id]['touchdowns'] += 1
-    
-    for play in red_zone_plays:
-        game_id = play.get('game_id')
-        red_zone_by_game[game_id]['plays'] += 1
-        if play.get('scoring'):
-            red_zone_by_game[game_id]['scores'] += 1
-            if ('touchdown' in play.get('play_type', '').lower() 
-                or 'touchdown' in play.get('play_text', '').lower()):
-                red_zone_by_game[game_id]['touchdowns'] += 1
-    
-    for play in green_zone_plays:
-        game_id = play.get('game_id')
-        green_zone_by_game[game_id]['plays'] += 1
-        if play.get('scoring'):
-            green_zone_by_game[game_id]['scores'] += 1
-            if ('touchdown' in play.get('play_type', '').lower() 
-                or 'touchdown' in play.get('play_text', '').lower()):
-                green_zone_by_game[game_id]['touchdowns'] += 1
-    
+
+    red_zone_attempts = total('red_zone_attempts')
+    td_scoring_rate = (total('drives_with_td') / red_zone_attempts * 100) if red_zone_attempts > 0 else 0
+
+    ppa_count = total('ppa_count')
+    avg_ppa = total('ppa_sum') / ppa_count if ppa_count else 0
+
+    explosive = total('explosive_plays')
+    explosive_rate = explosive / total_plays * 100
+
+    third_attempts = total('third_attempts')
+    third_conversions = total('third_conversions')
+    fourth_attempts = total('fourth_attempts')
+    fourth_conversions = total('fourth_conversions')
+
+    zone_plays_list = []
+    for partial in zone_partials:
+        zone_plays_list.extend(partial['plays'])
+
     return {
-        'tight_red_zone': tight_red_zone_stats,
-        'red_zone': red_zone_stats,
-        'outer_red_zone': outer_red_zone_stats,
-        'green_zone': green_zone_stats,
-        'tight_red_zone_by_game': dict(tight_red_zone_by_game),
-        'red_zone_by_game': dict(red_zone_by_game),
-        'green_zone_by_game': dict(green_zone_by_game),
-        'total_games': len(set(p.get('game_id') for p in offensive_plays))
+        'total_plays': total_plays,
+        'red_zone_attempts': red_zone_attempts,
+        'touchdowns': total('touchdowns'),
+        'td_scoring_rate': td_scoring_rate,
+        'turnovers': total('turnovers'),
+        'turnovers_on_downs': total('turnovers_on_downs'),
+        'avg_ppa': avg_ppa,
+        'explosive_plays': explosive,
+        'explosive_rate': explosive_rate,
+        'conversions_3rd': {
+            'attempts': third_attempts,
+            'conversions': third_conversions,
+            'rate': (third_conversions / third_attempts * 100) if third_attempts else 0
+        },
+        'conversions_4th': {
+            'attempts': fourth_attempts,
+            'conversions': fourth_conversions,
+            'rate': (fourth_conversions / fourth_attempts * 100) if fourth_attempts else 0
+        },
+        'plays': zone_plays_list
     }
 
+def analyze_red_zone(plays: List[Dict], team_name: str) -> Dict[str, Any]:
+    """
+    Analyze Tight Red Zone (10 yards), Red Zone (20 yards), and Green Zone (30 yards) performance
+    
+    Args:
+        plays: List of play dictionaries
+        team_name: Name of the team
+        
+    Returns:
+        Dictionary with analysis results
+    """
+    return run_analyzer(RedZoneAnalyzer(team_name), plays)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Compact play payload embedded in the generated analysis app
+
+The app used to embed every play three times (in allData, as teamXPlays and
+in a deep clone made on load). The payload stores them once, column by
+column:
+- one array per play field per team
+- low-cardinality strings (team names, play types, opponents, ...) are codes
+  into a string table shared by both teams
+- rows that lack a field are listed under 'absent', so the page can tell a
+  missing field from a null one
+
+The page wraps the columns in row views (decodePlays in the generated JS).
+
+write_data_block() streams the app's whole data block (analysis results and
+plays) into the output file, gzip-compressed and base64-encoded by default;
+the page inflates it with the browser's DecompressionStream.
+"""
+
+import base64
+import json
+import zlib
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Mapping, TextIO
+
+from play_table import MAX_DICT_RATIO, MISSING
+
+# Characters of JSON buffered per write of the data block
+WRITE_CHUNK_SIZE = 64 * 1024
+# List items encoded per piece when streaming the data block
+ENCODE_SLICE_SIZE = 1000
+
+
+def _is_dictionary_column(values: List[Any]) -> bool:
+    """True if a column is a low-cardinality string column worth encoding"""
+    distinct = set()
+    for value in values:
+        if value is not None and not isinstance(value, str):
+            return False
+        distinct.add(value)
+    return len(distinct) <= len(values) * MAX_DICT_RATIO
+
+
+def encode_plays_payload(teams: Dict[str, Iterable[Mapping[str, Any]]],
+                         exclude: Collection[str] = ()) -> Dict[str, Any]:
+    """
+    Encode the plays of each team as columns with a shared string table.
+
+    Args:
+        teams: Team key -> plays (play dicts or PlayTable rows)
+        exclude: Play fields to leave out (e.g. fields only the Python
+            analyzers read)
+
+    Returns:
+        {'strings': [...], 'teams': {team_key: {'length': n, 'columns': {...}}}}
+        where every column is {'codes': [...]} (indices into strings) or
+        {'values': [...]}, plus 'absent': [row, ...] when some rows lack it
+    """
+    strings: List[Any] = []
+    string_codes: Dict[Any, int] = {}
+
+    def intern(value: Any) -> int:
+        code = string_codes.get(value)
+        if code is None:
+            code = string_codes[value] = len(strings)
+            strings.append(value)
+        return code
+
+    encoded_teams = {}
+    for team_key, plays in teams.items():
+        plays = list(plays)
+        n = len(plays)
+
+        # Transpose rows into columns (first-seen field order)
+        raw: Dict[str, List[Any]] = {}
+        for i, play in enumerate(plays):
+            for key, value in play.items():
+                values = raw.get(key)
+                if values is None:
+                    if key in exclude:
+                        continue
+                    values = raw[key] = [MISSING] * n
+                values[i] = value
+
+        columns = {}
+        for key, values in raw.items():
+            absent = [i for i, value in enumerate(values) if value is MISSING]
+            if absent:
+                values = [None if value is MISSING else value for value in values]
+            if _is_dictionary_column(values):
+                column = {'codes': [intern(value) for value in values]}
+            else:
+                column = {'values': values}
+            if absent:
+                column['absent'] = absent
+            columns[key] = column
+
+        encoded_teams[team_key] = {'length': n, 'columns': columns}
+
+    return {'strings': strings, 'teams': encoded_teams}
+
+
+def _iterencode(value: Any, encode: Callable[[Any], str]) -> Iterator[str]:
+    """
+    Encode `value` as JSON piece by piece.
+
+    Dicts with string keys are walked and long lists are encoded in slices;
+    everything else goes through `encode` (the C encoder) in one piece, so
+    no piece grows with the size of the data.
+    """
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        yield '{'
+        for i, (key, item) in enumerate(value.items()):
+            yield (',' if i else '') + encode(key) + ':'
+            yield from _iterencode(item, encode)
+        yield '}'
+    elif isinstance(value, (list, tuple)) and len(value) > ENCODE_SLICE_SIZE:
+        yield '['
+        for start in range(0, len(value), ENCODE_SLICE_SIZE):
+            # Strip the slice's own brackets
+            text = encode(value[start:start + ENCODE_SLICE_SIZE])[1:-1]
+            yield (',' if start else '') + text
+        yield ']'
+    else:
+        yield encode(value)
+
+
+def _joined(chunks: Iterator[str], size: int = WRITE_CHUNK_SIZE) -> Iterator[str]:
+    """Join small encoded pieces into chunks of about `size` characters"""
+    pending: List[str] = []
+    length = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(pending)
+            pending = []
+            length = 0
+    if pending:
+        yield ''.join(pending)
+
+
+def write_data_block(fp: TextIO, data: Any, encoding: str = 'gzip') -> None:
+    """
+    Serialize the data block embedded in the generated app into a file.
+
+    The JSON is written as it is encoded (and compressed), so the serialized
+    block is never held in memory as a whole.
+
+    Args:
+        fp: Text file to write to
+        data: JSON-serializable data
+        encoding: 'gzip' to gzip the JSON and base64-encode it, or 'json' to
+            write plain JSON (for browsers without DecompressionStream); the
+            output is safe to place inside a <script> element either way
+    """
+    if encoding not in ('gzip', 'json'):
+        raise ValueError(f"Unknown data block encoding: {encoding}")
+
+    chunks = _joined(_iterencode(data, json.JSONEncoder(separators=(',', ':')).encode))
+    if encoding == 'json':
+        for chunk in chunks:
+            # '<\/' is a valid JSON escape and cannot close the <script> element.
+            # '<' only occurs inside strings, which the encoder emits whole,
+            # so a '</' never straddles two chunks.
+            fp.write(chunk.replace('</', '<\\/'))
+        return
+
+    # wbits=31 writes a gzip container; its header has no timestamp, so the
+    # output is identical for identical data
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    pending = b''
+    for chunk in chunks:
+        pending += compressor.compress(chunk.encode('utf-8'))
+        # Base64-encode whole 3-byte groups only, so the pieces concatenate
+        cut = len(pending) - len(pending) % 3
+        fp.write(base64.b64encode(pending[:cut]).decode('ascii'))
+        pending = pending[cut:]
+    pending += compressor.flush()
+    fp.write(base64.b64encode(pending).decode('ascii'))
@@ -5,79 +5,68 @@ Find and analyze the specific game using CFBD API
 """
 
 import json
-import requests
 from datetime import datetime
 
-def find_michigan_washington_2025():
+from http_cache import ResponseCache
+from http_client import CfbdApi, HttpError, run
+
+async def fetch_michigan_washington_2025(client):
     """Find Michigan vs Washington game in 2025 using CFBD API"""
     print("Searching for Michigan vs Washington 2025 in CFBD...")
     
     # Load API key
-    with open('config.json', 'r') as f:
-        config = json.load(f)
-    
-    api_key = config['api_key']
-    base_url = config['base_url']
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
+    cfbd = CfbdApi.from_config(client)
     
     try:
         # Search for Michigan games in 2025
         print("Searching for Michigan games in 2025...")
-        response = requests.get(f"{base_url}/games", headers=headers, params={
-            'year': 2025,
-            'team': 'Michigan'
-        })
-        
-        if response.status_code == 200:
-            games = response.json()
-            print(f"Found {len(games)} Michigan games in 2025")
-            
-            # Look for Washington opponent
-            target_game = None
-            for game in games:
-                home_team = game.get('home_team', '')
-                away_team = game.get('away_team', '')
-                print(f"Game {game.get('id')}: {away_team} @ {home_team}")
-                
-                if 'Washington' in home_team or 'Washington' in away_team:
-                    target_game = game
-                    print(f"  *** FOUND MATCH: {away_team} @ {home_team} ***")
-                    break
-            
-            if target_game:
-                game_id = target_game.get('id')
-                print(f"Using game ID: {game_id}")
-                
-                # Get plays for this specific game
-                plays_response = requests.get(f"{base_url}/plays", headers=headers, params={
-                    'gameId': game_id,
-                    'year': 2025
-                })
-                
-                if plays_response.status_code == 200:
-                    plays = plays_response.json()
-                    print(f"Retrieved {len(plays)} plays from CFBD")
-                    return target_game, plays
-                else:
-                    print(f"Failed to get plays: {plays_response.text}")
-            else:
-                print("No Michigan vs Washington game found in 2025")
-                # Show all available games for reference
-                print("\nAll Michigan 2025 games:")
-                for game in games:
-                    print(f"  {game.get('id')}: {game.get('away_team')} @ {game.get('home_team')} - {game.get('start_date')}")
-                
-        else:
-            print(f"Failed to get games: {response.text}")
-            
+        games = await cfbd.get('games', year=2025, team='Michigan')
+    except HttpError as e:
+        print(f"Failed to get games: {e.body.decode('utf-8', errors='replace')}")
+        return None, []
+    
+    print(f"Found {len(games)} Michigan games in 2025")
+    
+    # Look for Washington opponent
+    target_game = None
+    for game in games:
+        home_team = game.get('home_team', '')
+        away_team = game.get('away_team', '')
+        print(f"Game {game.get('id')}: {away_team} @ {home_team}")
+        
+        if 'Washington' in home_team or 'Washington' in away_team:
+            target_game = game
+            print(f"  *** FOUND MATCH: {away_team} @ {home_team} ***")
+            break
+    
+    if not target_game:
+        print("No Michigan vs Washington game found in 2025")
+        # Show all available games for reference
+        print("\nAll Michigan 2025 games:")
+        for game in games:
+            print(f"  {game.get('id')}: {game.get('away_team')} @ {game.get('home_team')} - {game.get('start_date')}")
+        return None, []
+    
+    game_id = target_game.get('id')
+    print(f"Using game ID: {game_id}")
+    
+    # Get plays for this specific game
+    try:
+        plays = await cfbd.get('plays', gameId=game_id, year=2025)
+    except HttpError as e:
+        print(f"Failed to get plays: {e.body.decode('utf-8', errors='replace')}")
+        return None, []
+    
+    print(f"Retrieved {len(plays)} plays from CFBD")
+    return target_game, plays
+
+def find_michigan_washington_2025():
+    """Find Michigan vs Washington game in 2025 using CFBD API"""
+    try:
+        return run(fetch_michigan_washington_2025, cache=ResponseCache())
     except Exception as e:
         print(f"Error: {e}")
-    
-    return None, []
+        return None, []
 
 def load_espn_michigan_washington():
     """Load ESPN data for Michigan vs Washington (401752873)"""
@@ -5,26 +5,20 @@ Follows GAME_REVIEW_INSTRUCTIONS.md requirements
 """
 
 import json
-import requests
 import os
 import re
 from datetime import datetime
 from collections import defaultdict
 
-def load_config():
-    """Load API configuration"""
-    with open('config.json', 'r') as f:
-        return json.load(f)
+from http_cache import ResponseCache
+from http_client import CfbdApi, EspnApi, HttpError, run
 
 def fetch_espn_summary(game_id):
     """Fetch complete game summary from ESPN API"""
     print(f"Fetching ESPN summary for game {game_id}...")
-    url = f"https://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={game_id}"
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = run(lambda client: EspnApi(client).summary(game_id), cache=ResponseCache())
         print(f"  ✓ Successfully fetched ESPN summary")
         return data
     except Exception as e:
@@ -35,30 +29,16 @@ def fetch_cfbd_team_stats(team_name, year=2025):
     """Fetch CFBD team statistics for 2025 season"""
     print(f"Fetching CFBD stats for {team_name} ({year})...")
     
-    config = load_config()
-    headers = {
-        'Authorization': f"Bearer {config['api_key']}",
-        'Content-Type': 'application/json'
-    }
-    
     try:
         # Get team stats endpoint
-        url = f"{config['base_url']}/stats/season"
-        params = {
-            'year': year,
-            'team': team_name,
-            'category': 'passing'
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            # Note: This endpoint may vary, adjust based on actual CFBD API structure
-            stats = response.json()
-            print(f"  ✓ Fetched stats for {team_name}")
-            return stats
-        else:
-            print(f"  ⚠ Could not fetch stats (status {response.status_code})")
-            return None
+        # Note: This endpoint may vary, adjust based on actual CFBD API structure
+        stats = run(lambda client: CfbdApi.from_config(client).get(
+            'stats/season', year=year, team=team_name, category='passing'), cache=ResponseCache())
+        print(f"  ✓ Fetched stats for {team_name}")
+        return stats
+    except HttpError as e:
+        print(f"  ⚠ Could not fetch stats (status {e.status})")
+        return None
     except Exception as e:
         print(f"  ⚠ Error fetching stats: {e}")
         return None
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Per-drive index shared by the loader and the analyzers
+
+analyze_post_turnover used to rescan the whole season for every drive it
+looked at (the turnover that caused a drive, the play after a muffed punt,
+the turnovers of the previous drive). load_team_data builds one DriveIndex
+so those lookups are dictionary hits.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from play_table import PlayTable
+
+
+class DriveIndex:
+    """
+    Plays and turnovers of each (game_id, drive_number), in play order.
+
+    Drives are keyed like the analyzers read them: play.get('game_id') and
+    play.get('drive_number', 0).
+
+    Args:
+        plays: List of play dicts or a PlayTable (not modified)
+    """
+
+    def __init__(self, plays: Sequence[Dict[str, Any]]):
+        if isinstance(plays, PlayTable):
+            game_ids = plays.column('game_id')
+            drive_numbers = plays.column('drive_number', 0)
+            turnovers = plays.column('turnover')
+        else:
+            game_ids = [play.get('game_id') for play in plays]
+            drive_numbers = [play.get('drive_number', 0) for play in plays]
+            turnovers = [play.get('turnover') for play in plays]
+
+        # (game_id, drive_number) -> row positions, in play order
+        self.drive_rows: Dict[Tuple[Any, Any], List[int]] = {}
+        self.turnover_rows: Dict[Tuple[Any, Any], List[int]] = {}
+        for i, key in enumerate(zip(game_ids, drive_numbers)):
+            self.drive_rows.setdefault(key, []).append(i)
+            if turnovers[i] == True:
+                self.turnover_rows.setdefault(key, []).append(i)
+
+        self.plays = plays
+
+    def __len__(self) -> int:
+        return len(self.drive_rows)
+
+    def __contains__(self, key: Tuple[Any, Any]) -> bool:
+        return key in self.drive_rows
+
+    def rows(self, game_id: Any, drive_number: Any) -> List[int]:
+        """Row positions of a drive's plays"""
+        return self.drive_rows.get((game_id, drive_number), [])
+
+    def drive(self, game_id: Any, drive_number: Any) -> List[Dict[str, Any]]:
+        """Plays of a drive, in play order"""
+        return [self.plays[i] for i in self.rows(game_id, drive_number)]
+
+    def turnovers(self, game_id: Any, drive_number: Any) -> List[Dict[str, Any]]:
+        """Plays of a drive with turnover == True, in play order"""
+        return [self.plays[i] for i in self.turnover_rows.get((game_id, drive_number), [])]
+
+    def next_play(self, play: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        First play (in play order) of the same game that is either in the
+        next drive or later in the same drive (higher play_number)
+        """
+        game_id = play.get('game_id')
+        drive_number = play.get('drive_number', 0)
+        play_number = play.get('play_number', 0)
+
+        candidates = []
+        next_drive = self.rows(game_id, drive_number + 1)
+        if next_drive:
+            candidates.append(next_drive[0])
+        for i in self.rows(game_id, drive_number):
+            if self.plays[i].get('play_number', 0) > play_number:
+                candidates.append(i)
+                break
+
+        return self.plays[min(candidates)] if candidates else None
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Batched $ref resolution for ESPN core API responses
+
+ESPN core responses link most nested objects ({'$ref': url}) instead of
+embedding them. RefResolver inlines them level by level:
+- walk the response and collect every unresolved ref
+- dedup them by URL and fetch them concurrently (through the client, so the
+  HTTP response cache applies)
+- replace each ref with the fetched object, which keeps its '$ref' key, so
+  code that reads the ref URL still works
+- repeat for refs inside the fetched objects, up to the configured depth
+
+Teams, athletes, venues and positions are the same in every game of a
+season; the resolver keeps them across resolve() calls, so a season fetch
+downloads each once.
+
+Usage:
+    resolver = RefResolver(client, depth=1, match=r'/teams/')
+    drives = await resolver.resolve(await espn.drives(game_id))
+"""
+
+import asyncio
+import copy
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from http_client import HttpClient, HttpError
+
+# Refs to objects shared across games (kept for the resolver's lifetime)
+SHARED_REFS = re.compile(r'/(teams|athletes|venues|positions|franchises)/\d+')
+REF_CONCURRENCY = 16
+
+
+def is_unresolved(value: Any) -> bool:
+    """True for a bare {'$ref': url} link"""
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get('$ref'), str)
+
+
+def ref_id(ref: str, kind: str) -> Optional[str]:
+    """
+    Id of a `kind` object from a ref URL, without fetching it
+
+    e.g. ref_id('.../seasons/2025/teams/2509?lang=en', 'teams') == '2509'
+    """
+    match = re.search(rf'/{re.escape(kind)}/(\d+)', ref)
+    return match.group(1) if match else None
+
+
+def ref_url(ref: str) -> str:
+    """URL to fetch for a ref (ESPN links use http://; fetch those over https)"""
+    if ref.startswith('http://') and (urlsplit(ref).hostname or '').endswith('.espn.com'):
+        return 'https://' + ref[len('http://'):]
+    return ref
+
+
+class RefResolver:
+    """
+    Inlines $ref links in ESPN core responses
+
+    Args:
+        client: Shared HttpClient
+        depth: Levels of refs to inline (1 = only refs in the response itself)
+        concurrency: Maximum refs fetched at the same time
+        match: Regex; only refs whose URL matches are resolved (None = all)
+    """
+
+    def __init__(self, client: HttpClient, depth: int = 1, concurrency: int = REF_CONCURRENCY,
+                 match: Optional[str] = None):
+        self.client = client
+        self.depth = depth
+        self.concurrency = concurrency
+        self.match = re.compile(match) if match else None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shared: Dict[str, asyncio.Task] = {}
+        self.fetched = 0
+
+    async def resolve(self, data: Any, depth: Optional[int] = None) -> Any:
+        """
+        Inline the refs of a response (in place)
+
+        Args:
+            data: Decoded JSON response (may itself be a bare ref)
+            depth: Levels to inline (default: the resolver's depth)
+
+        Returns:
+            The response with its refs inlined; refs that could not be fetched
+            are left as they are
+        """
+        depth = self.depth if depth is None else depth
+        holder = [data]
+        roots: List[Any] = [holder]
+        fetches: Dict[str, asyncio.Task] = {}
+        for _ in range(depth):
+            refs: Dict[str, List[Tuple[Any, Any]]] = {}
+            for root in roots:
+                self._collect(root, refs)
+            if not refs:
+                break
+
+            urls = list(refs)
+            results = await asyncio.gather(*(self._fetch(url, fetches) for url in urls))
+            roots = []
+            for url, result in zip(urls, results):
+                if result is None:
+                    continue
+                for container, key in refs[url]:
+                    # Each place gets its own copy, so inlined objects never
+                    # form cycles and can be edited independently
+                    container[key] = value = copy.deepcopy(result)
+                    roots.append(value)
+        return holder[0]
+
+    def _collect(self, value: Any, refs: Dict[str, List[Tuple[Any, Any]]]) -> None:
+        """Record (container, key) of every unresolved ref below value, by URL"""
+        if isinstance(value, dict):
+            items = value.items()
+        elif isinstance(value, list):
+            items = enumerate(value)
+        else:
+            return
+        for key, item in items:
+            if is_unresolved(item):
+                url = ref_url(item['$ref'])
+                if self.match is None or self.match.search(url):
+                    refs.setdefault(url, []).append((value, key))
+            elif isinstance(item, (dict, list)):
+                self._collect(item, refs)
+
+    async def _fetch(self, url: str, fetches: Dict[str, asyncio.Task]) -> Optional[Any]:
+        """Fetched object of a ref, shared by every request for it"""
+        memo = self._shared if SHARED_REFS.search(url) else fetches
+        task = memo.get(url)
+        if task is None:
+            task = memo[url] = asyncio.ensure_future(self._get(url))
+        result = await asyncio.shield(task)
+        if result is None:
+            # Retry failed refs on the next resolve()
+            memo.pop(url, None)
+        return result
+
+    async def _get(self, url: str) -> Optional[Any]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A semaphore belongs to one event loop (the resolver may outlive it)
+            self._limit, self._loop = asyncio.Semaphore(self.concurrency), loop
+        async with self._limit:
+            try:
+                result = await self.client.get_json(url)
+            except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
+                print(f"  Warning: could not resolve {url}: {e}")
+                return None
+        self.fetched += 1
+        return result
@@ -4,35 +4,27 @@ Fetch complete Purdue play-by-play data for multiple games using ESPN API
 Game IDs: 401752864, 401752861, 401752848, 401752832, 401752819, 401752801
 """
 
+import asyncio
 import json
-import requests
 import os
 from datetime import datetime
 
-def fetch_complete_game_data(game_id):
-    """Fetch complete game data including header, boxscore, and drives"""
+from espn_refs import RefResolver
+from http_cache import ResponseCache
+from http_client import EspnApi, HttpError, run
+
+async def fetch_complete_game_data(espn, game_id, resolver=None):
+    """Fetch complete game data including header, boxscore, and drives (team $refs inlined by the resolver)"""
     print(f"Fetching complete data for game {game_id}...")
     
-    # Fetch header and boxscore
-    header_url = f"http://sports.core.api.espn.com/v2/sports/football/leagues/college-football/events/{game_id}?lang=en&region=us"
-    boxscore_url = f"http://sports.core.api.espn.com/v2/sports/football/leagues/college-football/events/{game_id}/competitions/{game_id}?lang=en&region=us"
-    drives_url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/college-football/events/{game_id}/competitions/{game_id}/drives?lang=en&region=us"
-    
     try:
-        # Fetch header
-        header_response = requests.get(header_url)
-        header_response.raise_for_status()
-        header_data = header_response.json()
-        
-        # Fetch boxscore
-        boxscore_response = requests.get(boxscore_url)
-        boxscore_response.raise_for_status()
-        boxscore_data = boxscore_response.json()
-        
-        # Fetch drives
-        drives_response = requests.get(drives_url)
-        drives_response.raise_for_status()
-        drives_data = drives_response.json()
+        header_data, boxscore_data, drives_data = await asyncio.gather(
+            espn.event(game_id),
+            espn.competition(game_id),
+            espn.core(f"events/{game_id}/competitions/{game_id}/drives"),
+        )
+        if resolver is not None:
+            await asyncio.gather(*(resolver.resolve(part) for part in (header_data, boxscore_data, drives_data)))
         
         # Combine all data
         complete_data = {
@@ -44,10 +36,18 @@ def fetch_complete_game_data(game_id):
         
         print(f"  ✓ Successfully fetched {game_id}")
         return complete_data
-    except requests.exceptions.RequestException as e:
+    except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
         print(f"  ✗ Error fetching {game_id}: {e}")
         return None
 
+async def fetch_all_games(client, game_ids):
+    """Fetch several games at once over the shared client; returns data per game id"""
+    espn = EspnApi(client)
+    # One resolver for all games, so each team is fetched once
+    resolver = RefResolver(client, depth=1, match=r'/teams/\d+(\?|$)')
+    results = await asyncio.gather(*(fetch_complete_game_data(espn, game_id, resolver) for game_id in game_ids))
+    return dict(zip(game_ids, results))
+
 def save_game_data(game_id, data):
     """Save game data to local file"""
     if data is None:
@@ -105,11 +105,13 @@ def main():
     successful_fetches = 0
     failed_fetches = 0
     
+    # Fetch all games concurrently over pooled connections
+    all_data = run(lambda client: fetch_all_games(client, list(game_info)), cache=ResponseCache())
+    print()
+    
     for game_id, game_name in game_info.items():
-        print(f"Fetching {game_name} (ID: {game_id})...")
-        
-        # Fetch complete data
-        data = fetch_complete_game_data(game_id)
+        print(f"Saving {game_name} (ID: {game_id})...")
+        data = all_data[game_id]
         
         if data:
             if save_game_data(game_id, data):
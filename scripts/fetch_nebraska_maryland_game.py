@@ -4,11 +4,15 @@ Fetch complete game data for Nebraska vs Maryland
 Game ID: 401752867
 """
 
+import asyncio
 import json
 import requests
 import os
 from datetime import datetime
 
+from http_cache import ResponseCache
+from http_client import EspnApi, HttpError, run
+
 def fetch_game_data(game_id):
     """Fetch basic game data from ESPN API"""
     print(f"Fetching game data for {game_id}...")
@@ -26,42 +30,17 @@ def fetch_game_data(game_id):
         return None
 
 def fetch_all_plays(game_id):
-    """Fetch all pages of play-by-play data from ESPN API"""
+    """Fetch all pages of play-by-play data from ESPN API (remaining pages concurrently)"""
     print(f"Fetching all play-by-play data for {game_id}...")
+    try:
+        all_plays = run(lambda client: EspnApi(client).all_plays(game_id), cache=ResponseCache())
+    except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
+        print(f"  ✗ Error fetching plays: {e}")
+        return []
+    print(f"  ✓ Total plays fetched: {len(all_plays)}")
+    return all_plays
     
-    all_plays = []
-    page = 1
-    
-    while True:
-        print(f"  Fetching page {page}...")
-        url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/college-football/events/{game_id}/competitions/{game_id}/plays"
-        params = {
-            'page': page,
-            'pageSize': 25
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if 'items' not in data or not data['items']:
-                print(f"  No more plays on page {page}")
-                break
-                
-            all_plays.extend(data['items'])
-            print(f"  ✓ Fetched {len(data['items'])} plays from page {page}")
-            
-            # Check if this is the last page
-            if page >= data.get('pageCount', 1):
-                break
-                
-            page += 1
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  ✗ Error fetching page {page}: {e}")
-            break
-    
+    all_plays = run(fetch_pages, cache=ResponseCache())
     print(f"  ✓ Total plays fetched: {len(all_plays)}")
     return all_plays
 
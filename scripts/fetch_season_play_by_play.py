@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Bulk-fetch a season's play-by-play into the {team}_play_by_play folders
+
+Replaces the per-game fetch scripts: given a season, a conference or a list
+of teams and a week range, lists the games on CFBD, fetches the plays of
+every game that is missing (or was saved before it finished) concurrently,
+normalizes them into the game_info + plays schema that load_team_data()
+reads and writes each file atomically.
+
+Games whose file is present and completed are skipped without a request for
+their plays, so refreshing a conference after a weekend only downloads the
+new games. Responses go through the HTTP response cache, so plays of a game
+shared by two fetched teams are downloaded once; plays of a game stored in
+progress (or of every game, with --refresh) are revalidated with CFBD
+rather than served from a cached in-progress response.
+
+Usage:
+    python fetch_season_play_by_play.py --year 2025 --conference "Big Ten" --weeks 1-8
+    python fetch_season_play_by_play.py --year 2025 --teams Washington Wisconsin
+"""
+
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from http_cache import DEFAULT_CACHE_DIR, ResponseCache
+from http_client import CfbdApi, HttpError, run
+from load_advanced_pbp_data import team_folder_name
+
+POWER4_CONFERENCES = {'SEC', 'Big Ten', 'Big 12', 'ACC'}
+# CFBD conference abbreviations -> the names used on its games
+CONFERENCE_NAMES = {
+    'B1G': 'Big Ten',
+    'B12': 'Big 12',
+    'PAC': 'Pac-12',
+    'MWC': 'Mountain West',
+    'AAC': 'American Athletic',
+    'MAC': 'Mid-American',
+    'SBC': 'Sun Belt',
+    'CUSA': 'Conference USA',
+}
+# Games whose plays are fetched at the same time
+GAME_CONCURRENCY = 8
+
+# "Washington Penalty, False Start (-5 Yards) to the ..."
+PENALTY_PATTERN = re.compile(r'^(.*?)\s+Penalty,\s*([^(]+?)\s*\((-?\d+)\s*Yard', re.IGNORECASE)
+
+
+def parse_weeks(text: str) -> Tuple[int, int]:
+    """'3' -> (3, 3), '1-8' -> (1, 8)"""
+    start, _, end = text.partition('-')
+    return int(start), int(end or start)
+
+
+def conference_matches(conference: Optional[str], wanted: str) -> bool:
+    """Whether a game side's conference is the requested one (name or CFBD abbreviation)"""
+    if not conference:
+        return False
+    names = {wanted.lower(), CONFERENCE_NAMES.get(wanted.upper(), wanted).lower()}
+    return conference.lower() in names
+
+
+def format_clock(clock: Any) -> str:
+    """CFBD clock ({'minutes', 'seconds'}) as "M:SS", the format the loader parses"""
+    if isinstance(clock, dict):
+        return f"{clock.get('minutes') or 0}:{clock.get('seconds') or 0:02d}"
+    return str(clock or '')
+
+
+def classify_play(play_type: str) -> str:
+    """play_classification of a CFBD play type"""
+    play_type = play_type.lower()
+    if 'punt' in play_type or 'field goal' in play_type or 'kick' in play_type:
+        return 'special_teams'
+    if 'penalty' in play_type:
+        return 'penalty'
+    return 'normal'
+
+
+def turnover_type(play_type: str) -> Optional[str]:
+    """'interception' or 'fumble' for CFBD play types that change possession"""
+    play_type = play_type.lower()
+    if 'interception' in play_type:
+        return 'interception'
+    if 'fumble recovery (opponent)' in play_type or 'fumble return' in play_type:
+        return 'fumble'
+    return None
+
+
+def penalty_fields(play: Dict[str, Any], classification: str) -> Dict[str, Any]:
+    """penalty_type/decision/yards/category parsed from a CFBD play's text"""
+    text = play.get('playText') or ''
+    match = PENALTY_PATTERN.search(text)
+    if not match:
+        return {'penalty_type': None, 'penalty_decision': None, 'penalty_category': None}
+
+    team, penalty_type, yards = match.group(1).strip(), match.group(2).strip(), int(match.group(3))
+    lower_text = text.lower()
+    if 'declined' in lower_text:
+        decision = 'declined'
+    elif 'offsetting' in lower_text:
+        decision = 'offsetting'
+    else:
+        decision = 'accepted'
+
+    category = None
+    if 'holding' in penalty_type.lower():
+        if classification == 'special_teams':
+            category = 'special_teams_holding'
+        elif team.lower() == (play.get('offense') or '').lower():
+            category = 'offensive_holding'
+        else:
+            category = 'defensive_holding'
+
+    return {
+        'penalty_type': penalty_type,
+        'penalty_decision': decision,
+        'penalty_category': category,
+        'penalty_yards': yards,
+    }
+
+
+def normalize_play(play: Dict[str, Any], game_id: int) -> Dict[str, Any]:
+    """
+    Convert a CFBD /plays record to the play schema of the game files
+
+    Fields derived from play_text (is_td, return_yards, ...) and middle_eight
+    are left to the loader, which adds them when a file lacks them.
+    """
+    play_type = play.get('playType') or ''
+    classification = classify_play(play_type)
+    yards_gained = play.get('yardsGained') or 0
+    lower_type = play_type.lower()
+    explosive = classification == 'normal' and (
+        ('rush' in lower_type and yards_gained >= 15) or ('pass' in lower_type and yards_gained >= 20))
+    lost_ball = turnover_type(play_type)
+
+    normalized = {
+        'id': str(play.get('id', '')),
+        'drive_id': str(play.get('driveId', '')),
+        'game_id': game_id,
+        'drive_number': play.get('driveNumber'),
+        'play_number': play.get('playNumber'),
+        'offense': play.get('offense', ''),
+        'defense': play.get('defense', ''),
+        'period': play.get('period'),
+        'clock': format_clock(play.get('clock')),
+        'yard_line': play.get('yardline'),
+        'yards_to_goal': play.get('yardsToGoal'),
+        'down': play.get('down'),
+        'distance': play.get('distance'),
+        'yards_gained': yards_gained,
+        'scoring': bool(play.get('scoring')),
+        'play_type': play_type,
+        'play_text': play.get('playText') or '',
+        'ppa': play.get('ppa'),
+        'explosive_play': explosive,
+        'play_classification': classification,
+        'turnover': lost_ball is not None,
+        'turnover_type': lost_ball,
+        'offenseScore': play.get('offenseScore'),
+        'defenseScore': play.get('defenseScore'),
+    }
+    normalized.update(penalty_fields(play, classification))
+    if play.get('wallclock'):
+        normalized['wallclock'] = play['wallclock']
+    return normalized
+
+
+def build_game_info(game: Dict[str, Any], plays: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """game_info block of a game file from a CFBD /games record"""
+    return {
+        'game_id': game.get('id'),
+        'home_team': game.get('homeTeam'),
+        'away_team': game.get('awayTeam'),
+        'week': game.get('week'),
+        'date': game.get('startDate', ''),
+        'season': game.get('season'),
+        'season_type': game.get('seasonType'),
+        'total_plays': len(plays),
+        'conference': bool(game.get('conferenceGame')),
+        'home_power4': game.get('homeConference') in POWER4_CONFERENCES,
+        'away_power4': game.get('awayConference') in POWER4_CONFERENCES,
+        'completed': bool(game.get('completed')),
+    }
+
+
+def game_file_path(data_dir: Path, team: str, game: Dict[str, Any]) -> Path:
+    """
+    File of a game in a team's folder
+
+    An existing file of the game (e.g. from a per-game script) is reused, so
+    a game is never stored twice.
+    """
+    folder = data_dir / team_folder_name(team)
+    existing = sorted(folder.glob(f"game_{game['id']}_*.json"))
+    if existing:
+        return existing[0]
+    slug = team_folder_name(team)[:-len('_play_by_play')]
+    return folder / f"game_{game['id']}_{slug}_week_{game.get('week')}.json"
+
+
+def is_stored_complete(path: Path) -> bool:
+    """Whether a game file exists and holds a completed game"""
+    if not path.exists():
+        return False
+    try:
+        with open(path, 'r') as f:
+            game_info = json.load(f).get('game_info', {})
+    except Exception as e:
+        print(f"  Warning: re-fetching unreadable {path}: {e}")
+        return False
+    # Files written by the per-game scripts have no flag; they hold finished games
+    return bool(game_info.get('completed', True) and game_info.get('total_plays', 1))
+
+
+def has_started(game: Dict[str, Any], now: datetime) -> bool:
+    """Whether a game has kicked off (unknown start times count as started)"""
+    start = game.get('startDate')
+    if not start:
+        return True
+    try:
+        return datetime.fromisoformat(start.replace('Z', '+00:00')) <= now
+    except ValueError:
+        return True
+
+
+def write_game_file(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically replace a game file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+async def list_games(cfbd: CfbdApi, year: int, weeks: Tuple[int, int], season_type: str,
+                     conference: Optional[str] = None,
+                     teams: Optional[Iterable[str]] = None) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """
+    Games of the season in scope, with the teams to store each one for
+
+    Returns:
+        [(CFBD game, [team, ...]), ...] ordered by week
+    """
+    teams = list(teams or [])
+    if teams:
+        results = await asyncio.gather(*(cfbd.games(year, team=team, season_type=season_type)
+                                         for team in teams))
+        games = [game for result in results for game in result]
+    else:
+        games = await cfbd.games(year, conference=conference, season_type=season_type)
+
+    wanted_teams = {team.lower() for team in teams}
+    scoped = {}
+    for game in games:
+        if not weeks[0] <= (game.get('week') or 0) <= weeks[1]:
+            continue
+        sides = []
+        for side in ('home', 'away'):
+            team = game.get(f'{side}Team')
+            if not team:
+                continue
+            if (team.lower() in wanted_teams or
+                    (conference and conference_matches(game.get(f'{side}Conference'), conference))):
+                sides.append(team)
+        if sides:
+            # A game between two listed teams appears in both teams' results
+            scoped[game['id']] = (game, sides)
+    return sorted(scoped.values(), key=lambda item: (item[0].get('week') or 0, item[0]['id']))
+
+
+async def fetch_season(client, year: int, weeks: Tuple[int, int], data_dir: str,
+                       conference: Optional[str] = None, teams: Optional[Iterable[str]] = None,
+                       season_type: str = 'regular', config_path: str = 'config.json',
+                       refresh: bool = False, concurrency: int = GAME_CONCURRENCY) -> Dict[str, int]:
+    """
+    Fetch and store the missing games of a season
+
+    Args:
+        client: Shared HttpClient
+        year: Season
+        weeks: (first week, last week), inclusive
+        data_dir: Folder holding the {team}_play_by_play folders
+        conference: Conference name or CFBD abbreviation
+        teams: Team names (alternative or addition to conference)
+        season_type: CFBD season type ('regular' or 'postseason')
+        config_path: config.json with the CFBD api_key and base_url
+        refresh: Re-fetch games even if their file is complete (bypassing cached plays)
+        concurrency: Games fetched at the same time
+
+    Returns:
+        Counts of 'written', 'skipped', 'not_started' and 'failed' game files
+    """
+    cfbd = CfbdApi.from_config(client, config_path)
+    games = await list_games(cfbd, year, weeks, season_type, conference, teams)
+    now = datetime.now(timezone.utc)
+    data_path = Path(data_dir)
+    counts = {'written': 0, 'skipped': 0, 'not_started': 0, 'failed': 0}
+
+    jobs = []
+    for game, sides in games:
+        paths = []
+        for team in sides:
+            path = game_file_path(data_path, team, game)
+            # Games transcribed from PDFs are never overwritten
+            if path.name.endswith('_PDF.json') or (not refresh and is_stored_complete(path)):
+                counts['skipped'] += 1
+            else:
+                paths.append(path)
+        if not paths:
+            continue
+        if not has_started(game, now):
+            counts['not_started'] += len(paths)
+        else:
+            # A stored file that is not complete was saved in progress; its
+            # cached plays may still be that partial response
+            revalidate = refresh or any(path.exists() for path in paths)
+            jobs.append((game, paths, revalidate))
+
+    print(f"{len(games)} game(s) in scope: {len(jobs)} to fetch, "
+          f"{counts['skipped']} file(s) already complete, {counts['not_started']} not started")
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def fetch_game(game: Dict[str, Any], paths: List[Path], revalidate: bool) -> None:
+        async with limit:
+            try:
+                raw_plays = await cfbd.plays(year, game['week'], game_id=game['id'], season_type=season_type,
+                                             refresh=revalidate)
+            except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
+                print(f"  ✗ Week {game['week']} {game['awayTeam']} @ {game['homeTeam']}: {e}")
+                counts['failed'] += len(paths)
+                return
+        plays = [normalize_play(play, game['id']) for play in raw_plays]
+        data = {'game_info': build_game_info(game, plays), 'plays': plays}
+        for path in paths:
+            write_game_file(path, data)
+        counts['written'] += len(paths)
+        state = '' if game.get('completed') else ' (in progress)'
+        print(f"  ✓ Week {game['week']} {game['awayTeam']} @ {game['homeTeam']}: {len(plays)} plays{state}")
+
+    await asyncio.gather(*(fetch_game(*job) for job in jobs))
+    return counts
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fetch a season of play-by-play into the {team}_play_by_play folders')
+    parser.add_argument('--year', type=int, required=True, help='Season')
+    parser.add_argument('--conference', type=str, default=None,
+                       help='Conference name or CFBD abbreviation (e.g. "Big Ten" or B1G)')
+    parser.add_argument('--teams', type=str, nargs='+', default=None, help='Team names')
+    parser.add_argument('--weeks', type=str, default='1-20', help='Week or week range (default: 1-20)')
+    parser.add_argument('--season-type', type=str, default='regular', choices=['regular', 'postseason'])
+    parser.add_argument('--data-dir', type=str, default='advanced_reports_yogi',
+                       help='Folder with the {team}_play_by_play folders (default: advanced_reports_yogi)')
+    parser.add_argument('--config', type=str, default='config.json', help='CFBD config file (default: config.json)')
+    parser.add_argument('--http-cache-dir', type=str, default=DEFAULT_CACHE_DIR,
+                       help=f'HTTP response cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--refresh', action='store_true', help='Re-fetch games that are already stored')
+    parser.add_argument('--concurrency', type=int, default=GAME_CONCURRENCY,
+                       help=f'Games fetched at the same time (default: {GAME_CONCURRENCY})')
+
+    args = parser.parse_args()
+    if not args.conference and not args.teams:
+        parser.error('give --conference and/or --teams')
+
+    counts = run(lambda client: fetch_season(
+        client, args.year, parse_weeks(args.weeks), args.data_dir,
+        conference=args.conference, teams=args.teams, season_type=args.season_type,
+        config_path=args.config, refresh=args.refresh, concurrency=args.concurrency
+    ), cache=ResponseCache(args.http_cache_dir))
+
+    print(f"\n✓ {counts['written']} game file(s) written, {counts['skipped']} already complete, "
+          f"{counts['not_started']} not started, {counts['failed']} failed")
+    sys.exit(1 if counts['failed'] else 0)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Chronological game index shared by the loader and the analyzers
+
+The analyzers all need "the last 3 games" (ordered by week) for their
+summary cards. Instead of every analyzer re-scanning the season to find each
+game's week, load_team_data builds one GameIndex and passes it along.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from play_table import PlayTable
+
+
+class GameAggregates:
+    """
+    Prefix sums of per-game values over a chronological game list, so any
+    window ("last N games", a week range, a rolling trend) is O(1) to sum.
+
+    Args:
+        game_ids: Games in chronological order
+        stats: Per-game stats dict keyed by game_id (e.g. an analyzer's
+            game_stats); games without stats count as 0
+        fields: Stats fields to sum
+    """
+
+    def __init__(self, game_ids: Sequence[Any], stats: Mapping[Any, Mapping[str, float]],
+                 fields: Sequence[str]):
+        self.game_ids = list(game_ids)
+        self.prefix: Dict[str, List[float]] = {field: [0] for field in fields}
+        for game_id in self.game_ids:
+            game = stats.get(game_id, {})
+            for field, prefix in self.prefix.items():
+                prefix.append(prefix[-1] + game.get(field, 0))
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def total(self, field: str) -> float:
+        """Sum over all games"""
+        return self.prefix[field][-1]
+
+    def between(self, field: str, start: int, end: int) -> float:
+        """Sum over game_ids[start:end]"""
+        prefix = self.prefix[field]
+        return prefix[end] - prefix[start]
+
+    def last(self, n: int, field: str) -> float:
+        """Sum over the last n games"""
+        return self.between(field, max(0, len(self.game_ids) - n), len(self.game_ids))
+
+    def last_games(self, n: int) -> List[Any]:
+        """The last n games (the window summed by last(n))"""
+        return self.game_ids[-n:] if n > 0 else []
+
+    def rolling(self, n: int, field: str) -> List[float]:
+        """Sum over the n games ending at each game (fewer at the start)"""
+        return [self.between(field, max(0, end - n), end) for end in range(1, len(self.game_ids) + 1)]
+
+
+class GameIndex:
+    """
+    Games of a season in chronological (week) order, with week/date/opponent
+    per game_id.
+
+    Args:
+        plays: List of play dicts or a PlayTable (not modified)
+    """
+
+    def __init__(self, plays: Sequence[Dict[str, Any]]):
+        if isinstance(plays, PlayTable):
+            game_ids = plays.column('game_id')
+        else:
+            game_ids = [play.get('game_id') for play in plays]
+
+        first_rows: Dict[Any, int] = {}
+        for i, game_id in enumerate(game_ids):
+            if game_id not in first_rows:
+                first_rows[game_id] = i
+
+        # A game's week/date/opponent are taken from its first play
+        games = []
+        for game_id, first_row in first_rows.items():
+            play = plays[first_row]
+            games.append({
+                'game_id': game_id,
+                'week': play.get('game_week'),
+                'date': play.get('game_date'),
+                'opponent': play.get('opponent'),
+                'first_row': first_row
+            })
+        games.sort(key=lambda g: (g['week'] or 0, g['first_row']))
+
+        self.games: List[Dict[str, Any]] = games
+        self.game_ids: List[Any] = [g['game_id'] for g in games]
+        self.by_id: Dict[Any, Dict[str, Any]] = {g['game_id']: g for g in games}
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def __contains__(self, game_id: Any) -> bool:
+        return game_id in self.by_id
+
+    def get(self, game_id: Any) -> Optional[Dict[str, Any]]:
+        """Week/date/opponent of a game, or None if it has no plays"""
+        return self.by_id.get(game_id)
+
+    def week(self, game_id: Any) -> Any:
+        """Week of a game (0 if unknown)"""
+        game = self.by_id.get(game_id)
+        return (game['week'] or 0) if game else 0
+
+    def order(self, game_ids: Optional[Iterable[Any]] = None) -> List[Any]:
+        """
+        Games in chronological order
+
+        Args:
+            game_ids: Subset of games to order (e.g. the games an analyzer
+                has stats for); ties within a week keep the given order.
+                Defaults to every game in the index.
+        """
+        if game_ids is None:
+            return list(self.game_ids)
+        return sorted(game_ids, key=self.week)
+
+    def last_n(self, n: int, game_ids: Optional[Iterable[Any]] = None) -> List[Any]:
+        """The last n games (optionally of a subset) in chronological order"""
+        ordered = self.order(game_ids)
+        return ordered[-n:] if n > 0 else []
+
+    def in_weeks(self, start: Optional[int] = None, end: Optional[int] = None,
+                 game_ids: Optional[Iterable[Any]] = None) -> List[Any]:
+        """Games with start <= week <= end (either bound optional), in order"""
+        return [game_id for game_id in self.order(game_ids)
+                if (start is None or self.week(game_id) >= start)
+                and (end is None or self.week(game_id) <= end)]
+
+    def aggregates(self, stats: Mapping[Any, Mapping[str, float]], fields: Sequence[str],
+                   game_ids: Optional[Iterable[Any]] = None) -> GameAggregates:
+        """
+        Prefix-summed per-game stats in chronological order
+
+        Args:
+            stats: Per-game stats dict keyed by game_id
+            fields: Stats fields to sum
+            game_ids: Games to include (default: the games in stats)
+        """
+        return GameAggregates(self.order(stats if game_ids is None else game_ids), stats, fields)
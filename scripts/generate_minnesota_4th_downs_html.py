@@ -4,10 +4,13 @@ Generate HTML report for Minnesota 4th Down Plays
 Creates detailed tables grouped by game with all available information
 """
 
+import asyncio
 import json
-import requests
 from datetime import datetime
 
+from http_cache import ResponseCache
+from http_client import CfbdApi, run
+
 # Load config
 with open('config.json', 'r') as f:
     config = json.load(f)
@@ -24,51 +27,27 @@ def load_4th_downs_data():
         print(f"Error loading data: {e}")
         return None
 
-def get_game_info(game_id, week):
+async def get_game_info(cfbd, game_id, week):
     """Get additional game information from CFBD API"""
     try:
-        url = f"{BASE_URL}/games"
-        params = {
-            'id': game_id,
-            'year': 2025,
-            'week': week
-        }
-        headers = {
-            'Authorization': f'Bearer {config["api_key"]}'
-        }
-        
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code == 200:
-            games = response.json()
-            if games:
-                return games[0]
+        games = await cfbd.get('games', id=game_id, year=2025, week=week)
+        if games:
+            return games[0]
     except:
         pass
     return None
 
-def get_all_game_plays(game_id, week):
+async def get_all_game_plays(cfbd, game_id, week):
     """Fetch ALL plays for a game to calculate scores at time of play"""
     try:
-        url = f"{BASE_URL}/plays"
-        params = {
-            'gameId': game_id,
-            'year': 2025,
-            'week': week
-        }
-        headers = {
-            'Authorization': f'Bearer {config["api_key"]}'
-        }
-        
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code == 200:
-            all_plays = response.json()
-            # Sort plays chronologically
-            sorted_plays = sorted(all_plays, key=lambda p: (
-                p.get('period', 1),
-                -p.get('clock', {}).get('minutes', 15) if isinstance(p.get('clock'), dict) else 15,
-                -p.get('clock', {}).get('seconds', 0) if isinstance(p.get('clock'), dict) else 0
-            ))
-            return sorted_plays
+        all_plays = await cfbd.plays(2025, week, game_id=game_id)
+        # Sort plays chronologically
+        sorted_plays = sorted(all_plays, key=lambda p: (
+            p.get('period', 1),
+            -p.get('clock', {}).get('minutes', 15) if isinstance(p.get('clock'), dict) else 15,
+            -p.get('clock', {}).get('seconds', 0) if isinstance(p.get('clock'), dict) else 0
+        ))
+        return sorted_plays
     except Exception as e:
         print(f"      Error fetching all plays: {e}")
     return []
@@ -112,32 +91,44 @@ def calculate_scores_for_plays(all_plays):
     
     return score_map
 
-def get_enhanced_play_data(game_id, week):
+async def get_enhanced_play_data(cfbd, game_id, week):
     """Fetch enhanced play data with drive and score information from CFBD"""
     try:
-        url = f"{BASE_URL}/plays"
-        params = {
-            'gameId': game_id,
-            'year': 2025,
-            'week': week
-        }
-        headers = {
-            'Authorization': f'Bearer {config["api_key"]}'
-        }
-        
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code == 200:
-            all_plays = response.json()
-            # Filter to only 4th down Minnesota plays
-            minnesota_4th_downs = []
-            for play in all_plays:
-                if play.get('offense') == 'Minnesota' and play.get('down') == 4:
-                    minnesota_4th_downs.append(play)
-            return minnesota_4th_downs
+        all_plays = await cfbd.plays(2025, week, game_id=game_id)
+        # Filter to only 4th down Minnesota plays
+        minnesota_4th_downs = []
+        for play in all_plays:
+            if play.get('offense') == 'Minnesota' and play.get('down') == 4:
+                minnesota_4th_downs.append(play)
+        return minnesota_4th_downs
     except:
         pass
     return []
 
+async def fetch_game_context(client, plays_by_game):
+    """
+    Fetch game info, all plays and 4th-down plays of every game concurrently
+
+    A game's info is fetched before its plays: the /games response tells the
+    response cache whether the game is final or in progress, which decides
+    how long the /plays response is kept. Both play lookups request the same
+    /plays URL; the cache shares one download between them (and keeps it on
+    disk for the next run).
+    """
+    cfbd = CfbdApi(client, config['api_key'], BASE_URL)
+
+    async def fetch_game(game_id, week):
+        game_info = await get_game_info(cfbd, game_id, week)
+        all_plays, fourth_down_plays = await asyncio.gather(
+            get_all_game_plays(cfbd, game_id, week),
+            get_enhanced_play_data(cfbd, game_id, week),
+        )
+        return game_info, all_plays, fourth_down_plays
+
+    results = await asyncio.gather(*(fetch_game(game_id, game_data['week'])
+                                     for game_id, game_data in plays_by_game.items()))
+    return dict(zip(plays_by_game, results))
+
 def calculate_score_at_play(plays, target_play_index):
     """Calculate score at the time of a specific play"""
     minnesota_score = 0
@@ -184,12 +175,15 @@ def enhance_plays_with_game_context(plays_data):
     
     # Fetch game details and enhanced play data
     print("Enhancing plays with game context...")
+    print(f"  Fetching game info and plays for {len(plays_by_game)} games...")
+    game_context = run(lambda client: fetch_game_context(client, plays_by_game), cache=ResponseCache())
     for game_id, game_data in plays_by_game.items():
         week = game_data['week']
-        print(f"  Fetching enhanced data for {game_id} (Week {week})...")
+        print(f"  Enhancing {game_id} (Week {week})...")
         
-        # Get game info
-        game_info = get_game_info(game_id, week)
+        # Game info, ALL plays (for fallback matching if the enhanced play
+        # match fails) and enhanced play data with drive info (just 4th downs)
+        game_info, all_plays, enhanced_plays_cfbd = game_context[game_id]
         if game_info:
             home_team = game_info.get('homeTeam', 'Unknown')
             away_team = game_info.get('awayTeam', 'Unknown')
@@ -205,13 +199,6 @@ def enhance_plays_with_game_context(plays_data):
             else:
                 game_data['opponent'] = home_team
         
-        # Fetch ALL plays for potential fallback matching (if enhanced play match fails)
-        print(f"      Fetching all plays for matching...")
-        all_plays = get_all_game_plays(game_id, week)
-        
-        # Fetch enhanced play data with drive info (just 4th downs)
-        enhanced_plays_cfbd = get_enhanced_play_data(game_id, week)
-        
         # Create lookup map for enhanced data
         enhanced_play_map = {}
         for ep in enhanced_plays_cfbd:
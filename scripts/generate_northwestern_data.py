@@ -10,6 +10,8 @@ from datetime import datetime
 from collections import defaultdict, Counter
 import math
 
+from espn_refs import ref_id
+
 def fetch_espn_game_data(game_id):
     """Fetch game data from ESPN API using the correct endpoints"""
     print(f"Fetching game data for ID: {game_id}")
@@ -151,12 +153,8 @@ def analyze_drives_for_possession_times(data, teams):
                     team_id = drive['team']['id']
                 elif '$ref' in drive['team']:
                     # Extract team ID from $ref URL
-                    ref_url = drive['team']['$ref']
-                    if 'teams/77' in ref_url:
-                        team_id = '77'  # Northwestern
-                    elif 'teams/213' in ref_url:
-                        team_id = '213'  # Penn State
-                    else:
+                    team_id = ref_id(drive['team']['$ref'], 'teams')
+                    if team_id is None:
                         continue
                 else:
                     continue
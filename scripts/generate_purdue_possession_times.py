@@ -7,6 +7,8 @@ import json
 import os
 from collections import defaultdict
 
+from espn_refs import ref_id
+
 def analyze_drives_for_possession_times(data, teams):
     """Analyze drives to calculate possession times by quarter"""
     print("Analyzing drives for possession times...")
@@ -47,12 +49,8 @@ def analyze_drives_for_possession_times(data, teams):
                     team_id = drive['team']['id']
                 elif '$ref' in drive['team']:
                     # Extract team ID from $ref URL
-                    ref_url = drive['team']['$ref']
-                    if 'teams/2509' in ref_url:
-                        team_id = '2509'  # Purdue
-                    elif 'teams/135' in ref_url:
-                        team_id = '135'  # Minnesota
-                    else:
+                    team_id = ref_id(drive['team']['$ref'], 'teams')
+                    if team_id is None:
                         continue
                 else:
                     continue
@@ -4,37 +4,20 @@ Minnesota 4th Down Analysis for 2025 Season
 Retrieve all Minnesota offensive 4th down plays throughout the season
 """
 
+import asyncio
 import json
-import requests
 import os
-import time
 from datetime import datetime
 
-# Load config
-with open('config.json', 'r') as f:
-    config = json.load(f)
+from http_cache import ResponseCache
+from http_client import CfbdApi, EspnApi, HttpError, run
 
-CFBD_API_KEY = config['api_key']
-BASE_URL = config['base_url']
-
-def get_minnesota_games_2025():
+async def get_minnesota_games_2025(cfbd):
     """Get all Minnesota games for 2025 season"""
     print("Fetching Minnesota's 2025 season games...")
     
-    url = f"{BASE_URL}/games"
-    params = {
-        'year': 2025,
-        'team': 'Minnesota',
-        'seasonType': 'regular'
-    }
-    headers = {
-        'Authorization': f'Bearer {CFBD_API_KEY}'
-    }
-    
     try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        games = response.json()
+        games = await cfbd.games(2025, team='Minnesota')
         
         print(f"Found {len(games)} games for Minnesota in 2025")
         for game in games:
@@ -46,84 +29,42 @@ def get_minnesota_games_2025():
             print(f"  Week {week}: {away_team} @ {home_team} (CFBD ID: {game_id}, ESPN ID: {espn_id})")
         
         return games
-    except requests.exceptions.RequestException as e:
+    except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
         print(f"Error fetching games: {e}")
         return []
 
-def fetch_cfbd_game_plays(cfbd_game_id, week, year=2025):
+async def fetch_cfbd_game_plays(cfbd, cfbd_game_id, week, year=2025):
     """Fetch play-by-play data from CFBD API - REQUIRES week parameter"""
     print(f"  Fetching CFBD plays for game {cfbd_game_id} (Week {week})...")
     
-    url = f"{BASE_URL}/plays"
-    params = {
-        'gameId': cfbd_game_id,
-        'year': year,
-        'week': week
-    }
-    headers = {
-        'Authorization': f'Bearer {CFBD_API_KEY}'
-    }
-    
     try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        plays = response.json()
+        plays = await cfbd.plays(year, week, game_id=cfbd_game_id)
         
         print(f"    ✓ Fetched {len(plays)} plays from CFBD")
         return plays
         
-    except requests.exceptions.RequestException as e:
+    except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
         print(f"    ✗ Error fetching CFBD plays: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"    Error details: {e.response.text[:300]}")
+        if isinstance(e, HttpError):
+            print(f"    Error details: {e.body[:300].decode('utf-8', errors='replace')}")
         return []
 
-def fetch_espn_game_plays(espn_game_id):
-    """Fetch all plays from ESPN API using drives endpoint"""
+async def fetch_espn_game_plays(espn, espn_game_id):
+    """Fetch all plays from ESPN API using drives endpoint (pages fetched concurrently)"""
     print(f"  Fetching ESPN plays for game {espn_game_id}...")
     
-    all_plays = []
-    
-    # Fetch drives (which contain plays)
-    drives_url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/college-football/events/{espn_game_id}/competitions/{espn_game_id}/drives"
-    
-    page = 1
-    page_size = 100
-    
     try:
-        while True:
-            params = {
-                'limit': page_size,
-                'page': page,
-                'lang': 'en',
-                'region': 'us'
-            }
-            
-            response = requests.get(drives_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            drives = data.get('items', [])
-            if not drives:
-                break
-            
-            # Extract plays from drives
-            for drive in drives:
-                plays = drive.get('plays', [])
-                all_plays.extend(plays)
-            
-            # Check if there are more pages
-            page_count = data.get('pageCount', 1)
-            if page >= page_count:
-                break
-            
-            page += 1
-            time.sleep(0.1)  # Rate limiting
+        drives = [drive async for drive in espn.iter_drives(espn_game_id)]
         
-        print(f"    ✓ Fetched {len(all_plays)} plays from {len(data.get('items', []))} drives")
-        return all_plays, data.get('items', [])
+        # Extract plays from drives
+        all_plays = []
+        for drive in drives:
+            all_plays.extend(drive.get('plays', []))
         
-    except requests.exceptions.RequestException as e:
+        print(f"    ✓ Fetched {len(all_plays)} plays from {len(drives)} drives")
+        return all_plays, drives
+        
+    except (HttpError, OSError, asyncio.TimeoutError, ValueError) as e:
         print(f"    ✗ Error fetching ESPN plays: {e}")
         return [], []
 
@@ -343,88 +284,94 @@ def analyze_4th_down_plays_cfbd(plays, opponent_name):
     
     return fourth_downs
 
+async def process_game(cfbd, espn, idx, total, game):
+    """4th down plays of one game (CFBD plays, falling back to ESPN)"""
+    cfbd_game_id = game.get('id')
+    week = game.get('week', 'N/A')
+    away_team = game.get('away_team', 'Unknown')
+    home_team = game.get('home_team', 'Unknown')
+    
+    # Determine opponent - CFBD format
+    opponent = away_team if away_team != 'Minnesota' else home_team
+    if opponent == 'Unknown':
+        # Try alternative fields
+        opponent = game.get('opponent', 'Unknown')
+    
+    print(f"\n[{idx}/{total}] Processing Week {week}: Minnesota vs {opponent}")
+    
+    if not cfbd_game_id:
+        print(f"  ⚠ No CFBD game ID found, skipping...")
+        return []
+    
+    # Try CFBD API first (requires week parameter)
+    cfbd_plays = await fetch_cfbd_game_plays(cfbd, cfbd_game_id, week)
+    
+    if cfbd_plays:
+        # Use CFBD plays
+        print(f"  Using CFBD plays data...")
+        fourth_downs = analyze_4th_down_plays_cfbd(cfbd_plays, opponent)
+    else:
+        # Fallback to ESPN API
+        print(f"  Falling back to ESPN API...")
+        plays, drives = await fetch_espn_game_plays(espn, cfbd_game_id)
+        
+        if not plays:
+            print(f"  ⚠ Could not fetch plays from either API, skipping...")
+            return []
+        
+        # Fetch game summary to get team IDs
+        try:
+            game_summary = await espn.summary(cfbd_game_id)
+            
+            # Extract Minnesota team ID
+            minnesota_id = extract_minnesota_team_id(game_summary)
+            if not minnesota_id:
+                print(f"  ⚠ Could not identify Minnesota team ID, skipping...")
+                return []
+        except Exception as e:
+            print(f"  ⚠ Could not fetch game summary: {e}, skipping...")
+            return []
+        
+        # Analyze 4th downs
+        fourth_downs = analyze_4th_down_plays(plays, drives, minnesota_id)
+    
+    # Add game context to each 4th down
+    for fd in fourth_downs:
+        fd['game_id'] = cfbd_game_id
+        fd['opponent'] = opponent
+        fd['week'] = week
+        fd['date'] = game.get('start_date', '')
+        fd['home_team'] = home_team
+        fd['away_team'] = away_team
+    
+    print(f"  ✓ Found {len(fourth_downs)} 4th down plays (Go for it: {sum(1 for fd in fourth_downs if fd['is_go_for_it'])})")
+    return fourth_downs
+
+async def fetch_season_4th_downs(client):
+    """Minnesota's games and the 4th down plays of all of them (games fetched concurrently)"""
+    cfbd = CfbdApi.from_config(client)
+    espn = EspnApi(client)
+    
+    # Get all Minnesota games
+    games = await get_minnesota_games_2025(cfbd)
+    
+    # Process each game
+    results = await asyncio.gather(*(process_game(cfbd, espn, idx, len(games), game)
+                                     for idx, game in enumerate(games, 1)))
+    all_fourth_downs = [fd for fourth_downs in results for fd in fourth_downs]
+    return games, all_fourth_downs
+
 def main():
     print("=" * 70)
     print("Minnesota 2025 Season - All 4th Down Offensive Plays")
     print("=" * 70)
     
-    # Get all Minnesota games
-    games = get_minnesota_games_2025()
+    games, all_fourth_downs = run(fetch_season_4th_downs, cache=ResponseCache())
     
     if not games:
         print("No games found for Minnesota in 2025")
         return
     
-    all_fourth_downs = []
-    
-    # Process each game
-    for idx, game in enumerate(games, 1):
-        cfbd_game_id = game.get('id')
-        week = game.get('week', 'N/A')
-        away_team = game.get('away_team', 'Unknown')
-        home_team = game.get('home_team', 'Unknown')
-        
-        # Determine opponent - CFBD format
-        opponent = away_team if away_team != 'Minnesota' else home_team
-        if opponent == 'Unknown':
-            # Try alternative fields
-            opponent = game.get('opponent', 'Unknown')
-        
-        print(f"\n[{idx}/{len(games)}] Processing Week {week}: Minnesota vs {opponent}")
-        
-        if not cfbd_game_id:
-            print(f"  ⚠ No CFBD game ID found, skipping...")
-            continue
-        
-        # Try CFBD API first (requires week parameter)
-        cfbd_plays = fetch_cfbd_game_plays(cfbd_game_id, week)
-        
-        if cfbd_plays:
-            # Use CFBD plays
-            print(f"  Using CFBD plays data...")
-            fourth_downs = analyze_4th_down_plays_cfbd(cfbd_plays, opponent)
-        else:
-            # Fallback to ESPN API
-            print(f"  Falling back to ESPN API...")
-            plays, drives = fetch_espn_game_plays(cfbd_game_id)
-            
-            if not plays:
-                print(f"  ⚠ Could not fetch plays from either API, skipping...")
-                continue
-            
-            # Fetch game summary to get team IDs
-            summary_url = f"https://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={cfbd_game_id}"
-            try:
-                summary_response = requests.get(summary_url)
-                summary_response.raise_for_status()
-                game_summary = summary_response.json()
-                
-                # Extract Minnesota team ID
-                minnesota_id = extract_minnesota_team_id(game_summary)
-                if not minnesota_id:
-                    print(f"  ⚠ Could not identify Minnesota team ID, skipping...")
-                    continue
-            except Exception as e:
-                print(f"  ⚠ Could not fetch game summary: {e}, skipping...")
-                continue
-            
-            # Analyze 4th downs
-            fourth_downs = analyze_4th_down_plays(plays, drives, minnesota_id)
-        
-        # Add game context to each 4th down
-        for fd in fourth_downs:
-            fd['game_id'] = cfbd_game_id
-            fd['opponent'] = opponent
-            fd['week'] = week
-            fd['date'] = game.get('start_date', '')
-            fd['home_team'] = home_team
-            fd['away_team'] = away_team
-        
-        all_fourth_downs.extend(fourth_downs)
-        print(f"  ✓ Found {len(fourth_downs)} 4th down plays (Go for it: {sum(1 for fd in fourth_downs if fd['is_go_for_it'])})")
-        
-        time.sleep(0.2)  # Rate limiting
-    
     # Summary statistics
     print("\n" + "=" * 70)
     print("SEASON SUMMARY")
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of HTTP GET responses for the ESPN and CFBD fetchers
+
+Entries are named by a hash of the normalized request URL (scheme and host
+lower-cased, default port dropped, query parameters sorted) and hold the
+zlib-compressed body plus a short JSON header with the validators (ETag,
+Last-Modified) and expiry.
+
+How long an entry is fresh depends on the game it describes:
+- responses stored after their game was completed never expire; game ids
+  seen as completed (in a summary, scoreboard, status or CFBD /games
+  response) are remembered, so later plays/probability/drive pages of those
+  games are kept for good too (the entry records this as 'final')
+- responses of games in progress (an ESPN status that is in progress, or a
+  CFBD /games entry past its start time that is not completed) expire after
+  LIVE_TTL seconds, and keep expiring after the game ends, so a partial
+  payload is never kept for good
+- anything else gets its endpoint's TTL (ENDPOINT_TTLS)
+
+Expired entries with a validator are revalidated with If-None-Match /
+If-Modified-Since, so an unchanged payload is not downloaded again.
+Identical requests in flight at the same time share one download, and the
+least recently used entries are evicted once the cache outgrows its budget.
+
+Usage:
+    cache = ResponseCache('.http_cache')
+    summaries = run(main, cache=cache)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from http_client import HttpClient, Response
+
+DEFAULT_CACHE_DIR = '.http_cache'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Evict down to this fraction of the budget, so eviction does not run on every write
+EVICT_TO = 0.9
+
+# Seconds a response of a game in progress stays fresh
+LIVE_TTL = 15
+# (URL pattern, seconds) for responses that do not tell the game state; first match wins
+ENDPOINT_TTLS = [
+    (re.compile(r'/scoreboard'), 60),
+    (re.compile(r'/summary'), 60),
+    (re.compile(r'/(plays|probabilities|drives)\b'), 300),
+    (re.compile(r'/metrics/wp'), 300),
+    (re.compile(r'/games\b'), 3600),
+    (re.compile(r'/(teams|athletes|venues|positions)\b'), 7 * 24 * 3600),
+]
+DEFAULT_TTL = 3600
+
+# Response headers kept with an entry
+KEPT_HEADERS = ('content-type', 'etag', 'last-modified')
+
+_EVENT_PATH = re.compile(r'/events/(\d+)')
+_GAME_PARAMS = ('event', 'gameId', 'id')
+
+
+def normalize_url(url: str) -> str:
+    """URL with lower-case scheme/host, no default port and sorted query parameters"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != (443 if scheme == 'https' else 80):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+def cache_key(url: str) -> str:
+    """Cache entry name of a GET request"""
+    return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+
+def url_game_ids(url: str) -> Set[str]:
+    """Game ids a request is about (ESPN event path/param, CFBD gameId/id)"""
+    parts = urlsplit(url)
+    ids = set(_EVENT_PATH.findall(parts.path))
+    for name, value in parse_qsl(parts.query):
+        if name in _GAME_PARAMS and value.isdigit():
+            ids.add(value)
+    return ids
+
+
+def _espn_state(status: Any) -> Optional[str]:
+    """'final', 'live' or None from an ESPN status object"""
+    if not isinstance(status, dict):
+        return None
+    status_type = status.get('type') or {}
+    if status_type.get('completed'):
+        return 'final'
+    if status_type.get('state') == 'in':
+        return 'live'
+    return None
+
+
+def _started(start_date: Any, now: float) -> bool:
+    """Whether a CFBD ISO 8601 start date (UTC unless it says otherwise) is in the past"""
+    if not isinstance(start_date, str):
+        return False
+    try:
+        start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.timestamp() <= now
+
+
+def game_states(data: Any) -> Dict[str, str]:
+    """
+    Game id -> 'final' or 'live' for the games a response reports on
+
+    Understands ESPN site summaries and scoreboards, ESPN core status and
+    event objects, and CFBD /games lists.
+    """
+    states: Dict[str, str] = {}
+    if isinstance(data, list):
+        # CFBD /games has no in-progress flag: a game that is not completed
+        # is live once its start time has passed
+        now = time.time()
+        for game in data:
+            if not isinstance(game, dict) or 'id' not in game:
+                continue
+            if game.get('completed'):
+                states[str(game['id'])] = 'final'
+            elif _started(game.get('startDate') or game.get('start_date'), now):
+                states[str(game['id'])] = 'live'
+        return states
+    if not isinstance(data, dict):
+        return states
+
+    # ESPN site summary
+    header = data.get('header')
+    if isinstance(header, dict):
+        for competition in header.get('competitions') or []:
+            state = _espn_state(competition.get('status'))
+            if state:
+                states[str(header.get('id', competition.get('id')))] = state
+
+    # ESPN scoreboard / core event
+    for event in data.get('events') or []:
+        if isinstance(event, dict):
+            state = _espn_state(event.get('status'))
+            if state:
+                states[str(event.get('id'))] = state
+    for competition in data.get('competitions') or []:
+        if isinstance(competition, dict):
+            state = _espn_state(competition.get('status'))
+            if state:
+                states[str(competition.get('id', data.get('id')))] = state
+
+    # ESPN core status object (.../competitions/{id}/status)
+    ref = data.get('$ref', '')
+    if ref.rstrip('/').split('?')[0].endswith('/status'):
+        state = _espn_state(data)
+        ids = url_game_ids(ref)
+        if state and ids:
+            states.update((game_id, state) for game_id in ids)
+    return states
+
+
+class ResponseCache:
+    """
+    Disk cache of GET responses, used by HttpClient(cache=...)
+
+    Args:
+        cache_dir: Directory for the entries (created on first write)
+        max_bytes: Size budget; least recently used entries are evicted beyond it
+        live_ttl: Seconds a response of a game in progress stays fresh
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 live_ttl: float = LIVE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.final_games_path = self.cache_dir / 'final_games.json'
+        self._final_games: Optional[Set[str]] = None
+        self._live_games: Set[str] = set()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._size: Optional[int] = None
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    @property
+    def final_games(self) -> Set[str]:
+        """Ids of games known to be completed"""
+        if self._final_games is None:
+            try:
+                with open(self.final_games_path, 'r') as f:
+                    self._final_games = set(json.load(f))
+            except FileNotFoundError:
+                self._final_games = set()
+            except Exception as e:
+                print(f"  Warning: ignoring unreadable {self.final_games_path}: {e}")
+                self._final_games = set()
+        return self._final_games
+
+    def mark_final(self, game_ids: Iterable[str]) -> None:
+        """Remember completed games, so their responses never expire"""
+        new_ids = {str(game_id) for game_id in game_ids} - self.final_games
+        if not new_ids:
+            return
+        self.final_games.update(new_ids)
+        self._live_games -= new_ids
+        _write_atomic(self.final_games_path, json.dumps(sorted(self.final_games)).encode('utf-8'))
+
+    async def get(self, client: HttpClient, url: str,
+                  headers: Optional[Mapping[str, str]] = None, refresh: bool = False) -> Response:
+        """
+        GET through the cache
+
+        Concurrent calls for the same URL share one lookup/download.
+
+        Args:
+            client: HttpClient for the request
+            url: URL with its query string
+            headers: Extra request headers
+            refresh: Revalidate a stored entry even if it is fresh or final
+        """
+        key = cache_key(url)
+        inflight_key = f"{key}:refresh" if refresh else key
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(client, key, url, headers, refresh))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+    async def _get(self, client: HttpClient, key: str, url: str,
+                   headers: Optional[Mapping[str, str]], refresh: bool = False) -> Response:
+        entry = self.read(key)
+        now = time.time()
+        if entry is not None:
+            meta, body = entry
+            if not refresh and (meta.get('final') or
+                                (meta['expires_at'] is not None and now < meta['expires_at'])):
+                self._touch(key)
+                return self._response(url, meta, body, 'hit')
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if meta['headers'].get('etag'):
+                request_headers['If-None-Match'] = meta['headers']['etag']
+            if meta['headers'].get('last-modified'):
+                request_headers['If-Modified-Since'] = meta['headers']['last-modified']
+
+        response = await client.request('GET', url, headers=request_headers)
+        if response.status == 304 and entry is not None:
+            self._set_expiry(meta, url, body, now)
+            self.write(key, meta, body)
+            return self._response(url, meta, body, 'revalidated')
+        if response.status != 200:
+            return response
+
+        meta = {
+            'url': normalize_url(url),
+            'headers': {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            'stored_at': now,
+        }
+        self._set_expiry(meta, url, response.body, now)
+        self.write(key, meta, response.body)
+        response.headers['x-cache'] = 'miss'
+        return response
+
+    def _set_expiry(self, meta: Dict[str, Any], url: str, body: bytes, now: float) -> None:
+        """Set an entry's expires_at, and whether its games were completed when it was stored"""
+        meta['expires_at'] = self._expires_at(url, body, meta['headers'].get('content-type', ''), now)
+        # Only this flag makes an entry permanent; a game finishing later
+        # does not make a payload stored while it was in progress complete
+        meta['final'] = meta['expires_at'] is None
+
+    def _expires_at(self, url: str, body: bytes, content_type: str, now: float) -> Optional[float]:
+        """Expiry time of a response (None = never)"""
+        if 'json' in content_type or body[:1] in (b'{', b'['):
+            try:
+                states = game_states(json.loads(body))
+            except ValueError:
+                states = {}
+            self.mark_final(game_id for game_id, state in states.items() if state == 'final')
+            self._live_games.update(game_id for game_id, state in states.items() if state == 'live')
+
+        ids = url_game_ids(url)
+        if ids and ids <= self.final_games:
+            return None
+        if ids & self._live_games:
+            return now + self.live_ttl
+        path = urlsplit(url).path
+        for pattern, ttl in ENDPOINT_TTLS:
+            if pattern.search(path):
+                return now + ttl
+        return now + DEFAULT_TTL
+
+    @staticmethod
+    def _response(url: str, meta: Dict[str, Any], body: bytes, status: str) -> Response:
+        return Response(url, 200, dict(meta['headers'], **{'x-cache': status}), body)
+
+    def read(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """(meta, body) of an entry, or None if it is missing or unreadable"""
+        try:
+            raw = self.entry_path(key).read_bytes()
+            header, _, compressed = raw.partition(b'\n')
+            return json.loads(header), zlib.decompress(compressed)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"  Warning: ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def write(self, key: str, meta: Dict[str, Any], body: bytes) -> None:
+        """Store an entry (a JSON header line, then the compressed body)"""
+        path = self.entry_path(key)
+        raw = json.dumps(meta).encode('utf-8') + b'\n' + zlib.compress(body, 6)
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            _write_atomic(path, raw)
+        except OSError as e:
+            print(f"  Warning: could not write cache entry {path}: {e}")
+            return
+        if self._size is not None:
+            self._size += len(raw) - old_size
+        if self.size() > self.max_bytes:
+            self.evict()
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as recently used (eviction goes by mtime)"""
+        try:
+            os.utime(self.entry_path(key))
+        except OSError:
+            pass
+
+    def _entries(self):
+        """(mtime, size, path) of every entry"""
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of the entries"""
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        return self._size
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache is within budget
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO
+        deleted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            deleted += 1
+        self._size = total
+        return deleted
+
+
+def _write_atomic(path: Path, raw: bytes) -> None:
+    """Atomically replace a file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
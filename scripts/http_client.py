@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Shared asyncio HTTP client for the ESPN and CFBD fetchers
+
+Built on asyncio streams, so it needs no third-party HTTP library:
+- keep-alive HTTP/1.1 connections, pooled per host and reused across requests
+- a limit on concurrent requests per host, so bulk fetches stay polite
+- gzip/deflate and chunked responses, redirects
+- retries with backoff on connection errors, 429 and 5xx responses
+
+EspnApi and CfbdApi wrap the endpoints the scripts use (ESPN core and site
+APIs, CFBD). Their base URLs can be overridden, e.g. to point a fetcher at a
+local stand-in server. Pass cache=http_cache.ResponseCache(...) to keep GET
+responses on disk between runs.
+
+Usage:
+    async def main(client):
+        espn = EspnApi(client)
+        return await asyncio.gather(*(espn.summary(game_id) for game_id in game_ids))
+
+    summaries = run(main)
+"""
+
+import asyncio
+import json
+import ssl
+import zlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import urlencode, urljoin, urlsplit
+
+ESPN_CORE_BASE = "https://sports.core.api.espn.com/v2/sports/football/leagues/college-football"
+ESPN_SITE_BASE = "https://site.api.espn.com/apis/site/v2/sports/football/college-football"
+CFBD_BASE = "https://api.collegefootballdata.com"
+
+USER_AGENT = "matchup-analytics/1.0"
+# Statuses worth retrying (rate limited, server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_REDIRECTS = 5
+# Request headers not forwarded when a redirect leaves the original origin
+CREDENTIAL_HEADERS = {'authorization', 'proxy-authorization', 'cookie'}
+# Pages of one paginated collection fetched at the same time
+PAGE_CONCURRENCY = 8
+
+T = TypeVar('T')
+
+
+class HttpError(Exception):
+    """Non-2xx response (after retries)"""
+
+    def __init__(self, status: int, url: str, body: bytes = b''):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class MalformedResponse(ValueError):
+    """Response that does not parse as HTTP (retried like a connection error)"""
+
+
+class Response:
+    """
+    A complete HTTP response
+
+    Args:
+        url: Requested URL (after redirects)
+        status: Status code
+        headers: Header name (lower case) -> value
+        body: Decoded body (gzip/deflate already undone)
+    """
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HttpError(self.status, self.url, self.body)
+
+
+def build_url(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """URL with query parameters appended (None values are dropped)"""
+    if not params:
+        return url
+    query = urlencode([(key, value) for key, value in params.items() if value is not None])
+    if not query:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+class _Connection:
+    """One keep-alive connection to a host"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class HttpClient:
+    """
+    Pooled asyncio HTTP/1.1 client
+
+    Args:
+        per_host_limit: Maximum concurrent requests per host
+        timeout: Seconds allowed for one request (connect to last body byte)
+        retries: Extra attempts after a connection error or retryable status
+        backoff: Seconds before the first retry (doubled on each retry)
+        headers: Headers sent with every request
+        cache: http_cache.ResponseCache for GET requests (None = no caching)
+    """
+
+    def __init__(self, per_host_limit: int = 8, timeout: float = 30.0, retries: int = 3,
+                 backoff: float = 0.5, headers: Optional[Mapping[str, str]] = None,
+                 cache: Optional[Any] = None):
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = dict(headers or {})
+        self.cache = cache
+        self._idle: Dict[Tuple[str, str, int], List[_Connection]] = {}
+        self._limits: Dict[Tuple[str, str, int], asyncio.Semaphore] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    async def __aenter__(self) -> 'HttpClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all pooled connections"""
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+    async def get(self, url: str, params: Optional[Mapping[str, Any]] = None,
+                  headers: Optional[Mapping[str, str]] = None, refresh: bool = False) -> Response:
+        """
+        GET a URL (through the cache, if any); non-2xx responses are returned, not raised
+
+        refresh=True revalidates a cached response even if it is still fresh.
+        """
+        url = build_url(url, params)
+        if self.cache is not None:
+            return await self.cache.get(self, url, headers, refresh=refresh)
+        return await self.request('GET', url, headers=headers)
+
+    async def get_json(self, url: str, params: Optional[Mapping[str, Any]] = None,
+                       headers: Optional[Mapping[str, str]] = None, refresh: bool = False) -> Any:
+        """GET a URL and decode its JSON body; raises HttpError on non-2xx"""
+        response = await self.get(url, params, headers, refresh=refresh)
+        response.raise_for_status()
+        return response.json()
+
+    async def request(self, method: str, url: str, headers: Optional[Mapping[str, str]] = None,
+                      body: Optional[bytes] = None) -> Response:
+        """
+        Send a request, following redirects and retrying transient failures
+
+        A redirect to another origin is followed without the credential
+        headers; a redirect from https to http is refused.
+
+        Returns:
+            The final response, whatever its status
+        """
+        headers = {**self.headers, **(headers or {})}
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._request_with_retries(method, url, headers, body)
+            location = response.headers.get('location')
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                return response
+            source, url = urlsplit(url), urljoin(url, location)
+            target = urlsplit(url)
+            if source.scheme == 'https' and target.scheme != 'https':
+                raise HttpError(response.status, url, b'refused redirect from https to http')
+            if (source.scheme, source.netloc) != (target.scheme, target.netloc):
+                headers = {name: value for name, value in headers.items()
+                           if name.lower() not in CREDENTIAL_HEADERS}
+            if response.status == 303:
+                method, body = 'GET', None
+        raise HttpError(response.status, url, b'too many redirects')
+
+    async def _request_with_retries(self, method: str, url: str, headers: Mapping[str, str],
+                                    body: Optional[bytes]) -> Response:
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                response = await self._send(method, url, headers, body)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, MalformedResponse):
+                # Bad URLs and undecodable bodies (plain ValueError) are not retried
+                if last_attempt:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or last_attempt:
+                    return response
+                retry_after = response.headers.get('retry-after', '')
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+            delay *= 2
+        raise AssertionError("unreachable")
+
+    def _host_key(self, url: str) -> Tuple[Tuple[str, str, int], str]:
+        """((scheme, host, port), request target) of a URL"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        return (parts.scheme, parts.hostname, port), target
+
+    async def _send(self, method: str, url: str, headers: Mapping[str, str],
+                    body: Optional[bytes]) -> Response:
+        """
+        Send one request; headers already include the client-wide ones
+
+        The timeout starts once the request has a per-host slot, so time
+        spent queued behind other requests to the host does not count.
+        """
+        key, target = self._host_key(url)
+        scheme, host, port = key
+        default_port = 443 if scheme == 'https' else 80
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {host if port == default_port else f'{host}:{port}'}",
+            f"User-Agent: {USER_AGENT}",
+            "Accept-Encoding: gzip, deflate",
+            "Connection: keep-alive",
+        ]
+        for name, value in headers.items():
+            lines.append(f"{name}: {value}")
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.per_host_limit)
+        async with limit:
+            return await asyncio.wait_for(self._send_head(key, url, method, head, body), self.timeout)
+
+    async def _send_head(self, key: Tuple[str, str, int], url: str, method: str, head: bytes,
+                         body: Optional[bytes]) -> Response:
+        """Send a serialized request on a pooled or new connection"""
+        # A pooled connection may have been closed by the server while
+        # idle; such a failure is retried once on a new connection
+        connection = self._take_idle(key)
+        if connection is not None:
+            try:
+                return await self._exchange(key, connection, url, method, head, body)
+            except (OSError, asyncio.IncompleteReadError, MalformedResponse):
+                connection.close()
+            except BaseException:
+                # e.g. cancelled by the request timeout mid-response
+                connection.close()
+                raise
+        connection = await self._connect(key)
+        try:
+            return await self._exchange(key, connection, url, method, head, body)
+        except BaseException:
+            connection.close()
+            raise
+
+    def _take_idle(self, key: Tuple[str, str, int]) -> Optional[_Connection]:
+        connections = self._idle.get(key)
+        while connections:
+            connection = connections.pop()
+            if not connection.reader.at_eof() and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    async def _connect(self, key: Tuple[str, str, int]) -> _Connection:
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        return _Connection(reader, writer)
+
+    async def _exchange(self, key: Tuple[str, str, int], connection: _Connection, url: str,
+                        method: str, head: bytes, body: Optional[bytes]) -> Response:
+        """Send one request on a connection and read the response"""
+        connection.writer.write(head + (body or b''))
+        await connection.writer.drain()
+
+        reader = connection.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b'', None)
+        parts = status_line.decode('latin-1').split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+            raise MalformedResponse(f"Malformed status line from {url}: {status_line!r}")
+        status = int(parts[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            value = value.strip()
+            # Repeated headers are joined, as in HTTP list syntax
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+        reusable = headers.get('connection', '').lower() != 'close' and parts[0] != 'HTTP/1.0'
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            raw = b''
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            raw = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            raw = await reader.readexactly(int(headers['content-length']))
+        else:
+            raw = await reader.read()
+            reusable = False
+
+        if reusable:
+            self._idle.setdefault(key, []).append(connection)
+        else:
+            connection.close()
+        return Response(url, status, headers, _decode_body(raw, headers.get('content-encoding', '')))
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+            if size == 0:
+                # Skip trailers up to the blank line
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # CRLF after the chunk
+
+
+def _decode_body(raw: bytes, encoding: str) -> bytes:
+    """Undo a gzip/deflate Content-Encoding"""
+    if not raw:
+        # HEAD and 304 responses keep the entity's Content-Encoding
+        return raw
+    encoding = encoding.lower().strip()
+    try:
+        if encoding == 'gzip':
+            return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            try:
+                return zlib.decompress(raw)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                return zlib.decompress(raw, -zlib.MAX_WBITS)
+    except zlib.error as e:
+        # The same bytes would come back on a retry
+        raise ValueError(f"Undecodable {encoding} body: {e}") from e
+    return raw
+
+
+async def paginate(fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+                   concurrency: int = PAGE_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Pages of an ESPN core collection, in order
+
+    The first page gives the pageCount; the remaining pages are then fetched
+    concurrently (at most `concurrency` at a time). Each page is yielded as
+    soon as it and all pages before it have arrived.
+
+    Args:
+        fetch_page: Coroutine function fetching one page (1-based)
+        concurrency: Maximum pages in flight
+    """
+    first = await fetch_page(1)
+    yield first
+    page_count = int(first.get('pageCount') or 1)
+    if page_count <= 1:
+        return
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def fetch(page: int) -> Dict[str, Any]:
+        async with limit:
+            return await fetch_page(page)
+
+    tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, page_count + 1)]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        # The caller stopped early or a page failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def paginate_items(fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+                         concurrency: int = PAGE_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+    """Items of an ESPN core collection, in order, as their pages arrive (see paginate)"""
+    async for page in paginate(fetch_page, concurrency):
+        for item in page.get('items') or []:
+            yield item
+
+
+class EspnApi:
+    """
+    ESPN college football endpoints
+
+    Args:
+        client: Shared HttpClient
+        core_base: ESPN core API base URL (sports.core.api.espn.com)
+        site_base: ESPN site API base URL (site.api.espn.com)
+    """
+
+    def __init__(self, client: HttpClient, core_base: str = ESPN_CORE_BASE,
+                 site_base: str = ESPN_SITE_BASE):
+        self.client = client
+        self.core_base = core_base.rstrip('/')
+        self.site_base = site_base.rstrip('/')
+
+    async def core(self, path: str, **params: Any) -> Dict[str, Any]:
+        """GET a core API path (relative to the league) or full core URL"""
+        url = path if path.startswith(('http://', 'https://')) else f"{self.core_base}/{path.lstrip('/')}"
+        return await self.client.get_json(url, {'lang': 'en', 'region': 'us', **params})
+
+    async def event(self, event_id: int) -> Dict[str, Any]:
+        return await self.core(f"events/{event_id}")
+
+    async def competition(self, event_id: int) -> Dict[str, Any]:
+        return await self.core(f"events/{event_id}/competitions/{event_id}")
+
+    async def drives(self, event_id: int, page: int = 1, limit: int = 100) -> Dict[str, Any]:
+        """One page of a game's drives ({'count', 'pageIndex', 'pageCount', 'items'})"""
+        return await self.core(f"events/{event_id}/competitions/{event_id}/drives", page=page, limit=limit)
+
+    async def plays(self, event_id: int, page: int = 1, limit: int = 300) -> Dict[str, Any]:
+        """One page of a game's plays"""
+        return await self.core(f"events/{event_id}/competitions/{event_id}/plays", page=page, limit=limit)
+
+    async def probabilities(self, event_id: int, page: int = 1, limit: int = 300) -> Dict[str, Any]:
+        """One page of a game's win probabilities"""
+        return await self.core(f"events/{event_id}/competitions/{event_id}/probabilities",
+                               page=page, limit=limit)
+
+    def iter_plays(self, event_id: int, limit: int = 300,
+                   concurrency: int = PAGE_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+        """All plays of a game in order, streamed as their pages arrive"""
+        return paginate_items(lambda page: self.plays(event_id, page, limit), concurrency)
+
+    def iter_probabilities(self, event_id: int, limit: int = 300,
+                           concurrency: int = PAGE_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+        """All win probabilities of a game in order, streamed as their pages arrive"""
+        return paginate_items(lambda page: self.probabilities(event_id, page, limit), concurrency)
+
+    def iter_drives(self, event_id: int, limit: int = 100,
+                    concurrency: int = PAGE_CONCURRENCY) -> AsyncIterator[Dict[str, Any]]:
+        """All drives of a game in order, streamed as their pages arrive"""
+        return paginate_items(lambda page: self.drives(event_id, page, limit), concurrency)
+
+    async def all_plays(self, event_id: int, limit: int = 300) -> List[Dict[str, Any]]:
+        return [play async for play in self.iter_plays(event_id, limit)]
+
+    async def all_probabilities(self, event_id: int, limit: int = 300) -> List[Dict[str, Any]]:
+        return [probability async for probability in self.iter_probabilities(event_id, limit)]
+
+    async def summary(self, event_id: int) -> Dict[str, Any]:
+        """Site API game summary (header, boxscore, drives, plays, winprobability)"""
+        return await self.client.get_json(f"{self.site_base}/summary", {'event': event_id})
+
+    async def scoreboard(self, year: int, week: int, groups: Optional[int] = None,
+                         season_type: int = 2, limit: int = 300) -> Dict[str, Any]:
+        """Site API scoreboard of a week (groups = conference group id)"""
+        return await self.client.get_json(f"{self.site_base}/scoreboard", {
+            'dates': year, 'week': week, 'groups': groups, 'seasontype': season_type, 'limit': limit
+        })
+
+
+class CfbdApi:
+    """
+    CollegeFootballData endpoints
+
+    Args:
+        client: Shared HttpClient
+        api_key: CFBD API key (sent as a bearer token)
+        base_url: CFBD API base URL
+    """
+
+    def __init__(self, client: HttpClient, api_key: Optional[str] = None, base_url: str = CFBD_BASE):
+        self.client = client
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Authorization': f"Bearer {api_key}"} if api_key else {}
+
+    @classmethod
+    def from_config(cls, client: HttpClient, config_path: str = 'config.json') -> 'CfbdApi':
+        """CfbdApi with the key and base URL of a config.json ({'api_key', 'base_url'})"""
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        return cls(client, config.get('api_key'), config.get('base_url', CFBD_BASE))
+
+    async def get(self, path: str, refresh: bool = False, **params: Any) -> Any:
+        """GET a CFBD path; None parameters are dropped (refresh: see HttpClient.get)"""
+        return await self.client.get_json(f"{self.base_url}/{path.lstrip('/')}", params, self.headers,
+                                          refresh=refresh)
+
+    async def games(self, year: int, week: Optional[int] = None, team: Optional[str] = None,
+                    conference: Optional[str] = None, season_type: str = 'regular') -> List[Dict[str, Any]]:
+        return await self.get('games', year=year, week=week, team=team, conference=conference,
+                              seasonType=season_type)
+
+    async def plays(self, year: int, week: int, game_id: Optional[int] = None,
+                    team: Optional[str] = None, season_type: str = 'regular',
+                    refresh: bool = False) -> List[Dict[str, Any]]:
+        """Plays of a week (CFBD requires the week, even with a game id)"""
+        return await self.get('plays', refresh=refresh, year=year, week=week, gameId=game_id, team=team,
+                              seasonType=season_type)
+
+    async def drives(self, year: int, week: Optional[int] = None, game_id: Optional[int] = None,
+                     team: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self.get('drives', year=year, week=week, gameId=game_id, team=team)
+
+    async def win_probability(self, game_id: int) -> List[Dict[str, Any]]:
+        return await self.get('metrics/wp', gameId=game_id)
+
+
+def run(main: Callable[[HttpClient], Awaitable[T]], **client_options: Any) -> T:
+    """
+    Run an async fetch from synchronous code
+
+    Args:
+        main: Coroutine function taking the shared client
+        client_options: HttpClient arguments
+
+    Returns:
+        main's result
+    """
+    async def runner() -> T:
+        async with HttpClient(**client_options) as client:
+            return await main(client)
+
+    return asyncio.run(runner())
@@ -6,10 +6,22 @@ Load and parse advanced play-by-play data from JSON files
 import json
 import os
 import re
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from drive_index import DriveIndex
+from game_index import GameIndex
+from play_index import PlayIndex
+from play_table import GAME_CONTEXT_KEYS, PlayTableBuilder
+from play_text_features import PLAY_TEXT_FEATURES, add_play_text_features
+
+
+# Bump whenever the normalized output of load_team_data changes, so that
+# on-disk caches written by an older loader are ignored
+LOADER_VERSION = 6
+
 
 def is_middle_eight(period: int, clock: str) -> bool:
     """
@@ -46,6 +58,43 @@ def is_middle_eight(period: int, clock: str) -> bool:
     return False
 
 
+def mark_turnover_drives(game_plays: List[Dict]) -> None:
+    """
+    Mark the drives of one game that started after a turnover.
+
+    Args:
+        game_plays: Plays of a single game (modified in place)
+    """
+    # Find all turnovers (excluding turnovers on downs)
+    turnovers = []
+    for p in game_plays:
+        if p.get('turnover') == True:
+            turnover_type = (p.get('turnover_type') or '').lower()
+            if turnover_type != 'downs':
+                turnovers.append(p)
+
+    # Get the drive numbers that started after turnovers
+    drives_after_turnover = set()
+    for turnover in turnovers:
+        turnover_drive = turnover.get('drive_number')
+        if turnover_drive is not None:
+            # The next drive started after this turnover
+            drives_after_turnover.add(turnover_drive + 1)
+
+    # Mark plays in those drives
+    for play in game_plays:
+        play_drive = play.get('drive_number')
+        if play_drive in drives_after_turnover:
+            play['drive_started_after_turnover'] = True
+        elif 'drive_started_after_turnover' not in play:
+            play['drive_started_after_turnover'] = False
+
+
+def get_turnover_game_key(play: Dict) -> Any:
+    """Key that groups plays of one game for turnover-drive marking"""
+    return play.get('game_id') or f"week_{play.get('game_week', 0)}"
+
+
 def calculate_drive_started_after_turnover(plays: List[Dict]) -> List[Dict]:
     """
     Calculate drive_started_after_turnover field for PDF data.
@@ -65,38 +114,36 @@ def calculate_drive_started_after_turnover(plays: List[Dict]) -> List[Dict]:
     # Group plays by game (using game_week for PDF data)
     games = defaultdict(list)
     for play in plays:
-        game_key = play.get('game_id') or f"week_{play.get('game_week', 0)}"
-        games[game_key].append(play)
+        games[get_turnover_game_key(play)].append(play)
 
     # For each game, find turnovers and mark subsequent drives
-    for game_key, game_plays in games.items():
-        # Find all turnovers (excluding turnovers on downs)
-        turnovers = []
-        for p in game_plays:
-            if p.get('turnover') == True:
-                turnover_type = (p.get('turnover_type') or '').lower()
-                if turnover_type != 'downs':
-                    turnovers.append(p)
-
-        # Get the drive numbers that started after turnovers
-        drives_after_turnover = set()
-        for turnover in turnovers:
-            turnover_drive = turnover.get('drive_number')
-            if turnover_drive is not None:
-                # The next drive started after this turnover
-                drives_after_turnover.add(turnover_drive + 1)
-
-        # Mark plays in those drives
-        for play in game_plays:
-            play_drive = play.get('drive_number')
-            if play_drive in drives_after_turnover:
-                play['drive_started_after_turnover'] = True
-            elif 'drive_started_after_turnover' not in play:
-                play['drive_started_after_turnover'] = False
+    for game_plays in games.values():
+        mark_turnover_drives(game_plays)
 
     return plays
 
 
+def get_play_dedup_key(play: Dict, game_id: Any) -> tuple:
+    """
+    Identifying fields used by deduplicate_plays
+
+    Args:
+        play: Play dictionary
+        game_id: Game the play belongs to (passed separately so raw plays
+            can be keyed before game context is applied)
+    """
+    # Include drive_number to differentiate kickoffs with same result (e.g., touchbacks)
+    return (
+        game_id,
+        play.get('period'),
+        str(play.get('clock', '')),
+        play.get('down'),
+        play.get('distance'),
+        play.get('drive_number'),
+        (play.get('play_text') or '')[:100]  # First 100 chars of play text
+    )
+
+
 def deduplicate_plays(plays: List[Dict]) -> List[Dict]:
     """
     Remove duplicate plays based on key identifying fields.
@@ -117,16 +164,7 @@ def deduplicate_plays(plays: List[Dict]) -> List[Dict]:
 
     for play in plays:
         # Create a key from identifying fields
-        # Include drive_number to differentiate kickoffs with same result (e.g., touchbacks)
-        key = (
-            play.get('game_id'),
-            play.get('period'),
-            str(play.get('clock', '')),
-            play.get('down'),
-            play.get('distance'),
-            play.get('drive_number'),
-            (play.get('play_text') or '')[:100]  # First 100 chars of play text
-        )
+        key = get_play_dedup_key(play, play.get('game_id'))
 
         if key not in seen:
             seen.add(key)
@@ -140,18 +178,73 @@ def deduplicate_plays(plays: List[Dict]) -> List[Dict]:
     return unique_plays
 
 
-def load_team_data(team_name: str, data_dir: str = "advanced_reports_yogi",
-                   pdf_only: bool = False) -> Dict[str, Any]:
+def mark_game_turnover_drives(plays: List[Dict], game_id: Any) -> None:
     """
-    Load all game data for a given team
+    Turnover-drive marking for a single game file.
+
+    Duplicate plays are skipped the same way deduplicate_plays will drop them,
+    so the result matches marking the merged season unless another file
+    shares this game (see assemble_team_data).
 
     Args:
-        team_name: 'Washington' or 'Wisconsin'
-        data_dir: Base directory containing team folders
-        pdf_only: If True, only load files ending in '_PDF.json'
+        plays: Plays of one game file (modified in place)
+        game_id: Game the plays belong to
+    """
+    seen = set()
+    unique_plays = []
+    for play in plays:
+        key = get_play_dedup_key(play, game_id)
+        if key not in seen:
+            seen.add(key)
+            unique_plays.append(play)
+    mark_turnover_drives(unique_plays)
+
+
+def get_game_context(game_info: Dict[str, Any], team_name: str) -> Dict[str, Any]:
+    """
+    Build the game-level fields that every play of a game shares.
+
+    Args:
+        game_info: 'game_info' block of a game JSON file
+        team_name: Team whose folder the game was loaded from
 
     Returns:
-        Dictionary with game data and metadata
+        Dictionary with game_id, game_week, opponent, is_power4_opponent, etc.
+    """
+    home_team = game_info.get('home_team', '')
+    away_team = game_info.get('away_team', '')
+    team_is_home = (team_name.lower() == home_team.lower())
+
+    context = {
+        'game_id': game_info.get('game_id'),
+        'game_week': game_info.get('week'),
+        'game_date': game_info.get('date'),
+        'home_team': home_team,
+        'away_team': away_team,
+        'is_conference': game_info.get('conference', False),
+        'is_home': team_is_home,
+    }
+
+    # Determine opponent and Power 4 status
+    # Opponent is always the other team, regardless of offense/defense
+    if team_is_home:
+        context['opponent'] = away_team if away_team else 'Unknown'
+        # If team is home, opponent is away - check away_power4
+        context['is_power4_opponent'] = game_info.get('away_power4', False)
+    else:
+        context['opponent'] = home_team if home_team else 'Unknown'
+        # If team is away, opponent is home - check home_power4
+        context['is_power4_opponent'] = game_info.get('home_power4', False)
+
+    return context
+
+
+def team_folder_name(team_name: str) -> str:
+    """
+    Name of a team's play-by-play folder ("Washington" -> "washington_play_by_play")
+
+    Args:
+        team_name: Team name
     """
     # Normalize team name for folder matching (lowercase, replace spaces/& with underscores)
     # Handle "William & Mary" -> "william_mary" (remove & and spaces, then replace with single underscore)
@@ -160,7 +253,21 @@ def load_team_data(team_name: str, data_dir: str = "advanced_reports_yogi",
     while "__" in normalized_name:
         normalized_name = normalized_name.replace("__", "_")
     normalized_name = normalized_name.strip("_")
-    team_folder = f"{normalized_name}_play_by_play"
+    return f"{normalized_name}_play_by_play"
+
+
+def get_team_path(team_name: str, data_dir: str = "advanced_reports_yogi") -> Path:
+    """
+    Locate the {team}_play_by_play folder for a team
+
+    Args:
+        team_name: 'Washington' or 'Wisconsin'
+        data_dir: Base directory containing team folders
+
+    Returns:
+        Path to the team folder
+    """
+    team_folder = team_folder_name(team_name)
     # Handle both relative and absolute paths
     if Path(data_dir).is_absolute():
         team_path = Path(data_dir) / team_folder
@@ -172,86 +279,284 @@ def load_team_data(team_name: str, data_dir: str = "advanced_reports_yogi",
     
     if not team_path.exists():
         raise ValueError(f"Team folder not found: {team_path}")
-    
-    games = []
-    all_plays = []
-    
+
+    return team_path
+
+
+def get_default_cache_dir(data_dir: str = "advanced_reports_yogi") -> Path:
+    """
+    Default location of the parsed play-by-play cache (see pbp_cache.py)
+
+    Args:
+        data_dir: Base directory containing team folders
+
+    Returns:
+        Path to "{data_dir}/.pbp_cache"
+    """
+    data_path = Path(data_dir)
+    if not data_path.is_absolute() and not data_path.exists():
+        # Same fallback as get_team_path: try from parent directory
+        data_path = Path("..") / data_dir
+    return data_path / ".pbp_cache"
+
+
+def get_game_files(team_path: Path, pdf_only: bool = False) -> List[Path]:
+    """
+    List the game JSON files to load from a team folder
+
+    Args:
+        team_path: Team folder from get_team_path()
+        pdf_only: If True, only return pure PDF sources (game_week*_PDF.json)
+
+    Returns:
+        Sorted list of game file paths
+    """
     # Load JSON files (optionally filter for PDF-only sources)
     all_json_files = sorted(team_path.glob("*.json"))
     if pdf_only:
         # Only load files matching game_week*_PDF.json pattern (pure PDF without embedded game_ids)
         # This excludes files like game_401628333_*_PDF.json which have game_ids from filenames
-        import re
-        json_files = [f for f in all_json_files
-                      if f.name.endswith('_PDF.json') and re.match(r'^game_week\d+_', f.name)]
-    else:
-        json_files = all_json_files
-    
-    for json_file in json_files:
-        with open(json_file, 'r') as f:
-            game_data = json.load(f)
-            
-        game_info = game_data.get('game_info', {})
-        plays = game_data.get('plays', [])
-        
-        # Add game context to each play
-        home_team = game_info.get('home_team', '')
-        away_team = game_info.get('away_team', '')
-        team_is_home = (team_name.lower() == home_team.lower())
-        
-        for play in plays:
-            play['game_id'] = game_info.get('game_id')
-            play['game_week'] = game_info.get('week')
-            play['game_date'] = game_info.get('date')
-            play['home_team'] = home_team
-            play['away_team'] = away_team
-            play['is_conference'] = game_info.get('conference', False)
-            play['is_home'] = team_is_home
-            
-            # Determine opponent and Power 4 status
-            # Opponent is always the other team, regardless of offense/defense
-            if team_is_home:
-                play['opponent'] = away_team if away_team else 'Unknown'
-                # If team is home, opponent is away - check away_power4
-                play['is_power4_opponent'] = game_info.get('away_power4', False)
-            else:
-                play['opponent'] = home_team if home_team else 'Unknown'
-                # If team is away, opponent is home - check home_power4
-                play['is_power4_opponent'] = game_info.get('home_power4', False)
-
-            # Add middle_eight flag if not already present
-            if 'middle_eight' not in play:
-                play['middle_eight'] = is_middle_eight(
-                    play.get('period', 0),
-                    play.get('clock', '')
-                )
+        return [f for f in all_json_files
+                if f.name.endswith('_PDF.json') and re.match(r'^game_week\d+_', f.name)]
+    return all_json_files
 
-        games.append({
-            'game_info': game_info,
+
+def parse_game_file(json_file: Path, team_name: str, raw: Optional[bytes] = None) -> Dict[str, Any]:
+    """
+    Parse one game JSON file and apply the per-game annotations
+
+    Game context is computed once (see get_game_context) but not yet copied
+    onto the plays; assemble_team_data does that for list-of-dict output.
+    Only depends on the file itself, so it can run in a worker process.
+
+    Args:
+        json_file: Path to the game file
+        team_name: Team whose folder the game was loaded from
+        raw: File contents if already read (e.g. for hashing)
+
+    Returns:
+        Dictionary with game_info, context, plays and file_name
+    """
+    if raw is None:
+        raw = Path(json_file).read_bytes()
+    game_data = json.loads(raw)
+
+    game_info = game_data.get('game_info', {})
+    plays = game_data.get('plays', [])
+
+    context = get_game_context(game_info, team_name)
+
+    derived_middle_eight = []
+    for i, play in enumerate(plays):
+        # Add middle_eight flag if not already present
+        if 'middle_eight' not in play:
+            play['middle_eight'] = is_middle_eight(
+                play.get('period', 0),
+                play.get('clock', '')
+            )
+            derived_middle_eight.append(i)
+
+    # Parse play_text once for the analyzers (return yards, TD, 1st down, ...)
+    for play in plays:
+        add_play_text_features(play)
+
+    # Plays whose turnover-drive flag is derived (not in the source file)
+    derived_turnover_flags = [i for i, play in enumerate(plays)
+                              if 'drive_started_after_turnover' not in play]
+    mark_game_turnover_drives(plays, context['game_id'])
+
+    return {
+        'game_info': game_info,
+        'context': context,
+        'plays': plays,
+        'file_name': Path(json_file).name,
+        'derived_middle_eight': derived_middle_eight,
+        'derived_turnover_flags': derived_turnover_flags
+    }
+
+
+def _parse_game_file_job(job: tuple) -> Dict[str, Any]:
+    """parse_game_file() for ProcessPoolExecutor.map"""
+    return parse_game_file(*job)
+
+
+def parse_game_files(json_files: List[Path], team_name: str, workers: int = 1,
+                     raws: Optional[List[Optional[bytes]]] = None) -> List[Dict[str, Any]]:
+    """
+    Parse game files, optionally in a pool of worker processes
+
+    Args:
+        json_files: Game files to parse
+        team_name: Team whose folder the games were loaded from
+        workers: Number of worker processes (1 = parse in this process,
+            0 = one per CPU core)
+        raws: File contents already read, aligned with json_files
+
+    Returns:
+        parse_game_file() results, in the order of json_files
+    """
+    if raws is None:
+        raws = [None] * len(json_files)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(json_files))
+
+    if workers <= 1:
+        return [parse_game_file(json_file, team_name, raw)
+                for json_file, raw in zip(json_files, raws)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(json_file, team_name, raw) for json_file, raw in zip(json_files, raws)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_game_file_job, jobs))
+
+
+def assemble_team_data(team_name: str, parsed_games: List[Dict[str, Any]],
+                       columnar: bool = False) -> Dict[str, Any]:
+    """
+    Merge parsed games into the load_team_data result
+
+    Copies game context onto plays (or into a PlayTable) and deduplicates
+    across games. Turnover drives are already marked per game file; they are
+    only re-marked here for games split across several files.
+
+    Args:
+        team_name: Team name
+        parsed_games: Output of parse_game_file() for each game, in load order
+        columnar: Build a PlayTable instead of a list of play dicts
+
+    Returns:
+        Dictionary with game data and metadata
+    """
+    games = []
+    all_plays = []
+    builder = PlayTableBuilder(GAME_CONTEXT_KEYS) if columnar else None
+
+    # Games whose plays come from more than one file must be marked together
+    key_counts = Counter()
+    for parsed in parsed_games:
+        context = parsed['context']
+        key_counts[('turnover', get_turnover_game_key(context))] += 1
+        key_counts[('dedup', context['game_id'])] += 1
+    merged_game_keys = set()
+
+    for parsed in parsed_games:
+        plays = parsed['plays']
+        context = parsed['context']
+        game_key = get_turnover_game_key(context)
+        merged = (key_counts[('turnover', game_key)] > 1 or
+                  key_counts[('dedup', context['game_id'])] > 1)
+
+        if merged:
+            # Marked across files below - on copies, so the parsed game (which
+            # the season cache reuses) keeps its source values and per-file marking
+            plays = [dict(play) for play in plays]
+            # Start from the source value of derived fields
+            for i in parsed['derived_turnover_flags']:
+                plays[i].pop('drive_started_after_turnover', None)
+            merged_game_keys.add(game_key)
+
+        game = {
+            'game_info': parsed['game_info'],
             'plays': plays,
-            'file_name': json_file.name
-        })
-        all_plays.extend(plays)
+            'file_name': parsed['file_name']
+        }
+        if builder is not None:
+            # Copy plays into columns; the game's row views are attached below
+            game['game_no'] = builder.add_game(context)
+            builder.extend(plays, game['game_no'])
+            game['plays'] = []
+        else:
+            # Add game context to each play
+            for play in plays:
+                play.update(context)
+            # Keep derived fields after the context fields
+            derived = [(('middle_eight',), parsed['derived_middle_eight']),
+                       (PLAY_TEXT_FEATURES, range(len(plays))),
+                       (('drive_started_after_turnover',), parsed['derived_turnover_flags'])]
+            for keys, indices in derived:
+                for i in indices:
+                    for key in keys:
+                        if key in plays[i]:
+                            plays[i][key] = plays[i].pop(key)
+            all_plays.extend(plays)
+        games.append(game)
     
     # Sort games by week
     games.sort(key=lambda x: x['game_info'].get('week', 0))
 
-    # Deduplicate plays (CFBD data sometimes has duplicate entries)
-    all_plays = deduplicate_plays(all_plays)
+    if builder is not None:
+        all_plays = builder.build()
+        # Deduplicate on row views, then keep only the surviving rows
+        unique_rows = deduplicate_plays(all_plays)
+        all_plays = all_plays.take(row.position for row in unique_rows)
+    else:
+        # Deduplicate plays (CFBD data sometimes has duplicate entries)
+        all_plays = deduplicate_plays(all_plays)
+
+    # Calculate drive_started_after_turnover for games split across files
+    if merged_game_keys:
+        calculate_drive_started_after_turnover(
+            [play for play in all_plays if get_turnover_game_key(play) in merged_game_keys])
 
-    # Calculate drive_started_after_turnover for PDF data that lacks this field
-    all_plays = calculate_drive_started_after_turnover(all_plays)
+    if builder is not None:
+        rows_by_game = all_plays.rows_by_game()
+        for game in games:
+            game['plays'] = rows_by_game[game.pop('game_no')]
+
+    game_index = GameIndex(all_plays)
 
     return {
         'team_name': team_name,
         'games': games,
         'all_plays': all_plays,
+        # Chronological games and drives (built once per load); the filter
+        # postings are built on the first filter_plays() call
+        'game_index': game_index,
+        'play_index': PlayIndex(all_plays, game_index),
+        'drive_index': DriveIndex(all_plays),
         'total_games': len(games),
         'total_plays': len(all_plays)
     }
 
 
-def filter_plays(plays: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
+def load_team_data(team_name: str, data_dir: str = "advanced_reports_yogi",
+                   pdf_only: bool = False, columnar: bool = False,
+                   cache_dir: Optional[str] = None, workers: int = 1) -> Dict[str, Any]:
+    """
+    Load all game data for a given team
+
+    Args:
+        team_name: 'Washington' or 'Wisconsin'
+        data_dir: Base directory containing team folders
+        pdf_only: If True, only load files ending in '_PDF.json'
+        columnar: If True, 'all_plays' is a PlayTable (columnar store with
+            dict-compatible row views) instead of a list of play dicts, and
+            per-game context is kept once per game instead of on every play
+        cache_dir: If set, reuse/store the normalized result in a per-team
+            binary cache in this directory (see pbp_cache.SeasonCache)
+        workers: Number of processes used to parse game files (1 = no pool,
+            0 = one per CPU core)
+
+    Returns:
+        Dictionary with game data and metadata
+    """
+    team_path = get_team_path(team_name, data_dir)
+    json_files = get_game_files(team_path, pdf_only)
+
+    if cache_dir is not None:
+        from pbp_cache import SeasonCache
+        return SeasonCache(cache_dir).load_team_data(
+            team_name, team_path, json_files, pdf_only=pdf_only, columnar=columnar,
+            workers=workers)
+
+    parsed_games = parse_game_files(json_files, team_name, workers=workers)
+    return assemble_team_data(team_name, parsed_games, columnar=columnar)
+
+
+def filter_plays(plays: List[Dict], filters: Dict[str, Any],
+                 index: Optional[PlayIndex] = None) -> List[Dict]:
     """
     Filter plays based on criteria
     
@@ -265,45 +570,17 @@ def filter_plays(plays: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
             - conference_only: Boolean for conference games only
             - non_conference_only: Boolean for non-conference games only
             - last_3_games: Boolean for last 3 games only
+        index: PlayIndex of these plays (team_data['play_index']); built on
+            the fly if not given
             
     Returns:
         Filtered list of plays
     """
-    filtered = plays
-    
-    # Filter by game IDs
-    if filters.get('game_ids'):
-        filtered = [p for p in filtered if p.get('game_id') in filters['game_ids']]
-    
-    # Filter by weeks
-    if filters.get('weeks'):
-        filtered = [p for p in filtered if p.get('game_week') in filters['weeks']]
-    
-    # Filter by opponents
-    if filters.get('opponents'):
-        filtered = [p for p in filtered if p.get('opponent') in filters['opponents']]
-    
-    # Filter by periods
-    if filters.get('periods'):
-        filtered = [p for p in filtered if p.get('period') in filters['periods']]
-    
-    # Filter by conference/non-conference/power4
-    if filters.get('conference_only'):
-        filtered = [p for p in filtered if p.get('is_conference') == True]
-    elif filters.get('non_conference_only'):
-        filtered = [p for p in filtered if p.get('is_conference') == False]
-    elif filters.get('power4_only'):
-        filtered = [p for p in filtered if p.get('is_power4_opponent') == True]
-    
-    # Filter by last 3 games
-    if filters.get('last_3_games'):
-        # Get unique games sorted by week
-        games = sorted(set(p.get('game_id') for p in plays), 
-                      key=lambda gid: next((p for p in plays if p.get('game_id') == gid), {}).get('game_week', 0))
-        last_3_game_ids = games[-3:] if len(games) >= 3 else games
-        filtered = [p for p in filtered if p.get('game_id') in last_3_game_ids]
-    
-    return filtered
+    if index is None:
+        index = PlayIndex(plays)
+    elif index.plays is not plays or len(index) != len(plays):
+        raise ValueError("PlayIndex was built for a different list of plays")
+    return index.filter(filters)
 
 
 def get_game_list(team_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Persistent binary cache of normalized play-by-play data
+
+One pickle blob per team (and load mode) holds:
+- one entry per game file, keyed by file name and validated by the file's
+  SHA-256 content hash (mtime/size are used as a fast pre-check)
+- the fully normalized load_team_data() result for the current set of files
+
+A warm start with no changed files only unpickles the blob. When files change,
+only those files are re-parsed; the other games are reused from their cached
+entries and the cross-game steps (dedup, turnover drives) are re-run.
+Columnar blobs keep only the PlayTable, so any change re-parses every file.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from load_advanced_pbp_data import LOADER_VERSION, assemble_team_data, parse_game_files
+
+
+def file_digest(raw: bytes) -> str:
+    """SHA-256 hex digest of a game file's contents"""
+    return hashlib.sha256(raw).hexdigest()
+
+
+class SeasonCache:
+    """
+    On-disk cache of load_team_data() results
+
+    Args:
+        cache_dir: Directory for the cache blobs (created on first save)
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def blob_path(self, team_path: Path, pdf_only: bool = False, columnar: bool = False) -> Path:
+        """Cache file for one team folder and load mode"""
+        mode = ('_pdf' if pdf_only else '') + ('_columnar' if columnar else '')
+        return self.cache_dir / f"{team_path.name}{mode}.pkl"
+
+    def read_blob(self, path: Path, team_name: str) -> Optional[Dict[str, Any]]:
+        """Load a cache blob, or None if it is missing, unreadable or stale"""
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                blob = pickle.load(f)
+        except Exception as e:
+            print(f"  Warning: ignoring unreadable cache {path}: {e}")
+            return None
+        if blob.get('version') != LOADER_VERSION or blob.get('team_name') != team_name:
+            return None
+        return blob
+
+    def write_blob(self, path: Path, blob: Dict[str, Any]) -> None:
+        """Atomically replace a cache blob"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(blob, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def load_team_data(self, team_name: str, team_path: Path, json_files: List[Path],
+                       pdf_only: bool = False, columnar: bool = False,
+                       workers: int = 1) -> Dict[str, Any]:
+        """
+        load_team_data() backed by the cache
+
+        Args:
+            team_name: Team name
+            team_path: Team folder
+            json_files: Game files to load, in load order
+            pdf_only: Load mode (part of the cache key)
+            columnar: Load mode (part of the cache key)
+            workers: Worker processes for re-parsing changed files
+
+        Returns:
+            Same dictionary as load_advanced_pbp_data.load_team_data()
+        """
+        path = self.blob_path(team_path, pdf_only, columnar)
+        blob = self.read_blob(path, team_name)
+        cached_files = blob['files'] if blob else {}
+
+        files = {}
+        to_parse = []
+        touched = False
+        for json_file in json_files:
+            stat = json_file.stat()
+            entry = cached_files.get(json_file.name)
+            if entry is not None and (entry['mtime_ns'], entry['size']) != (stat.st_mtime_ns, stat.st_size):
+                # Touched or rewritten - still valid if the content is unchanged
+                raw = json_file.read_bytes()
+                digest = file_digest(raw)
+                if entry['sha256'] != digest:
+                    entry = None
+                else:
+                    entry['mtime_ns'], entry['size'] = stat.st_mtime_ns, stat.st_size
+                    touched = True
+            else:
+                raw = None
+
+            if entry is None:
+                if raw is None:
+                    raw = json_file.read_bytes()
+                entry = {
+                    'sha256': file_digest(raw),
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'game': None
+                }
+                to_parse.append((json_file, raw, entry))
+
+            files[json_file.name] = entry
+
+        reparsed = [job[0].name for job in to_parse]
+        result_key = [(name, entry['sha256']) for name, entry in files.items()]
+        if blob is not None and not reparsed and blob.get('result_key') == result_key:
+            if touched or len(files) != len(cached_files):
+                # Only metadata changed (touched or removed files) - refresh the blob
+                self.write_blob(path, dict(blob, files=files))
+            print(f"  Loaded {team_name} from cache ({len(files)} games)")
+            return blob['result']
+
+        if blob is not None:
+            print(f"  Cache refresh for {team_name}: {len(reparsed)} of {len(files)} game file(s) re-parsed")
+
+        # Columnar blobs only keep the PlayTable, so unchanged games are re-parsed too
+        for json_file in json_files:
+            entry = files[json_file.name]
+            if entry['game'] is None and all(job[2] is not entry for job in to_parse):
+                to_parse.append((json_file, None, entry))
+
+        # Parse new and changed files (in worker processes if requested)
+        parsed = parse_game_files([job[0] for job in to_parse], team_name, workers=workers,
+                                  raws=[job[1] for job in to_parse])
+        for (json_file, raw, entry), game in zip(to_parse, parsed):
+            entry['game'] = game
+        parsed_games = [entry['game'] for entry in files.values()]
+
+        team_data = assemble_team_data(team_name, parsed_games, columnar=columnar)
+
+        self.write_blob(path, {
+            'version': LOADER_VERSION,
+            'team_name': team_name,
+            # The PlayTable holds every play; per-file dict plays would store them twice
+            'files': ({name: dict(entry, game=None) for name, entry in files.items()}
+                      if columnar else files),
+            'result_key': result_key,
+            'result': team_data
+        })
+        return team_data
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Penalty attribution shared by analyze_penalties and the generated app
+
+Play text names the team that committed a penalty with a marker next to the
+word PENALTY ("WASH PENALTY", "PENALTY UW", ...). Instead of testing every
+"<alias> PENALTY" / "PENALTY <alias>" string of every team against every
+penalty play, PenaltyMatcher indexes the aliases once and, for each PENALTY
+in the text, looks up the few strings right before and after it.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+PENALTY = 'PENALTY'
+
+# Team name -> abbreviations used in penalty markers (the team name itself is
+# always a marker too)
+TEAM_ALIASES: Dict[str, List[str]] = {
+    'WASHINGTON': ['WASH', 'WAS', 'UW'],
+    'UCLA': ['UCLA'],
+    'IOWA': ['IOWA', 'IA'],
+    'USC': ['USC', 'TROJAN'],
+    'WISCONSIN': ['WIS', 'WISC', 'UW'],
+    'NORTHWESTERN': ['NU', 'NW'],
+    'MICHIGAN': ['MICH', 'UM', 'UOM'],
+    'MICHIGAN STATE': ['MSU', 'MICHIGAN STATE'],
+    'ILLINOIS': ['ILL', 'ILLINOIS'],
+    'PENN STATE': ['PSU', 'PENN STATE'],
+    'OHIO STATE': ['OSU', 'OHIO STATE'],
+    'INDIANA': ['IND', 'IU'],
+    'PURDUE': ['PUR', 'PURDUE'],
+    'RUTGERS': ['RUT', 'RUTGERS'],
+    'MARYLAND': ['MD', 'MARYLAND'],
+    'MINNESOTA': ['MINN', 'MINNESOTA'],
+    'NEBRASKA': ['NEB', 'NEBRASKA'],
+    'OREGON': ['ORE', 'OREGON'],
+    'BALL STATE': ['BSU', 'BALL STATE']
+}
+
+# Hardcoded opponent markers (kept for backwards compatibility); these always
+# count as an opponent penalty unless the team's own marker is present
+OPPONENT_MARKERS = ['MSU PENALTY', 'MISSOURI STATE PENALTY', 'GS PENALTY', 'GEORGIA SOUTHERN PENALTY',
+                    'MICHIGAN STATE PENALTY', 'ILL PENALTY', 'ILLINOIS PENALTY',
+                    'UM PENALTY', 'UOM PENALTY', 'MICHIGAN PENALTY', 'IRISH PENALTY', 'NOTRE DAME PENALTY', 'ND PENALTY',
+                    'NEB PENALTY', 'NEBRASKA PENALTY', 'NU PENALTY', 'NORTHWESTERN PENALTY',
+                    'PENALTY WASH', 'WASH PENALTY', 'PENALTY WASHINGTON', 'WASHINGTON PENALTY',
+                    'PENALTY BALL', 'BALL PENALTY', 'PENALTY BSU', 'BSU PENALTY', 'BALL STATE PENALTY',
+                    'PENALTY USC', 'USC PENALTY',
+                    'PENALTY RUTGERS', 'RUTGERS PENALTY', 'PENALTY OSU', 'OSU PENALTY', 'OHIO STATE PENALTY',
+                    'PENALTY SIU', 'SIU PENALTY', 'SOUTHERN ILLINOIS PENALTY']
+
+# Label of the OPPONENT_MARKERS matches
+OPPONENT_MARKER = '<opponent marker>'
+
+# Penalty classes, matched as substrings of the upper-cased penalty_type
+PENALTY_CLASSES: Dict[str, List[str]] = {
+    'offensive': ['FALSE START', 'DELAY OF GAME', 'ILLEGAL FORMATION', 'OFFENSIVE HOLDING', 'HOLDING', 'INTENTIONAL GROUNDING', 'ILLEGAL SNAP', 'INELIGIBLE DOWNFIELD'],
+    'defensive': ['PASS INTERFERENCE', 'DEFENSIVE HOLDING', 'OFFSIDE', 'ROUGHING', 'UNNECESSARY ROUGHNESS', 'SIDELINE'],
+    'special_teams': ['ILLEGAL BLOCK', 'ILLEGAL BLOCK IN BACK', 'ILLEGAL BLOCK ABOVE WAIST', 'KICK CATCHING INTERFERENCE', 'ROUGHING THE KICKER', 'ROUGHING THE PUNTER', 'RUNNING INTO THE KICKER'],
+    # Penalties that can be committed by either offense or defense
+    'either_side': ['UNSPORTSMANLIKE', 'PERSONAL FOUL']
+}
+
+
+class PenaltyMatcher:
+    """
+    Finds which team a penalty play's text attributes the penalty to.
+
+    Args:
+        team_name: Team the analysis is for (its name is always one of its
+            markers, even if it is not in the alias registry)
+        aliases: Team alias registry (team name -> abbreviations)
+        opponent_markers: Extra "<alias> PENALTY" / "PENALTY <alias>" markers
+            that always mean an opponent penalty
+    """
+
+    def __init__(self, team_name: str, aliases: Dict[str, List[str]] = TEAM_ALIASES,
+                 opponent_markers: List[str] = OPPONENT_MARKERS):
+        self.team_upper = team_name.upper()
+
+        # "<alias> " right before PENALTY / " <alias>" right after it -> labels
+        self.before: Dict[str, Set[str]] = {}
+        self.after: Dict[str, Set[str]] = {}
+        for team, abbrevs in aliases.items():
+            for alias in [team] + abbrevs:
+                self._add(alias, team)
+        self._add(self.team_upper, self.team_upper)
+        for marker in opponent_markers:
+            if marker.startswith(PENALTY + ' '):
+                self._add(marker[len(PENALTY) + 1:], OPPONENT_MARKER, before=False)
+            else:
+                self._add(marker[:-len(PENALTY) - 1], OPPONENT_MARKER, after=False)
+
+        self.before_lengths = sorted({len(key) for key in self.before})
+        self.after_lengths = sorted({len(key) for key in self.after})
+        self._classes: Dict[str, FrozenSet[str]] = {}
+
+    def _add(self, alias: str, label: str, before: bool = True, after: bool = True) -> None:
+        if before:
+            self.before.setdefault(alias + ' ', set()).add(label)
+        if after:
+            self.after.setdefault(' ' + alias, set()).add(label)
+
+    def labels(self, play_text_upper: str) -> Set[str]:
+        """Teams (registry names, the analyzed team or OPPONENT_MARKER) marked in the text"""
+        found: Set[str] = set()
+        pos = play_text_upper.find(PENALTY)
+        while pos != -1:
+            for n in self.before_lengths:
+                if n > pos:
+                    break
+                labels = self.before.get(play_text_upper[pos - n:pos])
+                if labels:
+                    found |= labels
+            end = pos + len(PENALTY)
+            for n in self.after_lengths:
+                labels = self.after.get(play_text_upper[end:end + n])
+                if labels:
+                    found |= labels
+            pos = play_text_upper.find(PENALTY, pos + 1)
+        return found
+
+    def attribute(self, play_text_upper: str) -> Optional[str]:
+        """
+        'team' if the text marks the analyzed team, otherwise 'opponent' if it
+        marks another team, otherwise None
+        """
+        found = self.labels(play_text_upper)
+        if self.team_upper in found:
+            return 'team'
+        if found:
+            return 'opponent'
+        return None
+
+    def classify(self, penalty_type_upper: str) -> FrozenSet[str]:
+        """PENALTY_CLASSES keys matching a penalty type (cached per type)"""
+        classes = self._classes.get(penalty_type_upper)
+        if classes is None:
+            classes = frozenset(name for name, penalties in PENALTY_CLASSES.items()
+                                if any(penalty in penalty_type_upper for penalty in penalties))
+            self._classes[penalty_type_upper] = classes
+        return classes
+
+    def match(self, play_text_upper: str, penalty_type_upper: str) -> Tuple[Optional[str], FrozenSet[str]]:
+        """attribute() and classify() of a penalty play"""
+        return self.attribute(play_text_upper), self.classify(penalty_type_upper)
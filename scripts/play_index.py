@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Pre-built filter indexes over a season of plays
+
+A PlayIndex is attached to every load (see load_team_data) and, on the first
+filter, builds for every filterable field a bitmap of the row positions holding each value. Bitmaps
+are plain Python ints (bit i set = row i matches), so combining criteria is a
+handful of big-int AND/OR operations instead of one list pass per criterion,
+and only the matching rows are materialized at the end.
+"""
+
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from game_index import GameIndex
+from play_table import MISSING, PlayTable
+
+
+# Play fields with postings, in the order filter_plays applies them
+INDEXED_FIELDS = (
+    'game_id',
+    'game_week',
+    'opponent',
+    'period',
+    'is_conference',
+    'is_power4_opponent',
+)
+
+# Criteria understood by PlayIndex.match / filter_plays
+FILTER_KEYS = (
+    'game_ids',
+    'weeks',
+    'opponents',
+    'periods',
+    'conference_only',
+    'non_conference_only',
+    'power4_only',
+    'last_3_games',
+)
+
+# Bit positions set in each byte value, for turning a bitmap into row positions
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def bitmap_positions(bitmap: int) -> List[int]:
+    """Row positions of the set bits of a bitmap, in ascending order"""
+    positions = []
+    if not bitmap:
+        return positions
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset * 8
+            positions.extend(base + bit for bit in _BYTE_BITS[byte])
+    return positions
+
+
+def positions_bitmap(positions: Iterable[int]) -> int:
+    """Bitmap with the given row positions set"""
+    positions = list(positions)
+    if not positions:
+        return 0
+    data = bytearray(max(positions) // 8 + 1)
+    for i in positions:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, 'little')
+
+
+class PlayIndex:
+    """
+    Bitmap postings per game_id, week, opponent, period, conference and
+    power-4 flag, plus a week-ordered game list for "last N games".
+
+    The postings are built on first use, so loads that never filter plays
+    don't pay for them.
+
+    Args:
+        plays: List of play dicts or a PlayTable (not modified)
+        game_index: GameIndex of the same plays (built if not given)
+    """
+
+    def __init__(self, plays: Sequence[Dict[str, Any]], game_index: Optional[GameIndex] = None):
+        self.plays = plays
+        self.size = len(plays)
+        self.all_rows = (1 << self.size) - 1
+        self._game_index = game_index
+
+    def __len__(self) -> int:
+        return self.size
+
+    @cached_property
+    def postings(self) -> Dict[str, Dict[Any, int]]:
+        """Bitmap of row positions per value, for each indexed field"""
+        return {field: self._build_postings(self.plays, field) for field in INDEXED_FIELDS}
+
+    @cached_property
+    def games_by_week(self) -> List[Any]:
+        """Game IDs in week order"""
+        if self._game_index is None:
+            self._game_index = GameIndex(self.plays)
+        return self._game_index.game_ids
+
+    @cached_property
+    def last_games_rows(self) -> List[int]:
+        """Rows of the last n games, for every n (index 0 = no games)"""
+        rows = [0]
+        for game_id in reversed(self.games_by_week):
+            rows.append(rows[-1] | self.postings['game_id'][game_id])
+        return rows
+
+    @staticmethod
+    def _build_postings(plays: Sequence[Dict[str, Any]], field: str) -> Dict[Any, int]:
+        """Bitmap of row positions per distinct value of one field"""
+        rows: Dict[Any, List[int]] = {}
+        if isinstance(plays, PlayTable):
+            codes, values = plays.encoded(field)
+            by_code: Dict[int, List[int]] = {}
+            for i, code in enumerate(codes):
+                by_code.setdefault(code, []).append(i)
+            for code, positions in by_code.items():
+                value = values[code]
+                # Rows without the field read as None, like play.get(field)
+                rows.setdefault(None if value is MISSING else value, []).extend(positions)
+        else:
+            for i, play in enumerate(plays):
+                rows.setdefault(play.get(field), []).append(i)
+
+        return {value: positions_bitmap(positions) for value, positions in rows.items()}
+
+    def rows_with(self, field: str, values: Iterable[Any]) -> int:
+        """Bitmap of rows whose field equals any of the given values"""
+        postings = self.postings[field]
+        bitmap = 0
+        for value in values:
+            bitmap |= postings.get(value, 0)
+        return bitmap
+
+    def last_n_games(self, n: int) -> List[Any]:
+        """Game IDs of the last n games by week"""
+        return self.games_by_week[-n:] if n > 0 else []
+
+    def last_n_games_rows(self, n: int) -> int:
+        """Bitmap of the rows of the last n games by week"""
+        return self.last_games_rows[max(0, min(n, len(self.games_by_week)))]
+
+    def match(self, filters: Dict[str, Any]) -> int:
+        """Bitmap of the rows matching filter_plays() criteria"""
+        bitmap = self.all_rows
+
+        for key, field in (('game_ids', 'game_id'), ('weeks', 'game_week'),
+                           ('opponents', 'opponent'), ('periods', 'period')):
+            if filters.get(key):
+                bitmap &= self.rows_with(field, filters[key])
+
+        # Conference/non-conference/power4 are mutually exclusive (first one wins)
+        if filters.get('conference_only'):
+            bitmap &= self.postings['is_conference'].get(True, 0)
+        elif filters.get('non_conference_only'):
+            bitmap &= self.postings['is_conference'].get(False, 0)
+        elif filters.get('power4_only'):
+            bitmap &= self.postings['is_power4_opponent'].get(True, 0)
+
+        if filters.get('last_3_games'):
+            bitmap &= self.last_n_games_rows(3)
+
+        return bitmap
+
+    def positions(self, filters: Dict[str, Any]) -> List[int]:
+        """Row positions matching filter_plays() criteria, in play order"""
+        return bitmap_positions(self.match(filters))
+
+    def filter(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plays matching filter_plays() criteria, in play order"""
+        plays = self.plays
+        if not any(filters.get(key) for key in FILTER_KEYS):
+            return plays
+        return [plays[i] for i in self.positions(filters)]
+
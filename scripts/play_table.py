@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory play store for advanced play-by-play data
+
+A PlayTable keeps one typed column per play field instead of one dict per
+play:
+- int/float fields live in array-backed columns
+- low-cardinality strings (team, play_type, ...) are dictionary-encoded
+- game context (game_id, opponent, power-4 flag, ...) is stored once per game
+  and resolved through a per-row game index
+
+Rows are exposed as PlayRow views that behave like the old play dicts, so the
+analyze_* modules keep working unchanged. New code can use the column API
+(column(), encoded(), game_indices()) directly.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Keys that load_team_data copies from game_info onto every play
+GAME_CONTEXT_KEYS = (
+    'game_id',
+    'game_week',
+    'game_date',
+    'home_team',
+    'away_team',
+    'is_conference',
+    'is_home',
+    'opponent',
+    'is_power4_opponent',
+)
+
+# Dictionary-encoded string columns fall back to plain object storage when
+# more than this fraction of the values are distinct (e.g. play_text)
+MAX_DICT_RATIO = 0.5
+
+
+class _Missing:
+    """Sentinel for a key that is absent from a play (as opposed to None)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<missing>'
+
+    def __reduce__(self) -> str:
+        # Unpickle to the module-level singleton so `is MISSING` checks hold
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+# Per-row state codes for typed columns
+_ABSENT = 0
+_NONE = 1
+_VALUE = 2
+
+
+class Column:
+    """Base class for a single play field stored column-wise"""
+
+    kind = 'object'
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def get(self, i: int) -> Any:
+        raise NotImplementedError
+
+    def append(self, value: Any) -> bool:
+        """Append a value; return False if the column cannot hold its type"""
+        raise NotImplementedError
+
+    def set(self, i: int, value: Any) -> bool:
+        """Overwrite a value; return False if the column cannot hold its type"""
+        raise NotImplementedError
+
+    def take(self, indices: Sequence[int]) -> 'Column':
+        raise NotImplementedError
+
+    def values(self) -> List[Any]:
+        """All values as a list (MISSING for absent keys)"""
+        return [self.get(i) for i in range(len(self))]
+
+    def to_object(self) -> 'ObjectColumn':
+        return ObjectColumn(self.values())
+
+    def promote(self, value: Any) -> 'Column':
+        """Return a column holding the same values that can also hold `value`"""
+        return self.to_object()
+
+
+class NullColumn(Column):
+    """Column whose values so far are all None/absent (type not known yet)"""
+
+    kind = 'null'
+
+    def __init__(self):
+        self.state = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def get(self, i: int) -> Any:
+        return None if self.state[i] == _NONE else MISSING
+
+    def append(self, value: Any) -> bool:
+        if value is None:
+            self.state.append(_NONE)
+        elif value is MISSING:
+            self.state.append(_ABSENT)
+        else:
+            return False
+        return True
+
+    def set(self, i: int, value: Any) -> bool:
+        if value is None:
+            self.state[i] = _NONE
+        elif value is MISSING:
+            self.state[i] = _ABSENT
+        else:
+            return False
+        return True
+
+    def take(self, indices: Sequence[int]) -> 'NullColumn':
+        col = NullColumn()
+        state = self.state
+        col.state = bytearray(state[i] for i in indices)
+        return col
+
+    def promote(self, value: Any) -> Column:
+        col = _new_column(value)
+        for state in self.state:
+            col.append(None if state == _NONE else MISSING)
+        return col
+
+
+class ObjectColumn(Column):
+    """Fallback column holding arbitrary Python objects"""
+
+    kind = 'object'
+
+    def __init__(self, data: Optional[List[Any]] = None):
+        self.data = data if data is not None else []
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, i: int) -> Any:
+        return self.data[i]
+
+    def append(self, value: Any) -> bool:
+        self.data.append(value)
+        return True
+
+    def set(self, i: int, value: Any) -> bool:
+        self.data[i] = value
+        return True
+
+    def take(self, indices: Sequence[int]) -> 'ObjectColumn':
+        data = self.data
+        return ObjectColumn([data[i] for i in indices])
+
+    def values(self) -> List[Any]:
+        return list(self.data)
+
+    def to_object(self) -> 'ObjectColumn':
+        return self
+
+
+class _ArrayColumn(Column):
+    """Numeric column backed by array.array plus a per-row state byte"""
+
+    typecode = 'q'
+    value_type: type = int
+
+    def __init__(self):
+        self.data = array(self.typecode)
+        self.state = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def _accepts(self, value: Any) -> bool:
+        return type(value) is self.value_type
+
+    def get(self, i: int) -> Any:
+        state = self.state[i]
+        if state == _VALUE:
+            return self.data[i]
+        if state == _NONE:
+            return None
+        return MISSING
+
+    def append(self, value: Any) -> bool:
+        if value is MISSING:
+            self.data.append(0)
+            self.state.append(_ABSENT)
+        elif value is None:
+            self.data.append(0)
+            self.state.append(_NONE)
+        elif self._accepts(value):
+            try:
+                self.data.append(value)
+            except OverflowError:
+                return False
+            self.state.append(_VALUE)
+        else:
+            return False
+        return True
+
+    def set(self, i: int, value: Any) -> bool:
+        if value is MISSING:
+            self.state[i] = _ABSENT
+        elif value is None:
+            self.state[i] = _NONE
+        elif self._accepts(value):
+            try:
+                self.data[i] = value
+            except OverflowError:
+                return False
+            self.state[i] = _VALUE
+        else:
+            return False
+        return True
+
+    def take(self, indices: Sequence[int]) -> '_ArrayColumn':
+        col = type(self)()
+        data, state = self.data, self.state
+        col.data = array(self.typecode, (data[i] for i in indices))
+        col.state = bytearray(state[i] for i in indices)
+        return col
+
+
+class IntColumn(_ArrayColumn):
+    """64-bit integer column (down, distance, yards_gained, ...)"""
+
+    kind = 'int'
+    typecode = 'q'
+    value_type = int
+
+
+class FloatColumn(_ArrayColumn):
+    """Double precision column (ppa, ...)"""
+
+    kind = 'float'
+    typecode = 'd'
+    value_type = float
+
+
+class BoolColumn(Column):
+    """Boolean column stored as one byte per row"""
+
+    kind = 'bool'
+
+    _FALSE = 0
+    _TRUE = 1
+    _NONE_CODE = 2
+    _ABSENT_CODE = 3
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _encode(self, value: Any) -> Optional[int]:
+        if value is True:
+            return self._TRUE
+        if value is False:
+            return self._FALSE
+        if value is None:
+            return self._NONE_CODE
+        if value is MISSING:
+            return self._ABSENT_CODE
+        return None
+
+    def get(self, i: int) -> Any:
+        code = self.data[i]
+        if code == self._TRUE:
+            return True
+        if code == self._FALSE:
+            return False
+        if code == self._NONE_CODE:
+            return None
+        return MISSING
+
+    def append(self, value: Any) -> bool:
+        code = self._encode(value)
+        if code is None:
+            return False
+        self.data.append(code)
+        return True
+
+    def set(self, i: int, value: Any) -> bool:
+        code = self._encode(value)
+        if code is None:
+            return False
+        self.data[i] = code
+        return True
+
+    def take(self, indices: Sequence[int]) -> 'BoolColumn':
+        col = BoolColumn()
+        data = self.data
+        col.data = bytearray(data[i] for i in indices)
+        return col
+
+
+class DictColumn(Column):
+    """
+    Dictionary-encoded string column.
+
+    Code 0 is an absent key, code 1 is None, codes >= 2 index into `values_table`.
+    """
+
+    kind = 'dict'
+
+    def __init__(self):
+        self.codes = array('I')
+        self.values_table: List[Any] = [MISSING, None]
+        self.lookup: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _code(self, value: Any) -> Optional[int]:
+        if value is MISSING:
+            return 0
+        if value is None:
+            return 1
+        if type(value) is not str:
+            return None
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values_table)
+            self.values_table.append(value)
+            self.lookup[value] = code
+        return code
+
+    def get(self, i: int) -> Any:
+        return self.values_table[self.codes[i]]
+
+    def append(self, value: Any) -> bool:
+        code = self._code(value)
+        if code is None:
+            return False
+        self.codes.append(code)
+        return True
+
+    def set(self, i: int, value: Any) -> bool:
+        code = self._code(value)
+        if code is None:
+            return False
+        self.codes[i] = code
+        return True
+
+    def take(self, indices: Sequence[int]) -> 'DictColumn':
+        col = DictColumn()
+        codes = self.codes
+        col.codes = array('I', (codes[i] for i in indices))
+        col.values_table = self.values_table
+        col.lookup = self.lookup
+        return col
+
+    def cardinality(self) -> int:
+        return len(self.values_table) - 2
+
+
+def _new_column(value: Any) -> Column:
+    """Pick the narrowest column type that can hold a value"""
+    if value is None or value is MISSING:
+        return NullColumn()
+    value_type = type(value)
+    if value_type is bool:
+        return BoolColumn()
+    if value_type is int:
+        return IntColumn()
+    if value_type is float:
+        return FloatColumn()
+    if value_type is str:
+        return DictColumn()
+    return ObjectColumn()
+
+
+class PlayRow(MutableMapping):
+    """
+    Dict-compatible view of one row of a PlayTable.
+
+    Supports get/[]/in/iteration/items() like the original play dicts.
+    Assigning a key writes through to the table column (game context keys are
+    shared per game and therefore read-only on a row).
+    """
+
+    __slots__ = ('_table', 'position')
+
+    def __init__(self, table: 'PlayTable', position: int):
+        self._table = table
+        self.position = position
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._table._value(self.position, key)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._table._value(self.position, key)
+        return default if value is MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return self._table._value(self.position, key) is not MISSING
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._table._set_value(self.position, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._table._set_value(self.position, key, MISSING)
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._table
+        i = self.position
+        for key in table.context_keys:
+            yield key
+        for key, col in table.columns.items():
+            if col.get(i) is not MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"PlayRow({dict(self)!r})"
+
+
+class PlayTable:
+    """
+    Columnar table of plays with per-game context stored once.
+
+    Indexing and iteration yield PlayRow views, so a PlayTable can be passed
+    anywhere a List[Dict] of plays was used before.
+    """
+
+    def __init__(self, columns: Dict[str, Column], game_index: array,
+                 games: List[Dict[str, Any]],
+                 context_keys: Sequence[str] = GAME_CONTEXT_KEYS):
+        self.columns = columns
+        self.game_index = game_index
+        self.games = games
+        self.context_keys = tuple(context_keys)
+        self._context_set = frozenset(self.context_keys)
+
+    # -- Sequence protocol ---------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.game_index)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [PlayRow(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('play index out of range')
+        return PlayRow(self, i)
+
+    def __iter__(self) -> Iterator[PlayRow]:
+        for i in range(len(self)):
+            yield PlayRow(self, i)
+
+    def __repr__(self) -> str:
+        return f"PlayTable({len(self)} plays, {len(self.games)} games, {len(self.columns)} columns)"
+
+    # -- Row access ----------------------------------------------------------
+
+    def _value(self, i: int, key: Any) -> Any:
+        if key in self._context_set:
+            return self.games[self.game_index[i]].get(key, MISSING)
+        col = self.columns.get(key)
+        if col is None:
+            return MISSING
+        return col.get(i)
+
+    def _set_value(self, i: int, key: str, value: Any) -> None:
+        if key in self._context_set:
+            raise TypeError(f"'{key}' is game context shared by every play in the game; "
+                            f"update table.games instead")
+        col = self.columns.get(key)
+        if col is None:
+            if value is MISSING:
+                return
+            col = _new_column(value)
+            for _ in range(len(self)):
+                col.append(MISSING)
+            self.columns[key] = col
+        if not col.set(i, value):
+            col = col.promote(value)
+            col.set(i, value)
+            self.columns[key] = col
+
+    # -- Column API ----------------------------------------------------------
+
+    def column(self, key: str, default: Any = None) -> List[Any]:
+        """
+        Values of one field for every row.
+
+        Args:
+            key: Play field name (or game context key)
+            default: Value used for rows that lack the field
+
+        Returns:
+            List with one value per row
+        """
+        if key in self._context_set:
+            per_game = [g.get(key, default) for g in self.games]
+            return [per_game[g] for g in self.game_index]
+        col = self.columns.get(key)
+        if col is None:
+            return [default] * len(self)
+        return [default if v is MISSING else v for v in col.values()]
+
+    def encoded(self, key: str) -> Tuple[Sequence[int], List[Any]]:
+        """
+        Dictionary codes for a string column (fast group-by).
+
+        Returns:
+            (codes, values) where values[codes[i]] is the value of row i.
+            MISSING marks rows without the field.
+        """
+        if key in self._context_set:
+            values = [g.get(key, MISSING) for g in self.games]
+            return self.game_index, values
+        col = self.columns.get(key)
+        if isinstance(col, DictColumn):
+            return col.codes, col.values_table
+        if col is None:
+            return array('I', bytes(4 * len(self))), [MISSING]
+        values: List[Any] = []
+        lookup: Dict[Any, int] = {}
+        codes = array('I')
+        for v in col.values():
+            try:
+                code = lookup.get(v)
+            except TypeError:
+                code = None
+            if code is None:
+                code = len(values)
+                values.append(v)
+                try:
+                    lookup[v] = code
+                except TypeError:
+                    pass
+            codes.append(code)
+        return codes, values
+
+    def game_indices(self) -> array:
+        """Position in `games` for every row"""
+        return self.game_index
+
+    def rows_by_game(self) -> List[List[PlayRow]]:
+        """Row views grouped by entry of `games` (in table order)"""
+        grouped: List[List[PlayRow]] = [[] for _ in self.games]
+        for i, game_no in enumerate(self.game_index):
+            grouped[game_no].append(PlayRow(self, i))
+        return grouped
+
+    def take(self, indices: Iterable[int]) -> 'PlayTable':
+        """New table with the given rows (in the given order)"""
+        indices = list(indices)
+        columns = {key: col.take(indices) for key, col in self.columns.items()}
+        game_index = array(self.game_index.typecode, (self.game_index[i] for i in indices))
+        return PlayTable(columns, game_index, self.games, self.context_keys)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize plain play dicts (e.g. for JSON serialization)"""
+        return [dict(row) for row in self]
+
+
+class PlayTableBuilder:
+    """
+    Incrementally build a PlayTable one game at a time.
+
+    Raw play dicts are copied into columns as they are appended, so only the
+    current game's parsed JSON needs to be held in memory.
+    """
+
+    def __init__(self, context_keys: Sequence[str] = GAME_CONTEXT_KEYS):
+        self.context_keys = tuple(context_keys)
+        self._context_set = frozenset(self.context_keys)
+        self.columns: Dict[str, Column] = {}
+        self.game_index = array('I')
+        self.games: List[Dict[str, Any]] = []
+
+    def add_game(self, context: Dict[str, Any]) -> int:
+        """Register a game's shared context; returns its game number"""
+        self.games.append(context)
+        return len(self.games) - 1
+
+    def append(self, play: Dict[str, Any], game_no: int) -> None:
+        """Append one play dict belonging to a registered game"""
+        n = len(self.game_index)
+        columns = self.columns
+        for key, value in play.items():
+            if key in self._context_set:
+                continue
+            col = columns.get(key)
+            if col is None:
+                col = _new_column(value)
+                for _ in range(n):
+                    col.append(MISSING)
+                columns[key] = col
+            if not col.append(value):
+                col = col.promote(value)
+                col.append(value)
+                columns[key] = col
+        # Pad columns this play doesn't have
+        for col in columns.values():
+            if len(col) == n:
+                col.append(MISSING)
+        self.game_index.append(game_no)
+
+    def extend(self, plays: Iterable[Dict[str, Any]], game_no: int) -> None:
+        for play in plays:
+            self.append(play, game_no)
+
+    def build(self) -> PlayTable:
+        """Finalize column encodings and return the table"""
+        n = len(self.game_index)
+        for key, col in list(self.columns.items()):
+            if isinstance(col, DictColumn) and n and col.cardinality() > n * MAX_DICT_RATIO:
+                self.columns[key] = col.to_object()
+        return PlayTable(self.columns, self.game_index, self.games, self.context_keys)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Structured fields parsed from play_text
+
+The analyzers used to re-scan the same play_text strings for return yards,
+touchdowns, first downs and penalty/turnover wording. The loader now parses
+each play once (see parse_game_file) and stores the results on the play:
+
+- text_return_yards: Yards of a kick/punt return ("returns for 56 yds",
+  "return 40 yards"), 0 for "no gain", None if the text has no return
+- text_is_td: Text mentions a touchdown
+- text_is_first_down: Text mentions a first down ("1st down"/"first down")
+- text_penalty_declined, text_offsetting, text_enforced, text_no_play: Text
+  contains "declined", "offsetting", "enforced", "no play"
+- text_recovered_by: 'defense' or 'offense' if the text says the ball was
+  "recovered by" that team (full name or its first three letters), else None
+- text_fumble_lost: Text mentions a fumble recovered by the defense
+
+Analyzers read them through text_feature(), which parses the play_text
+(memoized) when a play did not come through the loader, so the stored fields
+are only a cache.
+
+The text_ prefix keeps them apart from source fields such as no_play, which
+some game files carry with other meanings (or as placeholders). They are
+always derived from the text and are not embedded in the generated app.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional
+
+
+# Fields added to each play by add_play_text_features()
+PLAY_TEXT_FEATURES = (
+    'text_return_yards',
+    'text_is_td',
+    'text_is_first_down',
+    'text_penalty_declined',
+    'text_offsetting',
+    'text_enforced',
+    'text_no_play',
+    'text_recovered_by',
+    'text_fumble_lost',
+)
+
+# "returns for 56 yds" / "return for no gain"
+RETURN_FOR_PATTERN = re.compile(r'return[s]? for (?:no gain|(\d+) (?:yd|yard))', re.IGNORECASE)
+# CFBD-style "return 40 yards to the UK40"
+RETURN_PATTERN = re.compile(r'return (\d+) (?:yd|yard)', re.IGNORECASE)
+
+
+def parse_return_yards(play_text: str) -> Optional[int]:
+    """
+    Parse return yards from play text
+
+    Returns:
+        Return yards (0 for "no gain"), or None if no return is described
+    """
+    if not play_text:
+        return None
+
+    match = RETURN_FOR_PATTERN.search(play_text)
+    if match:
+        return int(match.group(1)) if match.group(1) else 0
+
+    match = RETURN_PATTERN.search(play_text)
+    if match:
+        return int(match.group(1))
+
+    return None
+
+
+def _recovered_by(play_text_upper: str, team_upper: str) -> bool:
+    """Whether the text says the ball was recovered by a team"""
+    if not team_upper or team_upper not in play_text_upper:
+        return False
+    return (f'RECOVERED BY {team_upper}' in play_text_upper or
+            f'RECOVERED BY {team_upper[:3]}' in play_text_upper)
+
+
+@lru_cache(maxsize=65536)
+def extract_play_text_features(play_text: str, offense: str = '',
+                               defense: str = '') -> Dict[str, Any]:
+    """
+    Parse the PLAY_TEXT_FEATURES fields of a play (memoized)
+
+    Args:
+        play_text: The play's play_text
+        offense: Offense team name (for recovered_by)
+        defense: Defense team name (for recovered_by)
+
+    Returns:
+        Dictionary of feature name -> value; treat as read-only
+    """
+    text_upper = play_text.upper()
+
+    if _recovered_by(text_upper, defense.upper()):
+        recovered_by = 'defense'
+    elif _recovered_by(text_upper, offense.upper()):
+        recovered_by = 'offense'
+    else:
+        recovered_by = None
+
+    return {
+        'text_return_yards': parse_return_yards(play_text),
+        'text_is_td': 'TOUCHDOWN' in text_upper,
+        'text_is_first_down': '1ST DOWN' in text_upper or 'FIRST DOWN' in text_upper,
+        'text_penalty_declined': 'DECLINED' in text_upper,
+        'text_offsetting': 'OFFSETTING' in text_upper,
+        'text_enforced': 'ENFORCED' in text_upper,
+        'text_no_play': 'NO PLAY' in text_upper,
+        'text_recovered_by': recovered_by,
+        'text_fumble_lost': 'FUMBLE' in text_upper and recovered_by == 'defense',
+    }
+
+
+def add_play_text_features(play: Dict[str, Any]) -> None:
+    """Set the PLAY_TEXT_FEATURES fields of a play from its play_text"""
+    play.update(extract_play_text_features(play.get('play_text') or '',
+                                           play.get('offense') or '',
+                                           play.get('defense') or ''))
+
+
+def text_feature(play: Mapping[str, Any], name: str) -> Any:
+    """
+    A PLAY_TEXT_FEATURES field of a play
+
+    Uses the value stored by the loader, or parses the play_text if the
+    play was not loaded with add_play_text_features (e.g. raw play dicts).
+    """
+    if name in play:
+        return play[name]
+    return extract_play_text_features(play.get('play_text') or '',
+                                      play.get('offense') or '',
+                                      play.get('defense') or '')[name]
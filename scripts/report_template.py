@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Compiled page template of the generated analysis app
+
+The app's static CSS and JavaScript live as plain files in
+templates/advanced_analysis_app/; page.html is the per-report skeleton, with
+string.Template fields (${team_name1}, ${data_block}, ...) for the values
+that differ between reports. A compiled template holds:
+- the skeleton split into (literal text, field name) chunks
+- the assets, with build-time constants (__NAME__ tokens) filled in
+- a content hash of the assets, used to name the shared asset bundle
+
+Templates are compiled once per process and cached on disk, keyed by the
+template files' sizes and mtimes and by the constants. The disk cache lives
+next to the template files (templates/.cache), so every data directory
+shares it and it does not depend on the parsed-season cache settings.
+
+Reports either inline the assets (single-file delivery) or link to one
+shared, content-hashed bundle written next to them, so browsers cache the
+assets across reports.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, List, Mapping, Optional, TextIO, Tuple
+
+# Bump whenever the compiled form changes, so that on-disk caches written by
+# an older version are ignored
+TEMPLATE_VERSION = 1
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates' / 'advanced_analysis_app'
+# Default directory of the compiled template cache
+DEFAULT_CACHE_DIR = Path(__file__).parent / 'templates' / '.cache'
+PAGE_FILE = 'page.html'
+ASSET_FILES = {
+    'css': 'app.css',
+    'core': 'analysis_core.js',
+    'worker': 'analysis_worker.js',
+    'app': 'app.js',
+}
+# Assets that go into the shared bundle (the worker script is tiny and is
+# always inlined as text)
+BUNDLE_FILES = {
+    'css': 'advanced-analysis.{hash}.css',
+    'core': 'advanced-analysis-core.{hash}.js',
+    'app': 'advanced-analysis.{hash}.js',
+}
+ASSET_MODES = ('inline', 'shared')
+
+# Compiled templates of this process, by source signature
+_compiled: Dict[str, 'CompiledTemplate'] = {}
+
+
+def parse_page(text: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split a string.Template page into (literal, field) chunks
+
+    The last chunk's field is None. '$$' is unescaped to '$'.
+    """
+    chunks = []
+    literal = []
+    pos = 0
+    for match in Template.pattern.finditer(text):
+        literal.append(text[pos:match.start()])
+        pos = match.end()
+        if match.group('escaped') is not None:
+            literal.append('$')
+            continue
+        field = match.group('named') or match.group('braced')
+        if field is None:
+            raise ValueError(f"Invalid placeholder in {PAGE_FILE} at offset {match.start()}")
+        chunks.append((''.join(literal), field))
+        literal = []
+    literal.append(text[pos:])
+    chunks.append((''.join(literal), None))
+    return chunks
+
+
+class CompiledTemplate:
+    """
+    Page skeleton chunks plus the assets they embed or link to
+
+    Args:
+        chunks: (literal, field) pairs from parse_page()
+        assets: Asset kind ('css', 'core', 'worker', 'app') -> text
+    """
+
+    def __init__(self, chunks: List[Tuple[str, Optional[str]]], assets: Dict[str, str]):
+        self.chunks = chunks
+        self.assets = assets
+        digest = hashlib.sha256()
+        for kind in BUNDLE_FILES:
+            digest.update(assets[kind].encode('utf-8'))
+        self.bundle_hash = digest.hexdigest()[:12]
+
+    def bundle_names(self) -> Dict[str, str]:
+        """File name of each shared asset"""
+        return {kind: name.format(hash=self.bundle_hash) for kind, name in BUNDLE_FILES.items()}
+
+    def write_bundle(self, assets_dir: str) -> None:
+        """Write the shared assets to assets_dir (files already there are kept)"""
+        assets_path = Path(assets_dir)
+        assets_path.mkdir(parents=True, exist_ok=True)
+        for kind, name in self.bundle_names().items():
+            path = assets_path / name
+            if not path.exists():
+                _write_atomic(path, self.assets[kind])
+
+    def asset_fields(self, mode: str = 'inline', assets_url: str = 'assets') -> Dict[str, str]:
+        """
+        Page fields that embed or link to the assets
+
+        Args:
+            mode: 'inline' to embed the assets, 'shared' to link to the bundle
+            assets_url: URL of the bundle's directory, relative to the page
+        """
+        if mode not in ASSET_MODES:
+            raise ValueError(f"Unknown asset mode: {mode}")
+        fields = {'analysis_worker': self.assets['worker']}
+        if mode == 'inline':
+            fields['app_styles'] = f"<style>\n{self.assets['css']}    </style>"
+            fields['analysis_core'] = f"<script id=\"analysisCore\">\n{self.assets['core']}    </script>"
+            fields['app_script'] = f"<script>\n{self.assets['app']}    </script>"
+        else:
+            names = {kind: f"{assets_url.rstrip('/')}/{name}" for kind, name in self.bundle_names().items()}
+            fields['app_styles'] = f"<link rel=\"stylesheet\" href=\"{names['css']}\">"
+            fields['analysis_core'] = f"<script id=\"analysisCore\" src=\"{names['core']}\"></script>"
+            fields['app_script'] = f"<script src=\"{names['app']}\"></script>"
+        return fields
+
+    def render(self, fp: TextIO, fields: Mapping[str, Any],
+               streamed: Optional[Mapping[str, Callable[[TextIO], None]]] = None) -> None:
+        """
+        Write the page to a file
+
+        Args:
+            fp: Text file to write to
+            fields: Field name -> value (written with str())
+            streamed: Field name -> function that writes the field's value to
+                the file itself (for large values such as the data block)
+        """
+        streamed = streamed or {}
+        for literal, field in self.chunks:
+            fp.write(literal)
+            if field is None:
+                continue
+            if field in streamed:
+                streamed[field](fp)
+            elif field in fields:
+                fp.write(str(fields[field]))
+            else:
+                raise KeyError(f"No value for template field '{field}'")
+
+    def to_blob(self, signature: str) -> Dict[str, Any]:
+        """JSON-serializable form for the disk cache"""
+        return {'version': TEMPLATE_VERSION, 'signature': signature,
+                'chunks': self.chunks, 'assets': self.assets}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Atomically replace a text file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp creates the file private; assets are served to browsers
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _signature(constants: Mapping[str, str]) -> str:
+    """Cache key of the template sources and constants"""
+    digest = hashlib.sha256(str(TEMPLATE_VERSION).encode())
+    for name in [PAGE_FILE, *ASSET_FILES.values()]:
+        stat = (TEMPLATE_DIR / name).stat()
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    digest.update(json.dumps(sorted(constants.items())).encode())
+    return digest.hexdigest()
+
+
+def compile_template(constants: Mapping[str, str]) -> CompiledTemplate:
+    """
+    Compile the page template from the template files
+
+    Args:
+        constants: Token name -> text; each __NAME__ in the assets is replaced
+            by its text
+    """
+    chunks = parse_page((TEMPLATE_DIR / PAGE_FILE).read_text(encoding='utf-8'))
+    assets = {}
+    for kind, name in ASSET_FILES.items():
+        text = (TEMPLATE_DIR / name).read_text(encoding='utf-8')
+        for token, value in constants.items():
+            text = text.replace(f"__{token}__", value)
+        assets[kind] = text
+    return CompiledTemplate(chunks, assets)
+
+
+def load_template(constants: Mapping[str, str],
+                  cache_dir: Optional[os.PathLike] = DEFAULT_CACHE_DIR) -> CompiledTemplate:
+    """
+    Compiled page template, from memory, the disk cache or the template files
+
+    Args:
+        constants: Build-time constants (see compile_template)
+        cache_dir: Directory for the compiled template cache (default:
+            templates/.cache; None = no disk cache)
+    """
+    signature = _signature(constants)
+    template = _compiled.get(signature)
+    if template is not None:
+        return template
+
+    cache_path = Path(cache_dir) / 'app_template.json' if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                blob = json.load(f)
+            if blob.get('version') == TEMPLATE_VERSION and blob.get('signature') == signature:
+                template = CompiledTemplate([tuple(chunk) for chunk in blob['chunks']], blob['assets'])
+        except Exception as e:
+            print(f"  Warning: ignoring unreadable template cache {cache_path}: {e}")
+
+    if template is None:
+        template = compile_template(constants)
+        if cache_path is not None:
+            try:
+                _write_atomic(cache_path, json.dumps(template.to_blob(signature)))
+            except OSError as e:
+                print(f"  Warning: could not write template cache {cache_path}: {e}")
+
+    _compiled[signature] = template
+    return template
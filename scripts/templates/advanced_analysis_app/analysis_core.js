@@ -0,0 +1,1470 @@
+// Filtering and analysis functions shared by the page and the filter
+// worker: the worker runs this script plus the analysisWorker element (see
+// startAnalysisWorker), so nothing here may use the DOM or the page's data.
+// The penalty team aliases are filled in when the template is compiled.
+
+// Conference team lists for filtering
+// Each team filters by their OWN conference opponents
+const conferenceTeams = {
+    'Big Ten': [
+        'Illinois', 'Indiana', 'Iowa', 'Maryland', 'Michigan', 'Michigan State',
+        'Minnesota', 'Nebraska', 'Northwestern', 'Ohio State', 'Oregon', 'Penn State',
+        'Purdue', 'Rutgers', 'UCLA', 'USC', 'Washington', 'Wisconsin'
+    ],
+    'SEC': [
+        'Alabama', 'Arkansas', 'Auburn', 'Florida', 'Georgia', 'Kentucky',
+        'LSU', 'Mississippi State', 'Missouri', 'Oklahoma', 'Ole Miss',
+        'South Carolina', 'Tennessee', 'Texas', 'Texas A&M', 'Vanderbilt'
+    ],
+    'Big 12': [
+        'Arizona', 'Arizona State', 'Baylor', 'BYU', 'Cincinnati', 'Colorado',
+        'Houston', 'Iowa State', 'Kansas', 'Kansas State', 'Oklahoma State',
+        'TCU', 'Texas Tech', 'UCF', 'Utah', 'West Virginia'
+    ],
+    'ACC': [
+        'Boston College', 'California', 'Clemson', 'Duke', 'Florida State',
+        'Georgia Tech', 'Louisville', 'Miami', 'NC State', 'North Carolina',
+        'Notre Dame', 'Pitt', 'SMU', 'Stanford', 'Syracuse', 'Virginia',
+        'Virginia Tech', 'Wake Forest'
+    ]
+};
+
+// Determine which conference each team is in
+function getTeamConference(teamName) {
+    for (const [conf, teams] of Object.entries(conferenceTeams)) {
+        if (teams.some(t => t.toLowerCase() === teamName.toLowerCase())) {
+            return conf;
+        }
+    }
+    return null;
+}
+
+// Normalize team names to handle common abbreviations and naming conflicts
+// E.g., "USC" can mean South Carolina (SEC) or USC (Big Ten) depending on context
+function normalizeTeamName(name, conferenceContext) {
+    if (!name) return name;
+    const lname = name.toLowerCase();
+
+    // USC disambiguation: South Carolina in SEC context, USC (SoCal) in Big Ten
+    if (lname === 'usc') {
+        if (conferenceContext === 'SEC') return 'South Carolina';
+        if (conferenceContext === 'Big Ten') return 'USC';
+    }
+
+    // Common alternate names
+    const aliases = {
+        'ole miss': 'Ole Miss',
+        'mississippi': 'Ole Miss',
+        'pitt': 'Pittsburgh',
+        'pittsburgh': 'Pitt',  // ACC has 'Pitt' in list
+        'texas a&m': 'Texas A&M',
+        'tamu': 'Texas A&M'
+    };
+
+    return aliases[lname] || name;
+}
+
+// Check if opponent is in same conference as team
+function isConferenceGame(teamName, opponentName) {
+    const teamConf = getTeamConference(teamName);
+    if (!teamConf) return false;
+
+    // Normalize opponent name for this conference context
+    const normalizedOpponent = normalizeTeamName(opponentName, teamConf);
+
+    const confTeams = conferenceTeams[teamConf] || [];
+    return confTeams.some(t => t.toLowerCase() === normalizedOpponent.toLowerCase());
+}
+
+// Check if opponent is a Power 4 team (SEC, Big Ten, Big 12, ACC)
+function isPower4Opponent(opponentName) {
+    if (!opponentName) return false;
+    const power4Conferences = ['SEC', 'Big Ten', 'Big 12', 'ACC'];
+
+    // Try each Power 4 conference to see if opponent is a member
+    for (const conf of power4Conferences) {
+        // Normalize the opponent name for this conference context
+        const normalizedOpponent = normalizeTeamName(opponentName, conf);
+        const confTeams = conferenceTeams[conf] || [];
+        if (confTeams.some(t => t.toLowerCase() === normalizedOpponent.toLowerCase())) {
+            return true;
+        }
+    }
+    return false;
+}
+
+function filterPlays(plays, filters, teamName) {
+    let filtered = plays;
+
+    // Helper to get game key (handles PDF data where game_id is null)
+    const getGameKey = (p) => p.game_id != null ? String(p.game_id) : `week_${p.game_week || 0}`;
+
+    // Filter by conference/non-conference/power4
+    // ALWAYS use opponent name to check conference membership
+    // (source data is_conference field is often incorrect for cross-conference matchups)
+    if (filters.conference_only) {
+        filtered = filtered.filter(p => {
+            const opponent = p.opponent || '';
+            return teamName ? isConferenceGame(teamName, opponent) : false;
+        });
+    } else if (filters.non_conference_only) {
+        filtered = filtered.filter(p => {
+            const opponent = p.opponent || '';
+            return teamName ? !isConferenceGame(teamName, opponent) : false;
+        });
+    } else if (filters.power4_only) {
+        filtered = filtered.filter(p => {
+            const opponent = p.opponent || '';
+            return isPower4Opponent(opponent);
+        });
+    }
+
+    // Filter by last 3 games
+    if (filters.last_3_games) {
+        const games = [...new Set(filtered.map(p => getGameKey(p)))];
+        const gameWeeks = games.map(gkey => ({
+            id: gkey,
+            week: filtered.find(p => getGameKey(p) === gkey)?.game_week || 0
+        })).sort((a, b) => a.week - b.week);
+        const last3 = gameWeeks.slice(-3).map(g => g.id);
+        filtered = filtered.filter(p => last3.includes(getGameKey(p)));
+    }
+
+    return filtered;
+}
+
+// Plays arrive as one columnar payload (see app_payload.py): one array
+// per field, low-cardinality strings as codes into a string table
+// shared by both teams, and the rows lacking a field under 'absent'.
+// decodePlays() wraps the columns in row views that read the columns
+// on access, so the plays are neither duplicated nor cloned.
+function decodePlays(payload, teamKey) {
+    const table = payload.teams[teamKey];
+    const keys = Object.keys(table.columns);
+    function PlayRow(row) {
+        this._row = row;
+    }
+    keys.forEach(key => {
+        const column = table.columns[key];
+        const values = column.codes ? column.codes.map(code => payload.strings[code]) : column.values;
+        (column.absent || []).forEach(row => { values[row] = undefined; });
+        Object.defineProperty(PlayRow.prototype, key, {
+            get() { return values[this._row]; },
+            // Writes (e.g. play._team_margin) shadow the column on this row only
+            set(value) {
+                Object.defineProperty(this, key, { value: value, writable: true, enumerable: true, configurable: true });
+            },
+            enumerable: true
+        });
+    });
+    PlayRow.prototype.toJSON = function() {
+        const play = {};
+        keys.forEach(key => {
+            if (this[key] !== undefined) play[key] = this[key];
+        });
+        Object.keys(this).forEach(key => {
+            if (key !== '_row') play[key] = this[key];
+        });
+        return play;
+    };
+    return Array.from({ length: table.length }, (_, row) => new PlayRow(row));
+}
+
+// Helper to get game key (handles PDF data where game_id is null)
+function getGameKey(p) {
+    return p.game_id != null ? String(p.game_id) : `week_${p.game_week || 0}`;
+}
+
+// Analysis functions in JavaScript (simplified versions)
+//
+// Every analyzer is split into a per-game partial and a merge:
+// - partialX(gamePlays, teamName) aggregates the plays of one game
+//   (counts, sums, attempt/conversion pairs and the game's table rows)
+// - mergeX(partials, teamName) combines the partials of any set of
+//   games, in game order, into the analyzer's result
+// The partials are built once per team (see buildGamePartials), so a
+// game-level filter only merges the partials of the games it keeps
+// instead of re-running the analyzers over the filtered plays.
+
+// Group plays by game, in order of each game's first play. Plays of a
+// game with another opponent or week (the fields game-level filters look
+// at besides the game) are grouped apart, so filters keep or drop whole
+// groups.
+function splitGames(plays) {
+    const games = new Map();
+    plays.forEach(p => {
+        const key = getGameKey(p);
+        const id = `${key}|${p.opponent}|${p.game_week}`;
+        let game = games.get(id);
+        if (!game) {
+            game = { key: key, plays: [] };
+            games.set(id, game);
+        }
+        game.plays.push(p);
+    });
+    return [...games.values()];
+}
+
+// Game key and week shared by every analyzer's partial
+function gamePartial(gamePlays) {
+    const first = gamePlays[0] || {};
+    return { game_key: getGameKey(first), week: first.game_week || 0, count: 0 };
+}
+
+// Sum the given fields of partials per game (a game can have several
+// partials); games without counted plays (count 0) are left out
+function mergeGameStats(partials, fields) {
+    const gameStats = {};
+    partials.forEach(part => {
+        if (!part.count) return;
+        let stats = gameStats[part.game_key];
+        if (!stats) {
+            stats = gameStats[part.game_key] = { week: part.week };
+            fields.forEach(field => stats[field] = 0);
+        }
+        fields.forEach(field => stats[field] += part[field]);
+    });
+    return gameStats;
+}
+
+// Keys of the last n games with a known week (> 0), sorted by week
+function lastGameKeys(gameStats, n) {
+    return Object.entries(gameStats)
+        .map(([id, stats]) => ({ id, week: stats.week }))
+        .filter(g => g.week > 0)
+        .sort((a, b) => a.week - b.week)
+        .slice(-n)
+        .map(g => g.id);
+}
+
+// Concatenate a list field of partials, in play order
+function mergeRows(partials, field) {
+    return [].concat(...partials.map(part => part[field]));
+}
+
+function sumField(partials, field) {
+    return partials.reduce((sum, part) => sum + part[field], 0);
+}
+
+function partialMiddleEight(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+    part.pointsScored = 0;
+    part.pointsAllowed = 0;
+    part.scoringDrives = [];
+
+    gamePlays.forEach(play => {
+        if (play.middle_eight !== true) return;
+        part.count++;
+
+        const isOffense = play.offense?.toLowerCase() === teamName.toLowerCase();
+        if (play.scoring === true) {
+            let points = 0;
+            if (play.play_type?.includes('Touchdown')) {
+                points = 7;
+            } else if (play.play_type?.includes('Field Goal')) {
+                points = 3;
+            }
+
+            if (isOffense) {
+                part.pointsScored += points;
+            } else {
+                part.pointsAllowed += points;
+            }
+
+            // Determine actual opponent - if our team is on offense, opponent is defense, and vice versa
+            let actualOpponent = play.opponent || '';
+            if (!actualOpponent || actualOpponent.toLowerCase() === teamName.toLowerCase()) {
+                actualOpponent = play.defense || '';
+            }
+
+            part.scoringDrives.push({
+                game_week: play.game_week,
+                opponent: actualOpponent,
+                scoring_team: play.offense || '',
+                drive_number: play.drive_number,
+                period: play.period,
+                clock: play.clock,
+                play_type: play.play_type,
+                points: points,  // Always positive
+                is_offense: isOffense,
+                play_text: play.play_text?.substring(0, 100) || ''
+            });
+        }
+    });
+    return part;
+}
+
+function mergeMiddleEight(partials, teamName) {
+    const gameStats = mergeGameStats(partials, ['pointsScored', 'pointsAllowed']);
+    const pointsScored = sumField(partials, 'pointsScored');
+    const pointsAllowed = sumField(partials, 'pointsAllowed');
+    const uniqueGames = Object.keys(gameStats).length;
+
+    // Calculate last 3 games
+    const last3Games = lastGameKeys(gameStats, 3);
+
+    const last3PointsScored = last3Games.reduce((sum, gid) => sum + (gameStats[gid]?.pointsScored || 0), 0);
+    const last3PointsAllowed = last3Games.reduce((sum, gid) => sum + (gameStats[gid]?.pointsAllowed || 0), 0);
+    const last3Net = last3PointsScored - last3PointsAllowed;
+
+    return {
+        total_points_scored: pointsScored,
+        total_points_allowed: pointsAllowed,
+        total_net_points: pointsScored - pointsAllowed,
+        avg_net_per_game: uniqueGames > 0 ? (pointsScored - pointsAllowed) / uniqueGames : 0,
+        last_3_games: {
+            points_scored: last3PointsScored,
+            points_allowed: last3PointsAllowed,
+            net_points: last3Net
+        },
+        scoring_drives: mergeRows(partials, 'scoringDrives')
+    };
+}
+
+function isRunPlay(playType) {
+    if (!playType) return false;
+    const pt = playType.toLowerCase();
+    return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+}
+
+function isPassPlay(playType) {
+    if (!playType) return false;
+    const pt = playType.toLowerCase();
+    return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+}
+
+function partialExplosivePlays(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+    const explosivePlays = gamePlays.filter(p =>
+        p.explosive_play === true &&
+        p.offense?.toLowerCase() === teamName.toLowerCase() &&
+        p.play_classification !== 'special_teams'
+    );
+    part.count = explosivePlays.length;
+
+    // Categorize runs vs passes (per-game pass counts skip plays that are also runs)
+    part.runs = explosivePlays.filter(p => isRunPlay(p.play_type)).length;
+    part.passes = explosivePlays.filter(p => isPassPlay(p.play_type)).length;
+    part.gamePasses = explosivePlays.filter(p => !isRunPlay(p.play_type) && isPassPlay(p.play_type)).length;
+
+    part.plays = explosivePlays.map(p => ({
+        game_week: p.game_week,
+        opponent: p.opponent,
+        period: p.period,
+        clock: p.clock,
+        down: p.down,
+        distance: p.distance,
+        yards_to_goal: p.yards_to_goal,
+        play_type: p.play_type,
+        yards_gained: p.yards_gained,
+        ppa: p.ppa,
+        play_text: p.play_text?.substring(0, 150) || ''
+    }));
+    return part;
+}
+
+function mergeExplosivePlays(partials, teamName) {
+    const gameStats = mergeGameStats(partials, ['count', 'runs', 'gamePasses']);
+    const uniqueGames = Object.keys(gameStats).length;
+    const total = sumField(partials, 'count');
+    const runs = sumField(partials, 'runs');
+    const passes = sumField(partials, 'passes');
+
+    // Sort games by week and get last 3
+    const last3Games = Object.entries(gameStats)
+        .map(([id, stats]) => ({ game_key: id, ...stats }))
+        .sort((a, b) => a.week - b.week)
+        .slice(-3);
+    const last3GameKeys = last3Games.map(g => g.game_key);
+    const last3Count = last3Games.reduce((sum, g) => sum + g.count, 0);
+    const last3Runs = last3Games.reduce((sum, g) => sum + g.runs, 0);
+    const last3Passes = last3Games.reduce((sum, g) => sum + g.gamePasses, 0);
+    const last3Avg = last3Games.length > 0 ? last3Count / last3Games.length : 0;
+
+    return {
+        total_explosive_plays: total,
+        total_runs: runs,
+        total_passes: passes,
+        avg_per_game: uniqueGames > 0 ? total / uniqueGames : 0,
+        avg_runs_per_game: uniqueGames > 0 ? runs / uniqueGames : 0,
+        avg_passes_per_game: uniqueGames > 0 ? passes / uniqueGames : 0,
+        last_3_games: {
+            total: last3Count,
+            runs: last3Runs,
+            passes: last3Passes,
+            avg_per_game: last3Avg,
+            games: last3GameKeys
+        },
+        plays: mergeRows(partials, 'plays')
+    };
+}
+
+// Penalty attribution (same team alias registry as scripts/penalty_matcher.py).
+// Aliases are indexed once per team; each play then only looks up the
+// strings right before/after every PENALTY in its text.
+const PENALTY_TEAM_ALIASES = __PENALTY_TEAM_ALIASES__;
+const penaltyMatchers = new Map();
+const penaltyClasses = new Map();
+
+function getPenaltyMatcher(teamUpper) {
+    let matcher = penaltyMatchers.get(teamUpper);
+    if (matcher) return matcher;
+
+    // "<ALIAS> " right before PENALTY / " <ALIAS>" right after it -> teams
+    const before = new Map();
+    const after = new Map();
+    const add = (alias, team) => {
+        if (!before.has(alias + ' ')) before.set(alias + ' ', new Set());
+        before.get(alias + ' ').add(team);
+        if (!after.has(' ' + alias)) after.set(' ' + alias, new Set());
+        after.get(' ' + alias).add(team);
+    };
+    for (const [team, abbrevs] of Object.entries(PENALTY_TEAM_ALIASES)) {
+        add(team, team);
+        abbrevs.forEach(abbrev => add(abbrev, team));
+    }
+    add(teamUpper, teamUpper);
+    const lengths = map => [...new Set([...map.keys()].map(key => key.length))].sort((a, b) => a - b);
+    const beforeLengths = lengths(before);
+    const afterLengths = lengths(after);
+
+    // Which teams the play text marks: { team: teamUpper, opponent: any other team }
+    matcher = playTextUpper => {
+        const marked = { team: false, opponent: false };
+        const mark = teams => teams.forEach(t => {
+            if (t === teamUpper) marked.team = true;
+            else marked.opponent = true;
+        });
+        let pos = playTextUpper.indexOf('PENALTY');
+        while (pos !== -1) {
+            for (const n of beforeLengths) {
+                if (n > pos) break;
+                const teams = before.get(playTextUpper.substring(pos - n, pos));
+                if (teams) mark(teams);
+            }
+            const end = pos + 'PENALTY'.length;
+            for (const n of afterLengths) {
+                const teams = after.get(playTextUpper.substring(end, end + n));
+                if (teams) mark(teams);
+            }
+            pos = playTextUpper.indexOf('PENALTY', pos + 1);
+        }
+        return marked;
+    };
+    penaltyMatchers.set(teamUpper, matcher);
+    return matcher;
+}
+
+// Offense/defense/special teams class of a penalty type (cached per type)
+function getPenaltyClass(penaltyType) {
+    let penaltyClass = penaltyClasses.get(penaltyType);
+    if (penaltyClass) return penaltyClass;
+
+    const offensivePenalties = ['FALSE START', 'DELAY OF GAME', 'ILLEGAL FORMATION', 'OFFENSIVE HOLDING', 'HOLDING', 'INTENTIONAL GROUNDING', 'ILLEGAL SNAP', 'INELIGIBLE DOWNFIELD'];
+    const defensivePenalties = ['PASS INTERFERENCE', 'DEFENSIVE HOLDING', 'OFFSIDE', 'ROUGHING', 'UNNECESSARY ROUGHNESS', 'SIDELINE', 'HORSE COLLAR'];
+    const eitherSidePenalties = ['UNSPORTSMANLIKE', 'PERSONAL FOUL'];
+    const specialTeamsPenalties = ['ILLEGAL BLOCK', 'ILLEGAL BLOCK IN BACK', 'ILLEGAL BLOCK ABOVE WAIST', 'KICK CATCHING INTERFERENCE', 'ROUGHING THE KICKER', 'ROUGHING THE PUNTER', 'RUNNING INTO THE KICKER'];
+    const matches = penalties => penalties.some(penalty => penaltyType.includes(penalty));
+    penaltyClass = {
+        eitherSide: matches(specialTeamsPenalties) || matches(eitherSidePenalties),
+        offensive: matches(offensivePenalties),
+        defensive: matches(defensivePenalties)
+    };
+    penaltyClasses.set(penaltyType, penaltyClass);
+    return penaltyClass;
+}
+
+function partialPenalties(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+    const teamUpper = teamName.toUpperCase();
+    const matchPenaltyText = getPenaltyMatcher(teamUpper);
+    const penaltyPlays = gamePlays.filter(p => {
+        if (p.penalty_type == null) return false;
+
+        const playTextUpper = (p.play_text || '').toUpperCase();
+
+        // Exclude offsetting penalties
+        if (playTextUpper.includes('OFFSETTING') || (p.penalty_type || '').toUpperCase().includes('OFFSETTING')) {
+            return false;
+        }
+
+        // Exclude declined penalties
+        if (playTextUpper.includes('DECLINED')) {
+            return false;
+        }
+
+        // Check for explicit team/opponent penalty markers in full play text
+        // This prevents false exclusions when opponent abbreviations appear in yard markers (e.g., "WASH37")
+        const marked = matchPenaltyText(playTextUpper);
+        if (marked.opponent) {
+            return false; // This is an opponent penalty, exclude it
+        }
+        let teamCommitted = marked.team;
+
+        // If no explicit markers, infer from penalty type and team position
+        // This is a simplified version - for accuracy, should use Python analysis
+        const penaltyClass = getPenaltyClass((p.penalty_type || '').toUpperCase());
+
+        const isOffense = p.offense?.toLowerCase() === teamName.toLowerCase();
+        const isDefense = p.defense?.toLowerCase() === teamName.toLowerCase();
+
+        if (penaltyClass.eitherSide) {
+            teamCommitted = isOffense || isDefense;
+        } else if (isOffense && penaltyClass.offensive) {
+            teamCommitted = true;
+        } else if (isDefense && penaltyClass.defensive) {
+            teamCommitted = true;
+        }
+
+        return teamCommitted;
+    });
+    part.count = penaltyPlays.length;
+    part.accepted = 0;
+    part.declined = 0;
+    part.yards = 0;
+
+    penaltyPlays.forEach(p => {
+        // Accepted only, excluding offsetting and declined
+        // Check both penalty_decision and penalty_status (for PDF data)
+        const decision = p.penalty_decision || p.penalty_status || '';
+        const playTextUpper = (p.play_text || '').toUpperCase();
+        if (decision === 'accepted' &&
+            !playTextUpper.includes('DECLINED') &&
+            !playTextUpper.includes('OFFSETTING') &&
+            !(p.penalty_type || '').toUpperCase().includes('OFFSETTING')) {
+            part.accepted++;
+            // Prefer penalty_yards field, fall back to yards_gained
+            const penaltyYards = p.penalty_yards;
+            if (penaltyYards != null) {
+                part.yards += Math.abs(penaltyYards);
+            } else {
+                const yardsGained = p.yards_gained || 0;
+                part.yards += Math.abs(yardsGained);
+            }
+        }
+        if (decision === 'declined' || playTextUpper.includes('DECLINED')) {
+            part.declined++;
+        }
+    });
+
+    part.plays = penaltyPlays.map(p => {
+        // Use penalty_category for holding penalties, otherwise use penalty_type
+        // This breaks out holding into: offensive_holding, defensive_holding, special_teams_holding
+        let displayPenaltyType = p.penalty_type;
+        if (p.penalty_category && ['offensive_holding', 'defensive_holding', 'special_teams_holding'].includes(p.penalty_category)) {
+            // Convert snake_case to Title Case: "Offensive Holding", "Defensive Holding", "Special Teams Holding"
+            displayPenaltyType = p.penalty_category.replace(/_/g, ' ').replace(/\b\w/g, function(l) { return l.toUpperCase(); });
+        }
+        return {
+            game_week: p.game_week,
+            opponent: p.opponent,
+            period: p.period,
+            clock: p.clock,
+            penalty_type: displayPenaltyType,
+            penalty_decision: p.penalty_decision,
+            down: p.down || 0,
+            play_text: p.play_text?.substring(0, 200) || ''
+        };
+    });
+    return part;
+}
+
+function mergePenalties(partials, teamName) {
+    const gameStats = mergeGameStats(partials, ['count', 'yards']);
+    const uniqueGames = Object.keys(gameStats).length;
+    const accepted = sumField(partials, 'accepted');
+
+    // Last 3 games (only games with valid week numbers)
+    const last3GameKeys = lastGameKeys(gameStats, 3);
+    const last3Yards = last3GameKeys.reduce((sum, gid) => sum + gameStats[gid].yards, 0);
+
+    return {
+        total_penalties: sumField(partials, 'count'),
+        accepted: accepted,
+        declined: sumField(partials, 'declined'),
+        total_penalty_yards: sumField(partials, 'yards'),
+        total_games: uniqueGames,
+        avg_per_game: uniqueGames > 0 ? accepted / uniqueGames : 0,
+        last_3_games: {
+            games: last3GameKeys, // Return list of game IDs to match Python structure
+            yards: last3Yards
+        },
+        plays: mergeRows(partials, 'plays')
+    };
+}
+
+function partial4thDowns(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+    const fourthDowns = gamePlays.filter(p =>
+        p.down === 4 &&
+        p.offense?.toLowerCase() === teamName.toLowerCase() &&
+        !p.play_type?.toLowerCase().includes('punt') &&
+        !p.play_type?.toLowerCase().includes('field goal') &&
+        !p.play_type?.toLowerCase().includes('kickoff') &&
+        !p.play_type?.toLowerCase().includes('timeout') &&
+        !(p.no_play === true) &&
+        !(p.play_type?.toLowerCase() === 'penalty' && p.play_text?.toLowerCase().includes('no play')) &&
+        !p.play_text?.toLowerCase().includes('knee')
+    );
+    part.count = fourthDowns.length;
+    part.conversions = 0;
+
+    part.plays = fourthDowns.map(p => {
+        const playText = p.play_text?.toLowerCase() || '';
+        // Turnovers are never conversions
+        const converted = p.turnover ? false : (
+                        playText.includes('1st down') ||
+                        playText.includes('first down') ||
+                        playText.includes('touchdown') ||
+                        (p.yards_gained >= p.distance));
+        if (converted) part.conversions++;
+        return {
+            game_id: p.game_id,
+            game_week: p.game_week,
+            opponent: p.opponent,
+            yard_line: p.yard_line,
+            distance: p.distance,
+            play_type: p.play_type,
+            converted: converted,
+            yards_gained: p.yards_gained,
+            ppa: p.ppa,
+            play_text: p.play_text?.substring(0, 200) || ''
+        };
+    });
+    return part;
+}
+
+function merge4thDowns(partials, teamName) {
+    const gameStats = mergeGameStats(partials, ['count', 'conversions']);
+    const attempts = sumField(partials, 'count');
+    const conversions = sumField(partials, 'conversions');
+
+    // Sort games by week and get last 3
+    const last3GameKeys = lastGameKeys(gameStats, 3);
+    const last3Attempts = last3GameKeys.reduce((sum, gid) => sum + gameStats[gid].count, 0);
+    const last3Conversions = last3GameKeys.reduce((sum, gid) => sum + gameStats[gid].conversions, 0);
+    const last3Rate = last3Attempts > 0 ? (last3Conversions / last3Attempts * 100) : 0;
+
+    return {
+        total_attempts: attempts,
+        total_conversions: conversions,
+        conversion_rate: attempts > 0 ? (conversions / attempts * 100) : 0,
+        last_3_games: {
+            attempts: last3Attempts,
+            conversions: last3Conversions,
+            conversion_rate: last3Rate
+        },
+        plays: mergeRows(partials, 'plays')
+    };
+}
+
+function partialPostTurnover(plays, teamName) {
+    // Filter turnovers - only fumbles lost and interceptions thrown
+    // Exclude turnovers on downs and plays with "NO PLAY" in text
+    const turnovers = plays.filter(p => {
+        if (p.turnover !== true) return false;
+
+        // Filter out plays with "NO PLAY" in the text
+        const playText = (p.play_text || '').toUpperCase();
+        if (playText.includes('NO PLAY')) return false;
+
+        // Check turnover_type field first - if it's "downs", exclude it
+        // Post turnover analysis only includes fumbles lost and interceptions
+        const turnoverTypeField = (p.turnover_type || '').toLowerCase();
+        if (turnoverTypeField === 'downs') {
+            // This is a turnover on downs, exclude from post turnover analysis
+            return false;
+        }
+
+        // Include penalty plays if they have a valid turnover_type (interception or fumble)
+        // Penalties can mark turnovers that occurred (e.g., interception then penalty called)
+        // But only if turnover_type is explicitly set to interception or fumble
+        const playType = (p.play_type || '').toUpperCase();
+        if (playType.includes('PENALTY')) {
+            // Only include penalty if it has a valid turnover_type
+            if (turnoverTypeField !== 'interception' && turnoverTypeField !== 'fumble') {
+                return false;
+            }
+            // If it has a valid turnover_type, we'll include it below
+        }
+
+        // Only count fumbles lost and interceptions thrown
+        // Exclude turnovers on downs
+        // Check both play_type and turnover_type for interceptions and fumbles
+        const isInterception = playType.includes('INTERCEPTION') || turnoverTypeField === 'interception';
+        const isFumble = playType.includes('FUMBLE') || turnoverTypeField === 'fumble';
+
+        // For fumbles, check if the offense recovered their own fumble
+        let isFumbleLost = false;
+        if (isFumble) {
+            // Check play_type for "(Own)" indicator - but also verify in play_text
+            // If "(OWN)" is in play_type, check play_text to see who actually recovered
+            const playTextUpper = (p.play_text || '').toUpperCase();
+            const offenseTeam = (p.offense || '').toUpperCase();
+            const defenseTeam = (p.defense || '').toUpperCase();
+
+            // Check if play_text indicates the defense recovered (turnover)
+            // Look for patterns like "recovered by [defense team]" or "recovered by [defense player]"
+            let defenseRecovered = false;
+            if (defenseTeam && playTextUpper.includes(defenseTeam)) {
+                // Check if it says "recovered by [defense team]" or similar
+                const recoveredPatterns = [
+                    `RECOVERED BY ${defenseTeam}`,
+                    `RECOVERED BY ${defenseTeam.substring(0, 3)}`,  // Abbreviation
+                ];
+                for (let pattern of recoveredPatterns) {
+                    if (playTextUpper.includes(pattern)) {
+                        defenseRecovered = true;
+                        break;
+                    }
+                }
+            }
+
+            // If play_type says "(Own)" but play_text shows defense recovered, it's a turnover
+            if (playType.includes('(OWN)') && !defenseRecovered) {
+                // Offense recovered their own fumble - NOT a turnover, exclude it
+                return false;
+            } else {
+                // If the play is marked as a turnover and has fumble, it's a fumble lost
+                isFumbleLost = true;
+            }
+        }
+
+        // Exclude turnovers on downs (additional check in case turnover_type wasn't set)
+        const isTurnoverOnDowns = playType.includes('TURNOVER ON DOWNS') ||
+            playType.includes('DOWNS');
+
+        // Only include interceptions and fumbles lost, exclude turnovers on downs
+        return (isInterception || isFumbleLost) && !isTurnoverOnDowns;
+    });
+    const postTurnoverPlays = plays.filter(p => p.drive_started_after_turnover === true);
+
+    // Group by drive_id to get unique drives that started after turnovers
+    // Use getGameKey for PDF data compatibility
+    const postTurnoverDrives = {};
+    postTurnoverPlays.forEach(play => {
+        const gameKey = getGameKey(play);
+        const driveId = play.drive_id || `${gameKey}_drive_${play.drive_number || 0}`;
+        if (!postTurnoverDrives[driveId]) {
+            postTurnoverDrives[driveId] = {
+                game_key: gameKey,
+                drive_number: play.drive_number || 0,
+                plays: []
+            };
+        }
+        postTurnoverDrives[driveId].plays.push(play);
+    });
+
+    const part = gamePartial(plays);
+    part.count = turnovers.length;
+    part.ourTurnovers = 0;
+    part.opponentTurnovers = 0;
+    part.pointsScored = 0;
+    part.pointsAllowed = 0;
+    // Analysis entries by drive id (merged in drive id order, like the keys
+    // of postTurnoverDrives)
+    part.drives = {};
+    // Scoring turnovers not followed by a drive of their own (see mergePostTurnover)
+    part.scoringTurnovers = [];
+
+    // For each drive that started after a turnover, find the turnover that caused it
+    Object.keys(postTurnoverDrives).forEach(driveId => {
+        const driveInfo = postTurnoverDrives[driveId];
+        const gameKey = driveInfo.game_key;
+        const driveNumber = driveInfo.drive_number;
+        const drivePlays = driveInfo.plays;
+
+        // Find the turnover in the previous drive (or same drive if turnover ended the drive)
+        // If a drive has drive_started_after_turnover == True, the turnover should be in the PREVIOUS drive
+        let matchingTurnover = null;
+
+        // First, try to find turnover in previous drive
+        turnovers.forEach(turnover => {
+            const turnoverGameKey = getGameKey(turnover);
+            if (turnoverGameKey === gameKey &&
+                turnover.drive_number === driveNumber - 1) {
+                matchingTurnover = turnover;
+                return;
+            }
+        });
+
+        // Only check same drive if no previous drive turnover found AND the drive doesn't have
+        // drive_started_after_turnover == True (which would indicate a data inconsistency)
+        // If drive_started_after_turnover is True, we should only match to previous drive turnovers
+        if (!matchingTurnover) {
+            // Check if this drive has drive_started_after_turnover flag
+            // If it does, we should skip it if no previous drive turnover found (data inconsistency)
+            const driveHasFlag = drivePlays.some(p => p.drive_started_after_turnover === true);
+
+            if (!driveHasFlag) {
+                // Drive doesn't have the flag, so it's safe to check same drive
+                // This handles cases where turnover ended the previous drive and started the next
+                turnovers.forEach(turnover => {
+                    const turnoverGameKey = getGameKey(turnover);
+                    if (turnoverGameKey === gameKey &&
+                        turnover.drive_number === driveNumber) {
+                        matchingTurnover = turnover;
+                        return;
+                    }
+                });
+            }
+        }
+
+        // Check if the turnover play itself resulted in points (e.g., pick-6, fumble return TD)
+        let drivePoints = 0;
+        let driveResult = 'No Score';
+        let scoringPlayText = '';
+
+        if (matchingTurnover && matchingTurnover.scoring === true) {
+            const playType = matchingTurnover.play_type || '';
+            const playText = (matchingTurnover.play_text || '').toUpperCase();
+            if (playType.includes('Touchdown') || playText.includes('TOUCHDOWN')) {
+                drivePoints = 7;
+                driveResult = 'Touchdown';
+                scoringPlayText = matchingTurnover.play_text?.substring(0, 150) || '';
+            } else if (playType.includes('Field Goal')) {
+                drivePoints = 3;
+                driveResult = 'Field Goal';
+                scoringPlayText = matchingTurnover.play_text?.substring(0, 150) || '';
+            }
+        }
+
+        // If turnover didn't score (or no matching turnover found), check the drive for scoring plays
+        if (drivePoints === 0) {
+            drivePlays.forEach(p => {
+                if (p.scoring === true) {
+                    // If scoring is True, check play_text to determine if it's a TD or FG
+                    // (play_type might be "Pass Reception" or "Rush" even for touchdowns)
+                    const playType = p.play_type || '';
+                    const playText = (p.play_text || '').toUpperCase();
+
+                    // Check for touchdown in play_type or play_text
+                    if (playType.includes('Touchdown') || playText.includes('TOUCHDOWN')) {
+                        drivePoints = 7;
+                        driveResult = 'Touchdown';
+                        scoringPlayText = p.play_text?.substring(0, 150) || '';
+                        return; // Touchdown is highest priority
+                    } else if ((playType.includes('Field Goal') || playText.includes('FIELD GOAL')) && driveResult === 'No Score') {
+                        drivePoints = 3;
+                        driveResult = 'Field Goal';
+                        scoringPlayText = p.play_text?.substring(0, 150) || '';
+                    }
+                }
+            });
+        }
+
+        // Determine if it's our turnover or opponent's turnover
+        // If we found a matching turnover, use it to determine ownership
+        // If not, infer from the drive's offense (if our team is on offense, it was opponent's turnover)
+        let isOurTurnover;
+        if (matchingTurnover) {
+            isOurTurnover = matchingTurnover.offense?.toLowerCase() === teamName.toLowerCase();
+
+            // For fumble recoveries on punts, the offense field is the recovering team,
+            // but the turnover actually belongs to the punting team (defense on the play)
+            const playTypeCheck = (matchingTurnover.play_type || '').toUpperCase();
+            if (playTypeCheck.includes('PUNT') && playTypeCheck.includes('FUMBLE RECOVERY')) {
+                // For punt fumble recoveries, the turnover belongs to the punting team (defense)
+                // So flip the logic: if we're the defense, it's our opponent's turnover
+                // If we're the offense (recovering team), it's our opponent's turnover
+                isOurTurnover = matchingTurnover.defense?.toLowerCase() === teamName.toLowerCase();
+            }
+        } else {
+            // No matching turnover found - check if it's a turnover on downs
+            // Look for turnovers in the previous drive OR same drive that are turnovers on downs
+            const prevDriveTurnovers = plays.filter(p => 
+                getGameKey(p) === gameKey && 
+                (p.drive_number === driveNumber - 1 || p.drive_number === driveNumber) &&
+                p.turnover === true
+            );
+
+            // Check if any of these are turnovers on downs
+            let isTurnoverOnDowns = false;
+            for (let t of prevDriveTurnovers) {
+                const turnoverTypeField = (t.turnover_type || '').toLowerCase();
+                if (turnoverTypeField === 'downs') {
+                    isTurnoverOnDowns = true;
+                    break;
+                }
+            }
+
+            // If it's a turnover on downs, skip this drive (only track fumbles/interceptions)
+            if (isTurnoverOnDowns) {
+                return;
+            }
+
+            // Not a turnover on downs, but no matching turnover found
+            // Check if there are any turnovers at all in the previous or same drive
+            // If there are no turnovers found, this is likely a data inconsistency
+            // (drive_started_after_turnover is True but no actual turnover exists)
+            // Skip these drives to avoid creating "details not found" entries
+            if (prevDriveTurnovers.length === 0) {
+                return;
+            }
+
+            // There are turnovers in the previous/same drive, but none matched
+            // This could be because they were filtered out for other reasons
+            // For now, skip these to avoid "details not found" entries
+            return;
+        }
+
+        if (isOurTurnover) part.ourTurnovers++;
+        else part.opponentTurnovers++;
+
+        // Determine turnover type
+        let turnoverType;
+        let turnoverText;
+        if (matchingTurnover) {
+            // Only interceptions and fumbles lost should be in the turnovers list
+            // (turnovers on downs are filtered out earlier)
+            const playType = matchingTurnover.play_type || 'Unknown';
+            const turnoverTypeField = (matchingTurnover.turnover_type || '').toLowerCase();
+
+            // Check both play_type and turnover_type field
+            if (playType.includes('Interception') || playType.includes('interception') || 
+                turnoverTypeField === 'interception') {
+                turnoverType = 'Interception';
+            } else if (playType.includes('Fumble') || playType.includes('fumble') || 
+                       turnoverTypeField === 'fumble') {
+                turnoverType = 'Fumble';
+            } else {
+                // This shouldn't happen if filtering is correct, but handle edge case
+                turnoverType = 'Unknown';
+            }
+            turnoverText = matchingTurnover.play_text?.substring(0, 150) || '';
+        } else {
+            // No matching turnover found - use unknown type
+            turnoverType = 'Unknown';
+            turnoverText = 'Turnover (details not found)';
+        }
+
+        if (isOurTurnover) {
+            part.pointsAllowed += drivePoints;
+        } else {
+            part.pointsScored += drivePoints;
+        }
+
+        // Combine turnover play and scoring play text
+        const playDescription = scoringPlayText 
+            ? `TO: ${turnoverText} | Score: ${scoringPlayText}`
+            : `TO: ${turnoverText}`;
+
+        // Get game info from drive plays if matchingTurnover is not available
+        const gameWeek = matchingTurnover ? matchingTurnover.game_week : (drivePlays[0]?.game_week || 0);
+        const opponent = matchingTurnover ? matchingTurnover.opponent : (drivePlays[0]?.opponent || 'Unknown');
+
+        part.drives[driveId] = {
+            game_week: gameWeek,
+            opponent: opponent,
+            turnover_type: turnoverType,
+            is_our_turnover: isOurTurnover,
+            drive_result: driveResult,
+            points_scored: isOurTurnover ? 0 : drivePoints,
+            points_allowed: isOurTurnover ? drivePoints : 0,
+            play_text: playDescription
+        };
+    });
+
+    // Turnovers that score directly (pick-6s, fumble return TDs) and don't
+    // have a subsequent drive are added by mergePostTurnover, once the drive
+    // entries of every merged game are known
+    turnovers.forEach(turnover => {
+        if (turnover.scoring === true) {
+            // Check if this turnover was already included in turnoverAnalysis
+            // A turnover is already processed if there's a drive that started after it
+            // Check if any drive started after this turnover
+            let alreadyProcessed = false;
+            const turnoverGameKey = getGameKey(turnover);
+            const turnoverDriveNumber = turnover.drive_number || 0;
+
+            // Check if there's a drive that started after this turnover
+            plays.forEach(play => {
+                if (getGameKey(play) === turnoverGameKey &&
+                    play.drive_started_after_turnover === true &&
+                    play.drive_number === turnoverDriveNumber + 1) {
+                    // There's a drive that started after this turnover, so it was already processed
+                    alreadyProcessed = true;
+                }
+            });
+
+            if (!alreadyProcessed) {
+                part.scoringTurnovers.push(turnover);
+            }
+        }
+    });
+
+    return part;
+}
+
+function mergePostTurnover(partials, teamName) {
+    // Drive entries of every game, in the order of their drive ids
+    const drives = {};
+    partials.forEach(part => Object.assign(drives, part.drives));
+    const turnoverAnalysis = Object.values(drives);
+    const pointsScoredAfterOpponentTO = sumField(partials, 'pointsScored');
+    const pointsAllowedAfterOurTO = sumField(partials, 'pointsAllowed');
+
+    // Handle turnovers that score directly (pick-6s, fumble return TDs)
+    // that don't have a subsequent drive
+    mergeRows(partials, 'scoringTurnovers').forEach(turnover => {
+        // Check turnover_analysis for matching entries
+        let alreadyProcessed = false;
+        const turnoverText = (turnover.play_text || '').substring(0, 150);
+        turnoverAnalysis.forEach(ta => {
+            if (ta.game_week === turnover.game_week) {
+                const taText = ta.play_text || '';
+                // Check if turnover text appears in the analysis entry
+                if (taText.includes(turnoverText) || taText.startsWith(`TO: ${turnoverText}`)) {
+                    alreadyProcessed = true;
+                }
+                // Also check by matching the first part of the play text
+                // (in case formatting is slightly different)
+                if (taText.startsWith('TO:')) {
+                    // Extract the turnover part from taText
+                    const taTurnoverPart = taText.split(' | Score:')[0].replace('TO: ', '');
+                    if (turnoverText.substring(0, 100).includes(taTurnoverPart.substring(0, 100)) ||
+                        taTurnoverPart.substring(0, 100).includes(turnoverText.substring(0, 100))) {
+                        alreadyProcessed = true;
+                    }
+                }
+            }
+        });
+
+        if (!alreadyProcessed) {
+            // This is a turnover that scored directly (pick-6, fumble return TD)
+            // but doesn't have a subsequent drive
+            const playType = turnover.play_type || '';
+            const playText = (turnover.play_text || '').toUpperCase();
+
+            // Determine points and result
+            let drivePoints = 0;
+            let driveResult = 'No Score';
+            if (playType.includes('Touchdown') || playText.includes('TOUCHDOWN')) {
+                drivePoints = 7;
+                driveResult = 'Touchdown';
+            } else if (playType.includes('Field Goal')) {
+                drivePoints = 3;
+                driveResult = 'Field Goal';
+            }
+
+            // Determine if it's our turnover or opponent's
+            let isOurTurnover = (turnover.offense || '').toLowerCase() === teamName.toLowerCase();
+
+            // For fumble recoveries on punts, the offense field is the recovering team,
+            // but the turnover actually belongs to the punting team (defense on the play)
+            const playTypeCheck = (turnover.play_type || '').toUpperCase();
+            if (playTypeCheck.includes('PUNT') && playTypeCheck.includes('FUMBLE RECOVERY')) {
+                isOurTurnover = (turnover.defense || '').toLowerCase() === teamName.toLowerCase();
+            }
+
+            // Determine turnover type
+            const turnoverTypeField = (turnover.turnover_type || '').toLowerCase();
+            const playTypeUpper = playType.toUpperCase();
+            let turnoverType;
+            if (playTypeUpper.includes('INTERCEPTION') || turnoverTypeField === 'interception') {
+                turnoverType = 'Interception';
+            } else if (playTypeUpper.includes('FUMBLE') || turnoverTypeField === 'fumble') {
+                turnoverType = 'Fumble';
+            } else {
+                turnoverType = 'Unknown';
+            }
+
+            const turnoverText = (turnover.play_text || '').substring(0, 150);
+            const playDescription = `TO: ${turnoverText}`;
+
+            turnoverAnalysis.push({
+                game_week: turnover.game_week,
+                opponent: turnover.opponent,
+                turnover_type: turnoverType,
+                is_our_turnover: isOurTurnover,
+                drive_result: driveResult,
+                points_scored: isOurTurnover ? 0 : drivePoints,
+                points_allowed: isOurTurnover ? drivePoints : 0,
+                play_text: playDescription
+            });
+        }
+    });
+
+    const netPoints = pointsScoredAfterOpponentTO - pointsAllowedAfterOurTO;
+
+    // Calculate last 3 games
+    const sortedWeeks = [...new Set(turnoverAnalysis.map(t => t.game_week || 0))].sort((a, b) => a - b);
+    const last3Weeks = sortedWeeks.slice(-3);
+    const last3Turnovers = turnoverAnalysis.filter(t => last3Weeks.includes(t.game_week || 0));
+
+    const last3PointsScored = last3Turnovers
+        .filter(t => !t.is_our_turnover)
+        .reduce((sum, t) => sum + (t.points_scored || 0), 0);
+    const last3PointsAllowed = last3Turnovers
+        .filter(t => t.is_our_turnover)
+        .reduce((sum, t) => sum + (t.points_allowed || 0), 0);
+    const last3NetPoints = last3PointsScored - last3PointsAllowed;
+
+    return {
+        total_turnovers: sumField(partials, 'count'),
+        our_turnovers: sumField(partials, 'ourTurnovers'),
+        opponent_turnovers: sumField(partials, 'opponentTurnovers'),
+        points_scored_after_opponent_turnovers: pointsScoredAfterOpponentTO,
+        points_allowed_after_our_turnovers: pointsAllowedAfterOurTO,
+        net_points_after_turnovers: netPoints,
+        last_3_games: {
+            points_scored: last3PointsScored,
+            points_allowed: last3PointsAllowed,
+            net_points: last3NetPoints
+        },
+        turnover_analysis: turnoverAnalysis
+    };
+}
+
+
+function partialRedZone(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+
+    // Filter to ONLY the primary team's offensive plays (but include field goals even though they're special teams)
+    // This ensures we only analyze the primary team's performance, not opponent plays
+    let offensivePlays = gamePlays.filter(p =>
+        p.offense?.toLowerCase() === teamName.toLowerCase() &&
+        (p.play_classification !== 'special_teams' ||
+         (p.play_type || '').toLowerCase().includes('field goal'))
+    );
+
+    // Double-check: ensure no opponent plays slip through
+    offensivePlays = offensivePlays.filter(p => p.offense?.toLowerCase() === teamName.toLowerCase());
+
+    const tightRedZonePlays = offensivePlays.filter(p => (p.yards_to_goal || 100) <= 10);
+    const redZonePlays = offensivePlays.filter(p => (p.yards_to_goal || 100) <= 20);
+    const greenZonePlays = offensivePlays.filter(p => (p.yards_to_goal || 100) <= 30);
+
+    function partialZone(zonePlays) {
+        const isTouchdown = p => p.scoring === true &&
+            (p.play_type?.toLowerCase().includes('touchdown') ||
+             p.play_text?.toLowerCase().includes('touchdown'));
+
+        // Red zone attempts are unique drives that entered the zone; keep
+        // the drive keys so drives are counted once when games are merged
+        const driveKey = p => {
+            const gameKey = p.game_id != null ? String(p.game_id) : `week_${p.game_week || 0}`;
+            return `${gameKey}_${p.drive_number}`;
+        };
+        const hasDrive = p => p.drive_number !== null && p.drive_number !== undefined;
+
+        const ppas = zonePlays.filter(p => p.ppa != null).map(p => parseFloat(p.ppa));
+        const thirdDowns = zonePlays.filter(p => p.down === 3);
+
+        return {
+            total_plays: zonePlays.length,
+            drives: zonePlays.filter(hasDrive).map(driveKey),
+            // Drives that resulted in a touchdown
+            td_drives: zonePlays.filter(p => isTouchdown(p) && hasDrive(p)).map(driveKey),
+            touchdowns: zonePlays.filter(isTouchdown).length,
+            // Separate turnovers on downs from fumbles/interceptions
+            turnovers: zonePlays.filter(p =>
+                p.turnover === true &&
+                (p.turnover_type || '').toLowerCase() !== 'downs'
+            ).length,
+            turnovers_on_downs: zonePlays.filter(p =>
+                p.turnover === true &&
+                (p.turnover_type || '').toLowerCase() === 'downs'
+            ).length,
+            ppa_sum: ppas.reduce((a, b) => a + b, 0),
+            ppa_count: ppas.length,
+            third_attempts: thirdDowns.length,
+            third_conversions: thirdDowns.filter(p => {
+                const pt = (p.play_text || '').toLowerCase();
+                return pt.includes('1st down') || pt.includes('first down') || (p.yards_gained || 0) >= (p.distance || 0);
+            }).length,
+            plays: zonePlays.map(p => ({
+                game_week: p.game_week,
+                opponent: p.opponent,
+                period: p.period,
+                clock: p.clock,
+                down: p.down,
+                distance: p.distance,
+                yards_to_goal: p.yards_to_goal,
+                play_type: p.play_type,
+                yards_gained: p.yards_gained,
+                scoring: p.scoring || false,
+                explosive: p.explosive_play || false,
+                ppa: p.ppa,
+                play_text: p.play_text?.substring(0, 200) || ''
+            }))
+        };
+    }
+
+    part.tight_red_zone = partialZone(tightRedZonePlays);
+    part.red_zone = partialZone(redZonePlays);
+    part.green_zone = partialZone(greenZonePlays);
+    return part;
+}
+
+function mergeRedZone(partials, teamName) {
+    function mergeZone(zonePartials) {
+        const redZoneAttempts = new Set(mergeRows(zonePartials, 'drives')).size;
+        const drivesWithTD = new Set(mergeRows(zonePartials, 'td_drives')).size;
+        const ppaCount = sumField(zonePartials, 'ppa_count');
+        const thirdAttempts = sumField(zonePartials, 'third_attempts');
+        const thirdConversions = sumField(zonePartials, 'third_conversions');
+
+        return {
+            total_plays: sumField(zonePartials, 'total_plays'),
+            red_zone_attempts: redZoneAttempts,
+            touchdowns: sumField(zonePartials, 'touchdowns'),
+            td_scoring_rate: redZoneAttempts > 0 ? (drivesWithTD / redZoneAttempts * 100) : 0,
+            turnovers: sumField(zonePartials, 'turnovers'),
+            turnovers_on_downs: sumField(zonePartials, 'turnovers_on_downs'),
+            avg_ppa: ppaCount > 0 ? (sumField(zonePartials, 'ppa_sum') / ppaCount) : 0,
+            conversions_3rd: {
+                attempts: thirdAttempts,
+                conversions: thirdConversions,
+                rate: thirdAttempts > 0 ? (thirdConversions / thirdAttempts * 100) : 0
+            },
+            plays: mergeRows(zonePartials, 'plays')
+        };
+    }
+
+    return {
+        tight_red_zone: mergeZone(partials.map(part => part.tight_red_zone)),
+        red_zone: mergeZone(partials.map(part => part.red_zone)),
+        green_zone: mergeZone(partials.map(part => part.green_zone))
+    };
+}
+
+function partialSpecialTeams(gamePlays, teamName) {
+    const part = gamePartial(gamePlays);
+    const stPlays = gamePlays.filter(p => p.play_classification === 'special_teams');
+
+    // Separate by offense (our special teams) vs defense (opponent special teams)
+    // For returns, the returning team is on "defense", not "offense"
+    const ourSTPlays = [];
+    const opponentSTPlays = [];
+
+    stPlays.forEach(p => {
+        const playType = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+
+        // Check if it's a return play (kickoff return or punt return)
+        const isReturn = (
+            (playType.includes('return') || playText.includes('return')) &&
+            (playType.includes('kickoff') || playText.includes('kickoff') ||
+             playType.includes('punt') || playText.includes('punt'))
+        );
+
+        if (isReturn) {
+            // For returns, check defense field (returning team)
+            if (p.defense?.toLowerCase() === teamName.toLowerCase()) {
+                ourSTPlays.push(p);
+            } else {
+                opponentSTPlays.push(p);
+            }
+        } else {
+            // For other ST plays (kicks, punts), check offense field
+            if (p.offense?.toLowerCase() === teamName.toLowerCase()) {
+                ourSTPlays.push(p);
+            } else {
+                opponentSTPlays.push(p);
+            }
+        }
+    });
+
+    // Check if special teams play is explosive: 35+ kick return, 20+ punt return
+    function isSpecialTeamsExplosive(play) {
+        const pt = (play.play_type || '').toLowerCase();
+        const ptxt = (play.play_text || '').toLowerCase();
+
+        // For returns, we need to parse the return yards from the play text
+        // because yards_gained might include the kick/punt distance
+        function parseReturnYards(playText) {
+            if (!playText) return 0;
+
+            // Look for patterns like "returns for X yds" or "returns for no gain"
+            const returnMatch = playText.match(/return[s]? for (?:no gain|(\d+) (?:yd|yard))/i);
+            if (returnMatch) {
+                if (returnMatch[1]) {
+                    return parseInt(returnMatch[1], 10);
+                } else {
+                    return 0; // "no gain"
+                }
+            }
+
+            // Fallback: if we can't parse, return 0 to be safe
+            return 0;
+        }
+
+        // Kick return: 35+ yards
+        if ((pt.includes('kickoff') || ptxt.includes('kickoff')) && 
+            (pt.includes('return') || ptxt.includes('return'))) {
+            const returnYards = parseReturnYards(play.play_text);
+            return returnYards >= 35;
+        }
+
+        // Punt return: 20+ yards
+        if ((pt.includes('punt') || ptxt.includes('punt')) && 
+            (pt.includes('return') || ptxt.includes('return'))) {
+            const returnYards = parseReturnYards(play.play_text);
+            return returnYards >= 20;
+        }
+
+        return false;
+    }
+
+    const explosivePlays = ourSTPlays.filter(p => isSpecialTeamsExplosive(p));
+    const explosiveReturnsAllowed = opponentSTPlays.filter(p => isSpecialTeamsExplosive(p));
+
+    // Count touchdowns on special teams
+    // Important: For return TDs, the "offense" field is the team that punted/kicked,
+    // not the team that scored. We need to check all ST plays and determine who scored.
+    const tdsScored = stPlays.filter(p => {
+        const scoring = p.scoring === true;
+        if (!scoring) return false;
+
+        const playType = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+        const hasTD = playType.includes('touchdown') || playText.includes('touchdown') || playText.includes(' for a td');
+
+        if (!hasTD) return false;
+
+        // Check if this is a return TD (punt return or kickoff return)
+        const isReturnTD = (playType.includes('return') || playText.includes('return')) &&
+                          (playType.includes('kickoff') || playText.includes('kickoff') ||
+                           playType.includes('punt') || playText.includes('punt'));
+
+        if (isReturnTD) {
+            // For return TDs: if opponent is on offense (they punted/kicked), 
+            // then Washington scored on the return
+            const isOpponentOffense = p.offense?.toLowerCase() !== teamName.toLowerCase();
+            return isOpponentOffense;  // Opponent kicked, Washington returned for TD
+        } else {
+            // For non-return TDs (like blocked punts run back), Washington on offense = their TD
+            return p.offense?.toLowerCase() === teamName.toLowerCase();
+        }
+    }).length;
+
+    const tdsAllowed = stPlays.filter(p => {
+        const scoring = p.scoring === true;
+        if (!scoring) return false;
+
+        const playType = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+        const hasTD = playType.includes('touchdown') || playText.includes('touchdown') || playText.includes(' for a td');
+
+        if (!hasTD) return false;
+
+        // Check if this is a return TD
+        const isReturnTD = (playType.includes('return') || playText.includes('return')) &&
+                          (playType.includes('kickoff') || playText.includes('kickoff') ||
+                           playType.includes('punt') || playText.includes('punt'));
+
+        if (isReturnTD) {
+            // For return TDs: if Washington is on offense (they punted/kicked),
+            // then opponent scored on the return (Washington allowed it)
+            return p.offense?.toLowerCase() === teamName.toLowerCase();
+        } else {
+            // For non-return TDs, opponent on offense = their TD
+            return p.offense?.toLowerCase() !== teamName.toLowerCase();
+        }
+    }).length;
+
+    // Count punt blocks
+    // Punt blocks: when opponent is punting (they're on offense) and we block it
+    const puntBlocks = stPlays.filter(p => {
+        const playType = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+        const offense = p.offense || '';
+        const isOpponentOffense = offense.toLowerCase() !== teamName.toLowerCase();
+
+        // Must have "blocked punt" or "punt blocked" in play type or text
+        // This excludes false positives like "Illegal Block in Back" penalties on punts
+        const hasBlockedPuntInType = playType.includes('blocked punt') || playType.includes('punt blocked');
+        const hasBlockedPuntInText = playText.includes('blocked punt') || playText.includes('punt blocked');
+
+        return (hasBlockedPuntInType || hasBlockedPuntInText) && isOpponentOffense;
+    });
+
+    // Punt blocks allowed: when we're punting and opponent blocks it
+    const puntBlocksAllowed = stPlays.filter(p => {
+        const playType = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+        const offense = p.offense || '';
+        const isOurOffense = offense.toLowerCase() === teamName.toLowerCase();
+
+        // Must have "blocked punt" or "punt blocked" in play type or text
+        // This excludes false positives like "Illegal Block in Back" penalties on punts
+        const hasBlockedPuntInType = playType.includes('blocked punt') || playType.includes('punt blocked');
+        const hasBlockedPuntInText = playText.includes('blocked punt') || playText.includes('punt blocked');
+
+        return (hasBlockedPuntInType || hasBlockedPuntInText) && isOurOffense;
+    });
+
+    part.total_explosive_plays = explosivePlays.length;
+    part.explosive_returns_allowed = explosiveReturnsAllowed.length;
+    part.tds_scored = tdsScored;
+    part.tds_allowed = tdsAllowed;
+    part.punt_blocks = puntBlocks.length;
+    part.punt_blocks_allowed = puntBlocksAllowed.length;
+    part.plays = stPlays.map(p => {
+        const explosive = isSpecialTeamsExplosive(p);
+        const isOur = p.offense?.toLowerCase() === teamName.toLowerCase();
+        return {
+            game_week: p.game_week,
+            opponent: p.opponent,
+            play_type: p.play_type,
+            is_our: isOur,
+            explosive: explosive,
+            turnover: p.turnover || false,
+            yards_gained: p.yards_gained,
+            play_text: p.play_text?.substring(0, 200) || ''
+        };
+    });
+    return part;
+}
+
+function mergeSpecialTeams(partials, teamName) {
+    return {
+        total_explosive_plays: sumField(partials, 'total_explosive_plays'),
+        explosive_returns_allowed: sumField(partials, 'explosive_returns_allowed'),
+        tds_scored: sumField(partials, 'tds_scored'),
+        tds_allowed: sumField(partials, 'tds_allowed'),
+        punt_blocks: sumField(partials, 'punt_blocks'),
+        punt_blocks_allowed: sumField(partials, 'punt_blocks_allowed'),
+        plays: mergeRows(partials, 'plays')
+    };
+}
+
+// allData key -> [partial, merge] of each analyzer re-run by applyFilters
+const GAME_ANALYZERS = {
+    middle8: [partialMiddleEight, mergeMiddleEight],
+    explosive: [partialExplosivePlays, mergeExplosivePlays],
+    penalties: [partialPenalties, mergePenalties],
+    '4thdowns': [partial4thDowns, merge4thDowns],
+    turnover: [partialPostTurnover, mergePostTurnover],
+    specialteams: [partialSpecialTeams, mergeSpecialTeams],
+    redzone: [partialRedZone, mergeRedZone]
+};
+
+// Split plays into games and compute every analyzer's partial of each game
+function buildGamePartials(plays, teamName) {
+    const games = splitGames(plays);
+    games.forEach(game => {
+        game.partials = {};
+        Object.entries(GAME_ANALYZERS).forEach(([name, [partial]]) => {
+            game.partials[name] = partial(game.plays, teamName);
+        });
+    });
+    return games;
+}
+
+// Analysis results over a subset of games: the merge of their partials
+function mergeGamePartials(games, teamName) {
+    const results = {};
+    Object.entries(GAME_ANALYZERS).forEach(([name, [, merge]]) => {
+        results[name] = merge(games.map(game => game.partials[name]), teamName);
+    });
+    return results;
+}
+
+// Games kept by the filters. filterPlays() keeps or drops whole games, so
+// running it over the first play of each game selects the same games.
+function filterGames(games, filters, teamName) {
+    const kept = new Set(filterPlays(games.map(game => game.plays[0]), filters, teamName));
+    return games.filter(game => kept.has(game.plays[0]));
+}
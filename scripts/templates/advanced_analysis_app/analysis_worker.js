@@ -0,0 +1,36 @@
+// Filter worker: decodes the plays once, builds the per-game partials of
+// both teams and answers filter requests with the merged results and
+// the row numbers of the kept plays (in merge order)
+let workerTeams = null;
+let pendingRequest = null;
+
+function runPendingRequest() {
+    const request = pendingRequest;
+    pendingRequest = null;
+    const teams = workerTeams.map(team => {
+        const games = filterGames(team.games, request.filters, team.name);
+        const rows = Int32Array.from([].concat(...games.map(game => game.plays)), play => play._row);
+        return { data: mergeGamePartials(games, team.name), rows: rows };
+    });
+    self.postMessage({ id: request.id, teams: teams }, teams.map(team => team.rows.buffer));
+}
+
+self.onmessage = event => {
+    const message = event.data;
+    if (message.type === 'init') {
+        // The data block's JSON: a string, or UTF-8 bytes
+        const source = message.source;
+        const json = typeof source === 'string' ? source : new TextDecoder().decode(source);
+        const payload = JSON.parse(json).plays;
+        workerTeams = message.teams.map(team => ({
+            name: team.name,
+            games: buildGamePartials(decodePlays(payload, team.key), team.name)
+        }));
+    } else if (message.type === 'filter') {
+        // Requests queued behind a running one are coalesced: only the
+        // newest is computed
+        const scheduled = pendingRequest !== null;
+        pendingRequest = message;
+        if (!scheduled) setTimeout(runPendingRequest, 0);
+    }
+};
@@ -0,0 +1,5640 @@
+// Report settings (team keys, names, colors and games) are declared by the
+// page before this script runs.
+// All pre-computed analyses and the plays, set by initializeData() once the
+// embedded data block is decoded
+let allData = null;
+let originalAllData = null;
+let team1Plays = [];
+let team2Plays = [];
+let masterWeekMapping = null;
+
+// Team color at the given opacity, for charts (same as hex_to_rgba in the generator)
+function teamRgba(hexColor, alpha) {
+    const hex = hexColor.replace('#', '');
+    const [r, g, b] = [0, 2, 4].map(i => parseInt(hex.slice(i, i + 2), 16));
+    return `rgba(${r}, ${g}, ${b}, ${alpha})`;
+}
+const team1Conference = getTeamConference(team1Name);
+const team2Conference = getTeamConference(team2Name);
+console.log('Team conferences:', team1Name, '=', team1Conference, ',', team2Name, '=', team2Conference);
+
+// Decode the embedded data block: plain JSON, or gzip + base64
+// inflated with DecompressionStream (see app_payload.write_data_block).
+// Returns the parsed data and its JSON source (the block's text, or the
+// inflated UTF-8 bytes), which the filter worker parses on its own.
+async function loadAppData() {
+    const block = document.getElementById('appData');
+    if (block.dataset.encoding !== 'gzip') {
+        const text = block.textContent;
+        return { data: JSON.parse(text), source: text };
+    }
+    if (typeof DecompressionStream === 'undefined') {
+        throw new Error('this browser has no DecompressionStream; regenerate the app with --no-compress');
+    }
+    const bytes = Uint8Array.from(atob(block.textContent.trim()), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    const buffer = await new Response(stream).arrayBuffer();
+    return { data: JSON.parse(new TextDecoder().decode(buffer)), source: buffer };
+}
+
+function initializeData(data, source) {
+    allData = data.all_data;
+
+    // CRITICAL DEBUG: Check penalties immediately after parsing
+    console.log('=== PENALTIES DATA DEBUG (IMMEDIATE AFTER PARSE) ===');
+    console.log('Purdue penalties accepted:', allData[team2Key]?.penalties?.accepted);
+    console.log('Purdue penalties object:', allData[team2Key]?.penalties);
+
+    // Debug: Check deep_targets data structure immediately after parsing
+    console.log('=== DATA LOADING DEBUG ===');
+    console.log('team1Key =', team1Key, 'team2Key =', team2Key);
+    console.log('allData keys =', Object.keys(allData));
+    console.log('allData[team1Key] keys =', allData[team1Key] ? Object.keys(allData[team1Key]) : 'N/A');
+    console.log('allData[team1Key].deep_targets =', allData[team1Key]?.deep_targets ? 'exists' : 'missing');
+    if (allData[team1Key]?.deep_targets) {
+        console.log('allData[team1Key].deep_targets keys =', Object.keys(allData[team1Key].deep_targets));
+        console.log('allData[team1Key].deep_targets.passing =', allData[team1Key].deep_targets.passing);
+        console.log('allData[team1Key].deep_targets.passing.total =', allData[team1Key].deep_targets.passing?.total);
+        console.log('allData[team1Key].deep_targets.passing.by_game count =', allData[team1Key].deep_targets.passing?.by_game ? Object.keys(allData[team1Key].deep_targets.passing.by_game).length : 0);
+        console.log('allData[team1Key].deep_targets.receiving =', allData[team1Key].deep_targets.receiving);
+        console.log('allData[team1Key].deep_targets.receiving.total =', allData[team1Key].deep_targets.receiving?.total);
+        console.log('allData[team1Key].deep_targets.receiving.by_game count =', allData[team1Key].deep_targets.receiving?.by_game ? Object.keys(allData[team1Key].deep_targets.receiving.by_game).length : 0);
+    }
+    console.log('=== END DATA LOADING DEBUG ===');
+
+    // Store original data for filtering. Filters build new result objects
+    // and swap them into allData, so the originals are kept by reference.
+    originalAllData = {
+        [team1Key]: allData[team1Key],
+        [team2Key]: allData[team2Key]
+    };
+
+    team1Plays = decodePlays(data.plays, team1Key);
+    team2Plays = decodePlays(data.plays, team2Key);
+    masterWeekMapping = buildMasterWeekMapping();
+    startAnalysisWorker(source);
+}
+
+// Charts storage
+const charts = {};
+
+// Chart manager: each chart is created once; later renders (filter
+// changes) swap its labels, datasets and options in place and redraw
+// it without animation. Redraws are batched into one animation frame.
+const pendingChartUpdates = new Set();
+let chartFrame = null;
+
+function renderChart(name, ctx, config) {
+    const chart = charts[name];
+    if (!chart || chart.config.type !== config.type || chart.canvas !== ctx.canvas) {
+        if (chart) {
+            pendingChartUpdates.delete(chart);
+            chart.destroy();
+        }
+        charts[name] = new Chart(ctx, config);
+        return charts[name];
+    }
+
+    chart.data.labels = config.data.labels;
+    const datasets = config.data.datasets;
+    datasets.forEach((dataset, i) => {
+        const current = chart.data.datasets[i];
+        if (!current) {
+            chart.data.datasets[i] = dataset;
+            return;
+        }
+        // Keep the dataset object (and its controller); replace its fields
+        Object.keys(current).forEach(key => {
+            if (!(key in dataset) && !key.startsWith('_')) delete current[key];
+        });
+        Object.assign(current, dataset);
+    });
+    chart.data.datasets.length = datasets.length;
+    // Options too: their callbacks close over this render's data
+    chart.options = config.options || {};
+
+    pendingChartUpdates.add(chart);
+    if (chartFrame === null) chartFrame = requestAnimationFrame(flushChartUpdates);
+    return chart;
+}
+
+function flushChartUpdates() {
+    chartFrame = null;
+    pendingChartUpdates.forEach(chart => chart.update('none'));
+    pendingChartUpdates.clear();
+}
+
+// Helper function to format clock from "seconds=X minutes=Y" to "MM:SS"
+function formatClock(clockStr) {
+    if (!clockStr || typeof clockStr !== 'string') return '';
+
+    // Parse format like "seconds=26 minutes=13"
+    const secondsMatch = clockStr.match(/seconds=(\d+)/);
+    const minutesMatch = clockStr.match(/minutes=(\d+)/);
+
+    if (secondsMatch && minutesMatch) {
+        const minutes = parseInt(minutesMatch[1], 10);
+        const seconds = parseInt(secondsMatch[1], 10);
+        return `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+    }
+
+    // If parsing fails, return original
+    return clockStr;
+}
+
+function parseClockToSeconds(clockStr) {
+    if (!clockStr) return 0;
+    const minutesMatch = clockStr.match(/minutes=(\d+)/);
+    const secondsMatch = clockStr.match(/seconds=(\d+)/);
+    if (minutesMatch && secondsMatch) {
+        const minutes = parseInt(minutesMatch[1], 10);
+        const seconds = parseInt(secondsMatch[1], 10);
+        return minutes * 60 + seconds;
+    }
+    return 0;
+}
+
+function sortPlaysChronologically(plays) {
+    return plays.slice().sort((a, b) => {
+        // First sort by week
+        const weekA = a.game_week || 0;
+        const weekB = b.game_week || 0;
+        if (weekA !== weekB) return weekA - weekB;
+
+        // Then by period
+        const periodA = a.period || 0;
+        const periodB = b.period || 0;
+        if (periodA !== periodB) return periodA - periodB;
+
+        // Then by clock (higher time = earlier in period, so sort descending)
+        const clockA = parseClockToSeconds(a.clock);
+        const clockB = parseClockToSeconds(b.clock);
+        return clockB - clockA;  // Descending (more time = earlier)
+    });
+}
+
+function sortDrivesChronologically(drives) {
+    return drives.slice().sort((a, b) => {
+        // First sort by week
+        const weekA = a.game_week || 0;
+        const weekB = b.game_week || 0;
+        if (weekA !== weekB) return weekA - weekB;
+
+        // Then by period
+        const periodA = a.period || 0;
+        const periodB = b.period || 0;
+        if (periodA !== periodB) return periodA - periodB;
+
+        // Then by clock (higher time = earlier in period, so sort descending)
+        const clockA = parseClockToSeconds(a.clock);
+        const clockB = parseClockToSeconds(b.clock);
+        return clockB - clockA;  // Descending (more time = earlier)
+    });
+}
+
+// Helper function to add week-based classes to table rows
+function addWeekClass(row, weekValue) {
+    // Extract week number from week value (could be number or string like "Week 1")
+    let weekNum = 0;
+    if (typeof weekValue === 'number') {
+        weekNum = weekValue;
+    } else if (typeof weekValue === 'string') {
+        const match = weekValue.match(/\d+/);
+        if (match) weekNum = parseInt(match[0], 10);
+    }
+
+    // Add class based on week number (week-1, week-2, etc.)
+    if (weekNum > 0) {
+        $(row).addClass('week-' + weekNum);
+    }
+}
+
+// Create master week mapping - includes all weeks from 1 to max_week, with BYE weeks as 0
+function buildMasterWeekMapping() {
+    // Get BYE weeks data (if available)
+    const byeWeeks = allData.bye_weeks || {};
+    const team1ByeWeeks = new Set(byeWeeks[team1Name]?.bye_weeks || []);
+    const team2ByeWeeks = new Set(byeWeeks[team2Name]?.bye_weeks || []);
+
+    // Get all unique weeks from both teams (handles PDF data without game_id)
+    const allWeeks = new Set();
+    team1Games.forEach(g => { if (g.week) allWeeks.add(g.week); });
+    team2Games.forEach(g => { if (g.week) allWeeks.add(g.week); });
+
+    // Also collect game_id to week mapping for API data
+    const allGameIds = new Set();
+    team1Games.forEach(g => { if (g.game_id) allGameIds.add(g.game_id); });
+    team2Games.forEach(g => { if (g.game_id) allGameIds.add(g.game_id); });
+
+    // Get week for each game from the game lists
+    const allGames = Array.from(allGameIds).map(gameId => {
+        const washGame = team1Games.find(g => g.game_id === gameId);
+        const wiscGame = team2Games.find(g => g.game_id === gameId);
+        const week = washGame?.week || wiscGame?.week || 0;
+        return { gameId, week: week };
+    });
+
+    // Find the maximum week number from both sources
+    const maxWeekFromGames = allGames.length > 0 ? Math.max(...allGames.map(g => g.week).filter(w => w > 0), 0) : 0;
+    const maxWeekFromWeeks = allWeeks.size > 0 ? Math.max(...allWeeks) : 0;
+    const maxWeek = Math.max(maxWeekFromGames, maxWeekFromWeeks, 0);
+
+    // Create mapping: gameId -> week number
+    const gameIdToWeek = {};
+    allGames.forEach(game => {
+        if (game.week > 0) {
+            gameIdToWeek[game.gameId] = game.week;
+        }
+    });
+
+    // Create week-to-opponent mappings for both teams
+    // Explicitly mark BYE weeks if they exist in the bye_weeks data
+    const team1WeekToOpponent = {};
+    team1Games.forEach(game => {
+        if (game.week && game.opponent) {
+            team1WeekToOpponent[game.week] = game.opponent;
+        }
+    });
+    // Mark BYE weeks explicitly (opponent will be 'BYE' or undefined)
+    team1ByeWeeks.forEach(week => {
+        if (!team1WeekToOpponent[week]) {
+            team1WeekToOpponent[week] = 'BYE';
+        }
+    });
+
+    const team2WeekToOpponent = {};
+    team2Games.forEach(game => {
+        if (game.week && game.opponent) {
+            team2WeekToOpponent[game.week] = game.opponent;
+        }
+    });
+    // Mark BYE weeks explicitly (opponent will be 'BYE' or undefined)
+    team2ByeWeeks.forEach(week => {
+        if (!team2WeekToOpponent[week]) {
+            team2WeekToOpponent[week] = 'BYE';
+        }
+    });
+
+    // Create week labels for all weeks (1 to maxWeek)
+    const weekLabels = [];
+    for (let week = 1; week <= maxWeek; week++) {
+        weekLabels.push(`Week ${week}`);
+    }
+
+    return { gameIdToWeek, allGames: allGames, weekLabels, maxWeek, team1WeekToOpponent, team2WeekToOpponent, team1ByeWeeks, team2ByeWeeks };
+}
+
+// Helper function to get week number for a game ID
+function getWeekForGameId(gameId) {
+    return masterWeekMapping.gameIdToWeek[gameId] || null;
+}
+
+// Helper function to get master game mapping (for backward compatibility - deprecated)
+function createGameIdToGameNumberMapping(plays) {
+    // Return week mapping instead of sequential game numbers
+    return masterWeekMapping.gameIdToWeek;
+}
+
+// Helper function to calculate trends by week (includes BYE weeks with 0)
+function calculateTrendsByWeek(plays, teamName, metricFn) {
+    const byWeek = {};
+    plays.forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { plays: [] };
+        }
+        byWeek[week].plays.push(play);
+    });
+
+    // Create array with all weeks (1 to maxWeek), filling in 0 for BYE weeks
+    const values = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekPlays = byWeek[week]?.plays || [];
+        values.push(metricFn(weekPlays, teamName));
+    }
+
+    return { weeks: masterWeekMapping.weekLabels, values: values };
+}
+
+function calculateTurnoverTrends(plays, teamName) {
+    const byWeek = {};
+    plays.forEach(play => {
+        if (play.turnover === true) {
+            // Use game_week directly if available (PDF data), otherwise lookup from game_id
+            let week = play.game_week;
+            if (!week) {
+                const gameId = play.game_id;
+                if (!gameId) return;
+                week = getWeekForGameId(gameId);
+            }
+            if (!week) return;
+
+            if (!byWeek[week]) {
+                byWeek[week] = { ourTO: 0, oppTO: 0 };
+            }
+            const isOur = play.offense?.toLowerCase() === teamName.toLowerCase();
+            if (isOur) {
+                byWeek[week].ourTO++;
+            } else {
+                byWeek[week].oppTO++;
+            }
+        }
+    });
+
+    const ourTurnovers = [];
+    const oppTurnovers = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        ourTurnovers.push(byWeek[week]?.ourTO || 0);
+        oppTurnovers.push(byWeek[week]?.oppTO || 0);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        ourTurnovers: ourTurnovers,
+        oppTurnovers: oppTurnovers
+    };
+}
+
+function calculateNetPointsByWeek(plays, teamName) {
+    // Filter turnovers - only fumbles lost and interceptions thrown
+    // Exclude turnovers on downs and plays with "NO PLAY" in text
+    const turnovers = plays.filter(p => {
+        if (p.turnover !== true) return false;
+
+        // Filter out plays with "NO PLAY" in the text
+        const playText = (p.play_text || '').toUpperCase();
+        if (playText.includes('NO PLAY')) return false;
+
+        // Check turnover_type field first - if it's "downs", exclude it
+        // Post turnover analysis only includes fumbles lost and interceptions
+        const turnoverTypeField = (p.turnover_type || '').toLowerCase();
+        if (turnoverTypeField === 'downs') {
+            // This is a turnover on downs, exclude from post turnover analysis
+            return false;
+        }
+
+        // Include penalty plays if they have a valid turnover_type (interception or fumble)
+        // Penalties can mark turnovers that occurred (e.g., interception then penalty called)
+        // But only if turnover_type is explicitly set to interception or fumble
+        const playType = (p.play_type || '').toUpperCase();
+        if (playType.includes('PENALTY')) {
+            // Only include penalty if it has a valid turnover_type
+            if (turnoverTypeField !== 'interception' && turnoverTypeField !== 'fumble') {
+                return false;
+            }
+            // If it has a valid turnover_type, we'll include it below
+        }
+
+        // Only count fumbles lost and interceptions thrown
+        // Exclude turnovers on downs
+        // Check both play_type and turnover_type for interceptions and fumbles
+        const isInterception = playType.includes('INTERCEPTION') || turnoverTypeField === 'interception';
+        const isFumble = playType.includes('FUMBLE') || turnoverTypeField === 'fumble';
+
+        // For fumbles, check if the offense recovered their own fumble
+        let isFumbleLost = false;
+        if (isFumble) {
+            // Check play_type for "(Own)" indicator - but also verify in play_text
+            // If "(OWN)" is in play_type, check play_text to see who actually recovered
+            const playTextUpper = (p.play_text || '').toUpperCase();
+            const offenseTeam = (p.offense || '').toUpperCase();
+            const defenseTeam = (p.defense || '').toUpperCase();
+
+            // Check if play_text indicates the defense recovered (turnover)
+            // Look for patterns like "recovered by [defense team]" or "recovered by [defense player]"
+            let defenseRecovered = false;
+            if (defenseTeam && playTextUpper.includes(defenseTeam)) {
+                // Check if it says "recovered by [defense team]" or similar
+                const recoveredPatterns = [
+                    `RECOVERED BY ${defenseTeam}`,
+                    `RECOVERED BY ${defenseTeam.substring(0, 3)}`,  // Abbreviation
+                ];
+                for (let pattern of recoveredPatterns) {
+                    if (playTextUpper.includes(pattern)) {
+                        defenseRecovered = true;
+                        break;
+                    }
+                }
+            }
+
+            // If play_type says "(Own)" but play_text shows defense recovered, it's a turnover
+            if (playType.includes('(OWN)') && !defenseRecovered) {
+                // Offense recovered their own fumble - NOT a turnover, exclude it
+                return false;
+            } else {
+                // If the play is marked as a turnover and has fumble, it's a fumble lost
+                isFumbleLost = true;
+            }
+        }
+
+        // Exclude turnovers on downs (additional check in case turnover_type wasn't set)
+        const isTurnoverOnDowns = playType.includes('TURNOVER ON DOWNS') ||
+            playType.includes('DOWNS');
+
+        // Only include interceptions and fumbles lost, exclude turnovers on downs
+        return (isInterception || isFumbleLost) && !isTurnoverOnDowns;
+    });
+
+    const postTurnoverPlays = plays.filter(p => p.drive_started_after_turnover === true);
+
+    const byWeek = {};
+
+    turnovers.forEach(turnover => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = turnover.game_week;
+        if (!week) {
+            const gameId = turnover.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { pointsScored: 0, pointsAllowed: 0 };
+        }
+
+        // For muffed punts (punts with fumbles), check who's on offense after the recovery
+        // The receiving team (defense on the punt) loses the fumble if the punting team recovers
+        let isOurTurnover = turnover.offense?.toLowerCase() === teamName.toLowerCase();
+        const playType = (turnover.play_type || '').toUpperCase();
+        const playTextCheck = (turnover.play_text || '').toUpperCase();
+        if (playType.includes('PUNT') && (playTextCheck.includes('FUMBLE') || playTextCheck.includes('FUMBLED'))) {
+            // Find the next play to see who's on offense after the recovery
+            let nextPlay = null;
+            const turnoverDrive = turnover.drive_number || 0;
+            const turnoverPlayNum = turnover.play_number || 0;
+
+            // Look for next play in same drive or next drive
+            for (let play of plays) {
+                if (play.game_id === turnover.game_id) {
+                    const playDrive = play.drive_number || 0;
+                    const playNum = play.play_number || 0;
+                    // Next drive, or same drive with higher play number
+                    if ((playDrive === turnoverDrive + 1) || 
+                        (playDrive === turnoverDrive && playNum > turnoverPlayNum)) {
+                        nextPlay = play;
+                        break;
+                    }
+                }
+            }
+
+            if (nextPlay) {
+                // Who's on offense after the recovery?
+                const recoveringTeam = (nextPlay.offense || '').toLowerCase();
+                const receivingTeam = (turnover.defense || '').toLowerCase();  // Receiving team is defense on punt
+
+                // If the recovering team is on offense, the receiving team lost the fumble
+                if (recoveringTeam !== receivingTeam) {
+                    // Recovering team got the ball - receiving team lost the fumble
+                    isOurTurnover = receivingTeam === teamName.toLowerCase();
+                } else {
+                    // Receiving team recovered their own fumble - not a turnover (shouldn't happen)
+                    // But if it does, use default logic
+                    isOurTurnover = (turnover.offense || '').toLowerCase() === teamName.toLowerCase();
+                }
+            } else {
+                // Can't find next play, use original logic: receiving team (defense) lost the fumble
+                isOurTurnover = (turnover.defense || '').toLowerCase() === teamName.toLowerCase();
+            }
+        }
+
+        // Check if the turnover play itself resulted in points (e.g., pick-6, fumble return TD)
+        let drivePoints = 0;
+        if (turnover.scoring === true) {
+            // Check play_type first, then play_text (for pick-6, fumble return TD)
+            const playType = (turnover.play_type || '').toUpperCase();
+            const playText = (turnover.play_text || '').toUpperCase();
+
+            // Check for touchdown in play_type or play_text
+            if (playType.includes('TOUCHDOWN') || playText.includes('TOUCHDOWN')) {
+                drivePoints = 7;
+            } else if (playType.includes('FIELD GOAL')) {
+                drivePoints = 3;
+            }
+        }
+
+        // If turnover didn't score, check the subsequent drive
+        if (drivePoints === 0) {
+            // Find subsequent drive - look for plays in the next drive after the turnover
+            const turnoverDriveNumber = turnover.drive_number || 0;
+            const nextDrivePlays = postTurnoverPlays.filter(p => 
+                p.game_id === turnover.game_id && 
+                (p.drive_number === turnoverDriveNumber + 1 || p.drive_number === turnoverDriveNumber)
+            );
+
+            nextDrivePlays.forEach(p => {
+                if (p.scoring === true) {
+                    // If scoring is True, check play_text to determine if it's a TD or FG
+                    // (play_type might be "Pass Reception" or "Rush" even for touchdowns)
+                    const playType = p.play_type || '';
+                    const playText = (p.play_text || '').toUpperCase();
+
+                    // Check for touchdown in play_type or play_text
+                    if (playType.includes('Touchdown') || playText.includes('TOUCHDOWN')) {
+                        drivePoints = 7;
+                    } else if ((playType.includes('Field Goal') || playText.includes('FIELD GOAL')) && drivePoints === 0) {
+                        drivePoints = 3;
+                    }
+                }
+            });
+        }
+
+        if (isOurTurnover) {
+            byWeek[week].pointsAllowed += drivePoints;
+        } else {
+            byWeek[week].pointsScored += drivePoints;
+        }
+    });
+
+    const netPoints = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { pointsScored: 0, pointsAllowed: 0 };
+        netPoints.push(weekData.pointsScored - weekData.pointsAllowed);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        netPoints: netPoints
+    };
+}
+
+function calculateNetPointsByWeekFromAnalysis(turnoverAnalysis, teamName) {
+    // Calculate net points by week directly from turnover_analysis array
+    // This is more accurate than recalculating from plays
+    const byWeek = {};
+
+    turnoverAnalysis.forEach(t => {
+        const week = t.game_week || 0;
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { pointsScored: 0, pointsAllowed: 0 };
+        }
+
+        // Add points from this turnover
+        byWeek[week].pointsScored += t.points_scored || 0;
+        byWeek[week].pointsAllowed += t.points_allowed || 0;
+    });
+
+    const netPoints = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { pointsScored: 0, pointsAllowed: 0 };
+        netPoints.push(weekData.pointsScored - weekData.pointsAllowed);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        netPoints: netPoints
+    };
+}
+
+function calculateMiddle8Trends(plays, teamName) {
+    const byWeek = {};
+    plays.filter(p => p.middle_eight === true).forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { scored: 0, allowed: 0 };
+        }
+        if (play.scoring === true) {
+            const points = play.play_type?.includes('Touchdown') ? 7 : (play.play_type?.includes('Field Goal') ? 3 : 0);
+            const isOur = play.offense?.toLowerCase() === teamName.toLowerCase();
+            if (isOur) {
+                byWeek[week].scored += points;
+            } else {
+                byWeek[week].allowed += points;
+            }
+        }
+    });
+
+    const scored = [];
+    const allowed = [];
+    const net = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { scored: 0, allowed: 0 };
+        scored.push(weekData.scored);
+        allowed.push(weekData.allowed);
+        net.push(weekData.scored - weekData.allowed);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        scored: scored,
+        allowed: allowed,
+        net: net
+    };
+}
+
+function calculateExplosiveTrends(plays, teamName) {
+    const byWeek = {};
+    plays.filter(p =>
+        p.explosive_play === true &&
+        p.play_classification !== 'special_teams'
+    ).forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { ours: 0, allowed: 0 };
+        }
+        const isOurs = play.offense?.toLowerCase() === teamName.toLowerCase();
+        if (isOurs) {
+            byWeek[week].ours++;
+        } else {
+            byWeek[week].allowed++;
+        }
+    });
+
+    const ours = [];
+    const allowed = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { ours: 0, allowed: 0 };
+        ours.push(weekData.ours);
+        allowed.push(weekData.allowed);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        ours: ours,
+        allowed: allowed
+    };
+}
+
+function calculateSpecialTeamsExplosiveTrends(plays, teamName) {
+    // Check if special teams play is explosive: 35+ kick return, 20+ punt return
+    function isSpecialTeamsExplosive(play) {
+        if (play.play_classification !== 'special_teams') return false;
+        const pt = (play.play_type || '').toLowerCase();
+        const ptxt = (play.play_text || '').toLowerCase();
+
+        // For returns, we need to parse the return yards from the play text
+        // because yards_gained might include the kick/punt distance
+        function parseReturnYards(playText) {
+            if (!playText) return 0;
+
+            // Look for patterns like "returns for X yds" or "returns for no gain"
+            // Examples:
+            // "returns for 56 yds" -> 56
+            // "returns for no gain" -> 0
+            // "return for 20 yds" -> 20
+            const returnMatch = playText.match(/return[s]? for (?:no gain|(\d+) (?:yd|yard))/i);
+            if (returnMatch) {
+                if (returnMatch[1]) {
+                    return parseInt(returnMatch[1], 10);
+                } else {
+                    return 0; // "no gain"
+                }
+            }
+
+            // Also check for patterns without "for" (e.g., "return 40 yards to the UK40")
+            // This handles CFBD-style play text
+            const returnMatch2 = playText.match(/return (\d+) (?:yd|yard)/i);
+            if (returnMatch2) {
+                return parseInt(returnMatch2[1], 10);
+            }
+
+            // Fallback: if we can't parse, return 0 to be safe
+            return 0;
+        }
+
+        // Kick return: 35+ yards
+        if ((pt.includes('kickoff') || ptxt.includes('kickoff')) && 
+            (pt.includes('return') || ptxt.includes('return'))) {
+            const returnYards = parseReturnYards(play.play_text);
+            return returnYards >= 35;
+        }
+
+        // Punt return: 20+ yards
+        if ((pt.includes('punt') || ptxt.includes('punt')) && 
+            (pt.includes('return') || ptxt.includes('return'))) {
+            const returnYards = parseReturnYards(play.play_text);
+            return returnYards >= 20;
+        }
+
+        return false;
+    }
+
+    const byWeek = {};
+    plays.filter(p => isSpecialTeamsExplosive(p)).forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { ours: 0, allowed: 0 };
+        }
+
+        // For return plays, check defense field (returning team)
+        // For other ST plays, check offense field
+        const playType = (play.play_type || '').toLowerCase();
+        const playText = (play.play_text || '').toLowerCase();
+        const isReturn = (
+            (playType.includes('return') || playText.includes('return')) &&
+            (playType.includes('kickoff') || playText.includes('kickoff') ||
+             playType.includes('punt') || playText.includes('punt'))
+        );
+
+        const isOurs = isReturn 
+            ? (play.defense?.toLowerCase().trim() || '') === (teamName.toLowerCase().trim() || '')
+            : (play.offense?.toLowerCase().trim() || '') === (teamName.toLowerCase().trim() || '');
+
+        if (isOurs) {
+            byWeek[week].ours++;
+        } else {
+            byWeek[week].allowed++;
+        }
+    });
+
+    const ours = [];
+    const allowed = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { ours: 0, allowed: 0 };
+        ours.push(weekData.ours);
+        allowed.push(weekData.allowed);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        ours: ours,
+        allowed: allowed
+    };
+}
+
+function calculatePenaltyTrends(plays, teamName) {
+    const byWeek = {};
+    plays.filter(p => p.penalty_type != null && (p.offense?.toLowerCase() === teamName.toLowerCase() || p.defense?.toLowerCase() === teamName.toLowerCase())).forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = 0;
+        }
+        byWeek[week]++;
+    });
+
+    const values = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        values.push(byWeek[week] || 0);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        values: values
+    };
+}
+
+function extractPenaltyYards(playText, penaltyType) {
+    // Extract penalty yards from play text
+    // First try to find explicit yardage in text
+    const textLower = playText.toLowerCase();
+
+    // Pattern 1: (X yards) or (X yard) in parentheses
+    let matches = textLower.match(/\((\d+)\s*yard/);
+    if (matches) {
+        return parseInt(matches[1]);
+    }
+
+    // Pattern 2: X yards from (distance pattern like "15 yards from")
+    matches = textLower.match(/(\d+)\s*yards?\s+from/);
+    if (matches) {
+        return parseInt(matches[1]);
+    }
+
+    // Pattern 3: Look near 'penalty' keyword
+    const penaltyIdx = textLower.indexOf('penalty');
+    if (penaltyIdx >= 0) {
+        const afterText = textLower.substring(penaltyIdx, penaltyIdx + 50);
+        matches = afterText.match(/(\d+)\s*yard/);
+        if (matches) {
+            return parseInt(matches[1]);
+        }
+    }
+
+    // If no explicit yardage found, use standard penalty yardages based on type
+    const penaltyTypeLower = (penaltyType || '').toLowerCase();
+    if (penaltyTypeLower.includes('personal foul') || 
+        penaltyTypeLower.includes('unsportsmanlike') ||
+        penaltyTypeLower.includes('roughing')) {
+        return 15;
+    } else if (penaltyTypeLower.includes('pass interference')) {
+        return 15; // Can vary, but default to 15
+    } else if (penaltyTypeLower.includes('holding') || 
+               penaltyTypeLower.includes('illegal block')) {
+        return 10;
+    } else if (penaltyTypeLower.includes('false start') ||
+               penaltyTypeLower.includes('offside') ||
+               penaltyTypeLower.includes('delay of game')) {
+        return 5;
+    } else if (penaltyTypeLower.includes('illegal formation') ||
+               penaltyTypeLower.includes('illegal shift')) {
+        return 5;
+    }
+
+    // Default: try to use yards_gained if reasonable (1-20 yards)
+    // Otherwise return 0
+    return 0;
+}
+
+function calculateNetPenaltyYardsByWeek(plays, teamName) {
+    // Calculate net penalty yards per week (team's penalty yards - opponent's penalty yards)
+    // Positive values mean opponent had more penalty yards (good for team)
+    const teamYardsByWeek = {};
+    const opponentYardsByWeek = {};
+
+    // Team name variations for matching in play text
+    const teamNameLower = teamName.toLowerCase();
+    const teamNameShort = teamNameLower.substring(0, 4); // First 4 chars (e.g., "wash", "wisc")
+
+    plays.forEach(play => {
+        if (play.penalty_type == null) return;
+
+        // Only count accepted penalties (check both penalty_decision and penalty_status for PDF data)
+        const decision = play.penalty_decision || play.penalty_status;
+        if (decision !== 'accepted') return;
+
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        const playText = (play.play_text || '').toLowerCase();
+
+        // Extract penalty yards from text (not from yards_gained which includes return yards)
+        const yards = extractPenaltyYards(play.play_text || '', play.penalty_type);
+
+        // Determine which team committed the penalty by checking play text
+        // Look for patterns like team name in penalty text, "PENALTY [TEAM]", etc.
+        let teamCommittedPenalty = false;
+
+        // Check for team name in penalty context - look for patterns:
+        // "PENALTY [TEAM]", "[TEAM] Penalty", etc.
+        const penaltyPatterns = [
+            'penalty ' + teamNameShort,
+            'penalty ' + teamNameLower,
+            teamNameLower + ' penalty',
+            teamNameShort + ' penalty'
+        ];
+
+        for (const pattern of penaltyPatterns) {
+            if (playText.includes(pattern)) {
+                teamCommittedPenalty = true;
+                break;
+            }
+        }
+
+        if (teamCommittedPenalty) {
+            // Team committed penalty
+            if (!teamYardsByWeek[week]) teamYardsByWeek[week] = 0;
+            teamYardsByWeek[week] += yards;
+        } else {
+            // Opponent committed penalty (any penalty that's not explicitly team's)
+            // Only count if there's a penalty mentioned (to avoid double counting)
+            if (playText.includes('penalty')) {
+                if (!opponentYardsByWeek[week]) opponentYardsByWeek[week] = 0;
+                opponentYardsByWeek[week] += yards;
+            }
+        }
+    });
+
+    // Map to weeks and fill in BYE weeks with 0
+    const values = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const teamYards = teamYardsByWeek[week] || 0;
+        const oppYards = opponentYardsByWeek[week] || 0;
+        const netYards = oppYards - teamYards; // Positive = opponent had more (good), negative = team had more (bad)
+        values.push(netYards);
+
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        values: values
+    };
+}
+
+// Helper function to calculate game situation (winning/tied/trailing) for each play
+function calculateGameSituation(plays, teamName) {
+    // Group plays by game
+    const gameKey = (p) => p.game_id != null ? p.game_id : `week_${p.game_week || 0}`;
+    const gameGroups = {};
+    plays.forEach(p => {
+        const key = gameKey(p);
+        if (!gameGroups[key]) gameGroups[key] = [];
+        gameGroups[key].push(p);
+    });
+
+    // For each game, calculate cumulative scores and assign to each play
+    Object.values(gameGroups).forEach(gamePlays => {
+        // Sort plays by period (asc) and clock (desc) to get chronological order
+        gamePlays.sort((a, b) => {
+            if (a.period !== b.period) return a.period - b.period;
+            // Parse clock strings like "15:00" to compare
+            const parseClk = (c) => {
+                if (!c) return 0;
+                const parts = String(c).split(':');
+                return parseInt(parts[0] || 0) * 60 + parseInt(parts[1] || 0);
+            };
+            return parseClk(b.clock) - parseClk(a.clock);  // Higher clock = earlier in period
+        });
+
+        let teamScore = 0;
+        let oppScore = 0;
+
+        gamePlays.forEach(play => {
+            // Store current margin BEFORE this play
+            const isTeamOnOffense = play.offense?.toLowerCase() === teamName.toLowerCase();
+            play._team_margin = teamScore - oppScore;
+
+            // If this is a scoring play, update scores
+            if (play.scoring === true) {
+                const playText = (play.play_text || '').toLowerCase();
+                const playType = (play.play_type || '').toLowerCase();
+                let points = 0;
+
+                // Determine points scored
+                if (playText.includes('touchdown') || playType.includes('touchdown')) {
+                    points = 6;
+                    // Check for PAT
+                    if (playText.includes('kick attempt good') || playText.includes('extra point good')) {
+                        points = 7;
+                    } else if (playText.includes('two-point') && playText.includes('good')) {
+                        points = 8;
+                    }
+                } else if (playText.includes('field goal') && playText.includes('good')) {
+                    points = 3;
+                } else if (playText.includes('safety')) {
+                    points = 2;
+                }
+
+                // Determine who scored (check if offense or defense scored)
+                // For interception/fumble return TDs, the defense scored
+                const isDefensiveTD = playText.includes('interception') && playText.includes('touchdown') ||
+                                     playText.includes('fumble') && playText.includes('return') && playText.includes('touchdown');
+
+                if (isDefensiveTD) {
+                    // Defense scored
+                    if (isTeamOnOffense) {
+                        oppScore += points;
+                    } else {
+                        teamScore += points;
+                    }
+                } else {
+                    // Offense scored
+                    if (isTeamOnOffense) {
+                        teamScore += points;
+                    } else {
+                        oppScore += points;
+                    }
+                }
+            }
+        });
+    });
+
+    return plays;
+}
+
+function calculate4thDownTrends(plays, teamName) {
+    const byWeek = {};
+    plays.filter(p => p.down === 4 && p.offense?.toLowerCase() === teamName.toLowerCase() && !p.play_type?.toLowerCase().includes('punt') && !p.play_type?.toLowerCase().includes('field goal') && !p.play_type?.toLowerCase().includes('kickoff') && !p.play_type?.toLowerCase().includes('timeout') && !(p.no_play === true) && !(p.play_type?.toLowerCase() === 'penalty' && p.play_text?.toLowerCase().includes('no play')) && !p.play_text?.toLowerCase().includes('knee')).forEach(play => {
+        // Use game_week directly if available (PDF data), otherwise lookup from game_id
+        let week = play.game_week;
+        if (!week) {
+            const gameId = play.game_id;
+            if (!gameId) return;
+            week = getWeekForGameId(gameId);
+        }
+        if (!week) return;
+
+        if (!byWeek[week]) {
+            byWeek[week] = { attempts: 0, conversions: 0 };
+        }
+        byWeek[week].attempts++;
+        // Turnovers are never conversions
+        if (!play.turnover) {
+            const playText = play.play_text?.toLowerCase() || '';
+            if (playText.includes('1st down') || playText.includes('first down') || playText.includes('touchdown') || (play.yards_gained >= play.distance)) {
+                byWeek[week].conversions++;
+            }
+        }
+    });
+
+    const attempts = [];
+    const conversions = [];
+    const rates = [];
+    for (let week = 1; week <= masterWeekMapping.maxWeek; week++) {
+        const weekData = byWeek[week] || { attempts: 0, conversions: 0 };
+        attempts.push(weekData.attempts);
+        conversions.push(weekData.conversions);
+        const rate = weekData.attempts > 0 ? (weekData.conversions / weekData.attempts * 100) : 0;
+        rates.push(rate);
+    }
+
+    return {
+        weeks: masterWeekMapping.weekLabels,
+        attempts: attempts,
+        conversions: conversions,
+        rates: rates
+    };
+}
+
+// Initialize filters (no longer needed - removed filter dropdowns)
+function initializeFilters() {
+    // Filters are now simple dropdowns that don't need population
+}
+
+// Helper function to safely update or initialize DataTable
+function safeUpdateDataTable(selector, tableData, config) {
+    try {
+        const $table = $(selector);
+        if (!$table.length) return;
+
+        if ($.fn.DataTable.isDataTable(selector)) {
+            // Table already exists - update data
+            const table = $table.DataTable();
+            table.clear();
+            table.rows.add(tableData);
+            table.draw();
+        } else {
+            // Table doesn't exist - initialize it
+            $table.DataTable(config);
+        }
+    } catch (e) {
+        // Fallback: destroy and recreate
+        try {
+            if ($.fn.DataTable.isDataTable(selector)) {
+                $(selector).DataTable().destroy();
+            }
+            $(selector).DataTable(config);
+        } catch (e2) {
+            // Silently fail if DataTable recreation fails
+        }
+    }
+}
+
+// Virtual-scrolling table for long play lists. The rows are kept as
+// column arrays and only the rows in (or near) the viewport are in the
+// DOM, between two spacer rows; sorting and searching reorder a list of
+// row numbers over the column arrays instead of moving DOM rows.
+// Options follow the DataTables configs used elsewhere: columns
+// ([{ title, visible }]), order ([[column, 'asc' | 'desc'], ...],
+// default first column ascending), scrollY (max height), searching and
+// createdRow(tr, rowData).
+const VIRTUAL_TABLE_OVERSCAN = 10;
+
+function createVirtualTable(table, options) {
+    const columns = options.columns;
+    const shown = columns.map((column, c) => c).filter(c => columns[c].visible !== false);
+    const maxHeight = parseInt(options.scrollY || '400px', 10);
+    let order = options.order || [[0, 'asc']];
+    let columnValues = columns.map(() => []);
+    let sorted = [];        // row numbers in sort order
+    let rows = [];          // row numbers shown (sorted, matching the search)
+    let searchText = null;  // lower-case text of each row, built on the first search
+    let query = '';
+    let rowHeight = 0;
+    let rendered = null;
+
+    const viewport = document.createElement('div');
+    viewport.className = 'virtual-table-viewport';
+    viewport.style.maxHeight = `${maxHeight}px`;
+    table.parentNode.insertBefore(viewport, table);
+    viewport.appendChild(table);
+    table.classList.add('virtual-table');
+    viewport.addEventListener('scroll', () => render());
+
+    if (options.searching) {
+        const search = document.createElement('input');
+        search.type = 'search';
+        search.className = 'virtual-table-search';
+        search.placeholder = 'Search plays...';
+        search.addEventListener('input', () => {
+            query = search.value.trim().toLowerCase();
+            applySearch();
+        });
+        viewport.parentNode.insertBefore(search, viewport);
+    }
+
+    const colgroup = document.createElement('colgroup');
+    const thead = document.createElement('thead');
+    const headerRow = thead.insertRow();
+    const headers = shown.map(c => {
+        colgroup.appendChild(document.createElement('col'));
+        const th = document.createElement('th');
+        th.textContent = columns[c].title;
+        th.title = columns[c].title;
+        th.addEventListener('click', () => {
+            const dir = order[0][0] === c && order[0][1] === 'asc' ? 'desc' : 'asc';
+            order = [[c, dir]];
+            applySort();
+        });
+        headerRow.appendChild(th);
+        return th;
+    });
+    const tbody = document.createElement('tbody');
+    table.replaceChildren(colgroup, thead, tbody);
+
+    // Empty values sort first; numbers (and numeric strings) numerically
+    function compareValues(a, b) {
+        const emptyA = a === '' || a == null;
+        const emptyB = b === '' || b == null;
+        if (emptyA || emptyB) return emptyA === emptyB ? 0 : (emptyA ? -1 : 1);
+        const numA = Number(a);
+        const numB = Number(b);
+        if (!Number.isNaN(numA) && !Number.isNaN(numB)) return numA - numB;
+        const strA = String(a);
+        const strB = String(b);
+        return strA < strB ? -1 : (strA > strB ? 1 : 0);
+    }
+
+    function applySort() {
+        sorted = columnValues[0].map((value, i) => i);
+        sorted.sort((i, j) => {
+            for (const [c, dir] of order) {
+                const result = compareValues(columnValues[c][i], columnValues[c][j]);
+                if (result !== 0) return dir === 'desc' ? -result : result;
+            }
+            return i - j;
+        });
+        headers.forEach((th, k) => {
+            th.classList.toggle('sort-asc', order[0][0] === shown[k] && order[0][1] === 'asc');
+            th.classList.toggle('sort-desc', order[0][0] === shown[k] && order[0][1] === 'desc');
+        });
+        applySearch();
+    }
+
+    function applySearch() {
+        if (query) {
+            if (!searchText) {
+                searchText = columnValues[0].map((value, i) =>
+                    shown.map(c => columnValues[c][i] == null ? '' : String(columnValues[c][i])).join(' ').toLowerCase());
+            }
+            rows = sorted.filter(i => searchText[i].includes(query));
+        } else {
+            rows = sorted;
+        }
+        viewport.scrollTop = 0;
+        rendered = null;
+        render();
+    }
+
+    function spacerRow(height) {
+        const tr = document.createElement('tr');
+        const td = tr.insertCell();
+        td.className = 'virtual-table-spacer';
+        td.colSpan = shown.length;
+        td.style.height = `${height}px`;
+        return tr;
+    }
+
+    function render() {
+        const height = rowHeight || 32;
+        const viewHeight = viewport.clientHeight || maxHeight;
+        const first = Math.max(0, Math.floor(viewport.scrollTop / height) - VIRTUAL_TABLE_OVERSCAN);
+        const last = Math.min(rows.length, Math.ceil((viewport.scrollTop + viewHeight) / height) + VIRTUAL_TABLE_OVERSCAN);
+        if (rendered && rendered[0] === first && rendered[1] === last) return;
+        rendered = [first, last];
+
+        const fragment = document.createDocumentFragment();
+        if (!rows.length) {
+            const td = fragment.appendChild(document.createElement('tr')).insertCell();
+            td.colSpan = shown.length;
+            td.textContent = 'No data available in table';
+        }
+        fragment.appendChild(spacerRow(first * height));
+        for (let k = first; k < last; k++) {
+            const i = rows[k];
+            const tr = document.createElement('tr');
+            if (k % 2) tr.className = 'virtual-table-stripe';
+            shown.forEach(c => {
+                const value = columnValues[c][i];
+                const td = tr.insertCell();
+                td.textContent = value == null ? '' : value;
+                if (td.textContent.length > 30) td.title = td.textContent;
+            });
+            if (options.createdRow) options.createdRow(tr, columnValues.map(values => values[i]));
+            fragment.appendChild(tr);
+        }
+        fragment.appendChild(spacerRow((rows.length - last) * height));
+        tbody.replaceChildren(fragment);
+
+        // Row height is measured once the table is visible
+        if (!rowHeight && last > first && tbody.rows[1].offsetHeight) {
+            rowHeight = tbody.rows[1].offsetHeight;
+            rendered = null;
+            render();
+        }
+    }
+
+    // Column widths from the longest value of each column (in characters)
+    function sizeColumns() {
+        let total = 0;
+        shown.forEach((c, k) => {
+            let width = columns[c].title.length;
+            columnValues[c].forEach(value => {
+                if (value != null && String(value).length > width) width = String(value).length;
+            });
+            width = Math.min(60, Math.max(4, width)) + 2;
+            colgroup.children[k].style.width = `${width}ch`;
+            total += width;
+        });
+        table.style.minWidth = `${total}ch`;
+    }
+
+    return {
+        // values: one array per column (same row numbering)
+        setColumns(values) {
+            columnValues = values;
+            searchText = null;
+            sizeColumns();
+            applySort();
+        },
+        // data: DataTables-style row arrays
+        setRows(data) {
+            this.setColumns(columns.map((column, c) => data.map(row => row[c])));
+        }
+    };
+}
+
+// Drop-in replacement for safeUpdateDataTable for long play tables
+function updateVirtualTable(selector, tableData, config) {
+    const table = document.querySelector(selector);
+    if (!table) return;
+    if (!table._virtualTable) {
+        table._virtualTable = createVirtualTable(table, config);
+    }
+    table._virtualTable.setRows(tableData);
+}
+
+// Filter functions
+function getFilters() {
+    return {
+        conference_only: document.getElementById('conferenceFilter').value === 'conference',
+        non_conference_only: document.getElementById('conferenceFilter').value === 'non-conference',
+        power4_only: document.getElementById('conferenceFilter').value === 'power4',
+        last_3_games: document.getElementById('timePeriodFilter').value === 'last3'
+    };
+}
+
+// Analysis functions (simplified versions that run in browser)
+// Note: For full analysis, we'd need to run the Python scripts and embed results
+// For now, we'll do basic filtering and display
+
+function populateMiddleEight() {
+    const team1 = allData[team1Key].middle8;
+    const team2 = allData[team2Key].middle8;
+
+    // Summary cards
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card">
+                        <h3>Points Scored</h3>
+                        <div class="value">${team1.total_points_scored}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Points Allowed</h3>
+                        <div class="value">${team1.total_points_allowed}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Net Points</h3>
+                        <div class="value">${team1.total_net_points}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Avg Net/Game</h3>
+                        <div class="value">${team1.avg_net_per_game.toFixed(1)}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Last 3 Net</h3>
+                        <div class="value">${team1.last_3_games?.net_points || 0}</div>
+                    </div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card">
+                        <h3>Points Scored</h3>
+                        <div class="value">${team2.total_points_scored}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Points Allowed</h3>
+                        <div class="value">${team2.total_points_allowed}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Net Points</h3>
+                        <div class="value">${team2.total_net_points}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Avg Net/Game</h3>
+                        <div class="value">${team2.avg_net_per_game.toFixed(1)}</div>
+                    </div>
+                    <div class="summary-card">
+                        <h3>Last 3 Net</h3>
+                        <div class="value">${team2.last_3_games?.net_points || 0}</div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('middleEightSummary').innerHTML = summaryHtml;
+
+    // Chart
+    const ctx = document.getElementById('middleEightChart').getContext('2d');
+    renderChart('middleEight', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Points Scored', 'Points Allowed', 'Net Points'],
+            datasets: [
+                {
+                    label: team1Name,
+                    data: [team1.total_points_scored, team1.total_points_allowed, team1.total_net_points],
+                    backgroundColor: teamRgba(team1Color, 0.6)
+                },
+                {
+                    label: team2Name,
+                    data: [team2.total_points_scored, team2.total_points_allowed, team2.total_net_points],
+                    backgroundColor: teamRgba(team2Color, 0.6)
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false
+        }
+    });
+
+    // Trend chart - net points by week (use filtered plays if available)
+    const team1PlaysForTrend = typeof allData[team1Key].middle8._filtered_plays !== 'undefined' ? 
+        allData[team1Key].middle8._filtered_plays : team1Plays;
+    const team2PlaysForTrend = typeof allData[team2Key].middle8._filtered_plays !== 'undefined' ? 
+        allData[team2Key].middle8._filtered_plays : team2Plays;
+    const team1Trends = calculateMiddle8Trends(team1PlaysForTrend, team1Name);
+    const team2Trends = calculateMiddle8Trends(team2PlaysForTrend, team2Name);
+
+    // Trend functions already return data for all weeks (1 to maxWeek), including BYE weeks with 0
+    const allWeeks = team1Trends.weeks;
+    const team1NetPointsAllWeeks = team1Trends.net;
+    const team2NetPointsAllWeeks = team2Trends.net;
+
+    const ctxTrend = document.getElementById('middleEightTrendChart').getContext('2d');
+    renderChart('middleEightTrend', ctxTrend, {
+        type: 'line',
+        data: {
+            labels: allWeeks,
+            datasets: [
+                { label: team1Name + ' Net Points', data: team1NetPointsAllWeeks, borderColor: teamRgba(team1Color, 1.0), backgroundColor: teamRgba(team1Color, 0.1), fill: true },
+                { label: team2Name + ' Net Points', data: team2NetPointsAllWeeks, borderColor: teamRgba(team2Color, 1.0), backgroundColor: teamRgba(team2Color, 0.1), fill: true }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false, 
+            scales: { 
+                y: { 
+                    beginAtZero: false,
+                    ticks: {
+                        callback: function(value) {
+                            return value;
+                        }
+                    }
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: 'Middle 8 Net Points by Week' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const value = context.parsed.y;
+                            const sign = value >= 0 ? '+' : '';
+                            const week = context.dataIndex + 1;
+                            const teamName = context.dataset.label.includes(team1Name) ? team1Name : team2Name;
+                            const opponent = teamName === team1Name ? 
+                                (masterWeekMapping.team1WeekToOpponent[week] || 'BYE') : 
+                                (masterWeekMapping.team2WeekToOpponent[week] || 'BYE');
+                            return context.dataset.label + ': ' + sign + value + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                        }
+                    }
+                }
+            } 
+        }
+    });
+
+    // Tables - separate for each team (sort chronologically)
+    const washSorted = sortDrivesChronologically(team1.scoring_drives);
+    const washTableData = washSorted.map(d => [
+        d.game_week || '',
+        d.opponent || '',
+        d.scoring_team || (d.is_offense ? team1Name : (d.opponent || '')),
+        d.drive_number || '',
+        d.period || '',
+        formatClock(d.clock || ''),
+        d.play_type || '',
+        d.points || 0,
+        d.play_text || '',
+        d.scoring_team || (d.is_offense ? team1Name : (d.opponent || ''))  // Store scoring team for row class
+    ]);
+    const wiscSorted = sortDrivesChronologically(team2.scoring_drives);
+    const wiscTableData = wiscSorted.map(d => [
+        d.game_week || '',
+        d.opponent || '',
+        d.scoring_team || (d.is_offense ? team2Name : (d.opponent || '')),
+        d.drive_number || '',
+        d.period || '',
+        formatClock(d.clock || ''),
+        d.play_type || '',
+        d.points || 0,
+        d.play_text || '',
+        d.scoring_team || (d.is_offense ? team2Name : (d.opponent || ''))  // Store scoring team for row class
+    ]);
+
+    const washMiddle8Config = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' },
+            { title: 'Opponent' },
+            { title: 'Scoring Team' },
+            { title: 'Drive' },
+            { title: 'Period' },
+            { title: 'Clock' },
+            { title: 'Result' },
+            { title: 'Points' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for scoring team check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const scoringTeam = data[9]; // Last column (hidden, index 9)
+            if (scoringTeam && scoringTeam.toLowerCase() !== team1Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#middleEightTableWash', washTableData, washMiddle8Config);
+
+    const wiscMiddle8Config = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' },
+            { title: 'Opponent' },
+            { title: 'Scoring Team' },
+            { title: 'Drive' },
+            { title: 'Period' },
+            { title: 'Clock' },
+            { title: 'Result' },
+            { title: 'Points' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for scoring team check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const scoringTeam = data[9]; // Last column (hidden, index 9)
+            if (scoringTeam && scoringTeam.toLowerCase() !== team2Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#middleEightTableWisc', wiscTableData, wiscMiddle8Config);
+}
+
+function populateExplosivePlays() {
+    const team1 = allData[team1Key].explosive;
+    const team2 = allData[team2Key].explosive;
+
+    // If total_runs/total_passes don't exist (from Python data), calculate them from plays
+    if (typeof team1.total_runs === 'undefined' && team1.plays) {
+        team1.total_runs = team1.plays.filter(p => {
+            const pt = (p.play_type || '').toLowerCase();
+            return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+        }).length;
+        team1.total_passes = team1.plays.filter(p => {
+            const pt = (p.play_type || '').toLowerCase();
+            return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+        }).length;
+    }
+    if (typeof team2.total_runs === 'undefined' && team2.plays) {
+        team2.total_runs = team2.plays.filter(p => {
+            const pt = (p.play_type || '').toLowerCase();
+            return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+        }).length;
+        team2.total_passes = team2.plays.filter(p => {
+            const pt = (p.play_type || '').toLowerCase();
+            return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+        }).length;
+    }
+
+    // Calculate allowed explosive plays stats
+    const team1PlaysForAllowed = typeof allData[team1Key].explosive._filtered_plays !== 'undefined' ? 
+        allData[team1Key].explosive._filtered_plays : team1Plays;
+    const team2PlaysForAllowed = typeof allData[team2Key].explosive._filtered_plays !== 'undefined' ? 
+        allData[team2Key].explosive._filtered_plays : team2Plays;
+
+    // Calculate allowed explosive plays (by opponent, excluding special teams)
+    const washAllowedPlays = team1PlaysForAllowed.filter(p => 
+        p.explosive_play === true && 
+        p.offense?.toLowerCase() !== team1Name.toLowerCase() &&
+        p.play_classification !== 'special_teams'
+    );
+    const wiscAllowedPlays = team2PlaysForAllowed.filter(p => 
+        p.explosive_play === true && 
+        p.offense?.toLowerCase() !== team2Name.toLowerCase() &&
+        p.play_classification !== 'special_teams'
+    );
+
+    // Use game_week as fallback for PDF data (game_id is null)
+    const getGameKey = (p) => p.game_id != null ? p.game_id : `week_${p.game_week || 0}`;
+
+    // Calculate allowed stats
+    const washAllowedTotal = washAllowedPlays.length;
+    const washAllowedGames = new Set(washAllowedPlays.map(getGameKey)).size;
+    const washAllowedPerGame = washAllowedGames > 0 ? washAllowedTotal / washAllowedGames : 0;
+
+    // Calculate allowed runs and passes
+    const washAllowedRuns = washAllowedPlays.filter(p => {
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+    }).length;
+    const washAllowedPasses = washAllowedPlays.filter(p => {
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+    }).length;
+
+    // Last 3 games allowed
+    const washGameKeys = [...new Set(washAllowedPlays.map(getGameKey))].map(gkey => ({
+        id: gkey,
+        week: washAllowedPlays.find(p => getGameKey(p) === gkey)?.game_week || 0
+    })).filter(g => g.week > 0).sort((a, b) => a.week - b.week);
+    const washLast3GameKeys = washGameKeys.slice(-3).map(g => g.id);
+    const washAllowedLast3 = washAllowedPlays.filter(p => washLast3GameKeys.includes(getGameKey(p))).length;
+    const washAllowedLast3Runs = washAllowedPlays.filter(p => {
+        if (!washLast3GameKeys.includes(getGameKey(p))) return false;
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+    }).length;
+    const washAllowedLast3Passes = washAllowedPlays.filter(p => {
+        if (!washLast3GameKeys.includes(getGameKey(p))) return false;
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+    }).length;
+
+    const wiscAllowedTotal = wiscAllowedPlays.length;
+    const wiscAllowedGames = new Set(wiscAllowedPlays.map(getGameKey)).size;
+    const wiscAllowedPerGame = wiscAllowedGames > 0 ? wiscAllowedTotal / wiscAllowedGames : 0;
+
+    // Calculate allowed runs and passes
+    const wiscAllowedRuns = wiscAllowedPlays.filter(p => {
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+    }).length;
+    const wiscAllowedPasses = wiscAllowedPlays.filter(p => {
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+    }).length;
+
+    const wiscGameKeys = [...new Set(wiscAllowedPlays.map(getGameKey))].map(gkey => ({
+        id: gkey,
+        week: wiscAllowedPlays.find(p => getGameKey(p) === gkey)?.game_week || 0
+    })).filter(g => g.week > 0).sort((a, b) => a.week - b.week);
+    const wiscLast3GameKeys = wiscGameKeys.slice(-3).map(g => g.id);
+    const wiscAllowedLast3 = wiscAllowedPlays.filter(p => wiscLast3GameKeys.includes(getGameKey(p))).length;
+    const wiscAllowedLast3Runs = wiscAllowedPlays.filter(p => {
+        if (!wiscLast3GameKeys.includes(getGameKey(p))) return false;
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('rush') || pt.includes('run') || pt === 'sack';
+    }).length;
+    const wiscAllowedLast3Passes = wiscAllowedPlays.filter(p => {
+        if (!wiscLast3GameKeys.includes(getGameKey(p))) return false;
+        const pt = (p.play_type || '').toLowerCase();
+        return pt.includes('pass') || pt.includes('reception') || pt.includes('incompletion') || pt.includes('interception');
+    }).length;
+
+    // Field position breakdown for team 1 (using team1.plays which are the team's offensive explosives)
+    const team1FieldPos = {
+        ownDeep: team1.plays.filter(p => p.yards_to_goal > 75).length,
+        ownMid: team1.plays.filter(p => p.yards_to_goal > 50 && p.yards_to_goal <= 75).length,
+        oppMid: team1.plays.filter(p => p.yards_to_goal > 25 && p.yards_to_goal <= 50).length,
+        redZone: team1.plays.filter(p => p.yards_to_goal <= 25 && p.yards_to_goal > 0).length
+    };
+    const team1FieldTotal = team1.plays.length || 1;
+
+    const team2FieldPos = {
+        ownDeep: team2.plays.filter(p => p.yards_to_goal > 75).length,
+        ownMid: team2.plays.filter(p => p.yards_to_goal > 50 && p.yards_to_goal <= 75).length,
+        oppMid: team2.plays.filter(p => p.yards_to_goal > 25 && p.yards_to_goal <= 50).length,
+        redZone: team2.plays.filter(p => p.yards_to_goal <= 25 && p.yards_to_goal > 0).length
+    };
+    const team2FieldTotal = team2.plays.length || 1;
+
+    // Summary
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total</h3><div class="value">${team1.total_explosive_plays}</div></div>
+                    <div class="summary-card"><h3>Per Game</h3><div class="value">${team1.avg_per_game.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Runs</h3><div class="value">${team1.total_runs || 0}</div></div>
+                    <div class="summary-card"><h3>Passes</h3><div class="value">${team1.total_passes || 0}</div></div>
+                    <div class="summary-card"><h3>Allowed Total</h3><div class="value">${washAllowedTotal}</div></div>
+                    <div class="summary-card"><h3>Allowed Per Game</h3><div class="value">${washAllowedPerGame.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Allowed Runs</h3><div class="value">${washAllowedRuns}</div></div>
+                    <div class="summary-card"><h3>Allowed Passes</h3><div class="value">${washAllowedPasses}</div></div>
+                    <div class="summary-card"><h3>Total Last 3</h3><div class="value">${team1.last_3_games.total}</div></div>
+                    <div class="summary-card"><h3>Allowed Last 3</h3><div class="value">${washAllowedLast3}</div></div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total</h3><div class="value">${team2.total_explosive_plays}</div></div>
+                    <div class="summary-card"><h3>Per Game</h3><div class="value">${team2.avg_per_game.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Runs</h3><div class="value">${team2.total_runs || 0}</div></div>
+                    <div class="summary-card"><h3>Passes</h3><div class="value">${team2.total_passes || 0}</div></div>
+                    <div class="summary-card"><h3>Allowed Total</h3><div class="value">${wiscAllowedTotal}</div></div>
+                    <div class="summary-card"><h3>Allowed Per Game</h3><div class="value">${wiscAllowedPerGame.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Allowed Runs</h3><div class="value">${wiscAllowedRuns}</div></div>
+                    <div class="summary-card"><h3>Allowed Passes</h3><div class="value">${wiscAllowedPasses}</div></div>
+                    <div class="summary-card"><h3>Total Last 3</h3><div class="value">${team2.last_3_games.total}</div></div>
+                    <div class="summary-card"><h3>Allowed Last 3</h3><div class="value">${wiscAllowedLast3}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('explosivePlaysSummary').innerHTML = summaryHtml;
+
+    // Field position breakdown - football field visualization
+    const fieldPosHtml = `
+        <div class="team-comparison" style="margin-top: 20px;">
+            <div class="team-section ${team1Key}">
+                <h4 style="margin-bottom: 10px;">Explosive Play Field Position</h4>
+                <div class="field-container">
+                    <div class="field-zone zone-own-deep">
+                        <div class="zone-label">OWN 1-24</div>
+                        <div class="zone-value">${team1FieldPos.ownDeep}</div>
+                        <div class="zone-pct">${(team1FieldPos.ownDeep/team1FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-own-mid">
+                        <div class="zone-label">OWN 25-49</div>
+                        <div class="zone-value">${team1FieldPos.ownMid}</div>
+                        <div class="zone-pct">${(team1FieldPos.ownMid/team1FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-opp-mid">
+                        <div class="zone-label">OPP 26-50</div>
+                        <div class="zone-value">${team1FieldPos.oppMid}</div>
+                        <div class="zone-pct">${(team1FieldPos.oppMid/team1FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-red">
+                        <div class="zone-label">RED ZONE</div>
+                        <div class="zone-value">${team1FieldPos.redZone}</div>
+                        <div class="zone-pct">${(team1FieldPos.redZone/team1FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-endzone">
+                        <div class="zone-label" style="font-size:9px;">END</div>
+                    </div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h4 style="margin-bottom: 10px;">Explosive Play Field Position</h4>
+                <div class="field-container">
+                    <div class="field-zone zone-own-deep">
+                        <div class="zone-label">OWN 1-24</div>
+                        <div class="zone-value">${team2FieldPos.ownDeep}</div>
+                        <div class="zone-pct">${(team2FieldPos.ownDeep/team2FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-own-mid">
+                        <div class="zone-label">OWN 25-49</div>
+                        <div class="zone-value">${team2FieldPos.ownMid}</div>
+                        <div class="zone-pct">${(team2FieldPos.ownMid/team2FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-opp-mid">
+                        <div class="zone-label">OPP 26-50</div>
+                        <div class="zone-value">${team2FieldPos.oppMid}</div>
+                        <div class="zone-pct">${(team2FieldPos.oppMid/team2FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-red">
+                        <div class="zone-label">RED ZONE</div>
+                        <div class="zone-value">${team2FieldPos.redZone}</div>
+                        <div class="zone-pct">${(team2FieldPos.redZone/team2FieldTotal*100).toFixed(0)}%</div>
+                    </div>
+                    <div class="field-zone zone-endzone">
+                        <div class="zone-label" style="font-size:9px;">END</div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('explosiveFieldPositionSummary').innerHTML = fieldPosHtml;
+
+    // Chart
+    const ctx = document.getElementById('explosivePlaysChart').getContext('2d');
+    renderChart('explosive', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Season Total', 'Per Game', 'Last 3 Games'],
+            datasets: [
+                {
+                    label: team1Name,
+                    data: [team1.total_explosive_plays, team1.avg_per_game, team1.last_3_games.total],
+                    backgroundColor: teamRgba(team1Color, 0.6)
+                },
+                {
+                    label: team2Name,
+                    data: [team2.total_explosive_plays, team2.avg_per_game, team2.last_3_games.total],
+                    backgroundColor: teamRgba(team2Color, 0.6)
+                }
+            ]
+        },
+        options: { responsive: true, maintainAspectRatio: false }
+    });
+
+    // Trend charts - split into two stacked bar charts (one per team)
+    const team1PlaysForTrend = typeof allData[team1Key].explosive._filtered_plays !== 'undefined' ? 
+        allData[team1Key].explosive._filtered_plays : team1Plays;
+    const team2PlaysForTrend = typeof allData[team2Key].explosive._filtered_plays !== 'undefined' ? 
+        allData[team2Key].explosive._filtered_plays : team2Plays;
+    const team1Trends = calculateExplosiveTrends(team1PlaysForTrend, team1Name);
+    const team2Trends = calculateExplosiveTrends(team2PlaysForTrend, team2Name);
+
+    // Team 1 line chart
+    const ctxTrendWash = document.getElementById('explosivePlaysTrendChartWash').getContext('2d');
+    renderChart('explosiveTrendWash', ctxTrendWash, {
+        type: 'line',
+        data: {
+            labels: team1Trends.weeks,
+            datasets: [
+                {
+                    label: team1Name,
+                    data: team1Trends.ours,
+                    borderColor: teamRgba(team1Color, 1.0),
+                    backgroundColor: teamRgba(team1Color, 0.1),
+                    fill: true,
+                    tension: 0.1
+                },
+                {
+                    label: 'Allowed',
+                    data: team1Trends.allowed,
+                    borderColor: 'rgba(128, 128, 128, 1)',
+                    backgroundColor: 'rgba(128, 128, 128, 0.1)',
+                    fill: true,
+                    tension: 0.1
+                }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            scales: { 
+                y: { 
+                    beginAtZero: true
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: team1Name + ' - Explosive Plays by Week' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const label = context.dataset.label || '';
+                            const value = context.parsed.y;
+                            const week = context.dataIndex + 1;
+                            const opponent = masterWeekMapping.team1WeekToOpponent[week] || 'BYE';
+                            return label + ': ' + value + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Team 2 line chart
+    const ctxTrendWisc = document.getElementById('explosivePlaysTrendChartWisc').getContext('2d');
+    renderChart('explosiveTrendWisc', ctxTrendWisc, {
+        type: 'line',
+        data: {
+            labels: team2Trends.weeks,
+            datasets: [
+                {
+                    label: team2Name,
+                    data: team2Trends.ours,
+                    borderColor: teamRgba(team2Color, 1.0),
+                    backgroundColor: teamRgba(team2Color, 0.1),
+                    fill: true,
+                    tension: 0.1
+                },
+                {
+                    label: 'Allowed',
+                    data: team2Trends.allowed,
+                    borderColor: 'rgba(128, 128, 128, 1)',
+                    backgroundColor: 'rgba(128, 128, 128, 0.1)',
+                    fill: true,
+                    tension: 0.1
+                }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            scales: { 
+                y: { 
+                    beginAtZero: true
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: team2Name + ' - Explosive Plays by Week' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const label = context.dataset.label || '';
+                            const value = context.parsed.y;
+                            const week = context.dataIndex + 1;
+                            const opponent = masterWeekMapping.team2WeekToOpponent[week] || 'BYE';
+                            return label + ': ' + value + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Run vs Pass Bar Charts - side by side (with Team Name and Allowed)
+    const ctxRunPassWash = document.getElementById('explosiveRunPassChartWash').getContext('2d');
+    renderChart('explosiveRunPassWash', ctxRunPassWash, {
+        type: 'bar',
+        data: {
+            labels: ['Runs', 'Passes'],
+            datasets: [
+                {
+                    label: team1Name,
+                    data: [team1.total_runs || 0, team1.total_passes || 0],
+                    backgroundColor: [teamRgba(team1Color, 0.6), teamRgba(team1Color, 0.4)]
+                },
+                {
+                    label: 'Allowed',
+                    data: [washAllowedRuns, washAllowedPasses],
+                    backgroundColor: ['rgba(128, 128, 128, 0.6)', 'rgba(128, 128, 128, 0.4)']
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team1Name + ' - Run vs Pass Explosives', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { y: { beginAtZero: true } }
+        }
+    });
+
+    const ctxRunPassWisc = document.getElementById('explosiveRunPassChartWisc').getContext('2d');
+    renderChart('explosiveRunPassWisc', ctxRunPassWisc, {
+        type: 'bar',
+        data: {
+            labels: ['Runs', 'Passes'],
+            datasets: [
+                {
+                    label: team2Name,
+                    data: [team2.total_runs || 0, team2.total_passes || 0],
+                    backgroundColor: [teamRgba(team2Color, 0.6), teamRgba(team2Color, 0.4)]
+                },
+                {
+                    label: 'Allowed',
+                    data: [wiscAllowedRuns, wiscAllowedPasses],
+                    backgroundColor: ['rgba(128, 128, 128, 0.6)', 'rgba(128, 128, 128, 0.4)']
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team2Name + ' - Run vs Pass Explosives', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { y: { beginAtZero: true } }
+        }
+    });
+
+    // Tables - separate for each team (sort chronologically)
+    const washSorted = sortPlaysChronologically(team1.plays);
+    const washTableData = washSorted.map(p => [
+        p.game_week || '',
+        p.opponent || '',
+        p.period || '',
+        formatClock(p.clock || ''),
+        p.down || '',
+        p.distance || '',
+        p.play_type || '',
+        p.yards_gained || 0,
+        p.ppa ? p.ppa.toFixed(2) : '',
+        p.play_text || '',
+        p.offense || ''  // Store offense for row class
+    ]);
+    const wiscSorted = sortPlaysChronologically(team2.plays);
+    const wiscTableData = wiscSorted.map(p => [
+        p.game_week || '',
+        p.opponent || '',
+        p.period || '',
+        formatClock(p.clock || ''),
+        p.down || '',
+        p.distance || '',
+        p.play_type || '',
+        p.yards_gained || 0,
+        p.ppa ? p.ppa.toFixed(2) : '',
+        p.play_text || '',
+        p.offense || ''  // Store offense for row class
+    ]);
+
+    const washExplosiveConfig = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' },
+            { title: 'Clock' }, { title: 'Down' }, { title: 'Distance' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'PPA' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for offense check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const offense = data[10]; // Last column (hidden)
+            if (offense && offense.toLowerCase() !== team1Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    updateVirtualTable('#explosivePlaysTableWash', washTableData, washExplosiveConfig);
+
+    const wiscExplosiveConfig = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' },
+            { title: 'Clock' }, { title: 'Down' }, { title: 'Distance' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'PPA' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for offense check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const offense = data[10]; // Last column (hidden)
+            if (offense && offense.toLowerCase() !== team2Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    updateVirtualTable('#explosivePlaysTableWisc', wiscTableData, wiscExplosiveConfig);
+}
+
+function populatePenalties() {
+    const team1 = allData[team1Key].penalties;
+    const team2 = allData[team2Key].penalties;
+
+    // Debug logging
+    console.log('populatePenalties DEBUG:', {
+        team1Key: team1Key,
+        team2Key: team2Key,
+        team1Accepted: team1?.accepted,
+        team2Accepted: team2?.accepted,
+        team1Total: team1?.total_penalties,
+        team2Total: team2?.total_penalties
+    });
+
+    // Calculate yards per game
+    const washYardsPerGame = team1.total_games > 0 ? (team1.total_penalty_yards || 0) / team1.total_games : 0;
+    const wiscYardsPerGame = team2.total_games > 0 ? (team2.total_penalty_yards || 0) / team2.total_games : 0;
+
+    // Calculate last 3 yards per game
+    const washLast3Games = (team1.last_3_games?.games?.length || 0);
+    const washLast3YardsPerGame = washLast3Games > 0 ? (team1.last_3_games?.yards || 0) / washLast3Games : 0;
+    const wiscLast3Games = (team2.last_3_games?.games?.length || 0);
+    const wiscLast3YardsPerGame = wiscLast3Games > 0 ? (team2.last_3_games?.yards || 0) / wiscLast3Games : 0;
+
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Accepted</h3><div class="value">${team1.accepted}</div></div>
+                    <div class="summary-card"><h3>Penalty Yards/G</h3><div class="value">${washYardsPerGame.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Accepted/G</h3><div class="value">${team1.avg_per_game.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Last 3 Yards/G</h3><div class="value">${washLast3YardsPerGame.toFixed(1)}</div></div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Accepted</h3><div class="value">${team2.accepted}</div></div>
+                    <div class="summary-card"><h3>Penalty Yards/G</h3><div class="value">${wiscYardsPerGame.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Accepted/G</h3><div class="value">${team2.avg_per_game.toFixed(1)}</div></div>
+                    <div class="summary-card"><h3>Last 3 Yards/G</h3><div class="value">${wiscLast3YardsPerGame.toFixed(1)}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    // Calculate Pass Interference drawn by each team
+    // PI drawn = when team is on offense and opponent defense commits PI
+    let team1PIDrawn = 0;
+    let team1PIDrawnYards = 0;
+    let team2PIDrawn = 0;
+    let team2PIDrawnYards = 0;
+
+    team1Plays.forEach(p => {
+        const penaltyType = (p.penalty_type || '').toUpperCase();
+        if ((penaltyType.includes('PASS INTERFERENCE') || penaltyType.includes('PI')) &&
+            (p.offense || '').toUpperCase() === team1Name.toUpperCase()) {
+            // Check both penalty_decision (API data) and penalty_status (PDF data)
+            const decision = p.penalty_decision || p.penalty_status;
+            if (decision === 'accepted') {
+                team1PIDrawn++;
+                // Use penalty_yards field, fall back to yards_gained
+                team1PIDrawnYards += Math.abs(p.penalty_yards || p.yards_gained || 0);
+            }
+        }
+    });
+
+    team2Plays.forEach(p => {
+        const penaltyType = (p.penalty_type || '').toUpperCase();
+        if ((penaltyType.includes('PASS INTERFERENCE') || penaltyType.includes('PI')) &&
+            (p.offense || '').toUpperCase() === team2Name.toUpperCase()) {
+            // Check both penalty_decision (API data) and penalty_status (PDF data)
+            const decision = p.penalty_decision || p.penalty_status;
+            if (decision === 'accepted') {
+                team2PIDrawn++;
+                // Use penalty_yards field, fall back to yards_gained
+                team2PIDrawnYards += Math.abs(p.penalty_yards || p.yards_gained || 0);
+            }
+        }
+    });
+
+    // Add PI drawn note and penalty yards warning to summary
+    const piDrawnNote = `
+        <div class="insight-box" style="background-color: #e7f3ff; border-left: 4px solid #0066cc; margin-top: 20px;">
+            <h4>Pass Interference Drawn by Offense:</h4>
+            <p><strong>${team1Name}:</strong> ${team1PIDrawn} PI penalties drawn (${team1PIDrawnYards} yards, ${(team1PIDrawn / (team1.total_games || 1)).toFixed(1)}/game)</p>
+            <p><strong>${team2Name}:</strong> ${team2PIDrawn} PI penalties drawn (${team2PIDrawnYards} yards, ${(team2PIDrawn / (team2.total_games || 1)).toFixed(1)}/game)</p>
+            <p style="margin-top: 10px; font-size: 0.9em;"><em>Note: This counts defensive pass interference penalties committed by opponents when the team was on offense.</em></p>
+        </div>
+    `;
+
+    document.getElementById('penaltySummary').innerHTML = summaryHtml + piDrawnNote;
+
+    const ctx = document.getElementById('penaltyChart').getContext('2d');
+    renderChart('penalties', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Accepted', 'Penalty Yards/G'],
+            datasets: [
+                { label: team1Name, data: [team1.accepted, washYardsPerGame], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [team2.accepted, wiscYardsPerGame], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { responsive: true, maintainAspectRatio: false }
+    });
+
+    // Trend chart - net penalty yards per week
+    const team1PlaysForTrend = typeof allData[team1Key].penalties._filtered_plays !== 'undefined' ? 
+        allData[team1Key].penalties._filtered_plays : team1Plays;
+    const team2PlaysForTrend = typeof allData[team2Key].penalties._filtered_plays !== 'undefined' ? 
+        allData[team2Key].penalties._filtered_plays : team2Plays;
+    const team1NetYards = calculateNetPenaltyYardsByWeek(team1PlaysForTrend, team1Name);
+    const team2NetYards = calculateNetPenaltyYardsByWeek(team2PlaysForTrend, team2Name);
+
+    // Trend functions already return data for all weeks (1 to maxWeek), including BYE weeks with 0
+    const allWeeks = team1NetYards.weeks;
+    const team1NetYardsAllWeeks = team1NetYards.values;
+    const team2NetYardsAllWeeks = team2NetYards.values;
+
+    const ctxTrend = document.getElementById('penaltyTrendChart').getContext('2d');
+    renderChart('penaltyTrend', ctxTrend, {
+        type: 'line',
+        data: {
+            labels: allWeeks,
+            datasets: [
+                { label: team1Name + ' Net Yards', data: team1NetYardsAllWeeks, borderColor: teamRgba(team1Color, 1.0), backgroundColor: teamRgba(team1Color, 0.1), fill: true },
+                { label: team2Name + ' Net Yards', data: team2NetYardsAllWeeks, borderColor: teamRgba(team2Color, 1.0), backgroundColor: teamRgba(team2Color, 0.1), fill: true }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false, 
+            scales: { 
+                y: { 
+                    beginAtZero: false,
+                    ticks: {
+                        callback: function(value) {
+                            return value;
+                        }
+                    }
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: 'Net Penalty Yards per Game (Positive = Opponent had more, Negative = Team had more)' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const value = context.parsed.y;
+                            const sign = value >= 0 ? '+' : '';
+                            const week = context.dataIndex + 1;
+                            const teamName = context.dataset.label.includes(team1Name) ? team1Name : team2Name;
+                            const opponent = teamName === team1Name ? 
+                                (masterWeekMapping.team1WeekToOpponent[week] || 'BYE') : 
+                                (masterWeekMapping.team2WeekToOpponent[week] || 'BYE');
+                            return context.dataset.label + ': ' + sign + value + ' yards' + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                        }
+                    }
+                }
+            } 
+        }
+    });
+
+    // Penalties by Quarter Chart
+    const washByQuarter = {1: 0, 2: 0, 3: 0, 4: 0};
+    const wiscByQuarter = {1: 0, 2: 0, 3: 0, 4: 0};
+    team1.plays.forEach(p => {
+        const qtr = p.period || 0;
+        if (qtr >= 1 && qtr <= 4) washByQuarter[qtr]++;
+    });
+    team2.plays.forEach(p => {
+        const qtr = p.period || 0;
+        if (qtr >= 1 && qtr <= 4) wiscByQuarter[qtr]++;
+    });
+
+    const ctxByQuarter = document.getElementById('penaltyByQuarterChart').getContext('2d');
+    renderChart('penaltyByQuarter', ctxByQuarter, {
+        type: 'bar',
+        data: {
+            labels: ['Q1', 'Q2', 'Q3', 'Q4'],
+            datasets: [
+                { label: team1Name, data: [washByQuarter[1], washByQuarter[2], washByQuarter[3], washByQuarter[4]], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [wiscByQuarter[1], wiscByQuarter[2], wiscByQuarter[3], wiscByQuarter[4]], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: 'Penalties by Quarter', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { y: { beginAtZero: true } }
+        }
+    });
+
+    // Penalty Type Breakdown
+    // Use penalty_category for holding penalties to distinguish offensive vs defensive
+    // Otherwise use penalty_type
+    // If penalty_category is missing but penalty_type is "Holding", try to infer from play_text
+    const washPenaltyTypes = {};
+    const wiscPenaltyTypes = {};
+
+    function getDisplayPenaltyType(play, teamName) {
+        let displayType = play.penalty_type || 'Unknown';
+
+        // If we have a penalty_category, use it for holding penalties
+        if (play.penalty_category && ['offensive_holding', 'defensive_holding', 'special_teams_holding'].includes(play.penalty_category)) {
+            // Convert snake_case to Title Case: "Offensive Holding", "Defensive Holding", "Special Teams Holding"
+            return play.penalty_category.replace(/_/g, ' ').replace(/\b\w/g, function(l) { return l.toUpperCase(); });
+        }
+
+        // If penalty_type is "Holding" but no category, determine from offense/defense
+        if (displayType && displayType.toUpperCase().includes('HOLDING')) {
+            // First try to infer from play_text (explicit mentions)
+            const playText = (play.play_text || '').toUpperCase();
+            if (playText.includes('OFFENSIVE HOLDING') || playText.includes('OFFENSIVE HOLD')) {
+                return 'Offensive Holding';
+            } else if (playText.includes('DEFENSIVE HOLDING') || playText.includes('DEFENSIVE HOLD')) {
+                return 'Defensive Holding';
+            } else if (playText.includes('SPECIAL TEAMS HOLDING') || playText.includes('SPECIAL TEAMS HOLD')) {
+                return 'Special Teams Holding';
+            }
+
+            // If not explicit in play_text, determine by checking if the team was on offense or defense
+            // Since we're analyzing penalties for a specific team, all penalties in this list
+            // are committed by that team. So if the team is on offense, it's offensive holding.
+            // If the team is on defense, it's defensive holding.
+            const offense = (play.offense || '').toUpperCase();
+            const teamNameUpper = (teamName || '').toUpperCase();
+
+            if (offense === teamNameUpper) {
+                // Team was on offense, so this is offensive holding
+                return 'Offensive Holding';
+            } else {
+                // Team was on defense, so this is defensive holding
+                return 'Defensive Holding';
+            }
+        }
+
+        return displayType;
+    }
+
+    team1.plays.forEach(p => {
+        const displayType = getDisplayPenaltyType(p, team1Name);
+        washPenaltyTypes[displayType] = (washPenaltyTypes[displayType] || 0) + 1;
+    });
+    team2.plays.forEach(p => {
+        const displayType = getDisplayPenaltyType(p, team2Name);
+        wiscPenaltyTypes[displayType] = (wiscPenaltyTypes[displayType] || 0) + 1;
+    });
+
+    // Get top penalty types (combine both teams)
+    const allTypes = new Set([...Object.keys(washPenaltyTypes), ...Object.keys(wiscPenaltyTypes)]);
+    const topTypes = Array.from(allTypes)
+        .map(type => ({
+            type: type,
+            wash: washPenaltyTypes[type] || 0,
+            wisc: wiscPenaltyTypes[type] || 0,
+            total: (washPenaltyTypes[type] || 0) + (wiscPenaltyTypes[type] || 0)
+        }))
+        .sort((a, b) => b.total - a.total)
+        .slice(0, 8)
+        .map(t => t.type);
+
+    const ctxType = document.getElementById('penaltyTypeChart').getContext('2d');
+    renderChart('penaltyType', ctxType, {
+        type: 'bar',
+        data: {
+            labels: topTypes,
+            datasets: [
+                { label: team1Name, data: topTypes.map(t => washPenaltyTypes[t] || 0), backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: topTypes.map(t => wiscPenaltyTypes[t] || 0), backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: 'Penalties by Type (Top 8)', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { 
+                y: { beginAtZero: true },
+                x: { ticks: { maxRotation: 45, minRotation: 45 } }
+            }
+        }
+    });
+
+    // Penalties by Down
+    const washByDown = {1: 0, 2: 0, 3: 0, 4: 0};
+    const wiscByDown = {1: 0, 2: 0, 3: 0, 4: 0};
+    team1.plays.forEach(p => {
+        const down = p.down || 0;
+        if (down >= 1 && down <= 4) washByDown[down]++;
+    });
+    team2.plays.forEach(p => {
+        const down = p.down || 0;
+        if (down >= 1 && down <= 4) wiscByDown[down]++;
+    });
+
+    const ctxByDown = document.getElementById('penaltyByDownChart').getContext('2d');
+    renderChart('penaltyByDown', ctxByDown, {
+        type: 'bar',
+        data: {
+            labels: ['1st Down', '2nd Down', '3rd Down', '4th Down'],
+            datasets: [
+                { label: team1Name, data: [washByDown[1], washByDown[2], washByDown[3], washByDown[4]], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [wiscByDown[1], wiscByDown[2], wiscByDown[3], wiscByDown[4]], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: 'Penalties by Down', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { y: { beginAtZero: true } }
+        }
+    });
+
+    // Penalties by Half
+    const washByHalf = {first: 0, second: 0};
+    const wiscByHalf = {first: 0, second: 0};
+    team1.plays.forEach(p => {
+        const qtr = p.period || 0;
+        if (qtr <= 2) washByHalf.first++;
+        else if (qtr >= 3) washByHalf.second++;
+    });
+    team2.plays.forEach(p => {
+        const qtr = p.period || 0;
+        if (qtr <= 2) wiscByHalf.first++;
+        else if (qtr >= 3) wiscByHalf.second++;
+    });
+
+    const ctxByHalf = document.getElementById('penaltyByHalfChart').getContext('2d');
+    renderChart('penaltyByHalf', ctxByHalf, {
+        type: 'bar',
+        data: {
+            labels: ['First Half', 'Second Half'],
+            datasets: [
+                { label: team1Name, data: [washByHalf.first, washByHalf.second], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [wiscByHalf.first, wiscByHalf.second], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: 'Penalties by Half', font: { size: 14 } },
+                legend: { display: true, position: 'top' }
+            },
+            scales: { y: { beginAtZero: true } }
+        }
+    });
+
+    // Tables - separate for each team
+    // Sort chronologically
+    const washSorted = sortPlaysChronologically(team1.plays);
+    const washTableData = washSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.penalty_type || '', p.penalty_decision || '', 
+        p.penalty_yards || (p.penalty_decision === 'accepted' ? Math.abs(p.yards_gained || 0) : 0),
+        p.play_text || '',
+        p.offense || ''  // Store offense for row class
+    ]);
+    const wiscSorted = sortPlaysChronologically(team2.plays);
+    const wiscTableData = wiscSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.penalty_type || '', p.penalty_decision || '',
+        p.penalty_yards || (p.penalty_decision === 'accepted' ? Math.abs(p.yards_gained || 0) : 0),
+        p.play_text || '',
+        p.offense || ''  // Store offense for row class
+    ]);
+
+    const washPenaltyConfig = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Penalty Type' }, { title: 'Decision' }, { title: 'Yards Lost' }, { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for offense check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const offense = data[8]; // Last column (hidden, index 8 now)
+            if (offense && offense.toLowerCase() !== team1Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#penaltyTableWash', washTableData, washPenaltyConfig);
+
+    const wiscPenaltyConfig = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Penalty Type' }, { title: 'Decision' }, { title: 'Yards Lost' }, { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for offense check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const offense = data[8]; // Last column (hidden, index 8 now)
+            if (offense && offense.toLowerCase() !== team2Name.toLowerCase()) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#penaltyTableWisc', wiscTableData, wiscPenaltyConfig);
+}
+
+function populate4thDowns() {
+    const team1 = allData[team1Key]['4thdowns'];
+    const team2 = allData[team2Key]['4thdowns'];
+
+    // Calculate game situation for 4th down plays
+    const team1PlaysWithSituation = calculateGameSituation([...team1Plays], team1Name);
+    const team2PlaysWithSituation = calculateGameSituation([...team2Plays], team2Name);
+
+    // Helper to check if a play is a "go for it" 4th down
+    const isGoForIt = (p, teamName) => {
+        if (p.down !== 4) return false;
+        if (p.offense?.toLowerCase() !== teamName.toLowerCase()) return false;
+        const pt = (p.play_type || '').toLowerCase();
+        const playText = (p.play_text || '').toLowerCase();
+        if (pt.includes('punt') || pt.includes('field goal') || pt.includes('kickoff') || pt.includes('timeout')) return false;
+        // Exclude ALL plays with "no play" (nullified by penalty) - they never happened
+        if (playText.includes('no play')) return false;
+        return true;
+    };
+
+    // Helper to check if converted
+    const isConverted = (p) => {
+        if (p.turnover) return false;
+        const playText = (p.play_text || '').toLowerCase();
+        if (playText.includes('1st down') || playText.includes('first down') || playText.includes('touchdown')) return true;
+        if (p.yards_gained >= p.distance) return true;
+        return false;
+    };
+
+    // Calculate situation-based stats for team 1
+    const team1GoForItPlays = team1PlaysWithSituation.filter(p => isGoForIt(p, team1Name));
+    const team1Winning = team1GoForItPlays.filter(p => (p._team_margin || 0) > 0);
+    const team1TiedOrTrailing = team1GoForItPlays.filter(p => (p._team_margin || 0) <= 0);
+
+    const team1WinningAttempts = team1Winning.length;
+    const team1WinningConversions = team1Winning.filter(isConverted).length;
+    const team1WinningRate = team1WinningAttempts > 0 ? (team1WinningConversions / team1WinningAttempts * 100) : 0;
+
+    const team1TrailingAttempts = team1TiedOrTrailing.length;
+    const team1TrailingConversions = team1TiedOrTrailing.filter(isConverted).length;
+    const team1TrailingRate = team1TrailingAttempts > 0 ? (team1TrailingConversions / team1TrailingAttempts * 100) : 0;
+
+    // Calculate situation-based stats for team 2
+    const team2GoForItPlays = team2PlaysWithSituation.filter(p => isGoForIt(p, team2Name));
+    const team2Winning = team2GoForItPlays.filter(p => (p._team_margin || 0) > 0);
+    const team2TiedOrTrailing = team2GoForItPlays.filter(p => (p._team_margin || 0) <= 0);
+
+    const team2WinningAttempts = team2Winning.length;
+    const team2WinningConversions = team2Winning.filter(isConverted).length;
+    const team2WinningRate = team2WinningAttempts > 0 ? (team2WinningConversions / team2WinningAttempts * 100) : 0;
+
+    const team2TrailingAttempts = team2TiedOrTrailing.length;
+    const team2TrailingConversions = team2TiedOrTrailing.filter(isConverted).length;
+    const team2TrailingRate = team2TrailingAttempts > 0 ? (team2TrailingConversions / team2TrailingAttempts * 100) : 0;
+
+    // Get current filters to determine rank
+    const filters = getFilters();
+    let team1Rank, team2Rank;
+
+    if (filters.conference_only) {
+        team1Rank = team1Name.toLowerCase() === 'indiana' ? 9 : 11;
+        team2Rank = team2Name.toLowerCase() === 'indiana' ? 9 : 11;
+    } else if (filters.power4_only) {
+        team1Rank = team1Name.toLowerCase() === 'indiana' ? 10 : 11;
+        team2Rank = team2Name.toLowerCase() === 'indiana' ? 10 : 11;
+    } else {
+        team1Rank = team1Name.toLowerCase() === 'indiana' ? 13 : 9;
+        team2Rank = team2Name.toLowerCase() === 'indiana' ? 13 : 9;
+    }
+
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team1.total_attempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team1.total_conversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="rank-badge">#${team1Rank}</div><div class="value">${team1.conversion_rate.toFixed(1)}%</div><div class="benchmark-text">53.63% BIG10 avg</div></div>
+                    <div class="summary-card"><h3>Last 3 Attempts</h3><div class="value">${team1.last_3_games.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Conversions</h3><div class="value">${team1.last_3_games.conversions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Rate</h3><div class="value">${team1.last_3_games.conversion_rate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">When Winning</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team1WinningAttempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team1WinningConversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="value">${team1WinningRate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">When Tied or Trailing</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team1TrailingAttempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team1TrailingConversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="value">${team1TrailingRate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">By Distance</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>4th & 1</h3><div class="value">${team1.distance_breakdown?.['4th_and_1']?.conversions || 0}/${team1.distance_breakdown?.['4th_and_1']?.attempts || 0}</div><div class="label">${team1.distance_breakdown?.['4th_and_1']?.attempts > 0 ? ((team1.distance_breakdown['4th_and_1'].conversions / team1.distance_breakdown['4th_and_1'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                    <div class="summary-card"><h3>4th & 2-3</h3><div class="value">${team1.distance_breakdown?.['4th_and_2_3']?.conversions || 0}/${team1.distance_breakdown?.['4th_and_2_3']?.attempts || 0}</div><div class="label">${team1.distance_breakdown?.['4th_and_2_3']?.attempts > 0 ? ((team1.distance_breakdown['4th_and_2_3'].conversions / team1.distance_breakdown['4th_and_2_3'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                    <div class="summary-card"><h3>4th & 4+</h3><div class="value">${team1.distance_breakdown?.['4th_and_4_plus']?.conversions || 0}/${team1.distance_breakdown?.['4th_and_4_plus']?.attempts || 0}</div><div class="label">${team1.distance_breakdown?.['4th_and_4_plus']?.attempts > 0 ? ((team1.distance_breakdown['4th_and_4_plus'].conversions / team1.distance_breakdown['4th_and_4_plus'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team2.total_attempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team2.total_conversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="rank-badge">#${team2Rank}</div><div class="value">${team2.conversion_rate.toFixed(1)}%</div><div class="benchmark-text">53.63% BIG10 avg</div></div>
+                    <div class="summary-card"><h3>Last 3 Attempts</h3><div class="value">${team2.last_3_games.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Conversions</h3><div class="value">${team2.last_3_games.conversions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Rate</h3><div class="value">${team2.last_3_games.conversion_rate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">When Winning</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team2WinningAttempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team2WinningConversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="value">${team2WinningRate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">When Tied or Trailing</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Attempts</h3><div class="value">${team2TrailingAttempts}</div></div>
+                    <div class="summary-card"><h3>Conversions</h3><div class="value">${team2TrailingConversions}</div></div>
+                    <div class="summary-card"><h3>Rate</h3><div class="value">${team2TrailingRate.toFixed(1)}%</div></div>
+                </div>
+                <h4 style="margin-top: 15px; margin-bottom: 5px;">By Distance</h4>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>4th & 1</h3><div class="value">${team2.distance_breakdown?.['4th_and_1']?.conversions || 0}/${team2.distance_breakdown?.['4th_and_1']?.attempts || 0}</div><div class="label">${team2.distance_breakdown?.['4th_and_1']?.attempts > 0 ? ((team2.distance_breakdown['4th_and_1'].conversions / team2.distance_breakdown['4th_and_1'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                    <div class="summary-card"><h3>4th & 2-3</h3><div class="value">${team2.distance_breakdown?.['4th_and_2_3']?.conversions || 0}/${team2.distance_breakdown?.['4th_and_2_3']?.attempts || 0}</div><div class="label">${team2.distance_breakdown?.['4th_and_2_3']?.attempts > 0 ? ((team2.distance_breakdown['4th_and_2_3'].conversions / team2.distance_breakdown['4th_and_2_3'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                    <div class="summary-card"><h3>4th & 4+</h3><div class="value">${team2.distance_breakdown?.['4th_and_4_plus']?.conversions || 0}/${team2.distance_breakdown?.['4th_and_4_plus']?.attempts || 0}</div><div class="label">${team2.distance_breakdown?.['4th_and_4_plus']?.attempts > 0 ? ((team2.distance_breakdown['4th_and_4_plus'].conversions / team2.distance_breakdown['4th_and_4_plus'].attempts) * 100).toFixed(0) : 0}%</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('fourthDownSummary').innerHTML = summaryHtml;
+
+    const ctx = document.getElementById('fourthDownChart').getContext('2d');
+    renderChart('fourthDown', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Attempts', 'Conversions', 'Rate %'],
+            datasets: [
+                { label: team1Name, data: [team1.total_attempts, team1.total_conversions, team1.conversion_rate], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [team2.total_attempts, team2.total_conversions, team2.conversion_rate], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { responsive: true, maintainAspectRatio: false }
+    });
+
+    // Trend chart - use filtered plays if available
+    const team1PlaysForTrend = typeof allData[team1Key]['4thdowns']._filtered_plays !== 'undefined' ? 
+        allData[team1Key]['4thdowns']._filtered_plays : team1Plays;
+    const team2PlaysForTrend = typeof allData[team2Key]['4thdowns']._filtered_plays !== 'undefined' ? 
+        allData[team2Key]['4thdowns']._filtered_plays : team2Plays;
+    const team1Trends = calculate4thDownTrends(team1PlaysForTrend, team1Name);
+    const team2Trends = calculate4thDownTrends(team2PlaysForTrend, team2Name);
+
+    // Trend functions already return data for all weeks (1 to maxWeek), including BYE weeks with 0
+    const allWeeks = team1Trends.weeks;
+    const team1ConversionsAllWeeks = team1Trends.conversions;
+    const team2ConversionsAllWeeks = team2Trends.conversions;
+    const team1AttemptsAllWeeks = team1Trends.attempts;
+    const team2AttemptsAllWeeks = team2Trends.attempts;
+
+    const ctxTrend = document.getElementById('fourthDownTrendChart').getContext('2d');
+    renderChart('fourthDownTrend', ctxTrend, {
+        type: 'line',
+        data: {
+            labels: allWeeks,
+            datasets: [
+                { 
+                    label: team1Name + ' Conversions', 
+                    data: team1ConversionsAllWeeks, 
+                    borderColor: teamRgba(team1Color, 1.0), 
+                    backgroundColor: teamRgba(team1Color, 0.1), 
+                    fill: true,
+                    borderWidth: 2
+                },
+                { 
+                    label: team1Name + ' Attempts', 
+                    data: team1AttemptsAllWeeks, 
+                    borderColor: 'rgba(255, 193, 7, 1)', 
+                    backgroundColor: 'rgba(255, 193, 7, 0.1)', 
+                    borderDash: [5, 5],
+                    fill: false,
+                    borderWidth: 1.5
+                },
+                { 
+                    label: team2Name + ' Conversions', 
+                    data: team2ConversionsAllWeeks, 
+                    borderColor: teamRgba(team2Color, 1.0), 
+                    backgroundColor: teamRgba(team2Color, 0.1), 
+                    fill: true,
+                    borderWidth: 2
+                },
+                { 
+                    label: team2Name + ' Attempts', 
+                    data: team2AttemptsAllWeeks, 
+                    borderColor: 'rgba(128, 128, 128, 1)', 
+                    backgroundColor: 'rgba(128, 128, 128, 0.1)', 
+                    borderDash: [5, 5],
+                    fill: false,
+                    borderWidth: 1.5
+                }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false, 
+            scales: { y: { beginAtZero: true } }, 
+            plugins: { 
+                title: { display: true, text: '4th Down Attempts & Conversions by Week' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const datasetIndex = context.datasetIndex;
+                            const dataIndex = context.dataIndex;
+                            const weekLabel = allWeeks[dataIndex];
+                            const weekNum = dataIndex + 1;
+                            const value = context.parsed.y;
+
+                            // Check if this is an attempts dataset (indices 1 and 3)
+                            const isAttempts = datasetIndex === 1 || datasetIndex === 3;
+
+                            if (isAttempts) {
+                                // Simple format for attempts: team name, number, and "attempts"
+                                const teamName = datasetIndex === 1 ? team1Name : team2Name;
+                                return `${teamName} ${value} attempts`;
+                            } else {
+                                // Full format for conversions: conversions/attempts (rate%)
+                                const teamTrends = datasetIndex === 0 ? team1Trends : team2Trends;
+                                const weekIndex = teamTrends.weeks.indexOf(weekLabel);
+
+                                const teamName = datasetIndex === 0 ? team1Name : team2Name;
+                                const opponent = datasetIndex === 0 ? 
+                                    (masterWeekMapping.team1WeekToOpponent[weekNum] || 'BYE') : 
+                                    (masterWeekMapping.team2WeekToOpponent[weekNum] || 'BYE');
+                                const opponentText = opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent;
+
+                                if (weekIndex >= 0) {
+                                    const attempts = teamTrends.attempts[weekIndex];
+                                    const rate = teamTrends.rates[weekIndex];
+                                    return `${teamName}: ${value}/${attempts} (${rate.toFixed(1)}%)${opponentText}`;
+                                } else {
+                                    // Week with no attempts
+                                    return `${teamName}: 0/0 (0.0%)${opponentText}`;
+                                }
+                            }
+                        }
+                    }
+                }
+            } 
+        }
+    });
+
+    // Tables - separate for each team
+    // Sort chronologically
+    const washSorted = sortPlaysChronologically(team1.plays);
+    const washTableData = washSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.yard_line || '', p.distance || '',
+        p.play_type || '', p.converted ? 'Yes' : 'No', p.yards_gained || 0, p.ppa ? p.ppa.toFixed(2) : '',
+        p.play_text || '',
+        p.converted || false  // Hidden column for conversion status
+    ]);
+    const wiscSorted = sortPlaysChronologically(team2.plays);
+    const wiscTableData = wiscSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.yard_line || '', p.distance || '',
+        p.play_type || '', p.converted ? 'Yes' : 'No', p.yards_gained || 0, p.ppa ? p.ppa.toFixed(2) : '',
+        p.play_text || '',
+        p.converted || false  // Hidden column for conversion status
+    ]);
+
+    const wash4thDownConfig = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Yard Line' }, { title: 'Distance' },
+            { title: 'Play Type' }, { title: 'Converted' }, { title: 'Yards' }, { title: 'PPA' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for conversion status
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const converted = data[9]; // Last column (hidden, index 9)
+            if (converted === true) {
+                $(row).addClass('converted-success');
+            } else {
+                $(row).addClass('converted-failed');
+            }
+        }
+    };
+    updateVirtualTable('#fourthDownTableWash', washTableData, wash4thDownConfig);
+
+    const wisc4thDownConfig = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Yard Line' }, { title: 'Distance' },
+            { title: 'Play Type' }, { title: 'Converted' }, { title: 'Yards' }, { title: 'PPA' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for conversion status
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const converted = data[9]; // Last column (hidden, index 9)
+            if (converted === true) {
+                $(row).addClass('converted-success');
+            } else {
+                $(row).addClass('converted-failed');
+            }
+        }
+    };
+    updateVirtualTable('#fourthDownTableWisc', wiscTableData, wisc4thDownConfig);
+}
+
+function populatePostTurnover() {
+    const team1 = allData[team1Key].turnover;
+    const team2 = allData[team2Key].turnover;
+
+    // Recalculate totals from turnover_analysis array to ensure chart matches table
+    const team1OpponentTurnovers = team1.turnover_analysis.filter(t => !t.is_our_turnover);
+    const team1OurTurnovers = team1.turnover_analysis.filter(t => t.is_our_turnover);
+    const team1PointsScored = team1OpponentTurnovers.reduce((sum, t) => sum + (t.points_scored || 0), 0);
+    const team1PointsAllowed = team1OurTurnovers.reduce((sum, t) => sum + (t.points_allowed || 0), 0);
+
+    const team2OpponentTurnovers = team2.turnover_analysis.filter(t => !t.is_our_turnover);
+    const team2OurTurnovers = team2.turnover_analysis.filter(t => t.is_our_turnover);
+    const team2PointsScored = team2OpponentTurnovers.reduce((sum, t) => sum + (t.points_scored || 0), 0);
+    const team2PointsAllowed = team2OurTurnovers.reduce((sum, t) => sum + (t.points_allowed || 0), 0);
+
+    // Use recalculated values for chart and summary
+    const team1ChartData = {
+        our_turnovers: team1OurTurnovers.length,
+        opponent_turnovers: team1OpponentTurnovers.length,
+        points_scored_after_opponent_turnovers: team1PointsScored,
+        points_allowed_after_our_turnovers: team1PointsAllowed
+    };
+    const team2ChartData = {
+        our_turnovers: team2OurTurnovers.length,
+        opponent_turnovers: team2OpponentTurnovers.length,
+        points_scored_after_opponent_turnovers: team2PointsScored,
+        points_allowed_after_our_turnovers: team2PointsAllowed
+    };
+
+    // Calculate net points by week from turnover_analysis array (more accurate than recalculating from plays)
+    const team1NetPointsByWeek = calculateNetPointsByWeekFromAnalysis(team1.turnover_analysis, team1Name);
+    const team2NetPointsByWeek = calculateNetPointsByWeekFromAnalysis(team2.turnover_analysis, team2Name);
+
+    // Sum weekly net points to get total (matching the chart calculation)
+    // Sum all values exactly as shown in the chart (all weeks from 1 to maxWeek)
+    const team1TotalNetPoints = team1NetPointsByWeek.netPoints.reduce((sum, val) => sum + val, 0);
+    const team2TotalNetPoints = team2NetPointsByWeek.netPoints.reduce((sum, val) => sum + val, 0);
+
+    // Calculate last 3 games from weekly data (matching chart calculation)
+    // Get weeks that have games (not BYE weeks)
+    const team1WeeksWithGames = team1NetPointsByWeek.netPoints.map((val, idx) => ({
+        week: idx + 1,
+        label: team1NetPointsByWeek.weeks[idx],
+        netPoints: val
+    })).filter(w => team1Games.some(g => g.week === w.week));
+    const team1Last3Weeks = team1WeeksWithGames.slice(-3);
+    const team1Last3NetFromWeekly = team1Last3Weeks.reduce((sum, w) => sum + w.netPoints, 0);
+
+    const team2WeeksWithGames = team2NetPointsByWeek.netPoints.map((val, idx) => ({
+        week: idx + 1,
+        label: team2NetPointsByWeek.weeks[idx],
+        netPoints: val
+    })).filter(w => team2Games.some(g => g.week === w.week));
+    const team2Last3Weeks = team2WeeksWithGames.slice(-3);
+    const team2Last3NetFromWeekly = team2Last3Weeks.reduce((sum, w) => sum + w.netPoints, 0);
+
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Opponent Turnovers</h3><div class="value">${team1ChartData.opponent_turnovers}</div></div>
+                    <div class="summary-card"><h3>Points Scored After</h3><div class="value">${team1ChartData.points_scored_after_opponent_turnovers}</div></div>
+                    <div class="summary-card"><h3>${team1Name} Turnovers</h3><div class="value">${team1ChartData.our_turnovers}</div></div>
+                    <div class="summary-card"><h3>Points Allowed After</h3><div class="value">${team1ChartData.points_allowed_after_our_turnovers}</div></div>
+                    <div class="summary-card"><h3>Net Points</h3><div class="value">${team1TotalNetPoints}</div></div>
+                    <div class="summary-card"><h3>Last 3 Net Points</h3><div class="value">${team1Last3NetFromWeekly}</div></div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Opponent Turnovers</h3><div class="value">${team2ChartData.opponent_turnovers}</div></div>
+                    <div class="summary-card"><h3>Points Scored After</h3><div class="value">${team2ChartData.points_scored_after_opponent_turnovers}</div></div>
+                    <div class="summary-card"><h3>${team2Name} Turnovers</h3><div class="value">${team2ChartData.our_turnovers}</div></div>
+                    <div class="summary-card"><h3>Points Allowed After</h3><div class="value">${team2ChartData.points_allowed_after_our_turnovers}</div></div>
+                    <div class="summary-card"><h3>Net Points</h3><div class="value">${team2TotalNetPoints}</div></div>
+                    <div class="summary-card"><h3>Last 3 Net Points</h3><div class="value">${team2Last3NetFromWeekly}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('postTurnoverSummary').innerHTML = summaryHtml;
+
+    const ctx = document.getElementById('postTurnoverChart').getContext('2d');
+    renderChart('postTurnover', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Team TO', 'Opp TO', 'Pts Scored Off TO', 'Pts Allowed Off TO'],
+            datasets: [
+                { label: team1Name, data: [team1ChartData.our_turnovers, team1ChartData.opponent_turnovers, team1ChartData.points_scored_after_opponent_turnovers, -team1ChartData.points_allowed_after_our_turnovers], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [team2ChartData.our_turnovers, team2ChartData.opponent_turnovers, team2ChartData.points_scored_after_opponent_turnovers, -team2ChartData.points_allowed_after_our_turnovers], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: false,
+                    ticks: {
+                        callback: function(value) {
+                            return Math.abs(value);
+                        }
+                    }
+                }
+            },
+            plugins: {
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const value = context.parsed.y;
+                            const label = context.label || '';
+                            if (value < 0) {
+                                return context.dataset.label + ': -' + Math.abs(value);
+                            }
+                            return context.dataset.label + ': ' + value;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Trend chart - net points by week - reuse already calculated values
+    // Trend functions already return data for all weeks (1 to maxWeek), including BYE weeks with 0
+    const allWeeks = team1NetPointsByWeek.weeks;
+    const team1NetPointsAllWeeks = team1NetPointsByWeek.netPoints;
+    const team2NetPointsAllWeeks = team2NetPointsByWeek.netPoints;
+
+    const ctxTrend = document.getElementById('postTurnoverTrendChart').getContext('2d');
+    renderChart('postTurnoverTrend', ctxTrend, {
+        type: 'line',
+        data: {
+            labels: allWeeks,
+            datasets: [
+                { label: team1Name + ' Net Points', data: team1NetPointsAllWeeks, borderColor: teamRgba(team1Color, 1.0), backgroundColor: teamRgba(team1Color, 0.1), fill: true },
+                { label: team2Name + ' Net Points', data: team2NetPointsAllWeeks, borderColor: teamRgba(team2Color, 1.0), backgroundColor: teamRgba(team2Color, 0.1), fill: true }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false, 
+            scales: { 
+                y: { 
+                    beginAtZero: false,
+                    ticks: {
+                        callback: function(value) {
+                            return value;
+                        }
+                    }
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: 'Net Points After Turnovers by Week' },
+                tooltip: {
+                    mode: 'index',
+                    intersect: false,
+                    callbacks: {
+                        title: function(context) {
+                            const week = context[0].dataIndex + 1;
+                            // Show both teams' opponents when both datasets are present
+                            const team1Opponent = masterWeekMapping.team1WeekToOpponent[week] || 'BYE';
+                            const team2Opponent = masterWeekMapping.team2WeekToOpponent[week] || 'BYE';
+
+                            if (context.length > 1) {
+                                // Both teams have data at this point
+                                const team1Text = team1Opponent === 'BYE' ? 'BYE' : team1Opponent;
+                                const team2Text = team2Opponent === 'BYE' ? 'BYE' : team2Opponent;
+                                return `Week ${week}: ${team1Name} vs ${team1Text}, ${team2Name} vs ${team2Text}`;
+                            } else {
+                                // Only one team has data
+                                const datasetIndex = context[0].datasetIndex;
+                                const opponent = datasetIndex === 0 ? team1Opponent : team2Opponent;
+                                return 'Week ' + week + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                            }
+                        },
+                        label: function(context) {
+                            const value = context.parsed.y;
+                            const sign = value >= 0 ? '+' : '';
+                            return context.dataset.label + ': ' + sign + value;
+                        }
+                    }
+                }
+            } 
+        }
+    });
+
+    // Tables - separate for each team
+    // Sort chronologically (turnover_analysis items may not have period/clock, so sort by week only)
+    const washTurnoverSorted = team1.turnover_analysis.slice().sort((a, b) => (a.game_week || 0) - (b.game_week || 0));
+    const washTableData = washTurnoverSorted.map(t => [
+        t.game_week || '', t.opponent || '', t.turnover_type || '',
+        t.is_our_turnover ? team1Name : 'Opponent', t.drive_result || '', 
+        (t.points_scored || 0) + (t.points_allowed || 0), // Total points from turnover
+        t.play_text || '',
+        t.is_our_turnover ? false : true  // Store isOpponent for row class
+    ]);
+    const wiscTurnoverSorted = team2.turnover_analysis.slice().sort((a, b) => (a.game_week || 0) - (b.game_week || 0));
+    const wiscTableData = wiscTurnoverSorted.map(t => [
+        t.game_week || '', t.opponent || '', t.turnover_type || '',
+        t.is_our_turnover ? team2Name : 'Opponent', t.drive_result || '', 
+        (t.points_scored || 0) + (t.points_allowed || 0), // Total points from turnover
+        t.play_text || '',
+        t.is_our_turnover ? false : true  // Store isOpponent for row class
+    ]);
+
+    const washTurnoverConfig = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Turnover Type' },
+            { title: 'Offense' }, { title: 'Drive Result' }, { title: 'Points' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for isOpponent check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const isOpponent = data[7]; // Last column (hidden)
+            if (isOpponent) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#postTurnoverTableWash', washTableData, washTurnoverConfig);
+
+    const wiscTurnoverConfig = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Turnover Type' },
+            { title: 'Offense' }, { title: 'Drive Result' }, { title: 'Points' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for isOpponent check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const isOpponent = data[7]; // Last column (hidden)
+            if (isOpponent) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#postTurnoverTableWisc', wiscTableData, wiscTurnoverConfig);
+}
+
+function populateSpecialTeams() {
+    const team1 = allData[team1Key].specialteams;
+    const team2 = allData[team2Key].specialteams;
+
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Explosive</h3><div class="value">${team1.total_explosive_plays}</div></div>
+                    <div class="summary-card"><h3>Explosive Allowed</h3><div class="value">${team1.explosive_returns_allowed}</div></div>
+                    <div class="summary-card"><h3>TD's Scored</h3><div class="value">${team1.tds_scored || 0}</div></div>
+                    <div class="summary-card"><h3>TD's Allowed</h3><div class="value">${team1.tds_allowed || 0}</div></div>
+                    <div class="summary-card"><h3>Punt Blocks</h3><div class="value">${team1.punt_blocks || 0}</div></div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Explosive</h3><div class="value">${team2.total_explosive_plays}</div></div>
+                    <div class="summary-card"><h3>Explosive Allowed</h3><div class="value">${team2.explosive_returns_allowed}</div></div>
+                    <div class="summary-card"><h3>TD's Scored</h3><div class="value">${team2.tds_scored || 0}</div></div>
+                    <div class="summary-card"><h3>TD's Allowed</h3><div class="value">${team2.tds_allowed || 0}</div></div>
+                    <div class="summary-card"><h3>Punt Blocks</h3><div class="value">${team2.punt_blocks || 0}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('specialTeamsSummary').innerHTML = summaryHtml;
+
+    // Trend chart for special teams explosive plays - use filtered plays if available
+    const team1PlaysForTrend = typeof allData[team1Key].specialteams._filtered_plays !== 'undefined' ? 
+        allData[team1Key].specialteams._filtered_plays : team1Plays;
+    const team2PlaysForTrend = typeof allData[team2Key].specialteams._filtered_plays !== 'undefined' ? 
+        allData[team2Key].specialteams._filtered_plays : team2Plays;
+    const team1Trends = calculateSpecialTeamsExplosiveTrends(team1PlaysForTrend, team1Name);
+    const team2Trends = calculateSpecialTeamsExplosiveTrends(team2PlaysForTrend, team2Name);
+    const ctxTrend = document.getElementById('specialTeamsTrendChart').getContext('2d');
+    renderChart('specialTeamsTrend', ctxTrend, {
+        type: 'line',
+        data: {
+            labels: team1Trends.weeks,
+            datasets: [
+                { label: team1Name + ' Explosive ST Plays', data: team1Trends.ours, borderColor: teamRgba(team1Color, 1.0), backgroundColor: teamRgba(team1Color, 0.1), fill: true },
+                { label: team1Name + ' Allowed', data: team1Trends.allowed.map(v => -v), borderColor: teamRgba(team1Color, 0.5), backgroundColor: teamRgba(team1Color, 0.05), fill: true },
+                { label: team2Name + ' Explosive ST Plays', data: team2Trends.ours, borderColor: teamRgba(team2Color, 1.0), backgroundColor: teamRgba(team2Color, 0.1), fill: true },
+                { label: team2Name + ' Allowed', data: team2Trends.allowed.map(v => -v), borderColor: teamRgba(team2Color, 0.5), backgroundColor: teamRgba(team2Color, 0.05), fill: true }
+            ]
+        },
+        options: { 
+            responsive: true, 
+            maintainAspectRatio: false, 
+            scales: { 
+                y: { 
+                    beginAtZero: false,
+                    ticks: {
+                        callback: function(value) {
+                            return Math.abs(value);
+                        }
+                    }
+                } 
+            }, 
+            plugins: { 
+                title: { display: true, text: 'Explosive Special Teams Plays by Week (Allowed shown as negative)' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            let label = context.dataset.label || '';
+                            if (label) {
+                                label += ': ';
+                            }
+                            if (context.parsed.y < 0) {
+                                label += Math.abs(context.parsed.y);
+                            } else {
+                                label += context.parsed.y;
+                            }
+                            const week = context.dataIndex + 1;
+                            const teamName = context.dataset.label.includes(team1Name) ? team1Name : team2Name;
+                            const opponent = teamName === team1Name ? 
+                                (masterWeekMapping.team1WeekToOpponent[week] || 'BYE') : 
+                                (masterWeekMapping.team2WeekToOpponent[week] || 'BYE');
+                            return label + (opponent === 'BYE' ? ' (BYE)' : ' vs ' + opponent);
+                        }
+                    }
+                }
+            } 
+        }
+    });
+
+    // Tables - separate for each team
+    // Sort chronologically
+    const washSTSorted = sortPlaysChronologically(team1.plays);
+    const washTableData = washSTSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.play_type || '',
+        p.is_our ? team1Name : 'Opponent', p.yards_gained || 0,
+        p.explosive ? 'Yes' : 'No',
+        p.play_text || '',
+        !p.is_our  // Store isOpponent for row class
+    ]);
+    const wiscSTSorted = sortPlaysChronologically(team2.plays);
+    const wiscTableData = wiscSTSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.play_type || '',
+        p.is_our ? team2Name : 'Opponent', p.yards_gained || 0,
+        p.explosive ? 'Yes' : 'No',
+        p.play_text || '',
+        !p.is_our  // Store isOpponent for row class
+    ]);
+
+    const washSpecialTeamsConfig = {
+        data: washTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Play Type' },
+            { title: 'Result' }, { title: 'Yards' }, { title: 'Explosive' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for isOpponent check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const isOpponent = data[7]; // Last column (hidden)
+            if (isOpponent) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#specialTeamsTableWash', washTableData, washSpecialTeamsConfig);
+
+    const wiscSpecialTeamsConfig = {
+        data: wiscTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Play Type' },
+            { title: 'Result' }, { title: 'Yards' }, { title: 'Explosive' },
+            { title: 'Play Description' },
+            { title: '', visible: false }  // Hidden column for isOpponent check
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+            const isOpponent = data[7]; // Last column (hidden)
+            if (isOpponent) {
+                $(row).addClass('opponent-row');
+            } else {
+                $(row).addClass('team-row');
+            }
+        }
+    };
+    safeUpdateDataTable('#specialTeamsTableWisc', wiscTableData, wiscSpecialTeamsConfig);
+}
+
+function populateRedZone() {
+    const team1 = allData[team1Key].redzone;
+    const team2 = allData[team2Key].redzone;
+
+    const summaryHtml = `
+        <div class="team-comparison">
+            <div class="team-section ${team1Key}">
+                <h3>${team1Name}</h3>
+                <div style="margin-bottom: 20px;">
+                    <h4 style="color: #388e3c; margin-bottom: 10px;">Green Zone (30 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team1.green_zone.total_plays} - ${team1.green_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team1.green_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team1.green_zone.td_scoring_rate.toFixed(1)}%</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team1.green_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team1.green_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team1.green_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+                <div style="margin-bottom: 20px;">
+                    <h4 style="color: #d32f2f; margin-bottom: 10px;">Red Zone (20 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team1.red_zone.total_plays} - ${team1.red_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team1.red_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team1.red_zone.td_scoring_rate.toFixed(1)}%</div><div class="benchmark-text">63.28% BIG10 avg</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team1.red_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team1.red_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team1.red_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+                <div>
+                    <h4 style="color: #b71c1c; margin-bottom: 10px;">Tight Red Zone (10 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team1.tight_red_zone.total_plays} - ${team1.tight_red_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team1.tight_red_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team1.tight_red_zone.td_scoring_rate.toFixed(1)}%</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team1.tight_red_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team1.tight_red_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team1.tight_red_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+            </div>
+            <div class="team-section ${team2Key}">
+                <h3>${team2Name}</h3>
+                <div style="margin-bottom: 20px;">
+                    <h4 style="color: #388e3c; margin-bottom: 10px;">Green Zone (30 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team2.green_zone.total_plays} - ${team2.green_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team2.green_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team2.green_zone.td_scoring_rate.toFixed(1)}%</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team2.green_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team2.green_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team2.green_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+                <div style="margin-bottom: 20px;">
+                    <h4 style="color: #d32f2f; margin-bottom: 10px;">Red Zone (20 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team2.red_zone.total_plays} - ${team2.red_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team2.red_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team2.red_zone.td_scoring_rate.toFixed(1)}%</div><div class="benchmark-text">63.28% BIG10 avg</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team2.red_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team2.red_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team2.red_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+                <div>
+                    <h4 style="color: #b71c1c; margin-bottom: 10px;">Tight Red Zone (10 & In)</h4>
+                    <div class="summary-cards">
+                        <div class="summary-card"><h3>Plays - Drives</h3><div class="value">${team2.tight_red_zone.total_plays} - ${team2.tight_red_zone.red_zone_attempts || 0}</div></div>
+                        <div class="summary-card"><h3>Touchdowns</h3><div class="value">${team2.tight_red_zone.touchdowns}</div></div>
+                        <div class="summary-card"><h3>TD Scoring %</h3><div class="value">${team2.tight_red_zone.td_scoring_rate.toFixed(1)}%</div></div>
+                        <div class="summary-card"><h3>Giveaways</h3><div class="value">${team2.tight_red_zone.turnovers}</div></div>
+                        <div class="summary-card"><h3>Turnovers on Downs</h3><div class="value">${team2.tight_red_zone.turnovers_on_downs || 0}</div></div>
+                        <div class="summary-card"><h3>3rd Down Conv</h3><div class="value">${team2.tight_red_zone.conversions_3rd.rate.toFixed(1)}%</div></div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('redZoneSummary').innerHTML = summaryHtml;
+
+    // Bar chart comparing Tight Red Zone, Red Zone and Green Zone scoring rates
+    const ctx = document.getElementById('redZoneChart').getContext('2d');
+    renderChart('redZone', ctx, {
+        type: 'bar',
+        data: {
+            labels: ['Tight Red Zone TD %', 'Red Zone TD %', 'Green Zone TD %'],
+            datasets: [
+                { label: team1Name, data: [team1.tight_red_zone.td_scoring_rate, team1.red_zone.td_scoring_rate, team1.green_zone.td_scoring_rate], backgroundColor: teamRgba(team1Color, 0.6) },
+                { label: team2Name, data: [team2.tight_red_zone.td_scoring_rate, team2.red_zone.td_scoring_rate, team2.green_zone.td_scoring_rate], backgroundColor: teamRgba(team2Color, 0.6) }
+            ]
+        },
+        options: { responsive: true, maintainAspectRatio: false }
+    });
+
+    // Red Zone Tables: All plays 20 yards and in, separate tables for each team
+    // Team 1 Red Zone Plays
+    const team1RedZoneSorted = sortPlaysChronologically(team1.red_zone.plays || []);
+    const team1RedZoneTableData = team1RedZoneSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    const team1RedZoneConfig = {
+        data: team1RedZoneTableData,
+        scrollY: '400px',
+        scrollCollapse: true,
+        paging: false,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' }, { title: 'Play Type' },
+            { title: 'Yards' }, { title: 'Scoring' }, { title: 'Explosive' }, { title: 'PPA' },
+            { title: 'Play Description' }
+        ],
+        order: [[0, 'asc'], [2, 'asc'], [3, 'desc']]
+    };
+    updateVirtualTable('#redZoneTableTeam1', team1RedZoneTableData, team1RedZoneConfig);
+
+    // Team 2 Red Zone Plays
+    const team2RedZoneSorted = sortPlaysChronologically(team2.red_zone.plays || []);
+    const team2RedZoneTableData = team2RedZoneSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    const team2RedZoneConfig = {
+        data: team2RedZoneTableData,
+        scrollY: '400px',
+        scrollCollapse: true,
+        paging: false,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' }, { title: 'Play Type' },
+            { title: 'Yards' }, { title: 'Scoring' }, { title: 'Explosive' }, { title: 'PPA' },
+            { title: 'Play Description' }
+        ],
+        order: [[0, 'asc'], [2, 'asc'], [3, 'desc']]
+    };
+    updateVirtualTable('#redZoneTableTeam2', team2RedZoneTableData, team2RedZoneConfig);
+
+    // Tables - Tight Red Zone and Green Zone
+    // Sort chronologically
+    const washTightRedSorted = sortPlaysChronologically(team1.tight_red_zone.plays);
+    const washTightRedTableData = washTightRedSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    const wiscTightRedSorted = sortPlaysChronologically(team2.tight_red_zone.plays);
+    const wiscTightRedTableData = wiscTightRedSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    const washGreenSorted = sortPlaysChronologically(team1.green_zone.plays);
+    const washGreenTableData = washGreenSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    const wiscGreenSorted = sortPlaysChronologically(team2.green_zone.plays);
+    const wiscGreenTableData = wiscGreenSorted.map(p => [
+        p.game_week || '', p.opponent || '', p.period || '', formatClock(p.clock || ''),
+        p.down || '', p.distance || '', p.yards_to_goal || '',
+        p.play_type || '', p.yards_gained || 0, p.scoring ? 'Yes' : 'No',
+        p.explosive ? 'Yes' : 'No', p.ppa ? p.ppa.toFixed(3) : '', p.play_text || ''
+    ]);
+
+    // Tight Red Zone tables
+    const washTightRedZoneConfig = {
+        data: washTightRedTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'Scoring' },
+            { title: 'Explosive' }, { title: 'PPA' }, { title: 'Play Description' }
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+        }
+    };
+    updateVirtualTable('#tightRedZoneTableWash', washTightRedTableData, washTightRedZoneConfig);
+
+    const wiscTightRedZoneConfig = {
+        data: wiscTightRedTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'Scoring' },
+            { title: 'Explosive' }, { title: 'PPA' }, { title: 'Play Description' }
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+        }
+    };
+    updateVirtualTable('#tightRedZoneTableWisc', wiscTightRedTableData, wiscTightRedZoneConfig);
+
+    const washGreenZoneConfig = {
+        data: washGreenTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'Scoring' },
+            { title: 'Explosive' }, { title: 'PPA' }, { title: 'Play Description' }
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+        }
+    };
+    updateVirtualTable('#greenZoneTableWash', washGreenTableData, washGreenZoneConfig);
+
+    const wiscGreenZoneConfig = {
+        data: wiscGreenTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Period' }, { title: 'Clock' },
+            { title: 'Down' }, { title: 'Dist' }, { title: 'YTG' },
+            { title: 'Play Type' }, { title: 'Yards' }, { title: 'Scoring' },
+            { title: 'Explosive' }, { title: 'PPA' }, { title: 'Play Description' }
+        ],
+        createdRow: function(row, data) {
+            const weekValue = data[0]; // Week is first column
+            addWeekClass(row, weekValue);
+        }
+    };
+    updateVirtualTable('#greenZoneTableWisc', wiscGreenTableData, wiscGreenZoneConfig);
+}
+
+function filterSituationalReceiving(situationalData, filters, teamName) {
+    // Filter SIS situational receiving data based on filters
+    // Returns filtered copy of the data structure
+    if (!situationalData) return null;
+
+    // Check if any filters are actually applied
+    const hasFilters = filters.conference_only || filters.non_conference_only ||
+                      filters.power4_only || filters.last_3_games;
+
+    // If no filters, return original data (no need to recalculate)
+    if (!hasFilters) {
+        return situationalData;
+    }
+
+    // We can now filter using opponent names against conference team lists
+    // even without explicit is_conference enrichment
+
+    const filtered = JSON.parse(JSON.stringify(situationalData)); // Deep copy
+
+    // Helper function to filter a situation (3rd_down or redzone)
+    // Handles both by_week and by_game structures
+    function filterSituation(situation) {
+        if (!situation) return situation;
+
+        // Check if we have by_week or by_game structure
+        const hasByWeek = situation.by_week && Object.keys(situation.by_week).length > 0;
+        const hasByGame = situation.by_game && Object.keys(situation.by_game).length > 0;
+
+        if (!hasByWeek && !hasByGame) return situation;
+
+        const filteredByWeek = {};
+        const filteredByGame = {};
+        let filteredTotal = { targets: 0, receptions: 0, yards: 0, first_downs: 0, touchdowns: 0 };
+        const filteredPlayers = {};
+        const filteredLast3Weeks = [];
+
+        // Get last 3 game IDs if needed
+        let last3GameIds = [];
+        if (filters.last_3_games) {
+            if (hasByWeek) {
+                // Get all unique game_ids from by_week, sorted by week
+                const allWeeks = Object.keys(situation.by_week)
+                    .map(w => ({
+                        week: parseInt(w),
+                        game_id: situation.by_week[w].game_id,
+                        week_str: w
+                    }))
+                    .filter(w => w.game_id)
+                    .sort((a, b) => a.week - b.week);
+                last3GameIds = allWeeks.slice(-3).map(w => w.game_id);
+            } else if (hasByGame) {
+                // Get all unique game_ids from by_game, sorted by week
+                const allGames = Object.entries(situation.by_game)
+                    .map(([key, data]) => ({
+                        week: data.week || parseInt(key.replace('Week', '').split('_')[0]) || 0,
+                        game_id: data.game_id,
+                        game_key: key
+                    }))
+                    .filter(g => g.game_id && g.week > 0)
+                    .sort((a, b) => a.week - b.week);
+                last3GameIds = allGames.slice(-3).map(g => g.game_id);
+            }
+        }
+
+        // Filter by_week entries (old format)
+        if (hasByWeek) {
+            for (const [weekStr, weekData] of Object.entries(situation.by_week)) {
+                let include = true;
+
+                // Filter by conference/non-conference/power4
+                // ALWAYS use opponent name to check conference membership
+                const opponent = weekData.opponent || '';
+                if (filters.conference_only) {
+                    include = include && (teamName ? isConferenceGame(teamName, opponent) : false);
+                } else if (filters.non_conference_only) {
+                    include = include && (teamName ? !isConferenceGame(teamName, opponent) : false);
+                } else if (filters.power4_only) {
+                    include = include && isPower4Opponent(opponent);
+                }
+
+                // Filter by last 3 games
+                if (filters.last_3_games) {
+                    if (weekData.game_id && last3GameIds.length > 0) {
+                        include = include && last3GameIds.includes(weekData.game_id);
+                    }
+                    // If game_id is missing, include it (can't filter without game_id)
+                }
+
+                if (include) {
+                    filteredByWeek[weekStr] = weekData;
+                    filteredLast3Weeks.push(parseInt(weekStr));
+
+                    // Aggregate totals
+                    const stats = weekData.stats || {};
+                    filteredTotal.targets += stats.targets || 0;
+                    filteredTotal.receptions += stats.receptions || 0;
+                    filteredTotal.yards += stats.yards || 0;
+                    if (situation === filtered['3rd_down']) {
+                        filteredTotal.first_downs += stats.first_downs || 0;
+                        // Also add touchdowns from stats (may not be in player-level data)
+                        filteredTotal.touchdowns += stats.touchdowns || 0;
+                    } else {
+                        // For redzone, also add touchdowns from stats
+                        filteredTotal.touchdowns += stats.touchdowns || 0;
+                    }
+
+                    // Aggregate player stats
+                    for (const player of weekData.players || []) {
+                        const playerId = player.playerId;
+                        if (!filteredPlayers[playerId]) {
+                            filteredPlayers[playerId] = {
+                                playerId: playerId,
+                                player: player.player,
+                                targets: 0,
+                                receptions: 0,
+                                yards: 0,
+                                first_downs: 0,
+                                touchdowns: 0,
+                                big_ten_rank: player.big_ten_rank,
+                                is_top_25: player.is_top_25
+                            };
+                        }
+                        filteredPlayers[playerId].targets += player.targets || 0;
+                        filteredPlayers[playerId].receptions += player.receptions || 0;
+                        filteredPlayers[playerId].yards += player.yards || 0;
+                        if (situation === filtered['3rd_down']) {
+                            filteredPlayers[playerId].first_downs += player.first_downs || 0;
+                        }
+                        filteredPlayers[playerId].touchdowns += player.touchdowns || 0;
+                    }
+                }
+            }
+        }
+
+        // Filter by_game entries (new format)
+        if (hasByGame) {
+            for (const [gameKey, gameData] of Object.entries(situation.by_game)) {
+                let include = true;
+
+                // Extract opponent from gameKey (format: "Week17_James Madison" or similar)
+                // or from gameData.opponent field
+                const opponent = gameData.opponent || gameKey.replace(/^Week\d+_/, '') || '';
+
+                // Filter by conference/non-conference/power4
+                // ALWAYS use opponent name to check conference membership
+                if (filters.conference_only) {
+                    include = include && (teamName ? isConferenceGame(teamName, opponent) : false);
+                } else if (filters.non_conference_only) {
+                    include = include && (teamName ? !isConferenceGame(teamName, opponent) : false);
+                } else if (filters.power4_only) {
+                    include = include && isPower4Opponent(opponent);
+                }
+
+                // Filter by last 3 games
+                if (filters.last_3_games) {
+                    if (gameData.game_id && last3GameIds.length > 0) {
+                        include = include && last3GameIds.includes(gameData.game_id);
+                    }
+                }
+
+                if (include) {
+                    filteredByGame[gameKey] = gameData;
+                    const week = gameData.week || parseInt(gameKey.replace('Week', '').split('_')[0]) || 0;
+                    if (week > 0) filteredLast3Weeks.push(week);
+
+                    // Aggregate totals (by_game structure has stats directly, not in stats object)
+                    filteredTotal.targets += gameData.targets || 0;
+                    filteredTotal.receptions += gameData.receptions || 0;
+                    filteredTotal.yards += gameData.yards || 0;
+                    if (situation === filtered['3rd_down']) {
+                        filteredTotal.first_downs += gameData.first_downs || 0;
+                        filteredTotal.touchdowns += gameData.touchdowns || 0;
+                    } else {
+                        filteredTotal.touchdowns += gameData.touchdowns || 0;
+                    }
+
+                    // Aggregate player stats
+                    for (const player of gameData.players || []) {
+                        const playerName = player.player || player.playerId;
+                        if (!filteredPlayers[playerName]) {
+                            filteredPlayers[playerName] = {
+                                playerId: player.playerId || playerName,
+                                player: player.player || playerName,
+                                targets: 0,
+                                receptions: 0,
+                                yards: 0,
+                                first_downs: 0,
+                                touchdowns: 0,
+                                big_ten_rank: player.big_ten_rank,
+                                is_top_25: player.is_top_25
+                            };
+                        }
+                        filteredPlayers[playerName].targets += player.targets || 0;
+                        filteredPlayers[playerName].receptions += player.receptions || 0;
+                        filteredPlayers[playerName].yards += player.yards || 0;
+                        if (situation === filtered['3rd_down']) {
+                            filteredPlayers[playerName].first_downs += player.first_downs || 0;
+                        }
+                        filteredPlayers[playerName].touchdowns += player.touchdowns || 0;
+                    }
+                }
+            }
+        }
+
+        // Calculate last 3 games stats
+        filteredLast3Weeks.sort((a, b) => a - b);
+        const last3 = filteredLast3Weeks.slice(-3);
+        const last3Targets = last3.reduce((sum, w) => {
+            if (hasByWeek) {
+                return sum + (filteredByWeek[w.toString()]?.stats?.targets || 0);
+            } else if (hasByGame) {
+                // Find games in last 3 weeks
+                return sum + Object.values(filteredByGame)
+                    .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                    .reduce((s, g) => s + (g.targets || 0), 0);
+            }
+            return sum;
+        }, 0);
+        const last3Receptions = last3.reduce((sum, w) => {
+            if (hasByWeek) {
+                return sum + (filteredByWeek[w.toString()]?.stats?.receptions || 0);
+            } else if (hasByGame) {
+                return sum + Object.values(filteredByGame)
+                    .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                    .reduce((s, g) => s + (g.receptions || 0), 0);
+            }
+            return sum;
+        }, 0);
+        const last3Yards = last3.reduce((sum, w) => {
+            if (hasByWeek) {
+                return sum + (filteredByWeek[w.toString()]?.stats?.yards || 0);
+            } else if (hasByGame) {
+                return sum + Object.values(filteredByGame)
+                    .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                    .reduce((s, g) => s + (g.yards || 0), 0);
+            }
+            return sum;
+        }, 0);
+
+        let last3Extra = {};
+        if (situation === filtered['3rd_down']) {
+            const last3FirstDowns = last3.reduce((sum, w) => {
+                if (hasByWeek) {
+                    return sum + (filteredByWeek[w.toString()]?.stats?.first_downs || 0);
+                } else if (hasByGame) {
+                    return sum + Object.values(filteredByGame)
+                        .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                        .reduce((s, g) => s + (g.first_downs || 0), 0);
+                }
+                return sum;
+            }, 0);
+            const last3Touchdowns = last3.reduce((sum, w) => {
+                if (hasByWeek) {
+                    return sum + (filteredByWeek[w.toString()]?.players || []).reduce((pSum, p) => pSum + (p.touchdowns || 0), 0);
+                } else if (hasByGame) {
+                    return sum + Object.values(filteredByGame)
+                        .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                        .reduce((s, g) => s + (g.players || []).reduce((pSum, p) => pSum + (p.touchdowns || 0), 0), 0);
+                }
+                return sum;
+            }, 0);
+            last3Extra = { first_downs: last3FirstDowns, touchdowns: last3Touchdowns };
+        } else {
+            const last3Touchdowns = last3.reduce((sum, w) => {
+                if (hasByWeek) {
+                    return sum + (filteredByWeek[w.toString()]?.players || []).reduce((pSum, p) => pSum + (p.touchdowns || 0), 0);
+                } else if (hasByGame) {
+                    return sum + Object.values(filteredByGame)
+                        .filter(g => (g.week || parseInt(Object.keys(situation.by_game).find(k => situation.by_game[k] === g)?.replace('Week', '').split('_')[0]) || 0) === w)
+                        .reduce((s, g) => s + (g.players || []).reduce((pSum, p) => pSum + (p.touchdowns || 0), 0), 0);
+                }
+                return sum;
+            }, 0);
+            last3Extra = { touchdowns: last3Touchdowns };
+        }
+
+        // Sum player first downs for total (use player-level aggregation for accuracy)
+        if (situation === filtered['3rd_down']) {
+            filteredTotal.first_downs = Object.values(filteredPlayers).reduce((sum, p) => sum + p.first_downs, 0);
+        }
+        // For touchdowns: 
+        // 1. First try stats.touchdowns sum (already calculated above)
+        // 2. If that's 0, try player-level sum
+        // 3. If both are 0 but original total had TDs, the weekly breakdown may be missing
+        //    In that case, we keep the stats sum (0) as it's the filtered subset
+        const playerTdSum = Object.values(filteredPlayers).reduce((sum, p) => sum + p.touchdowns, 0);
+        // Only use player-level sum if stats sum is 0 and player sum is > 0
+        if (filteredTotal.touchdowns === 0 && playerTdSum > 0) {
+            filteredTotal.touchdowns = playerTdSum;
+        }
+        // Note: If both are 0, it means the filtered weeks genuinely have 0 TDs
+        // (even if the original total had TDs, those TDs were in weeks not included in the filter)
+
+        // Return structure based on what we have
+        const result = {
+            total: filteredTotal,
+            last_3_games: {
+                targets: last3Targets,
+                receptions: last3Receptions,
+                yards: last3Yards,
+                ...last3Extra
+            },
+            players: Object.values(filteredPlayers).sort((a, b) => b.targets - a.targets)
+        };
+
+        // Add by_week or by_game based on what structure we filtered
+        if (hasByWeek) {
+            result.by_week = filteredByWeek;
+        }
+        if (hasByGame) {
+            result.by_game = filteredByGame;
+        }
+
+        return result;
+    }
+
+    // Filter both situations
+    if (filtered['3rd_down']) {
+        filtered['3rd_down'] = filterSituation(filtered['3rd_down']);
+    }
+    if (filtered.redzone) {
+        filtered.redzone = filterSituation(filtered.redzone);
+    }
+
+    return filtered;
+}
+
+function populateSituationalReceiving() {
+    // Use filtered data if available, otherwise use original
+    const team1 = allData[team1Key].situational_filtered || allData[team1Key].situational;
+    const team2 = allData[team2Key].situational_filtered || allData[team2Key].situational;
+
+    if (!team1 || !team2) {
+        return;
+    }
+
+    // 3rd Down Summary
+    const team13rd = team1['3rd_down'] || { total: {}, last_3_games: {} };
+    const team23rd = team2['3rd_down'] || { total: {}, last_3_games: {} };
+    const thirdDownSummary = `
+        <div class="team-comparison">
+            <div class="team-section ">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total Targets</h3><div class="value">${team13rd.total.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Receptions</h3><div class="value">${team13rd.total.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Reception %</h3><div class="value">${team13rd.total.targets > 0 ? (team13rd.total.receptions / team13rd.total.targets * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>First Downs</h3><div class="value">${team13rd.total.first_downs || 0}</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${team13rd.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Targets</h3><div class="value">${team13rd.last_3_games.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Receptions</h3><div class="value">${team13rd.last_3_games.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 First Downs</h3><div class="value">${team13rd.last_3_games.first_downs || 0}</div></div>
+                </div>
+            </div>
+            <div class="team-section ">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total Targets</h3><div class="value">${team23rd.total.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Receptions</h3><div class="value">${team23rd.total.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Reception %</h3><div class="value">${team23rd.total.targets > 0 ? (team23rd.total.receptions / team23rd.total.targets * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>First Downs</h3><div class="value">${team23rd.total.first_downs || 0}</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${team23rd.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Targets</h3><div class="value">${team23rd.last_3_games.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Receptions</h3><div class="value">${team23rd.last_3_games.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 First Downs</h3><div class="value">${team23rd.last_3_games.first_downs || 0}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('thirdDownSummary').innerHTML = thirdDownSummary;
+
+    // 3rd Down Pie Charts - Target Distribution by Player
+    // Aggregate player targets across all games, including rankings
+    const washPlayerTargets = {};
+    const wiscPlayerTargets = {};
+
+    // Also aggregate from players list to get rankings
+    const washPlayerRankings = {};
+    const wiscPlayerRankings = {};
+    for (const player of team13rd.players || []) {
+        const name = player.player || 'Unknown';
+        washPlayerRankings[name] = player.big_ten_rank;
+    }
+    for (const player of team23rd.players || []) {
+        const name = player.player || 'Unknown';
+        wiscPlayerRankings[name] = player.big_ten_rank;
+    }
+
+    for (const weekData of Object.values(team13rd.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const name = player.player || 'Unknown';
+            if (!washPlayerTargets[name]) {
+                washPlayerTargets[name] = { targets: 0, rank: washPlayerRankings[name] || null };
+            }
+            washPlayerTargets[name].targets += (player.targets || 0);
+        }
+    }
+
+    for (const weekData of Object.values(team23rd.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const name = player.player || 'Unknown';
+            if (!wiscPlayerTargets[name]) {
+                wiscPlayerTargets[name] = { targets: 0, rank: wiscPlayerRankings[name] || null };
+            }
+            wiscPlayerTargets[name].targets += (player.targets || 0);
+        }
+    }
+
+    // Sort by targets and take top players (limit to top 8 for readability)
+    const washTopPlayers = Object.entries(washPlayerTargets)
+        .map(([name, data]) => [name, data.targets, data.rank])
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+    const wiscTopPlayers = Object.entries(wiscPlayerTargets)
+        .map(([name, data]) => [name, data.targets, data.rank])
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+
+    // Team 1 pie chart
+    const ctx3rdWash = document.getElementById('thirdDownChartWash').getContext('2d');
+
+    const washColors = [
+        teamRgba(team1Color, 0.8), teamRgba(team1Color, 0.6), teamRgba(team1Color, 0.4),
+        'rgba(34, 139, 34, 0.8)', 'rgba(34, 139, 34, 0.6)', 'rgba(34, 139, 34, 0.4)',
+        'rgba(0, 100, 0, 0.8)', 'rgba(0, 100, 0, 0.6)'
+    ];
+
+    renderChart('thirdDownWash', ctx3rdWash, {
+        type: 'pie',
+        data: {
+            labels: washTopPlayers.map(p => p[0]),
+            datasets: [{
+                data: washTopPlayers.map(p => p[1]),
+                backgroundColor: washColors.slice(0, washTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team1Name + ' - 3rd Down Target Distribution', font: { size: 14 } },
+                legend: { 
+                    display: true,
+                    position: 'right',
+                    labels: {
+                        font: { size: 11 },
+                        padding: 12,
+                        generateLabels: function(chart) {
+                            const data = chart.data;
+                            if (data.labels.length && data.datasets.length) {
+                                return data.labels.map((label, i) => {
+                                    const value = data.datasets[0].data[i];
+                                    const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+                                    const percentage = ((value / total) * 100).toFixed(1);
+                                    const rank = washTopPlayers[i][2];
+                                    const rankText = rank ? ` (Rank #${rank})` : '';
+                                    return {
+                                        text: `${label}: ${value} (${percentage}%)${rankText}`,
+                                        fillStyle: data.datasets[0].backgroundColor[i],
+                                        strokeStyle: data.datasets[0].borderColor,
+                                        lineWidth: data.datasets[0].borderWidth,
+                                        hidden: false,
+                                        index: i
+                                    };
+                                });
+                            }
+                            return [];
+                        }
+                    }
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = washTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Team 2 pie chart
+    const ctx3rdWisc = document.getElementById('thirdDownChartWisc').getContext('2d');
+
+    const wiscColors = [
+        teamRgba(team2Color, 0.8), teamRgba(team2Color, 0.6), teamRgba(team2Color, 0.4),
+        teamRgba(team1Color, 0.8), teamRgba(team1Color, 0.6), teamRgba(team1Color, 0.4),
+        'rgba(165, 42, 42, 0.8)', 'rgba(165, 42, 42, 0.6)'
+    ];
+
+    renderChart('thirdDownWisc', ctx3rdWisc, {
+        type: 'pie',
+        data: {
+            labels: wiscTopPlayers.map(p => p[0]),
+            datasets: [{
+                data: wiscTopPlayers.map(p => p[1]),
+                backgroundColor: wiscColors.slice(0, wiscTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team2Name + ' - 3rd Down Target Distribution', font: { size: 14 } },
+                legend: { 
+                    display: true,
+                    position: 'right',
+                    labels: {
+                        font: { size: 11 },
+                        padding: 12,
+                        generateLabels: function(chart) {
+                            const data = chart.data;
+                            if (data.labels.length && data.datasets.length) {
+                                return data.labels.map((label, i) => {
+                                    const value = data.datasets[0].data[i];
+                                    const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+                                    const percentage = ((value / total) * 100).toFixed(1);
+                                    const rank = wiscTopPlayers[i][2];
+                                    const rankText = rank ? ` (Rank #${rank})` : '';
+                                    return {
+                                        text: `${label}: ${value} (${percentage}%)${rankText}`,
+                                        fillStyle: data.datasets[0].backgroundColor[i],
+                                        strokeStyle: data.datasets[0].borderColor,
+                                        lineWidth: data.datasets[0].borderWidth,
+                                        hidden: false,
+                                        index: i
+                                    };
+                                });
+                            }
+                            return [];
+                        }
+                    }
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = wiscTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Create player ranking lookup from aggregated players
+    const wash3rdPlayerRankings = {};
+    for (const player of team13rd.players || []) {
+        wash3rdPlayerRankings[player.player || 'Unknown'] = { rank: player.big_ten_rank, isTop25: player.is_top_25 };
+    }
+    const wisc3rdPlayerRankings = {};
+    for (const player of team23rd.players || []) {
+        wisc3rdPlayerRankings[player.player || 'Unknown'] = { rank: player.big_ten_rank, isTop25: player.is_top_25 };
+    }
+
+    // 3rd Down Tables
+    const wash3rdTableData = [];
+    for (const [weekStr, weekData] of Object.entries(team13rd.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            const playerName = player.player || 'Unknown';
+            const rankInfo = wash3rdPlayerRankings[playerName] || { rank: null, isTop25: false };
+            wash3rdTableData.push([
+                parseInt(weekStr), weekData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.first_downs || 0, player.touchdowns || 0, player.yards || 0,
+                rankInfo.rank || ''
+            ]);
+        }
+    }
+    wash3rdTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return a[0] - b[0];
+        return (b[3] || 0) - (a[3] || 0); // Sort by targets descending within week
+    });
+
+    const wisc3rdTableData = [];
+    for (const [weekStr, weekData] of Object.entries(team23rd.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            const playerName = player.player || 'Unknown';
+            const rankInfo = wisc3rdPlayerRankings[playerName] || { rank: null, isTop25: false };
+            wisc3rdTableData.push([
+                parseInt(weekStr), weekData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.first_downs || 0, player.touchdowns || 0, player.yards || 0,
+                rankInfo.rank || ''
+            ]);
+        }
+    }
+    wisc3rdTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return a[0] - b[0];
+        return (b[3] || 0) - (a[3] || 0);
+    });
+
+    // Get top 25 players for banner
+    const washTop25_3rd = team13rd.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+    const wiscTop25_3rd = team23rd.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+
+    const wash3rdDownConfig = {
+        data: wash3rdTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'First Downs' }, { title: 'TDs' }, { title: 'Yards' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[9]; // Big Ten Rank is the 10th column (index 9)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#thirdDownTableWash', wash3rdTableData, wash3rdDownConfig);
+
+    const wisc3rdDownConfig = {
+        data: wisc3rdTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'First Downs' }, { title: 'TDs' }, { title: 'Yards' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[9]; // Big Ten Rank is the 10th column (index 9)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#thirdDownTableWisc', wisc3rdTableData, wisc3rdDownConfig);
+
+    // Add top 25 banner for 3rd down
+    // Remove any existing banners first to avoid duplicates
+    const existing3rdBanner = document.getElementById('thirdDownTop25Banner');
+    if (existing3rdBanner) {
+        existing3rdBanner.remove();
+    }
+    const existing3rdInfoBanner = document.getElementById('thirdDownRankingInfoBanner');
+    if (existing3rdInfoBanner) {
+        existing3rdInfoBanner.remove();
+    }
+
+    if (washTop25_3rd || wiscTop25_3rd) {
+        let bannerHTML = '<div id="thirdDownTop25Banner" class="notice-banner" style="margin-bottom: 20px;"><strong>Top 25 Big Ten Rankings:</strong> ';
+        const parts = [];
+        if (washTop25_3rd) parts.push(`${team1Name}: ${washTop25_3rd}`);
+        if (wiscTop25_3rd) parts.push(`${team2Name}: ${wiscTop25_3rd}`);
+        bannerHTML += parts.join(' | ') + '</div>';
+        bannerHTML += '<div id="thirdDownRankingInfoBanner" class="notice-banner" style="margin-bottom: 20px; font-style: italic; color: #666;"><em>Rankings are based on number of targets in conference games only.</em></div>';
+        document.getElementById('thirdDownSummary').insertAdjacentHTML('afterend', bannerHTML);
+    }
+
+    // Red Zone Summary
+    const washRZ = team1.redzone || { total: {}, last_3_games: {} };
+    const wiscRZ = team2.redzone || { total: {}, last_3_games: {} };
+    const redZoneSummary = `
+        <div class="team-comparison">
+            <div class="team-section ">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total Targets</h3><div class="value">${washRZ.total.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Receptions</h3><div class="value">${washRZ.total.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Reception %</h3><div class="value">${washRZ.total.targets > 0 ? (washRZ.total.receptions / washRZ.total.targets * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${washRZ.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Targets</h3><div class="value">${washRZ.last_3_games.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Receptions</h3><div class="value">${washRZ.last_3_games.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 TDs</h3><div class="value">${washRZ.last_3_games.touchdowns || 0}</div></div>
+                </div>
+            </div>
+            <div class="team-section ">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Total Targets</h3><div class="value">${wiscRZ.total.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Receptions</h3><div class="value">${wiscRZ.total.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Reception %</h3><div class="value">${wiscRZ.total.targets > 0 ? (wiscRZ.total.receptions / wiscRZ.total.targets * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${wiscRZ.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Targets</h3><div class="value">${wiscRZ.last_3_games.targets || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Receptions</h3><div class="value">${wiscRZ.last_3_games.receptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 TDs</h3><div class="value">${wiscRZ.last_3_games.touchdowns || 0}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('redZoneReceivingSummary').innerHTML = redZoneSummary;
+
+    // Red Zone Pie Charts - Target Distribution by Player
+    // Aggregate player targets across all games, including rankings
+    const washRZPlayerTargets = {};
+    const wiscRZPlayerTargets = {};
+
+    // Also aggregate from players list to get rankings
+    const washRZPlayerRankings = {};
+    const wiscRZPlayerRankings = {};
+    for (const player of washRZ.players || []) {
+        const name = player.player || 'Unknown';
+        washRZPlayerRankings[name] = player.big_ten_rank;
+    }
+    for (const player of wiscRZ.players || []) {
+        const name = player.player || 'Unknown';
+        wiscRZPlayerRankings[name] = player.big_ten_rank;
+    }
+
+    for (const weekData of Object.values(washRZ.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const name = player.player || 'Unknown';
+            if (!washRZPlayerTargets[name]) {
+                washRZPlayerTargets[name] = { targets: 0, rank: washRZPlayerRankings[name] || null };
+            }
+            washRZPlayerTargets[name].targets += (player.targets || 0);
+        }
+    }
+
+    for (const weekData of Object.values(wiscRZ.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const name = player.player || 'Unknown';
+            if (!wiscRZPlayerTargets[name]) {
+                wiscRZPlayerTargets[name] = { targets: 0, rank: wiscRZPlayerRankings[name] || null };
+            }
+            wiscRZPlayerTargets[name].targets += (player.targets || 0);
+        }
+    }
+
+    // Sort by targets and take top players
+    const washRZTopPlayers = Object.entries(washRZPlayerTargets)
+        .map(([name, data]) => [name, data.targets, data.rank])
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+    const wiscRZTopPlayers = Object.entries(wiscRZPlayerTargets)
+        .map(([name, data]) => [name, data.targets, data.rank])
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+
+    // Team 1 Red Zone pie chart
+    const ctxRZWash = document.getElementById('redZoneReceivingChartWash').getContext('2d');
+
+    renderChart('redZoneReceivingWash', ctxRZWash, {
+        type: 'pie',
+        data: {
+            labels: washRZTopPlayers.map(p => p[0]),
+            datasets: [{
+                data: washRZTopPlayers.map(p => p[1]),
+                backgroundColor: washColors.slice(0, washRZTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team1Name + ' - Red Zone Target Distribution', font: { size: 14 } },
+                legend: { 
+                    display: true,
+                    position: 'right',
+                    labels: {
+                        font: { size: 11 },
+                        padding: 12,
+                        generateLabels: function(chart) {
+                            const data = chart.data;
+                            if (data.labels.length && data.datasets.length) {
+                                return data.labels.map((label, i) => {
+                                    const value = data.datasets[0].data[i];
+                                    const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+                                    const percentage = ((value / total) * 100).toFixed(1);
+                                    const rank = washRZTopPlayers[i][2];
+                                    const rankText = rank ? ` (Rank #${rank})` : '';
+                                    return {
+                                        text: `${label}: ${value} (${percentage}%)${rankText}`,
+                                        fillStyle: data.datasets[0].backgroundColor[i],
+                                        strokeStyle: data.datasets[0].borderColor,
+                                        lineWidth: data.datasets[0].borderWidth,
+                                        hidden: false,
+                                        index: i
+                                    };
+                                });
+                            }
+                            return [];
+                        }
+                    }
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = washRZTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Team 2 Red Zone pie chart
+    const ctxRZWisc = document.getElementById('redZoneReceivingChartWisc').getContext('2d');
+
+    renderChart('redZoneReceivingWisc', ctxRZWisc, {
+        type: 'pie',
+        data: {
+            labels: wiscRZTopPlayers.map(p => p[0]),
+            datasets: [{
+                data: wiscRZTopPlayers.map(p => p[1]),
+                backgroundColor: wiscColors.slice(0, wiscRZTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team2Name + ' - Red Zone Target Distribution', font: { size: 14 } },
+                legend: { 
+                    display: true,
+                    position: 'right',
+                    labels: {
+                        font: { size: 11 },
+                        padding: 12,
+                        generateLabels: function(chart) {
+                            const data = chart.data;
+                            if (data.labels.length && data.datasets.length) {
+                                return data.labels.map((label, i) => {
+                                    const value = data.datasets[0].data[i];
+                                    const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+                                    const percentage = ((value / total) * 100).toFixed(1);
+                                    const rank = wiscRZTopPlayers[i][2];
+                                    const rankText = rank ? ` (Rank #${rank})` : '';
+                                    return {
+                                        text: `${label}: ${value} (${percentage}%)${rankText}`,
+                                        fillStyle: data.datasets[0].backgroundColor[i],
+                                        strokeStyle: data.datasets[0].borderColor,
+                                        lineWidth: data.datasets[0].borderWidth,
+                                        hidden: false,
+                                        index: i
+                                    };
+                                });
+                            }
+                            return [];
+                        }
+                    }
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = wiscRZTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Create player ranking lookup from aggregated players for Red Zone
+    const washRZPlayerRankingsTable = {};
+    for (const player of washRZ.players || []) {
+        washRZPlayerRankingsTable[player.player || 'Unknown'] = { rank: player.big_ten_rank, isTop25: player.is_top_25 };
+    }
+    const wiscRZPlayerRankingsTable = {};
+    for (const player of wiscRZ.players || []) {
+        wiscRZPlayerRankingsTable[player.player || 'Unknown'] = { rank: player.big_ten_rank, isTop25: player.is_top_25 };
+    }
+
+    // Red Zone Tables
+    const washRZTableData = [];
+    for (const [weekStr, weekData] of Object.entries(washRZ.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            const playerName = player.player || 'Unknown';
+            const rankInfo = washRZPlayerRankingsTable[playerName] || { rank: null, isTop25: false };
+            washRZTableData.push([
+                parseInt(weekStr), weekData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.touchdowns || 0, player.yards || 0,
+                rankInfo.rank || ''
+            ]);
+        }
+    }
+    washRZTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return a[0] - b[0];
+        return (b[3] || 0) - (a[3] || 0);
+    });
+
+    const wiscRZTableData = [];
+    for (const [weekStr, weekData] of Object.entries(wiscRZ.by_week || {})) {
+        for (const player of weekData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            const playerName = player.player || 'Unknown';
+            const rankInfo = wiscRZPlayerRankingsTable[playerName] || { rank: null, isTop25: false };
+            wiscRZTableData.push([
+                parseInt(weekStr), weekData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.touchdowns || 0, player.yards || 0,
+                rankInfo.rank || ''
+            ]);
+        }
+    }
+    wiscRZTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return a[0] - b[0];
+        return (b[3] || 0) - (a[3] || 0);
+    });
+
+    // Get top 25 players for banner
+    const washTop25_RZ = washRZ.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+    const wiscTop25_RZ = wiscRZ.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+
+    const washRZConfig = {
+        data: washRZTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'TDs' }, { title: 'Yards' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[8]; // Big Ten Rank is the 9th column (index 8)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#redZoneReceivingTableWash', washRZTableData, washRZConfig);
+
+    const wiscRZConfig = {
+        data: wiscRZTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'TDs' }, { title: 'Yards' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[8]; // Big Ten Rank is the 9th column (index 8)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#redZoneReceivingTableWisc', wiscRZTableData, wiscRZConfig);
+
+    // Add top 25 banner for red zone
+    // Remove any existing banners first to avoid duplicates
+    const existingRZBanner = document.getElementById('redZoneTop25Banner');
+    if (existingRZBanner) {
+        existingRZBanner.remove();
+    }
+    const existingRZInfoBanner = document.getElementById('redZoneRankingInfoBanner');
+    if (existingRZInfoBanner) {
+        existingRZInfoBanner.remove();
+    }
+
+    if (washTop25_RZ || wiscTop25_RZ) {
+        let bannerHTML = '<div id="redZoneTop25Banner" class="notice-banner" style="margin-bottom: 20px;"><strong>Top 25 Big Ten Rankings:</strong> ';
+        const parts = [];
+        if (washTop25_RZ) parts.push(`${team1Name}: ${washTop25_RZ}`);
+        if (wiscTop25_RZ) parts.push(`${team2Name}: ${wiscTop25_RZ}`);
+        bannerHTML += parts.join(' | ') + '</div>';
+        bannerHTML += '<div id="redZoneRankingInfoBanner" class="notice-banner" style="margin-bottom: 20px; font-style: italic; color: #666;"><em>Rankings are based on number of targets in conference games only.</em></div>';
+        document.getElementById('redZoneReceivingSummary').insertAdjacentHTML('afterend', bannerHTML);
+    }
+}
+
+function filterDeepTargets(deepTargetData, filters, teamName) {
+    // Filter deep target data based on filters
+    // Returns filtered copy of the data structure
+    if (!deepTargetData) {
+        console.log('filterDeepTargets: deepTargetData is null/undefined');
+        return null;
+    }
+
+    // Check if any filters are actually applied
+    const hasFilters = filters.conference_only || filters.non_conference_only ||
+                      filters.power4_only || filters.last_3_games;
+
+    console.log('filterDeepTargets: hasFilters =', hasFilters, 'filters =', filters);
+
+    // If no filters, return original data
+    if (!hasFilters) {
+        console.log('filterDeepTargets: No filters, returning original data');
+        return deepTargetData;
+    }
+
+    // We can now filter using opponent names against conference team lists
+    // Check if receiving data has enrichment fields (for backwards compatibility)
+    let hasEnrichment = false;
+    if (deepTargetData.receiving && deepTargetData.receiving.by_game) {
+        for (const gameData of Object.values(deepTargetData.receiving.by_game)) {
+            if (gameData.hasOwnProperty('is_conference') || gameData.hasOwnProperty('is_power4_opponent') || gameData.hasOwnProperty('game_id')) {
+                hasEnrichment = true;
+                break;
+            }
+        }
+    }
+
+    // Note: Even without enrichment, we can filter by opponent name using conference team lists
+    const filtered = JSON.parse(JSON.stringify(deepTargetData)); // Deep copy
+
+    // Helper function to filter by_game data
+    // For passing data, we need to match it to receiving data to get enrichment fields
+    function filterByGame(byGame, isPassing, receivingByGame) {
+        console.log('filterByGame: isPassing =', isPassing, 'byGame keys =', Object.keys(byGame || {}).length);
+        if (!byGame) {
+            console.log('filterByGame: byGame is null/undefined');
+            return byGame;
+        }
+
+        const filteredByGame = {};
+        let filteredTotal = isPassing ? 
+            { attempts: 0, completions: 0, yards: 0, touchdowns: 0, interceptions: 0 } :
+            { targets: 0, receptions: 0, yards: 0, touchdowns: 0 };
+        const filteredLast3Games = [];
+        let gamesIncluded = 0;
+        let gamesExcluded = 0;
+
+        // Get last 3 game IDs if needed (use receiving data which has game_id)
+        let last3GameIds = [];
+        if (filters.last_3_games && receivingByGame) {
+            const allGames = Object.entries(receivingByGame)
+                .map(([key, data]) => ({
+                    week: data.week || parseInt(key.replace('Week', '').split('_')[0]) || 0,
+                    game_id: data.game_id,
+                    key: key
+                }))
+                .filter(g => g.game_id)
+                .sort((a, b) => a.week - b.week);
+            last3GameIds = allGames.slice(-3).map(g => g.game_id);
+        }
+
+        // Filter games
+        for (const [gameKey, gameData] of Object.entries(byGame)) {
+            let include = true;
+
+            // For passing data, get enrichment fields from matching receiving game
+            let enrichmentData = null;
+            if (isPassing && receivingByGame && receivingByGame[gameKey]) {
+                enrichmentData = receivingByGame[gameKey];
+            } else if (!isPassing) {
+                enrichmentData = gameData; // Receiving data has enrichment fields
+            }
+
+            // Debug: Log enrichment data status (only for first game to avoid spam)
+            let isFirstGame = false;
+            try {
+                const allKeys = Object.keys(byGame);
+                isFirstGame = (allKeys.length > 0 && gameKey === allKeys[0]);
+            } catch(e) {
+                isFirstGame = false;
+            }
+
+            if (filters.conference_only && isFirstGame) {
+                console.log('filterByGame DEBUG: First game key =', gameKey);
+                console.log('filterByGame DEBUG: isPassing =', isPassing);
+                console.log('filterByGame DEBUG: enrichmentData exists =', !!enrichmentData);
+                if (enrichmentData) {
+                    const keys = Object.keys(enrichmentData);
+                    console.log('filterByGame DEBUG: enrichmentData keys =', keys);
+                    console.log('filterByGame DEBUG: has is_conference =', enrichmentData.hasOwnProperty('is_conference'));
+                    console.log('filterByGame DEBUG: is_conference value =', enrichmentData.is_conference);
+                } else {
+                    console.log('filterByGame DEBUG: receivingByGame exists =', !!receivingByGame);
+                    if (receivingByGame) {
+                        const recKeys = Object.keys(receivingByGame);
+                        console.log('filterByGame DEBUG: receivingByGame keys (first 3) =', recKeys.slice(0, 3));
+                        console.log('filterByGame DEBUG: receivingByGame[gameKey] exists =', !!receivingByGame[gameKey]);
+                    }
+                }
+            }
+
+            // Extract opponent from gameKey (format: "Week17_James Madison" or similar)
+            const opponent = gameData.opponent || enrichmentData?.opponent || gameKey.replace(/^Week\d+_/, '') || '';
+
+            // Filter by conference/non-conference/power4
+            // ALWAYS use opponent name to check conference membership
+            if (filters.conference_only) {
+                const isConf = teamName ? isConferenceGame(teamName, opponent) : false;
+                if (isFirstGame) {
+                    console.log('filterByGame DEBUG: gameKey =', gameKey, 'opponent =', opponent, 'isConf =', isConf);
+                }
+                include = include && isConf;
+            } else if (filters.non_conference_only) {
+                const isConf = teamName ? isConferenceGame(teamName, opponent) : false;
+                include = include && !isConf;
+            } else if (filters.power4_only) {
+                include = include && isPower4Opponent(opponent);
+            }
+
+            // Filter by last 3 games
+            if (filters.last_3_games) {
+                if (enrichmentData && enrichmentData.hasOwnProperty('game_id') && enrichmentData.game_id) {
+                    include = include && last3GameIds.includes(enrichmentData.game_id);
+                }
+            }
+
+            if (include) {
+                gamesIncluded++;
+                // Deep copy gameData to preserve all fields including player rankings
+                const gameDataCopy = JSON.parse(JSON.stringify(gameData));
+                filteredByGame[gameKey] = gameDataCopy;
+                filteredLast3Games.push(gameDataCopy);
+
+                // Aggregate totals
+                if (isPassing) {
+                    filteredTotal.attempts += gameData.attempts || 0;
+                    filteredTotal.completions += gameData.completions || 0;
+                    filteredTotal.yards += gameData.yards || 0;
+                    filteredTotal.touchdowns += gameData.touchdowns || 0;
+                    filteredTotal.interceptions += gameData.interceptions || 0;
+                } else {
+                    filteredTotal.targets += gameData.targets || 0;
+                    filteredTotal.receptions += gameData.receptions || 0;
+                    filteredTotal.yards += gameData.yards || 0;
+                    filteredTotal.touchdowns += gameData.touchdowns || 0;
+                }
+            } else {
+                gamesExcluded++;
+            }
+        }
+
+        console.log('filterByGame: gamesIncluded =', gamesIncluded, 'gamesExcluded =', gamesExcluded, 'filteredTotal =', filteredTotal);
+
+        // Calculate last 3 games stats
+        filteredLast3Games.sort((a, b) => (a.week || 0) - (b.week || 0));
+        const last3 = filteredLast3Games.slice(-3);
+
+        const last3Stats = isPassing ? 
+            {
+                attempts: last3.reduce((sum, g) => sum + (g.attempts || 0), 0),
+                completions: last3.reduce((sum, g) => sum + (g.completions || 0), 0),
+                yards: last3.reduce((sum, g) => sum + (g.yards || 0), 0),
+                touchdowns: last3.reduce((sum, g) => sum + (g.touchdowns || 0), 0),
+                interceptions: last3.reduce((sum, g) => sum + (g.interceptions || 0), 0)
+            } :
+            {
+                targets: last3.reduce((sum, g) => sum + (g.targets || 0), 0),
+                receptions: last3.reduce((sum, g) => sum + (g.receptions || 0), 0),
+                yards: last3.reduce((sum, g) => sum + (g.yards || 0), 0),
+                touchdowns: last3.reduce((sum, g) => 
+                    sum + (g.players || []).reduce((pSum, p) => pSum + (p.touchdowns || 0), 0), 0)
+            };
+
+        return {
+            total: filteredTotal,
+            by_game: filteredByGame,
+            last_3_games: last3Stats,
+            big_ten_rank: isPassing ? (deepTargetData.passing?.big_ten_rank || null) : undefined, // Preserve rank if passing
+            players: isPassing ? undefined : aggregateReceivingPlayers(filteredByGame, deepTargetData.receiving?.players)
+        };
+    }
+
+    // Helper to aggregate receiving players across filtered games
+    // originalReceivingPlayers: optional lookup from original data for rankings
+    function aggregateReceivingPlayers(byGame, originalReceivingPlayers) {
+        // Build rankings lookup from original data if provided
+        const rankingsLookup = {};
+        if (originalReceivingPlayers) {
+            for (const player of originalReceivingPlayers) {
+                const name = player.player || 'Unknown';
+                rankingsLookup[name] = {
+                    rank: player.big_ten_rank,
+                    isTop25: player.is_top_25
+                };
+            }
+        }
+
+        const playerStats = {};
+        for (const gameData of Object.values(byGame)) {
+            for (const player of gameData.players || []) {
+                const name = player.player || 'Unknown';
+                if (!playerStats[name]) {
+                    // Try to get ranking from player, or fallback to original data lookup
+                    const ranking = player.big_ten_rank != null ? 
+                        { rank: player.big_ten_rank, isTop25: player.is_top_25 } :
+                        rankingsLookup[name];
+
+                    playerStats[name] = {
+                        player: name,
+                        targets: 0,
+                        receptions: 0,
+                        yards: 0,
+                        touchdowns: 0,
+                        air_yards: 0,
+                        big_ten_rank: ranking?.rank || null,
+                        is_top_25: ranking?.isTop25 || false
+                    };
+                }
+                playerStats[name].targets += player.targets || 0;
+                playerStats[name].receptions += player.receptions || 0;
+                playerStats[name].yards += player.yards || 0;
+                playerStats[name].touchdowns += player.touchdowns || 0;
+                playerStats[name].air_yards += player.air_yards || 0;
+                // Preserve ranking from first occurrence (rankings are consistent across games)
+                // If we still don't have a ranking, try to get it from the current player or lookup
+                if (playerStats[name].big_ten_rank == null) {
+                    if (player.big_ten_rank != null) {
+                        playerStats[name].big_ten_rank = player.big_ten_rank;
+                        playerStats[name].is_top_25 = player.is_top_25 || false;
+                    } else if (rankingsLookup[name]) {
+                        playerStats[name].big_ten_rank = rankingsLookup[name].rank;
+                        playerStats[name].is_top_25 = rankingsLookup[name].isTop25 || false;
+                    }
+                }
+            }
+        }
+        return Object.values(playerStats).sort((a, b) => b.targets - a.targets);
+    }
+
+    // Filter passing and receiving
+    // Pass receiving by_game to filterByGame so passing can use enrichment fields
+    console.log('filterDeepTargets: Before filtering, passing exists =', !!filtered.passing, 'receiving exists =', !!filtered.receiving);
+    if (filtered.passing && filtered.passing.by_game && filtered.receiving && filtered.receiving.by_game) {
+        console.log('filterDeepTargets: Filtering passing data');
+        filtered.passing = filterByGame(filtered.passing.by_game, true, filtered.receiving.by_game);
+        console.log('filterDeepTargets: After filtering passing, total =', filtered.passing?.total);
+    }
+    if (filtered.receiving && filtered.receiving.by_game) {
+        console.log('filterDeepTargets: Filtering receiving data');
+        filtered.receiving = filterByGame(filtered.receiving.by_game, false, null);
+        console.log('filterDeepTargets: After filtering receiving, total =', filtered.receiving?.total, 'players count =', filtered.receiving?.players?.length);
+    }
+
+    console.log('filterDeepTargets: Returning filtered data, passing =', !!filtered.passing, 'receiving =', !!filtered.receiving);
+    return filtered;
+}
+
+function populateDeepTargets() {
+    // Use filtered data if available, otherwise use original
+    const team1 = allData[team1Key].deep_targets_filtered || allData[team1Key].deep_targets;
+    const team2 = allData[team2Key].deep_targets_filtered || allData[team2Key].deep_targets;
+
+    console.log('populateDeepTargets: team1 exists =', !!team1, 'team2 exists =', !!team2);
+    console.log('populateDeepTargets: team1 deep_targets keys =', team1 ? Object.keys(team1) : 'N/A');
+    console.log('populateDeepTargets: team1 passing =', team1?.passing);
+    console.log('populateDeepTargets: team1 receiving =', team1?.receiving);
+    console.log('populateDeepTargets: team1 passing total =', team1?.passing?.total);
+    console.log('populateDeepTargets: team1 passing by_game count =', team1?.passing?.by_game ? Object.keys(team1.passing.by_game).length : 0);
+    console.log('populateDeepTargets: team1 receiving total =', team1?.receiving?.total);
+    console.log('populateDeepTargets: team1 receiving by_game count =', team1?.receiving?.by_game ? Object.keys(team1.receiving.by_game).length : 0);
+    console.log('populateDeepTargets: team2 passing total =', team2?.passing?.total);
+    console.log('populateDeepTargets: team2 receiving total =', team2?.receiving?.total);
+    console.log('populateDeepTargets: originalAllData team1 deep_targets =', originalAllData[team1Key]?.deep_targets ? 'exists' : 'missing');
+    console.log('populateDeepTargets: originalAllData team1 deep_targets passing total =', originalAllData[team1Key]?.deep_targets?.passing?.total);
+
+    if (!team1 || !team2) {
+        console.log('populateDeepTargets: Missing team data, returning early');
+        return;
+    }
+
+    // Combined Summary (unique cards only)
+    const team1Passing = team1.passing || { total: {}, last_3_games: {} };
+    const team2Passing = team2.passing || { total: {}, last_3_games: {} };
+    const team1Receiving = team1.receiving || { total: {}, last_3_games: {} };
+    const team2Receiving = team2.receiving || { total: {}, last_3_games: {} };
+    const combinedSummary = `
+        <div class="team-comparison">
+            <div class="team-section ">
+                <h3>${team1Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Pass Attempts</h3><div class="value">${team1Passing.total.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Completions</h3><div class="value">${team1Passing.total.completions || 0}</div></div>
+                    <div class="summary-card"><h3>Completion %</h3><div class="value">${team1Passing.total.attempts > 0 ? (team1Passing.total.completions / team1Passing.total.attempts * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>Yards</h3><div class="value">${team1Passing.total.yards || 0}</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${team1Passing.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>INTs</h3><div class="value">${team1Passing.total.interceptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Attempts</h3><div class="value">${team1Passing.last_3_games.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Completions</h3><div class="value">${team1Passing.last_3_games.completions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 TDs</h3><div class="value">${team1Receiving.last_3_games.touchdowns || 0}</div></div>
+                </div>
+            </div>
+            <div class="team-section ">
+                <h3>${team2Name}</h3>
+                <div class="summary-cards">
+                    <div class="summary-card"><h3>Pass Attempts</h3><div class="value">${team2Passing.total.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Completions</h3><div class="value">${team2Passing.total.completions || 0}</div></div>
+                    <div class="summary-card"><h3>Completion %</h3><div class="value">${team2Passing.total.attempts > 0 ? (team2Passing.total.completions / team2Passing.total.attempts * 100).toFixed(1) : 0}%</div></div>
+                    <div class="summary-card"><h3>Yards</h3><div class="value">${team2Passing.total.yards || 0}</div></div>
+                    <div class="summary-card"><h3>TDs</h3><div class="value">${team2Passing.total.touchdowns || 0}</div></div>
+                    <div class="summary-card"><h3>INTs</h3><div class="value">${team2Passing.total.interceptions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Attempts</h3><div class="value">${team2Passing.last_3_games.attempts || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 Completions</h3><div class="value">${team2Passing.last_3_games.completions || 0}</div></div>
+                    <div class="summary-card"><h3>Last 3 TDs</h3><div class="value">${team2Receiving.last_3_games.touchdowns || 0}</div></div>
+                </div>
+            </div>
+        </div>
+    `;
+    document.getElementById('deepTargetSummary').innerHTML = combinedSummary;
+
+    // Passing Charts - Attempts by Week (sorted by week)
+    const washPassingGames = Object.entries(team1Passing.by_game || {})
+        .map(([key, data]) => ({
+            week: data.week || parseInt(key.replace('Week', '').split('_')[0]) || 0,
+            opponent: data.opponent || key.replace('Week', '').split('_').slice(1).join(' ').replace(/_/g, ' ') || '',
+            attempts: data.attempts || 0,
+            completions: data.completions || 0
+        }))
+        .sort((a, b) => a.week - b.week);
+
+    const washPassingWeeks = washPassingGames.map(g => `Week ${g.week}`);
+    const washPassingAttempts = washPassingGames.map(g => g.attempts);
+    const washPassingCompletions = washPassingGames.map(g => g.completions);
+    const washPassingOpponents = washPassingGames.map(g => g.opponent);
+
+    const wiscPassingGames = Object.entries(team2Passing.by_game || {})
+        .map(([key, data]) => ({
+            week: data.week || parseInt(key.replace('Week', '').split('_')[0]) || 0,
+            opponent: data.opponent || key.replace('Week', '').split('_').slice(1).join(' ').replace(/_/g, ' ') || '',
+            attempts: data.attempts || 0,
+            completions: data.completions || 0
+        }))
+        .sort((a, b) => a.week - b.week);
+
+    const wiscPassingWeeks = wiscPassingGames.map(g => `Week ${g.week}`);
+    const wiscPassingAttempts = wiscPassingGames.map(g => g.attempts);
+    const wiscPassingCompletions = wiscPassingGames.map(g => g.completions);
+    const wiscPassingOpponents = wiscPassingGames.map(g => g.opponent);
+
+    // Team 1 passing chart
+    const ctxPassWash = document.getElementById('deepPassingChartWash').getContext('2d');
+    renderChart('deepPassingWash', ctxPassWash, {
+        type: 'bar',
+        data: {
+            labels: washPassingWeeks,
+            datasets: [{
+                label: 'Attempts',
+                data: washPassingAttempts,
+                backgroundColor: teamRgba(team1Color, 0.6),
+                borderColor: teamRgba(team1Color, 1.0),
+                borderWidth: 1
+            }, {
+                label: 'Completions',
+                data: washPassingCompletions,
+                backgroundColor: 'rgba(34, 139, 34, 0.6)',
+                borderColor: 'rgba(34, 139, 34, 1)',
+                borderWidth: 1
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team1Name + ' - Deep Ball Attempts by Week', font: { size: 14 } },
+                legend: { display: true, position: 'top' },
+                tooltip: {
+                    callbacks: {
+                        title: function(context) {
+                            const index = context[0].dataIndex;
+                            const opponent = washPassingOpponents[index] || '';
+                            return `Week ${washPassingGames[index].week}${opponent ? ' vs ' + opponent : ''}`;
+                        },
+                        label: function(context) {
+                            const label = context.dataset.label || '';
+                            const value = context.parsed.y || 0;
+                            return `${label}: ${value}`;
+                        }
+                    }
+                }
+            },
+            scales: {
+                y: { beginAtZero: true, ticks: { stepSize: 1 } }
+            }
+        }
+    });
+
+    // Team 2 passing chart
+    const ctxPassWisc = document.getElementById('deepPassingChartWisc').getContext('2d');
+    renderChart('deepPassingWisc', ctxPassWisc, {
+        type: 'bar',
+        data: {
+            labels: wiscPassingWeeks,
+            datasets: [{
+                label: 'Attempts',
+                data: wiscPassingAttempts,
+                backgroundColor: teamRgba(team2Color, 0.6),
+                borderColor: teamRgba(team2Color, 1.0),
+                borderWidth: 1
+            }, {
+                label: 'Completions',
+                data: wiscPassingCompletions,
+                backgroundColor: teamRgba(team1Color, 0.6),
+                borderColor: teamRgba(team1Color, 1.0),
+                borderWidth: 1
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team2Name + ' - Deep Ball Attempts by Week', font: { size: 14 } },
+                legend: { display: true, position: 'top' },
+                tooltip: {
+                    callbacks: {
+                        title: function(context) {
+                            const index = context[0].dataIndex;
+                            const opponent = wiscPassingOpponents[index] || '';
+                            return `Week ${wiscPassingGames[index].week}${opponent ? ' vs ' + opponent : ''}`;
+                        },
+                        label: function(context) {
+                            const label = context.dataset.label || '';
+                            const value = context.parsed.y || 0;
+                            return `${label}: ${value}`;
+                        }
+                    }
+                }
+            },
+            scales: {
+                y: { beginAtZero: true, ticks: { stepSize: 1 } }
+            }
+        }
+    });
+
+
+    // Receiving Charts - Target Distribution by Player
+    // Build player lookup with rankings from ORIGINAL unfiltered data
+    // Rankings are Big Ten-wide and shouldn't change when filtering
+    const originalTeam1 = originalAllData[team1Key].deep_targets || {};
+    const originalTeam2 = originalAllData[team2Key].deep_targets || {};
+    const originalTeam1Receiving = originalTeam1.receiving || {};
+    const originalTeam2Receiving = originalTeam2.receiving || {};
+
+    const washPlayerRankings = {};
+    const wiscPlayerRankings = {};
+    for (const player of originalTeam1Receiving.players || []) {
+        const name = player.player || 'Unknown';
+        washPlayerRankings[name] = {
+            rank: player.big_ten_rank,
+            isTop25: player.is_top_25
+        };
+    }
+    for (const player of originalTeam2Receiving.players || []) {
+        const name = player.player || 'Unknown';
+        wiscPlayerRankings[name] = {
+            rank: player.big_ten_rank,
+            isTop25: player.is_top_25
+        };
+    }
+
+    const washPlayerTargets = {};
+    const wiscPlayerTargets = {};
+
+    for (const player of team1Receiving.players || []) {
+        const name = player.player || 'Unknown';
+        washPlayerTargets[name] = (washPlayerTargets[name] || 0) + (player.targets || 0);
+    }
+
+    for (const player of team2Receiving.players || []) {
+        const name = player.player || 'Unknown';
+        wiscPlayerTargets[name] = (wiscPlayerTargets[name] || 0) + (player.targets || 0);
+    }
+
+    const washTopPlayers = Object.entries(washPlayerTargets)
+        .map(([name, targets]) => {
+            const ranking = washPlayerRankings[name];
+            const rankText = ranking && ranking.rank ? ` (Rank #${ranking.rank})` : '';
+            return [name, targets, ranking?.rank || null, rankText];
+        })
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+    const wiscTopPlayers = Object.entries(wiscPlayerTargets)
+        .map(([name, targets]) => {
+            const ranking = wiscPlayerRankings[name];
+            const rankText = ranking && ranking.rank ? ` (Rank #${ranking.rank})` : '';
+            return [name, targets, ranking?.rank || null, rankText];
+        })
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 8);
+
+    // Team 1 receiving pie chart
+    const ctxRecWash = document.getElementById('deepReceivingChartWash').getContext('2d');
+    const washColors = [
+        teamRgba(team1Color, 0.8), teamRgba(team1Color, 0.6), teamRgba(team1Color, 0.4),
+        'rgba(34, 139, 34, 0.8)', 'rgba(34, 139, 34, 0.6)', 'rgba(34, 139, 34, 0.4)',
+        'rgba(0, 100, 0, 0.8)', 'rgba(0, 100, 0, 0.6)'
+    ];
+    renderChart('deepReceivingWash', ctxRecWash, {
+        type: 'pie',
+        data: {
+            labels: washTopPlayers.map(p => p[0] + ' (' + p[1] + ')' + p[3]),
+            datasets: [{
+                data: washTopPlayers.map(p => p[1]),
+                backgroundColor: washColors.slice(0, washTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team1Name + ' - Deep Target Distribution', font: { size: 14 } },
+                legend: { display: true, position: 'right' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = washTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Team 2 receiving pie chart
+    const ctxRecWisc = document.getElementById('deepReceivingChartWisc').getContext('2d');
+    const wiscColors = [
+        teamRgba(team2Color, 0.8), teamRgba(team2Color, 0.6), teamRgba(team2Color, 0.4),
+        teamRgba(team1Color, 0.8), teamRgba(team1Color, 0.6), teamRgba(team1Color, 0.4),
+        'rgba(165, 42, 42, 0.8)', 'rgba(165, 42, 42, 0.6)'
+    ];
+    renderChart('deepReceivingWisc', ctxRecWisc, {
+        type: 'pie',
+        data: {
+            labels: wiscTopPlayers.map(p => p[0] + ' (' + p[1] + ')' + p[3]),
+            datasets: [{
+                data: wiscTopPlayers.map(p => p[1]),
+                backgroundColor: wiscColors.slice(0, wiscTopPlayers.length),
+                borderColor: 'rgba(255, 255, 255, 0.8)',
+                borderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: team2Name + ' - Deep Target Distribution', font: { size: 14 } },
+                legend: { display: true, position: 'right' },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const index = context.dataIndex;
+                            const player = wiscTopPlayers[index];
+                            const name = player[0];
+                            const targets = player[1];
+                            const rank = player[2];
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = ((targets / total) * 100).toFixed(1);
+                            let label = `${name}: ${targets} targets (${percentage}%)`;
+                            if (rank) {
+                                label += ` - Big Ten Rank #${rank}`;
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Receiving Tables
+    const washRecTableData = [];
+    for (const [gameKey, gameData] of Object.entries(team1Receiving.by_game || {})) {
+        for (const player of gameData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            // Use ranking from player, or fallback to original data lookup
+            const playerName = player.player || 'Unknown';
+            const rank = player.big_ten_rank || washPlayerRankings[playerName]?.rank || '';
+            const row = [
+                gameData.week || '', gameData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.yards || 0, player.air_yards || 0, player.touchdowns || 0,
+                rank
+            ];
+            washRecTableData.push(row);
+        }
+    }
+    washRecTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return (a[0] || 0) - (b[0] || 0);
+        return (b[3] || 0) - (a[3] || 0);
+    });
+
+    const wiscRecTableData = [];
+    for (const [gameKey, gameData] of Object.entries(team2Receiving.by_game || {})) {
+        for (const player of gameData.players || []) {
+            const recPct = player.targets > 0 ? (player.receptions / player.targets * 100).toFixed(1) : '0.0';
+            // Use ranking from player, or fallback to original data lookup
+            const playerName = player.player || 'Unknown';
+            const rank = player.big_ten_rank || wiscPlayerRankings[playerName]?.rank || '';
+            const row = [
+                gameData.week || '', gameData.opponent || '', playerName,
+                player.targets || 0, player.receptions || 0, recPct + '%',
+                player.yards || 0, player.air_yards || 0, player.touchdowns || 0,
+                rank
+            ];
+            wiscRecTableData.push(row);
+        }
+    }
+    wiscRecTableData.sort((a, b) => {
+        if (a[0] !== b[0]) return (a[0] || 0) - (b[0] || 0);
+        return (b[3] || 0) - (a[3] || 0);
+    });
+
+    const washRecConfig = {
+        data: washRecTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'Yards' }, { title: 'Air Yards' }, { title: 'TDs' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[9]; // Big Ten Rank is the 10th column (index 9)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#deepReceivingTableWash', washRecTableData, washRecConfig);
+
+    const wiscRecConfig = {
+        data: wiscRecTableData,
+        paging: false,
+        searching: false,
+        scrollY: '400px',
+        scrollCollapse: true,
+        columns: [
+            { title: 'Week' }, { title: 'Opponent' }, { title: 'Player' },
+            { title: 'Targets' }, { title: 'Receptions' }, { title: 'Reception %' },
+            { title: 'Yards' }, { title: 'Air Yards' }, { title: 'TDs' },
+            { title: 'Big Ten Rank' }
+        ],
+        createdRow: function(row, data) {
+            // Add top-25-rank class if rank is <= 25
+            const rank = data[9]; // Big Ten Rank is the 10th column (index 9)
+            if (rank && rank <= 25) {
+                $(row).addClass('top-25-rank');
+            }
+        }
+    };
+    safeUpdateDataTable('#deepReceivingTableWisc', wiscRecTableData, wiscRecConfig);
+
+    // Add top 25 banner for deep receiving
+    // Remove any existing banners first to avoid duplicates
+    const existingBanner = document.getElementById('deepReceivingTop25Banner');
+    if (existingBanner) {
+        existingBanner.remove();
+    }
+    const existingDeepInfoBanner = document.getElementById('deepReceivingRankingInfoBanner');
+    if (existingDeepInfoBanner) {
+        existingDeepInfoBanner.remove();
+    }
+
+    // Use original data for top 25 banner (rankings are Big Ten-wide)
+    const washTop25_deep = originalTeam1Receiving.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+    const wiscTop25_deep = originalTeam2Receiving.players.filter(p => p.is_top_25).map(p => p.player).join(', ');
+
+    if (washTop25_deep || wiscTop25_deep) {
+        let bannerHTML = '<div id="deepReceivingTop25Banner" class="notice-banner" style="margin-bottom: 20px;"><strong>Top 25 Big Ten Rankings:</strong> ';
+        const parts = [];
+        if (washTop25_deep) parts.push(`${team1Name}: ${washTop25_deep}`);
+        if (wiscTop25_deep) parts.push(`${team2Name}: ${wiscTop25_deep}`);
+        bannerHTML += parts.join(' | ') + '</div>';
+        bannerHTML += '<div id="deepReceivingRankingInfoBanner" class="notice-banner" style="margin-bottom: 20px; font-style: italic; color: #666;"><em>Rankings are based on number of targets in conference games only.</em></div>';
+        // Find the deep target summary element to insert after
+        const summaryElement = document.getElementById('deepTargetSummary');
+        if (summaryElement) {
+            summaryElement.insertAdjacentHTML('afterend', bannerHTML);
+        }
+    }
+}
+
+// Section id -> function that renders it, in page order. Sections are
+// rendered the first time they come near the viewport; the rest of
+// the page renders only when it is reached.
+const SECTION_RENDERERS = {
+    middleEightSection: populateMiddleEight,
+    explosivePlaysSection: populateExplosivePlays,
+    penaltySection: populatePenalties,
+    fourthDownSection: populate4thDowns,
+    postTurnoverSection: populatePostTurnover,
+    specialTeamsSection: populateSpecialTeams,
+    redZoneSection: populateRedZone,
+    situationalReceivingSection: populateSituationalReceiving,
+    deepTargetSection: populateDeepTargets,
+    allPlaysSection: populateAllPlaysBrowser
+};
+const renderedSections = new Set();
+let sectionObserver = null;
+
+function renderSection(sectionId) {
+    if (renderedSections.has(sectionId) || !SECTION_RENDERERS[sectionId]) return;
+    renderedSections.add(sectionId);
+    const section = document.getElementById(sectionId);
+    if (sectionObserver && section) sectionObserver.unobserve(section);
+    SECTION_RENDERERS[sectionId]();
+}
+
+// Render sections as they come within 400px of the viewport (all at
+// once without IntersectionObserver)
+function observeSections() {
+    if (typeof IntersectionObserver === 'undefined') {
+        Object.keys(SECTION_RENDERERS).forEach(renderSection);
+        return;
+    }
+    sectionObserver = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) renderSection(entry.target.id);
+        });
+    }, { rootMargin: '400px 0px' });
+    Object.keys(SECTION_RENDERERS).forEach(sectionId => {
+        const section = document.getElementById(sectionId);
+        if (section) sectionObserver.observe(section);
+    });
+}
+
+// Re-render the sections rendered so far (e.g. after a filter change);
+// the others pick up the current allData when they are first rendered
+function populateAllSections() {
+    renderedSections.forEach(sectionId => SECTION_RENDERERS[sectionId]());
+}
+
+// All Plays Browser: one virtual table per team. The plays do not
+// change with the filters, so the tables are built once.
+const allPlaysTables = [];
+
+function populateAllPlaysBrowser() {
+    const container = document.getElementById('allPlaysContainer');
+    if (!container || allPlaysTables.length) return;
+
+    container.innerHTML = '<div class="plays-browser"></div>';
+    const browser = container.firstChild;
+
+    const teams = [
+        { name: team1Name, plays: team1Plays, color: team1Key },
+        { name: team2Name, plays: team2Plays, color: team2Key }
+    ];
+
+    teams.forEach((team, teamIdx) => {
+        const teamId = `team-${teamIdx}`;
+        const section = document.createElement('div');
+        section.className = 'team-section-browser';
+        section.innerHTML = `
+            <div class="team-header-browser ${team.color}" onclick="toggleCollapsible('${teamId}')">
+                <span class="expand-icon">▶</span> ${team.name} (${team.plays.length} plays)
+            </div>
+            <div id="${teamId}" class="collapsible-content"><table class="plays-table-browser"></table></div>`;
+        browser.appendChild(section);
+
+        // Plays in game order: week, quarter, drive, play number
+        const table = createVirtualTable(section.querySelector('table'), {
+            columns: [
+                { title: 'Week' }, { title: 'Opponent' }, { title: 'Quarter' }, { title: 'Drive' },
+                { title: 'Play' }, { title: 'Clock' }, { title: 'Down' }, { title: 'Dist' },
+                { title: 'Yard Line' }, { title: 'Play Type' }, { title: 'Yards' }, { title: 'Description' }
+            ],
+            order: [[0, 'asc'], [2, 'asc'], [3, 'asc'], [4, 'asc']],
+            scrollY: '600px',
+            searching: true
+        });
+        const plays = team.plays;
+        table.setColumns([
+            plays.map(p => p.game_week || 0),
+            plays.map(p => p.opponent || 'Unknown'),
+            plays.map(p => getQuarterName(p.period || 1)),
+            plays.map(p => p.drive_number || 0),
+            plays.map(p => p.play_number || ''),
+            plays.map(p => formatClock(p.clock || '')),
+            plays.map(p => p.down || ''),
+            plays.map(p => p.distance || ''),
+            plays.map(p => p.yard_line || ''),
+            plays.map(p => p.play_type || ''),
+            plays.map(p => p.yards_gained || 0),
+            plays.map(p => p.play_text || '')
+        ]);
+        allPlaysTables.push(table);
+    });
+}
+
+function toggleCollapsible(id) {
+    const element = document.getElementById(id);
+    if (!element) return;
+
+    const isExpanded = element.classList.contains('expanded');
+    if (isExpanded) {
+        element.classList.remove('expanded');
+        // Hide all child collapsibles
+        element.querySelectorAll('.collapsible-content').forEach(child => {
+            child.classList.remove('expanded');
+        });
+    } else {
+        element.classList.add('expanded');
+    }
+
+    // Update icon
+    const header = element.previousElementSibling;
+    if (header) {
+        const icon = header.querySelector('.expand-icon');
+        if (icon) {
+            icon.classList.toggle('expanded', !isExpanded);
+        }
+    }
+}
+
+function getQuarterName(period) {
+    const quarters = ['', '1st', '2nd', '3rd', '4th', 'OT'];
+    return quarters[period] || period;
+}
+
+// Per-game partials of each team, built on the first filter change
+const gamePartials = {};
+function getGamePartials(teamKey, plays, teamName) {
+    if (!gamePartials[teamKey]) {
+        gamePartials[teamKey] = buildGamePartials(plays, teamName);
+    }
+    return gamePartials[teamKey];
+}
+
+// Filtered analysis of both teams on the main thread (used when the
+// filter worker is not available): [{ data, plays }, { data, plays }]
+function filterOnMainThread(filters) {
+    return [[team1Key, team1Plays, team1Name], [team2Key, team2Plays, team2Name]].map(([teamKey, plays, teamName]) => {
+        // Merge the per-game partials of the kept games (the analyzers are not re-run)
+        const games = filterGames(getGamePartials(teamKey, plays, teamName), filters, teamName);
+        return { data: mergeGamePartials(games, teamName), plays: [].concat(...games.map(game => game.plays)) };
+    });
+}
+
+// Filter worker, started from the analysisCore and analysisWorker
+// sources once the data is decoded; it gets the data block's JSON source
+// once (the inflated buffer is transferred, not copied). Only the newest filter request is pending: a new
+// request (or resetFilters) cancels the previous one.
+let analysisWorker = null;
+let filterRequestId = 0;
+let pendingFilter = null;
+
+function startAnalysisWorker(source) {
+    if (typeof Worker === 'undefined' || typeof Blob === 'undefined') return;
+    try {
+        // With shared assets the core is a linked file, which the worker imports
+        const core = document.getElementById('analysisCore');
+        const coreSource = core.src ? `importScripts(${JSON.stringify(core.src)});` : core.textContent;
+        const source = coreSource + '\n' + document.getElementById('analysisWorker').textContent;
+        analysisWorker = new Worker(URL.createObjectURL(new Blob([source], { type: 'text/javascript' })));
+    } catch (error) {
+        console.warn('Filter worker unavailable, filtering on the main thread:', error);
+        analysisWorker = null;
+        return;
+    }
+    analysisWorker.onmessage = event => {
+        const message = event.data;
+        if (!pendingFilter || pendingFilter.id !== message.id) return;  // superseded
+        const request = pendingFilter;
+        pendingFilter = null;
+        const teamPlays = [team1Plays, team2Plays];
+        request.resolve(message.teams.map((team, i) => ({
+            data: team.data,
+            plays: Array.from(team.rows, row => teamPlays[i][row])
+        })));
+    };
+    analysisWorker.onerror = event => {
+        console.warn('Filter worker failed, filtering on the main thread:', event.message);
+        analysisWorker.terminate();
+        analysisWorker = null;
+        const request = pendingFilter;
+        pendingFilter = null;
+        if (request) request.resolve(filterOnMainThread(request.filters));
+    };
+    const transfer = source instanceof ArrayBuffer ? [source] : [];
+    analysisWorker.postMessage({
+        type: 'init',
+        source: source,
+        teams: [{ key: team1Key, name: team1Name }, { key: team2Key, name: team2Name }]
+    }, transfer);
+}
+
+// Resolve a pending filter request with null (its result is not rendered)
+function cancelFilterRequest() {
+    if (pendingFilter) {
+        pendingFilter.resolve(null);
+        pendingFilter = null;
+    }
+}
+
+// Filtered analysis of both teams, from the worker when available
+function computeFilteredData(filters) {
+    cancelFilterRequest();
+    if (!analysisWorker) {
+        return Promise.resolve(filterOnMainThread(filters));
+    }
+    return new Promise(resolve => {
+        const id = ++filterRequestId;
+        pendingFilter = { id: id, filters: filters, resolve: resolve };
+        analysisWorker.postMessage({ type: 'filter', id: id, filters: filters });
+    });
+}
+
+// Filtered analyses of the most recently used filter states (users
+// toggle between the same few), keyed by the normalized filter state.
+// Map iteration order is insertion order, so the first key is the
+// least recently used one.
+const FILTER_CACHE_SIZE = 6;
+const filterCache = new Map();
+
+function filterCacheKey(filters) {
+    return Object.keys(filters).filter(name => filters[name]).sort().join('|');
+}
+
+function getFilteredData(filters) {
+    const key = filterCacheKey(filters);
+    const cached = filterCache.get(key);
+    if (cached) {
+        cancelFilterRequest();
+        filterCache.delete(key);
+        filterCache.set(key, cached);
+        return Promise.resolve(cached);
+    }
+    return computeFilteredData(filters).then(filtered => {
+        if (filtered) {
+            filterCache.set(key, filtered);
+            if (filterCache.size > FILTER_CACHE_SIZE) {
+                filterCache.delete(filterCache.keys().next().value);
+            }
+        }
+        return filtered;
+    });
+}
+
+function applyFilters() {
+    const filters = getFilters();
+    getFilteredData(filters).then(filtered => {
+        if (filtered) renderFilteredData(filters, filtered);
+    });
+}
+
+// Sections whose trend charts read the filtered plays (_filtered_plays)
+const TREND_SECTIONS = ['middle8', 'explosive', 'penalties', '4thdowns', 'turnover', 'specialteams', 'redzone'];
+
+function withFilteredPlays(teamData, plays) {
+    const copy = Object.assign({}, teamData);
+    TREND_SECTIONS.forEach(section => {
+        copy[section] = Object.assign({}, teamData[section], { _filtered_plays: plays });
+    });
+    return copy;
+}
+
+function renderFilteredData(filters, [team1Result, team2Result]) {
+    // Store filtered plays for trend calculations. The results are shared
+    // with filterCache, so render-only state goes on shallow copies.
+    const team1FilteredData = withFilteredPlays(team1Result.data, team1Result.plays);
+    const team2FilteredData = withFilteredPlays(team2Result.data, team2Result.plays);
+
+    // Filter SIS situational receiving data (always use original data)
+    console.log('=== SIS SITUATIONAL RECEIVING FILTERING DEBUG ===');
+    console.log('Team1 original situational:', originalAllData[team1Key].situational ? 'exists' : 'missing');
+    console.log('Team2 original situational:', originalAllData[team2Key].situational ? 'exists' : 'missing');
+    const team1SituationalFiltered = filterSituationalReceiving(originalAllData[team1Key].situational, filters, team1Name);
+    const team2SituationalFiltered = filterSituationalReceiving(originalAllData[team2Key].situational, filters, team2Name);
+    console.log('Team1 filtered situational:', team1SituationalFiltered ? 'exists' : 'missing');
+    console.log('Team2 filtered situational:', team2SituationalFiltered ? 'exists' : 'missing');
+    if (team1SituationalFiltered) {
+        console.log('Team1 filtered 3rd_down total:', team1SituationalFiltered['3rd_down']?.total);
+        console.log('Team1 filtered redzone total:', team1SituationalFiltered.redzone?.total);
+        console.log('Team1 filtered 3rd_down by_week count:', Object.keys(team1SituationalFiltered['3rd_down']?.by_week || {}).length);
+        console.log('Team1 filtered redzone by_week count:', Object.keys(team1SituationalFiltered.redzone?.by_week || {}).length);
+    }
+    if (team2SituationalFiltered) {
+        console.log('Team2 filtered 3rd_down total:', team2SituationalFiltered['3rd_down']?.total);
+        console.log('Team2 filtered redzone total:', team2SituationalFiltered.redzone?.total);
+        console.log('Team2 filtered 3rd_down by_week count:', Object.keys(team2SituationalFiltered['3rd_down']?.by_week || {}).length);
+        console.log('Team2 filtered redzone by_week count:', Object.keys(team2SituationalFiltered.redzone?.by_week || {}).length);
+    }
+    console.log('=== END SIS SITUATIONAL RECEIVING DEBUG ===');
+
+    // Filter SIS deep target data (always use original data)
+    console.log('=== SIS DEEP TARGETS FILTERING DEBUG ===');
+    console.log('Team1 original deep_targets:', originalAllData[team1Key].deep_targets ? 'exists' : 'missing');
+    console.log('Team2 original deep_targets:', originalAllData[team2Key].deep_targets ? 'exists' : 'missing');
+    const team1DeepTargetsFiltered = filterDeepTargets(originalAllData[team1Key].deep_targets, filters, team1Name);
+    const team2DeepTargetsFiltered = filterDeepTargets(originalAllData[team2Key].deep_targets, filters, team2Name);
+    console.log('Team1 filtered deep_targets:', team1DeepTargetsFiltered ? 'exists' : 'missing');
+    console.log('Team2 filtered deep_targets:', team2DeepTargetsFiltered ? 'exists' : 'missing');
+    if (team1DeepTargetsFiltered) {
+        console.log('Team1 filtered passing total:', team1DeepTargetsFiltered.passing?.total);
+        console.log('Team1 filtered receiving total:', team1DeepTargetsFiltered.receiving?.total);
+        console.log('Team1 filtered passing by_game count:', Object.keys(team1DeepTargetsFiltered.passing?.by_game || {}).length);
+        console.log('Team1 filtered receiving by_game count:', Object.keys(team1DeepTargetsFiltered.receiving?.by_game || {}).length);
+    }
+    if (team2DeepTargetsFiltered) {
+        console.log('Team2 filtered passing total:', team2DeepTargetsFiltered.passing?.total);
+        console.log('Team2 filtered receiving total:', team2DeepTargetsFiltered.receiving?.total);
+        console.log('Team2 filtered passing by_game count:', Object.keys(team2DeepTargetsFiltered.passing?.by_game || {}).length);
+        console.log('Team2 filtered receiving by_game count:', Object.keys(team2DeepTargetsFiltered.receiving?.by_game || {}).length);
+    }
+    console.log('=== END SIS DEEP TARGETS DEBUG ===');
+
+    // Replace allData with filtered data
+    allData[team1Key] = team1FilteredData;
+    allData[team2Key] = team2FilteredData;
+
+    // Add filtered SIS data
+    if (team1SituationalFiltered) {
+        allData[team1Key].situational_filtered = team1SituationalFiltered;
+    }
+    if (team2SituationalFiltered) {
+        allData[team2Key].situational_filtered = team2SituationalFiltered;
+    }
+    if (team1DeepTargetsFiltered) {
+        allData[team1Key].deep_targets_filtered = team1DeepTargetsFiltered;
+    }
+    if (team2DeepTargetsFiltered) {
+        allData[team2Key].deep_targets_filtered = team2DeepTargetsFiltered;
+    }
+
+    // Re-populate the rendered sections with filtered data. The filtered
+    // data stays in allData (filters always start from originalAllData)
+    // so sections rendered later show it too.
+    populateAllSections();
+}
+
+function resetFilters() {
+    cancelFilterRequest();
+
+    // Reset filter dropdowns
+    document.getElementById('conferenceFilter').selectedIndex = 0;
+    document.getElementById('timePeriodFilter').selectedIndex = 0;
+
+    // Restore original data
+    allData[team1Key] = originalAllData[team1Key];
+    allData[team2Key] = originalAllData[team2Key];
+
+    // Re-populate with original (unfiltered) data
+    populateAllSections();
+}
+
+// Update active navigation link on scroll
+function updateActiveNavLink() {
+    const sections = document.querySelectorAll('.section[id]');
+    const navLinks = document.querySelectorAll('.nav-links a');
+
+    let currentSection = '';
+    const scrollPosition = window.scrollY + 100;
+
+    sections.forEach(section => {
+        const sectionTop = section.offsetTop;
+        const sectionHeight = section.offsetHeight;
+
+        if (scrollPosition >= sectionTop && scrollPosition < sectionTop + sectionHeight) {
+            currentSection = section.getAttribute('id');
+        }
+    });
+
+    // The section on screen is always rendered (IntersectionObserver
+    // normally got to it first)
+    if (currentSection) renderSection(currentSection);
+
+    navLinks.forEach(link => {
+        link.classList.remove('active');
+        const href = link.getAttribute('href');
+        if (href === `#${currentSection}`) {
+            link.classList.add('active');
+        }
+    });
+}
+
+// Initialize on load
+window.addEventListener('DOMContentLoaded', async function() {
+    try {
+        const { data, source } = await loadAppData();
+        initializeData(data, source);
+    } catch (error) {
+        console.error('Failed to load the embedded data:', error);
+        document.body.insertAdjacentHTML('afterbegin',
+            `<div style="padding: 16px; background: #fee; color: #900;">Failed to load the analysis data: ${error.message}</div>`);
+        return;
+    }
+    initializeFilters();
+    observeSections();
+    updateActiveNavLink();
+
+    // Smooth scroll for navigation links
+    document.querySelectorAll('.nav-links a').forEach(link => {
+        link.addEventListener('click', function(e) {
+            e.preventDefault();
+            const targetId = this.getAttribute('href').substring(1);
+            const targetElement = document.getElementById(targetId);
+            if (targetElement) {
+                // Render the sections up to the target first so the
+                // page above it does not grow during the scroll
+                const sectionIds = Object.keys(SECTION_RENDERERS);
+                sectionIds.slice(0, sectionIds.indexOf(targetId) + 1).forEach(renderSection);
+                const offset = 80;
+                const targetPosition = targetElement.offsetTop - offset;
+                window.scrollTo({
+                    top: targetPosition,
+                    behavior: 'smooth'
+                });
+            }
+        });
+    });
+
+    // Update active link on scroll
+    window.addEventListener('scroll', updateActiveNavLink);
+});
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Analyzer results merged from per-game partials
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analysis_engine import AnalysisEngine, standard_analyzers  # noqa: E402
+from game_index import GameIndex  # noqa: E402
+
+PLAY_TYPES = ['Rush', 'Pass Reception', 'Penalty', 'Passing Touchdown', 'Field Goal Good', 'Punt',
+              'Kickoff Return (Offense)', 'Interception', 'Fumble Recovery (Opponent)', 'Blocked Punt']
+PLAY_TEXTS = ['run 1ST DOWN', 'PURDUE Penalty, Holding enforced', 'pass TOUCHDOWN',
+              'punt return for 25 yds', 'kickoff return for 40 yds', 'blocked punt', 'incomplete']
+
+
+def season(games: int = 6, plays_per_game: int = 80):
+    """Random but reproducible plays of Purdue vs Iowa games"""
+    rng = random.Random(7)
+    plays = []
+    for g in range(games):
+        game_id = 100 + g
+        drive = 0
+        for i in range(plays_per_game):
+            if rng.random() < 0.15:
+                drive += 1
+            offense = rng.choice(['Purdue', 'Iowa'])
+            play_type = rng.choice(PLAY_TYPES)
+            turnover = rng.random() < 0.08
+            plays.append({
+                'game_id': game_id,
+                'game_week': (g * 4) % games + 1,
+                'offense': offense,
+                'defense': 'Iowa' if offense == 'Purdue' else 'Purdue',
+                'opponent': 'Iowa',
+                'drive_number': drive,
+                'drive_id': f'{game_id}-{drive}',
+                'play_number': i,
+                'down': rng.choice([1, 2, 3, 4]),
+                'distance': rng.randint(1, 12),
+                'yards_gained': rng.randint(-3, 40),
+                'yards_to_goal': rng.randint(1, 99),
+                'yard_line': rng.randint(1, 99),
+                'ppa': rng.choice([None, 0.5, -0.25, 1.75]),
+                'play_type': play_type,
+                'play_text': rng.choice(PLAY_TEXTS),
+                'play_classification': rng.choice(['offense', 'special_teams']),
+                'penalty_type': rng.choice([None, 'Holding', 'False Start']),
+                'penalty_decision': rng.choice([None, 'accepted', 'declined']),
+                'turnover': turnover,
+                'turnover_type': rng.choice(['interception', 'fumble', 'downs']) if turnover else None,
+                'drive_started_after_turnover': rng.random() < 0.2,
+                'middle_eight': rng.random() < 0.2,
+                'scoring': ('Touchdown' in play_type or 'Field Goal' in play_type) and rng.random() < 0.6,
+                'explosive_play': rng.random() < 0.2,
+            })
+    return plays
+
+
+def run(plays, game_index):
+    engine = AnalysisEngine('Purdue', game_index)
+    for analyzer in standard_analyzers('Purdue'):
+        engine.register(analyzer)
+    return engine, engine.run(plays)
+
+
+class ResultsForGamesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.plays = season()
+        self.game_index = GameIndex(self.plays)
+        self.engine, self.results = run(self.plays, self.game_index)
+
+    def test_all_games_match_run(self) -> None:
+        self.assertEqual(self.engine.results_for_games(self.game_index.game_ids), self.results)
+
+    def test_subset_matches_run_over_its_plays(self) -> None:
+        for game_ids in ([101, 104], self.game_index.last_n(3), []):
+            with self.subTest(game_ids=game_ids):
+                subset = [play for play in self.plays if play['game_id'] in game_ids]
+                _, expected = run(subset, self.game_index)
+                self.assertEqual(self.engine.results_for_games(game_ids), expected)
+
+    def test_partials_sum_to_totals(self) -> None:
+        fourth_downs = self.engine.analyzers[3]
+        self.assertEqual(fourth_downs.name, 'fourth_downs')
+        partials = fourth_downs.partials.values()
+        self.assertEqual(sum(p['attempts'] for p in partials), self.results['fourth_downs']['total_attempts'])
+        self.assertEqual(sum(len(p['converted']) for p in partials),
+                         self.results['fourth_downs']['total_conversions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+RefResolver against a loopback stand-in for the ESPN core API
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import contextlib
+import io
+import json
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from espn_refs import RefResolver, is_unresolved  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+
+
+class CoreHandler(BaseHTTPRequestHandler):
+    """
+    /teams/1 links /venues/5, /plays/10 links /teams/1; anything else is a 404.
+    Every object carries its own '$ref', like ESPN's.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        base = server.base
+        objects = {
+            '/teams/1': {'id': '1', 'name': 'Purdue', 'venue': {'$ref': f'{base}/venues/5'}},
+            '/venues/5': {'id': '5', 'name': 'Ross-Ade Stadium'},
+            '/plays/10': {'id': '10', 'team': {'$ref': f'{base}/teams/1'}},
+        }
+        if self.path in objects:
+            status, body = 200, dict(objects[self.path], **{'$ref': f'{base}{self.path}'})
+        else:
+            status, body = 404, {'error': 'not found'}
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class RefResolverTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CoreHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        self.base = self.server.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def ref(self, path: str) -> dict:
+        return {'$ref': f'{self.base}{path}'}
+
+    async def test_same_ref_fetched_once(self) -> None:
+        data = {'home': self.ref('/teams/1'), 'teams': [self.ref('/teams/1'), self.ref('/teams/1')]}
+        async with HttpClient(retries=0) as client:
+            resolver = RefResolver(client)
+            data = await resolver.resolve(data)
+
+        self.assertEqual(self.server.hits, {'/teams/1': 1})
+        self.assertEqual(resolver.fetched, 1)
+        for team in (data['home'], *data['teams']):
+            self.assertEqual(team['name'], 'Purdue')
+            # The resolved object keeps its ref URL
+            self.assertEqual(team['$ref'], f'{self.base}/teams/1')
+        # Each place has its own copy
+        self.assertIsNot(data['home'], data['teams'][0])
+
+    async def test_depth_limits_nested_refs(self) -> None:
+        async with HttpClient(retries=0) as client:
+            resolver = RefResolver(client)
+            shallow = await resolver.resolve({'play': self.ref('/plays/10')})
+            deep = await resolver.resolve({'play': self.ref('/plays/10')}, depth=3)
+
+        self.assertTrue(is_unresolved(shallow['play']['team']))
+        self.assertEqual(deep['play']['team']['venue']['name'], 'Ross-Ade Stadium')
+        # depth 3 needed only three levels; nothing is left to fetch
+        self.assertEqual(self.server.hits, {'/plays/10': 2, '/teams/1': 1, '/venues/5': 1})
+
+    async def test_match_limits_refs(self) -> None:
+        async with HttpClient(retries=0) as client:
+            resolver = RefResolver(client, depth=2, match=r'/teams/')
+            data = await resolver.resolve({'play': self.ref('/plays/10'), 'team': self.ref('/teams/1')})
+
+        self.assertTrue(is_unresolved(data['play']))
+        self.assertTrue(is_unresolved(data['team']['venue']))
+        self.assertEqual(self.server.hits, {'/teams/1': 1})
+
+    async def test_shared_refs_memoized_across_resolves(self) -> None:
+        async with HttpClient(retries=0) as client:
+            resolver = RefResolver(client)
+            for _ in range(3):
+                data = await resolver.resolve({'team': self.ref('/teams/1'), 'play': self.ref('/plays/10')})
+                self.assertEqual(data['team']['name'], 'Purdue')
+                self.assertEqual(data['play']['id'], '10')
+
+        # Teams are kept for the resolver's lifetime; other refs only within one resolve()
+        self.assertEqual(self.server.hits, {'/teams/1': 1, '/plays/10': 3})
+
+    async def test_failed_ref_left_in_place_and_retried(self) -> None:
+        async with HttpClient(retries=0) as client:
+            resolver = RefResolver(client)
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                first = await resolver.resolve({'team': self.ref('/teams/404'), 'play': self.ref('/plays/10')})
+                second = await resolver.resolve({'team': self.ref('/teams/404')})
+
+        self.assertEqual(first['team'], self.ref('/teams/404'))
+        self.assertEqual(first['play']['id'], '10')
+        self.assertEqual(second['team'], self.ref('/teams/404'))
+        self.assertIn('could not resolve', output.getvalue())
+        # A failed shared ref is not memoized
+        self.assertEqual(self.server.hits['/teams/404'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
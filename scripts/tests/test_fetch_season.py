@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+fetch_season re-fetching games stored in progress, against a loopback CFBD stand-in
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fetch_season_play_by_play import fetch_season  # noqa: E402
+from http_cache import ResponseCache  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+
+
+class CfbdHandler(BaseHTTPRequestHandler):
+    """/games lists game 7 (completed once server.completed is set); /plays returns server.plays"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        if self.path.startswith('/games'):
+            body = [{
+                'id': 7, 'season': 2025, 'week': 1, 'seasonType': 'regular',
+                'startDate': '2025-08-30T19:00:00.000Z', 'completed': server.completed,
+                'homeTeam': 'Washington', 'homeConference': 'Big Ten',
+                'awayTeam': 'Colorado State', 'awayConference': 'Mountain West',
+            }]
+        else:
+            server.plays_requests += 1
+            body = [{'id': i, 'driveNumber': 1, 'playNumber': i, 'offense': 'Washington',
+                     'defense': 'Colorado State', 'period': 1, 'playType': 'Rush', 'playText': f'play {i}'}
+                    for i in range(1, server.plays + 1)]
+        body = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FetchSeasonTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CfbdHandler)
+        self.server.daemon_threads = True
+        self.server.completed = False
+        self.server.plays = 2
+        self.server.plays_requests = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.config = root / 'config.json'
+        self.config.write_text(json.dumps({
+            'api_key': 'test', 'base_url': f'http://127.0.0.1:{self.server.server_address[1]}'}))
+        self.data_dir = root / 'data'
+        self.cache = ResponseCache(str(root / 'http_cache'))
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    async def fetch(self, **kwargs):
+        """fetch_season of week 1 (through the shared response cache) and the stored game file"""
+        async with HttpClient(cache=self.cache) as client:
+            counts = await fetch_season(client, 2025, (1, 1), str(self.data_dir),
+                                        config_path=str(self.config), **kwargs)
+        (path,) = self.data_dir.glob('washington_play_by_play/game_7_*.json')
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return counts, data['game_info']['completed'], len(data['plays'])
+
+    async def test_game_stored_in_progress_is_refetched_once_completed(self) -> None:
+        counts, completed, plays = await self.fetch(teams=['Washington'])
+        self.assertEqual((counts['written'], completed, plays), (1, False, 2))
+
+        # The game ends; a listing by conference (not cached yet) reports it
+        # completed while the in-progress plays are still fresh in the cache
+        self.server.completed, self.server.plays = True, 5
+        counts, completed, plays = await self.fetch(conference='Big Ten')
+        self.assertEqual((counts['written'], completed, plays), (1, True, 5))
+        self.assertEqual(self.server.plays_requests, 2)
+
+        counts, _, _ = await self.fetch(conference='Big Ten')
+        self.assertEqual((counts['written'], counts['skipped']), (0, 1))
+        self.assertEqual(self.server.plays_requests, 2)
+
+    async def test_refresh_bypasses_cached_plays(self) -> None:
+        self.server.completed = True
+        await self.fetch(teams=['Washington'])
+        self.server.plays = 3
+        counts, completed, plays = await self.fetch(teams=['Washington'], refresh=True)
+        self.assertEqual((counts['written'], completed, plays), (1, True, 3))
+        self.assertEqual(self.server.plays_requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
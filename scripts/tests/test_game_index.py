@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+GameIndex ordering and prefix-summed per-game aggregates
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_index import GameIndex  # noqa: E402
+
+
+class GameIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Games listed out of week order
+        plays = [{'game_id': game_id, 'game_week': week}
+                 for game_id, week in ((30, 3), (10, 1), (40, 4), (20, 2), (50, 5))]
+        self.index = GameIndex(plays)
+        self.stats = {10: {'count': 1, 'yards': 5}, 20: {'count': 2, 'yards': 10},
+                      40: {'count': 4, 'yards': 20}, 50: {'count': 5, 'yards': 25}}
+
+    def test_last_n_in_week_order(self) -> None:
+        self.assertEqual(self.index.game_ids, [10, 20, 30, 40, 50])
+        self.assertEqual(self.index.last_n(3), [30, 40, 50])
+        self.assertEqual(self.index.last_n(3, self.stats), [20, 40, 50])
+
+    def test_aggregates_windows(self) -> None:
+        totals = self.index.aggregates(self.stats, ('count', 'yards'))
+        self.assertEqual(totals.last_games(3), [20, 40, 50])
+        self.assertEqual(totals.last(3, 'count'), 11)
+        self.assertEqual(totals.last(3, 'yards'), 55)
+        self.assertEqual(totals.last(10, 'count'), 12)
+        self.assertEqual(totals.total('yards'), 60)
+        self.assertEqual(totals.rolling(2, 'count'), [1, 3, 6, 9])
+
+    def test_aggregates_over_all_games(self) -> None:
+        # Games without stats count as 0
+        totals = self.index.aggregates(self.stats, ('count',), self.index.game_ids)
+        self.assertEqual(totals.last_games(3), [30, 40, 50])
+        self.assertEqual(totals.last(3, 'count'), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
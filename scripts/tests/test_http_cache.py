@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+ResponseCache expiry of game responses, against a loopback CFBD stand-in
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_cache import ResponseCache  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+
+
+class CfbdHandler(BaseHTTPRequestHandler):
+    """
+    /games reports game 7 (completed once server.completed is set, with
+    server.start_date if set); /plays returns a version
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        etag = f'"v{server.version}"'
+        if self.path.startswith('/games'):
+            game = {'id': 7, 'completed': server.completed}
+            if server.start_date:
+                game['startDate'] = server.start_date
+            body = json.dumps([game])
+        elif self.headers.get('If-None-Match') == etag:
+            server.plays_requests += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        else:
+            server.plays_requests += 1
+            body = json.dumps([{'version': server.version}])
+        body = body.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CfbdHandler)
+        self.server.daemon_threads = True
+        self.server.completed = False
+        self.server.version = 1
+        self.server.plays_requests = 0
+        self.server.start_date = None
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.cache_dir.name)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    async def get_plays(self, client: HttpClient, later: float = 0):
+        """GET /plays of game 7, `later` seconds from now"""
+        now = time.time()
+        with mock.patch('http_cache.time.time', return_value=now + later):
+            response = await client.get(f'{self.base}/plays', {'gameId': 7})
+        return response.headers['x-cache'], response.json()
+
+    async def test_entry_stored_in_progress_expires_after_game_ends(self) -> None:
+        async with HttpClient(cache=self.cache) as client:
+            self.assertEqual(await self.get_plays(client), ('miss', [{'version': 1}]))
+
+            # The game ends and more plays are published
+            self.server.completed, self.server.version = True, 2
+            await client.get_json(f'{self.base}/games', {'year': 2025})
+            self.assertIn('7', self.cache.final_games)
+            self.assertEqual(await self.get_plays(client), ('hit', [{'version': 1}]))
+
+            # Still expires; the refetched payload is final and kept for good
+            self.assertEqual(await self.get_plays(client, later=3600), ('miss', [{'version': 2}]))
+            self.assertEqual(await self.get_plays(client, later=10 ** 7), ('hit', [{'version': 2}]))
+        self.assertEqual(self.server.plays_requests, 2)
+
+    async def test_unchanged_entry_is_revalidated(self) -> None:
+        async with HttpClient(cache=self.cache) as client:
+            await self.get_plays(client)
+            self.server.completed = True
+            await client.get_json(f'{self.base}/games', {'year': 2025})
+
+            self.assertEqual(await self.get_plays(client, later=3600), ('revalidated', [{'version': 1}]))
+            self.assertEqual(await self.get_plays(client, later=10 ** 7), ('hit', [{'version': 1}]))
+        self.assertEqual(self.server.plays_requests, 2)
+
+    async def test_started_game_gets_live_ttl(self) -> None:
+        self.server.start_date = '2025-09-06T16:00:00.000Z'
+        async with HttpClient(cache=self.cache) as client:
+            await client.get_json(f'{self.base}/games', {'year': 2025})
+            self.assertEqual(await self.get_plays(client), ('miss', [{'version': 1}]))
+            self.assertEqual(await self.get_plays(client, later=5), ('hit', [{'version': 1}]))
+            # Past LIVE_TTL, not the 300 s /plays TTL
+            self.assertEqual(await self.get_plays(client, later=60), ('revalidated', [{'version': 1}]))
+
+    async def test_game_not_started_is_not_live(self) -> None:
+        self.server.start_date = '2999-09-06T16:00:00.000Z'
+        async with HttpClient(cache=self.cache) as client:
+            await client.get_json(f'{self.base}/games', {'year': 2025})
+            await self.get_plays(client)
+            self.assertEqual(await self.get_plays(client, later=60), ('hit', [{'version': 1}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
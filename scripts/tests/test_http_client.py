@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+HttpClient against a loopback HTTP/1.1 server
+
+Run from the repository root:
+    python -m pytest scripts/tests
+    python -m unittest discover -s scripts/tests
+"""
+
+import asyncio
+import contextlib
+import gzip
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_client import EspnApi, HttpClient, paginate  # noqa: E402
+
+
+class LoopbackHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def send_body(self, status: int, body: bytes, headers: dict = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.do_GET()
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.auth[self.path] = self.headers.get('Authorization')
+            hits = server.hits[self.path]
+        body = json.dumps({'path': self.path}).encode()
+
+        if self.path == '/chunked':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for part in (b'{"parts": ', b'[1, 2, 3]', b'}'):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(part), part))
+            self.wfile.write(b'0\r\n\r\n')
+        elif self.path == '/gzip':
+            self.send_body(200, gzip.compress(body), {'Content-Encoding': 'gzip'})
+        elif self.path == '/not-modified':
+            self.send_response(304)
+            self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+        elif self.path == '/redirect':
+            self.send_body(302, b'', {'Location': '/target'})
+        elif self.path == '/redirect-away':
+            self.send_body(302, b'', {'Location': server.redirect_target})
+        elif self.path == '/flaky':
+            if hits < 3:
+                self.send_body(503, b'unavailable')
+            else:
+                self.send_body(200, body)
+        elif self.path.startswith('/queued'):
+            time.sleep(0.4)
+            self.send_body(200, body)
+        elif self.path.startswith('/core/'):
+            # One page of an ESPN core collection
+            page = int(parse_qs(urlsplit(self.path).query)['page'][0])
+            with server.lock:
+                server.pages.append(page)
+            time.sleep(server.page_delays.get(page, 0))
+            page_body = {'pageIndex': page, 'items': [f'{page}.{i}' for i in range(2)]}
+            if server.page_count is not None:
+                page_body['pageCount'] = server.page_count
+            try:
+                self.send_body(200, json.dumps(page_body).encode())
+            except OSError:
+                pass  # the page was cancelled
+        elif self.path == '/slow':
+            time.sleep(0.5)
+            try:
+                self.send_body(200, body)
+            except OSError:
+                pass  # the client gave up
+        else:
+            self.send_body(200, body)
+
+
+class HttpClientTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.server = self.start_server()
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def start_server(self) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), LoopbackHandler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.connections = set()
+        server.hits = {}
+        server.auth = {}
+        server.pages = []
+        server.page_delays = {}
+        server.page_count = None
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    async def test_keep_alive_reuses_connection(self) -> None:
+        async with HttpClient() as client:
+            for i in range(5):
+                self.assertEqual(await client.get_json(f'{self.base}/json', {'i': i}),
+                                 {'path': f'/json?i={i}'})
+        self.assertEqual(len(self.server.connections), 1)
+
+    async def test_chunked_body(self) -> None:
+        async with HttpClient() as client:
+            self.assertEqual(await client.get_json(f'{self.base}/chunked'), {'parts': [1, 2, 3]})
+            # The connection is reusable after the last chunk
+            await client.get_json(f'{self.base}/json')
+        self.assertEqual(len(self.server.connections), 1)
+
+    async def test_gzip_body(self) -> None:
+        async with HttpClient() as client:
+            self.assertEqual(await client.get_json(f'{self.base}/gzip'), {'path': '/gzip'})
+
+    async def test_empty_gzip_body(self) -> None:
+        async with HttpClient() as client:
+            head = await client.request('HEAD', f'{self.base}/gzip')
+            not_modified = await client.get(f'{self.base}/not-modified')
+        self.assertEqual((head.status, head.body), (200, b''))
+        self.assertEqual((not_modified.status, not_modified.body), (304, b''))
+
+    async def test_redirect(self) -> None:
+        async with HttpClient() as client:
+            response = await client.get(f'{self.base}/redirect')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.url, f'{self.base}/target')
+        self.assertEqual(response.json(), {'path': '/target'})
+
+    async def test_cross_origin_redirect_drops_credentials(self) -> None:
+        other = self.start_server()
+        self.addCleanup(other.server_close)
+        self.addCleanup(other.shutdown)
+        self.server.redirect_target = f'http://127.0.0.1:{other.server_address[1]}/target'
+
+        async with HttpClient() as client:
+            response = await client.get(f'{self.base}/redirect-away',
+                                        headers={'Authorization': 'Bearer secret'})
+            await client.get(f'{self.base}/redirect', headers={'Authorization': 'Bearer secret'})
+        self.assertEqual(response.json(), {'path': '/target'})
+        self.assertEqual(self.server.auth['/redirect-away'], 'Bearer secret')
+        self.assertIsNone(other.auth['/target'])
+        # Same-origin redirects keep them
+        self.assertEqual(self.server.auth['/target'], 'Bearer secret')
+
+    async def test_unsupported_url_not_retried(self) -> None:
+        async with HttpClient(retries=3, backoff=30) as client:
+            with self.assertRaises(ValueError):
+                await asyncio.wait_for(client.get('ftp://127.0.0.1/file'), 5)
+
+    async def test_retry_on_unavailable(self) -> None:
+        async with HttpClient(retries=3, backoff=0.01) as client:
+            self.assertEqual(await client.get_json(f'{self.base}/flaky'), {'path': '/flaky'})
+        self.assertEqual(self.server.hits['/flaky'], 3)
+
+    async def test_timeout_excludes_time_queued_for_host(self) -> None:
+        # Each response takes 0.4 s; the third request waits 0.8 s for its slot
+        async with HttpClient(per_host_limit=1, timeout=0.6, retries=0) as client:
+            responses = await asyncio.gather(*(client.get(f'{self.base}/queued', {'i': i})
+                                               for i in range(3)))
+        self.assertEqual([response.status for response in responses], [200, 200, 200])
+        self.assertEqual(len(self.server.connections), 1)
+
+    async def test_paginate_yields_pages_in_order(self) -> None:
+        # Page 2 arrives after pages 3 and 4
+        self.server.page_count = 4
+        self.server.page_delays = {2: 0.3}
+        async with HttpClient() as client:
+            espn = EspnApi(client, core_base=f'{self.base}/core')
+            pages = [page async for page in paginate(lambda page: espn.plays(1, page))]
+            plays = await espn.all_plays(1)
+        self.assertEqual([page['pageIndex'] for page in pages], [1, 2, 3, 4])
+        self.assertEqual(plays, [f'{page}.{i}' for page in range(1, 5) for i in range(2)])
+
+    async def test_paginate_page_count(self) -> None:
+        async with HttpClient() as client:
+            espn = EspnApi(client, core_base=f'{self.base}/core')
+            # No pageCount: a single page
+            self.assertEqual(await espn.all_plays(1), ['1.0', '1.1'])
+            self.server.page_count = 1
+            self.assertEqual(await espn.all_plays(1), ['1.0', '1.1'])
+            self.server.page_count = 3
+            self.assertEqual(len(await espn.all_plays(1)), 6)
+        self.assertEqual(self.server.pages, [1, 1, 1, 2, 3])
+
+    async def test_paginate_cancels_pages_when_caller_stops(self) -> None:
+        self.server.page_count = 6
+        # Page 3 is still in flight when page 2 arrives
+        self.server.page_delays = {2: 0.2, 3: 0.5, 4: 0.5}
+        async with HttpClient() as client:
+            espn = EspnApi(client, core_base=f'{self.base}/core')
+            received = []
+            async with contextlib.aclosing(paginate(lambda page: espn.plays(1, page), concurrency=2)) as pages:
+                async for page in pages:
+                    received.append(page['pageIndex'])
+                    if len(received) == 2:
+                        break
+            # Long enough for pages 3 and 4 to have freed their slots
+            await asyncio.sleep(0.8)
+        self.assertEqual(received, [1, 2])
+        # Pages 3 and 4 were in flight; 5 and 6 were never requested
+        self.assertEqual(sorted(self.server.pages), [1, 2, 3, 4])
+
+    async def test_timeout_closes_pooled_connection(self) -> None:
+        async with HttpClient(timeout=0.2, retries=0) as client:
+            await client.get_json(f'{self.base}/json')
+            (connection,) = [conn for conns in client._idle.values() for conn in conns]
+
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.get(f'{self.base}/slow')
+            self.assertTrue(connection.writer.is_closing())
+            self.assertFalse(any(client._idle.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Analyzers on raw play dicts (not loaded through load_team_data)
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import copy
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyze_4th_downs import analyze_4th_downs  # noqa: E402
+from analyze_penalties import analyze_penalties  # noqa: E402
+from analyze_post_turnover import analyze_post_turnover  # noqa: E402
+from analyze_red_zone import analyze_red_zone  # noqa: E402
+from analyze_special_teams import analyze_special_teams  # noqa: E402
+from play_text_features import PLAY_TEXT_FEATURES, add_play_text_features  # noqa: E402
+
+
+def play(game_id: int, drive_number: int, offense: str, defense: str, play_type: str,
+         play_text: str, **fields) -> dict:
+    return {
+        'game_id': game_id, 'game_week': 1, 'opponent': 'Iowa', 'period': 1, 'clock': '10:00',
+        'drive_id': f'{game_id}-{drive_number}', 'drive_number': drive_number,
+        'offense': offense, 'defense': defense, 'play_type': play_type, 'play_text': play_text,
+        'down': 1, 'distance': 10, 'yards_gained': 0, **fields,
+    }
+
+
+def without_text_features(value):
+    """A result with the text_ fields dropped from the plays it lists"""
+    if isinstance(value, dict):
+        return {key: without_text_features(item) for key, item in value.items()
+                if key not in PLAY_TEXT_FEATURES}
+    if isinstance(value, list):
+        return [without_text_features(item) for item in value]
+    return value
+
+
+def raw_plays() -> list:
+    return [
+        play(1, 1, 'Iowa', 'Purdue', 'Kickoff Return (Offense)',
+             'Iowa kickoff for 65 yds, Purdue return for 40 yds to the PUR 40',
+             play_classification='special_teams'),
+        play(1, 2, 'Purdue', 'Iowa', 'Rush', 'Smith run for 2 yds to the IOW 30, 1ST DOWN',
+             down=4, distance=1, yards_gained=2),
+        play(1, 2, 'Purdue', 'Iowa', 'Rush', 'Smith run for 1 yd to the IOW 29',
+             down=4, distance=3, yards_gained=1),
+        play(1, 2, 'Purdue', 'Iowa', 'Penalty', 'PURDUE Penalty, False Start (5 Yds) enforced',
+             penalty_type='False Start', penalty_decision=None, yards_gained=-5),
+        play(1, 2, 'Purdue', 'Iowa', 'Penalty', 'PURDUE Penalty, Holding offsetting, NO PLAY',
+             penalty_type='Holding', penalty_decision=None),
+        play(1, 2, 'Purdue', 'Iowa', 'Fumble Recovery (Own)',
+             'Smith run for 3 yds, fumbled, recovered by Iowa', turnover=True, turnover_type='fumble'),
+        play(1, 3, 'Iowa', 'Purdue', 'Rush', 'Jones run for 20 yds for a TOUCHDOWN',
+             scoring=True, drive_started_after_turnover=True),
+    ]
+
+
+class RawPlaysTest(unittest.TestCase):
+
+    def test_analyzers_match_loaded_plays(self) -> None:
+        raw = raw_plays()
+        loaded = raw_plays()
+        for p in loaded:
+            add_play_text_features(p)
+
+        for analyze in (analyze_4th_downs, analyze_penalties, analyze_post_turnover, analyze_red_zone,
+                        analyze_special_teams):
+            with self.subTest(analyze.__name__):
+                self.assertEqual(analyze(copy.deepcopy(raw), 'Purdue'),
+                                 without_text_features(analyze(copy.deepcopy(loaded), 'Purdue')))
+        # The raw plays are not modified
+        self.assertFalse(any(name in p for p in raw for name in PLAY_TEXT_FEATURES))
+
+    def test_text_features_on_raw_plays(self) -> None:
+        raw = raw_plays()
+        self.assertEqual(analyze_special_teams(raw, 'Purdue')['total_explosive_plays'], 1)
+        self.assertEqual(analyze_4th_downs(raw, 'Purdue')['conversion_rate'], 50)
+        self.assertEqual(analyze_penalties(raw, 'Purdue')['total_penalties'], 1)
+        self.assertEqual(analyze_post_turnover(raw, 'Purdue')['total_turnovers'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()